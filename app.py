@@ -3,23 +3,46 @@ vocalyx-dashboard/app.py
 Point d'entrée principal du Dashboard (corrigé pour import circulaire)
 """
 
+import asyncio
 import logging
+import signal
 from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import (
     FastAPI, Request, Depends, HTTPException, status, Form
 )
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 
 import uvicorn
 
 from config import Config
 from api_client import VocalyxAPIClient  # Compatibilité
 from infrastructure.api.api_client import VocalyxAPIClient as VocalyxAPIClientRefactored
-from routes import dashboard_router
-from logging_config import setup_logging, setup_colored_logging, get_uvicorn_log_config
+from application.services.segment_service import SegmentService
+from application.services.search_index_service import SearchIndexService
+from application.services.eta_service import EtaService
+from application.services.metrics_rollup_service import MetricsRollupService
+from application.services.capacity_planner_service import CapacityPlannerService
+from application.services.worker_monitor_service import WorkerMonitorService
+from infrastructure.cache import StaleResponseCache
+from infrastructure.web.critical_css import build_critical_css
+from infrastructure.web.static_assets import StaticAssetManifest, VersionedStaticFiles
+from infrastructure.web.prefetch_limiter import PrefetchLimiter
+from infrastructure.web.metrics_middleware import MetricsMiddleware
+from infrastructure.web.tracing_middleware import TracedAPIRoute, TracingMiddleware
+from infrastructure.web.recording_middleware import TrafficRecordingMiddleware
+from infrastructure.metrics import (
+    REGISTRY,
+    CallbackGauge,
+    register_backend_metrics,
+    register_breaker_metrics,
+    register_cache_metrics,
+    register_pool_metrics
+)
+from infrastructure.tracing import OtlpJsonFileExporter, TrafficRecorder
+from routes import dashboard_router, admin_profile_cache
+from logging_config import setup_logging, setup_colored_logging, get_uvicorn_log_config, parse_rate_limits
 
 # --- MODIFICATION: Importer depuis auth_deps ---
 from auth_deps import get_current_token, AUTH_COOKIE_NAME
@@ -28,17 +51,43 @@ from auth_deps import get_current_token, AUTH_COOKIE_NAME
 # Initialiser la configuration
 config = Config()
 
-# Configurer le logging
-if config.log_colored:
-    logger = setup_colored_logging(
-        log_level=config.log_level,
-        log_file=config.log_file_path if config.log_file_enabled else None
-    )
+# Configurer le logging (écriture sur un thread dédié, jamais sur la boucle asyncio)
+logging_options = dict(
+    log_level=config.log_level,
+    log_file=config.log_file_path if config.log_file_enabled else None,
+    json_format=config.log_json,
+    max_bytes=config.log_file_max_bytes,
+    backup_count=config.log_file_backup_count,
+    compress=config.log_file_compress,
+    rate_limits=parse_rate_limits(config.log_rate_limits)
+)
+if config.log_colored and not config.log_json:
+    logger = setup_colored_logging(**logging_options)
 else:
-    logger = setup_logging(
-        log_level=config.log_level,
-        log_file=config.log_file_path if config.log_file_enabled else None
-    )
+    logger = setup_logging(**logging_options)
+
+# Export des traces (JSON OTLP) écrit par un thread dédié, démarré avec l'application
+trace_exporter = OtlpJsonFileExporter(
+    config.tracing_export_path,
+    sample_ratio=config.tracing_export_sample_ratio,
+    max_bytes=config.tracing_export_max_bytes
+) if config.tracing_enabled and config.tracing_export_enabled else None
+
+# Enregistrement anonymisé du trafic (rejeu avec benchmarks/replay.py)
+traffic_recorder = TrafficRecorder(
+    config.recording_path,
+    sample_ratio=config.recording_sample_ratio,
+    max_requests=config.recording_max_requests
+) if config.recording_enabled else None
+
+
+def reload_upstream_budgets(api_client: VocalyxAPIClientRefactored):
+    """SIGHUP : relit config.ini et applique les budgets des appels à l'API ([UPSTREAM_BUDGETS])"""
+    try:
+        config.reload()
+        api_client.configure_budgets(config)
+    except Exception as e:
+        logger.error(f"❌ Could not reload upstream budgets: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -50,17 +99,121 @@ async def lifespan(app: FastAPI):
     # Initialiser le client API (version refactorisée)
     api_client = VocalyxAPIClientRefactored(config)
     
-    # Vérifier la connexion à l'API
-    health = api_client.health_check()
-    if health.get("status") == "healthy":
-        logger.info("✅ API connection successful")
-    else:
-        logger.error(f"❌ API connection failed: {health.get('error')}")
+    # Vérifier la connexion à l'API et préchauffer les connexions, sans retarder le démarrage
+    api_warm_up = asyncio.create_task(api_client.warm_up(config.prewarm_connections), name="api-warm-up")
     
     # Stocker dans app.state pour accès dans les routes
     app.state.config = config
     app.state.api_client = api_client
     
+    # Cache des transcriptions analysées (lecture fenêtrée des segments)
+    app.state.segment_service = SegmentService(api_client, max_bytes=config.transcript_cache_max_bytes)
+    
+    # Dernières réponses valides des listes, servies si l'API est indisponible
+    app.state.stale_cache = (
+        StaleResponseCache(config.stale_cache_max_bytes, config.stale_cache_max_age_seconds)
+        if config.stale_cache_enabled else None
+    )
+    
+    # Préchargements des détails (survol / visibilité) limités par session
+    app.state.prefetch_limiter = PrefetchLimiter(config.prefetch_max_concurrent_per_session)
+    
+    # Estimation des heures de fin (modèles de temps de traitement appris en continu)
+    app.state.eta_service = EtaService(
+        api_client,
+        min_samples=config.eta_min_samples,
+        training_interval=config.eta_training_interval_seconds
+    )
+    
+    # Métriques de performance pré-agrégées (minute / heure / jour x dimensions)
+    app.state.metrics_rollups = MetricsRollupService(
+        api_client,
+        retention={
+            "minute": config.metrics_minute_retention_minutes * 60,
+            "hour": config.metrics_hour_retention_hours * 3600,
+            "day": config.metrics_day_retention_days * 86400
+        },
+        relative_accuracy=config.metrics_relative_accuracy,
+        backfill_max_items=config.metrics_backfill_max_items
+    )
+    
+    # Index de préfixes pour l'autocomplétion de la recherche
+    app.state.search_index = SearchIndexService(
+        api_client,
+        refresh_seconds=config.search_index_refresh_seconds,
+        max_items=config.search_index_max_items,
+        observers=(app.state.eta_service.observe, app.state.metrics_rollups.observe)
+    )
+    
+    # Sondage du statut des workers en tâche de fond (instantané partagé + historique)
+    app.state.worker_monitor = WorkerMonitorService(
+        api_client,
+        interval=config.workers_poll_interval_seconds,
+        history_size=config.workers_history_size,
+        idle_timeout=config.workers_idle_timeout_seconds
+    )
+    app.state.worker_monitor.start()
+    
+    # Sondes des instances de l'API (répartition de charge, plusieurs URL configurées)
+    api_client.balancer.start(api_client.probe_backend, config.lb_probe_interval_seconds)
+    
+    # Simulation de capacité des workers (vue admin)
+    app.state.capacity_planner = CapacityPlannerService(
+        api_client,
+        max_transcriptions=config.capacity_max_transcriptions,
+        replications=config.capacity_replications,
+        cache_ttl=config.capacity_cache_ttl_seconds
+    )
+    
+    # Métriques Prometheus évaluées à la lecture de /metrics (pools, caches, disjoncteurs, préchargements)
+    if config.metrics_prometheus_enabled:
+        register_pool_metrics(api_client.pools.clients)
+        register_breaker_metrics(api_client.breakers)
+        register_backend_metrics(api_client.balancer)
+        caches = {"transcripts": app.state.segment_service.cache, "admin_profile": admin_profile_cache}
+        if app.state.stale_cache is not None:
+            # Succès : réponses servies périmées ; échecs : API indisponible sans copie
+            caches["stale_responses"] = app.state.stale_cache
+        if api_client.dns_cache is not None:
+            caches["upstream_dns"] = api_client.dns_cache
+        register_cache_metrics(caches)
+        prefetch_limiter = app.state.prefetch_limiter
+        CallbackGauge(
+            "vocalyx_frontend_prefetch_rejected_total",
+            "Préchargements refusés (limite de requêtes simultanées par session)",
+            (),
+            lambda: [((), prefetch_limiter.rejected)],
+            type_name="counter"
+        )
+    
+    # CSS critique de la coque du dashboard, inséré en ligne dans dashboard_base.html
+    templates.env.globals["critical_css"] = ""
+    if config.critical_css_enabled:
+        try:
+            critical_css = build_critical_css(config.templates_dir)
+            size = len(critical_css.encode("utf-8"))
+            if size > config.critical_css_budget_bytes:
+                logger.warning(
+                    f"⚠️ CSS critique ({size} octets) au-delà du budget "
+                    f"({config.critical_css_budget_bytes} octets)"
+                )
+            templates.env.globals["critical_css"] = critical_css
+            logger.info(f"🎨 CSS critique généré ({size} octets)")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not build critical CSS, falling back to blocking stylesheet: {e}")
+    
+    if trace_exporter is not None:
+        trace_exporter.start()
+    if traffic_recorder is not None:
+        traffic_recorder.start()
+    
+    # Rechargement à chaud des budgets des appels à l'API (kill -HUP <pid>)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_upstream_budgets, api_client)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        # Windows, ou boucle hors du thread principal (TestClient)
+        logger.debug("SIGHUP reload unavailable")
+    
     # Récupérer les informations du projet admin
     try:
         logger.info(f"📋 Admin project name: {config.admin_project_name}")
@@ -71,6 +224,13 @@ async def lifespan(app: FastAPI):
     
     # --- Shutdown ---
     logger.info("🛑 Arrêt de Vocalyx Dashboard")
+    await app.state.worker_monitor.stop()
+    await api_client.balancer.stop()
+    api_warm_up.cancel()
+    if trace_exporter is not None:
+        trace_exporter.stop()
+    if traffic_recorder is not None:
+        traffic_recorder.stop()
     api_client.close()
     await api_client.aclose()
 
@@ -87,16 +247,36 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None
 )
+# Routes qui distinguent l'exécution du endpoint de la sérialisation (Server-Timing)
+app.router.route_class = TracedAPIRoute
 
-# Monter les fichiers statiques
-app.mount("/static", StaticFiles(directory="templates/static"), name="static")
+# Monter les fichiers statiques (URL versionnées ?v=<hash> servies avec un cache long)
+app.mount("/static", VersionedStaticFiles(directory="templates/static"), name="static")
+static_assets = StaticAssetManifest("templates/static")
 
 # Configurer les templates
 templates = Jinja2Templates(directory=config.templates_dir)
+templates.env.globals["static_url"] = static_assets.url
 
 # Inclure les routes du dashboard (celles de routes.py)
 app.include_router(dashboard_router)
 
+# Mesure des requêtes HTTP (latence par route, requêtes en cours), exposée sur /metrics
+if config.metrics_prometheus_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Enregistrement du trafic (à l'intérieur du traçage : réutilise les spans des appels à l'API)
+if traffic_recorder is not None:
+    app.add_middleware(TrafficRecordingMiddleware, recorder=traffic_recorder, cookie_name=AUTH_COOKIE_NAME)
+
+# Identifiant de corrélation, spans des appels à l'API et Server-Timing (middleware le plus externe)
+if config.tracing_enabled:
+    app.add_middleware(
+        TracingMiddleware,
+        server_timing=config.tracing_server_timing,
+        exporter=trace_exporter
+    )
+
 
 # ============================================================================
 # GESTION DE L'AUTHENTIFICATION
@@ -204,9 +384,11 @@ async def render_dashboard(request: Request, token: str, default_view: str = "tr
 
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
-        "api_url": config.api_url,
+        # Instance stable pour la session (plusieurs URL : connexions longues sur la même instance)
+        "api_url": api_client.sticky_backend(token).url,
         "flower_url": config.flower_url,
         "ws_port": config.ws_port,
+        "debug": config.log_level.upper() == "DEBUG",
         "DEFAULT_PROJECT_NAME": default_project_name or "",
         "DEFAULT_PROJECT_KEY": default_project_key or "",
         "active_page": default_view,
@@ -232,19 +414,59 @@ async def admin_page(request: Request, token: str = Depends(get_current_token)):
     return await render_dashboard(request, token, default_view="users")
 
 
+@app.get("/sw.js", tags=["System"], include_in_schema=False)
+async def service_worker(request: Request):
+    """
+    Service worker du dashboard : servi à la racine pour couvrir toute l'application.
+    Sa version suit l'empreinte des ressources statiques : tout déploiement qui modifie
+    un fichier déclenche la mise à jour du précache.
+    """
+    content = templates.get_template("sw.js").render(
+        version=static_assets.version,
+        precache_urls=static_assets.precache_urls(),
+        shell_urls=["/", "/dashboard"]
+    )
+    return Response(
+        content=content,
+        media_type="application/javascript",
+        headers={"Cache-Control": "no-cache", "Service-Worker-Allowed": "/"}
+    )
+
+
 @app.get("/health", tags=["System"])
 def health_check(request: Request):
     """Endpoint de santé du dashboard"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     api_health = api_client.health_check()
+    open_circuits = api_client.breakers.open_endpoints()
+    ejected_backends = api_client.balancer.ejected_urls()
     
     return {
-        "status": "healthy" if api_health.get("status") == "healthy" else "degraded",
+        "status": (
+            "healthy" if api_health.get("status") == "healthy" and not open_circuits and not ejected_backends
+            else "degraded"
+        ),
         "service": "vocalyx-dashboard",
         "api_status": api_health.get("status"),
-        "api_url": config.api_url
+        "api_url": config.api_url,
+        "fault_injection": api_client.faults.enabled,
+        "circuit_breakers": {
+            "open": open_circuits,
+            "endpoints": api_client.breakers.snapshot()
+        },
+        "upstream_budgets": api_client.pools.snapshot(),
+        "backends": api_client.balancer.snapshot(),
+        "stale_responses": request.app.state.stale_cache.stats() if request.app.state.stale_cache is not None else None
     }
 
+
+@app.get("/metrics", tags=["System"], include_in_schema=False)
+def prometheus_metrics():
+    """Métriques du dashboard au format d'exposition Prometheus"""
+    if not config.metrics_prometheus_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics disabled")
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     log_config = get_uvicorn_log_config(log_level=config.log_level)
     
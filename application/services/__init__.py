@@ -3,14 +3,26 @@ Services applicatifs
 """
 
 from application.services.auth_service import AuthService
+from application.services.capacity_planner_service import CapacityPlannerService
+from application.services.eta_service import EtaService
+from application.services.metrics_rollup_service import MetricsRollupService
 from application.services.project_service import ProjectService
+from application.services.search_index_service import SearchIndexService
+from application.services.segment_service import SegmentService
 from application.services.transcription_service import TranscriptionService
 from application.services.user_service import UserService
+from application.services.worker_monitor_service import WorkerMonitorService
 
 __all__ = [
     "AuthService",
+    "CapacityPlannerService",
+    "EtaService",
+    "MetricsRollupService",
     "ProjectService",
+    "SearchIndexService",
+    "SegmentService",
     "TranscriptionService",
-    "UserService"
+    "UserService",
+    "WorkerMonitorService"
 ]
 
@@ -0,0 +1,399 @@
+"""
+CapacityPlannerService - Dimensionnement des workers par simulation de file d'attente
+
+Usage CLI :
+    python -m application.services.capacity_planner_service --input transcriptions.json --workers 1,2,3,4
+    VOCALYX_TOKEN=<jwt admin> python -m application.services.capacity_planner_service --days 30
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from infrastructure.api.api_client import VocalyxAPIClient
+from infrastructure.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_WEEK = 168
+# Le 1er janvier 1970 était un jeudi : décalage pour des semaines commençant le lundi
+EPOCH_WEEK_OFFSET_HOURS = 72
+
+# En dessous de ce nombre d'échantillons, les temps de service suivent une loi log-normale ajustée
+MIN_EMPIRICAL_SAMPLES = 30
+DEFAULT_SERVICE_S = 60.0
+
+# Pools de workers : (champ d'arrivée dans la file, champ du temps de service)
+POOLS = {
+    "transcription": ("created_at", "processing_time"),
+    "enrichment": ("processing_end_time", "enrichment_processing_time")
+}
+
+
+def _parse_times(values: Sequence[Any]) -> np.ndarray:
+    """Horodatages ISO 8601 (naïf = UTC) -> epoch ; NaN si absent ou invalide"""
+    parsed = np.full(len(values), np.nan)
+    for index, value in enumerate(values):
+        if not value or not isinstance(value, str):
+            continue
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        parsed[index] = moment.timestamp()
+    return parsed
+
+
+def _hour_of_week(hours_since_epoch: np.ndarray) -> np.ndarray:
+    return (hours_since_epoch + EPOCH_WEEK_OFFSET_HOURS) % HOURS_PER_WEEK
+
+
+@dataclass(frozen=True)
+class WorkloadModel:
+    """
+    Charge ajustée sur l'historique : processus de Poisson dont le taux dépend de
+    l'heure de la semaine, et distribution des temps de service d'un pool de workers.
+    """
+
+    pool: str
+    hourly_rates: np.ndarray
+    service_times: np.ndarray
+    observed_waits: np.ndarray
+    window_days: float
+
+    @property
+    def samples(self) -> int:
+        return int(self.service_times.size)
+
+    @property
+    def arrivals_per_day(self) -> float:
+        return float(self.hourly_rates.mean() * 24)
+
+    @property
+    def mean_service_time(self) -> float:
+        return float(self.service_times.mean()) if self.samples else DEFAULT_SERVICE_S
+
+    def offered_load(self, traffic_scale: float = 1.0, peak: bool = False) -> float:
+        """Nombre moyen de places occupées (erlangs), en moyenne ou à l'heure de pointe"""
+        rate = self.hourly_rates.max() if peak else self.hourly_rates.mean()
+        return float(rate / 3600 * traffic_scale * self.mean_service_time)
+
+    def sample_service_times(self, rng: np.random.Generator, size) -> np.ndarray:
+        """Rééchantillonnage de l'historique, ou loi log-normale s'il est trop court"""
+        if self.samples >= MIN_EMPIRICAL_SAMPLES:
+            return rng.choice(self.service_times, size=size)
+        if self.samples >= 2:
+            logs = np.log(self.service_times)
+            return rng.lognormal(logs.mean(), max(logs.std(), 1e-3), size=size)
+        return rng.exponential(self.mean_service_time, size=size)
+
+    def summary(self) -> Dict[str, Any]:
+        def percentiles(values: np.ndarray) -> Optional[Dict[str, float]]:
+            if not values.size:
+                return None
+            p50, p95 = np.percentile(values, [50, 95])
+            return {"mean": round(float(values.mean()), 1), "p50": round(float(p50), 1), "p95": round(float(p95), 1)}
+
+        return {
+            "pool": self.pool,
+            "samples": self.samples,
+            "window_days": round(self.window_days, 1),
+            "arrivals_per_day": round(self.arrivals_per_day, 1),
+            "peak_hourly_rate": round(float(self.hourly_rates.max()), 1),
+            "service_time": percentiles(self.service_times),
+            "observed_wait": percentiles(self.observed_waits)
+        }
+
+
+def fit_workload(transcriptions: List[Dict[str, Any]], pool: str = "transcription") -> WorkloadModel:
+    """
+    Ajuste la charge d'un pool sur une liste de transcriptions (format de l'API).
+    Taux d'arrivée par heure de la semaine = arrivées observées / nombre de fois où
+    cette heure est couverte par la fenêtre ; les heures jamais couvertes (fenêtre
+    de moins d'une semaine) reprennent le taux de la même heure de la journée.
+    """
+    if pool not in POOLS:
+        raise ValueError(f"Unknown pool '{pool}' (expected one of {', '.join(POOLS)})")
+    arrival_field, service_field = POOLS[pool]
+    entries = [t for t in transcriptions if isinstance(t, dict)]
+    if pool == "enrichment":
+        entries = [t for t in entries if t.get("enrichment_requested")]
+
+    arrivals = _parse_times([t.get(arrival_field) for t in entries])
+    arrivals = arrivals[~np.isnan(arrivals)]
+    services = np.array([float(t.get(service_field) or 0) for t in entries])
+    services = services[services > 0]
+    waits = np.array([float(t["queue_wait_time"]) for t in entries if pool == "transcription" and t.get("queue_wait_time") is not None])
+
+    if arrivals.size < 2:
+        return WorkloadModel(pool, np.zeros(HOURS_PER_WEEK), services, waits, 0.0)
+
+    hours = np.floor(arrivals / 3600).astype(np.int64)
+    first, last = int(hours.min()), int(hours.max())
+    exposure = np.bincount(_hour_of_week(np.arange(first, last + 1)), minlength=HOURS_PER_WEEK).astype(float)
+    counts = np.bincount(_hour_of_week(hours), minlength=HOURS_PER_WEEK).astype(float)
+
+    rates = np.divide(counts, exposure, out=np.zeros(HOURS_PER_WEEK), where=exposure > 0)
+    uncovered = exposure == 0
+    if uncovered.any():
+        daily_counts = counts.reshape(7, 24).sum(axis=0)
+        daily_exposure = exposure.reshape(7, 24).sum(axis=0)
+        daily_rates = np.divide(daily_counts, daily_exposure, out=np.zeros(24), where=daily_exposure > 0)
+        rates[uncovered] = np.tile(daily_rates, 7)[uncovered]
+
+    return WorkloadModel(pool, rates, services, waits, (last + 1 - first) / 24)
+
+
+def generate_arrivals(
+    hourly_rates: np.ndarray,
+    hours: int,
+    replications: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Arrivées (secondes) de `replications` trajectoires indépendantes, triées par ligne.
+    Tableau (replications, n_max) complété par +inf pour les trajectoires plus courtes.
+    """
+    rates = np.resize(hourly_rates, hours)
+    counts = rng.poisson(rates, size=(replications, hours))
+    per_replication = counts.sum(axis=1)
+    total = int(per_replication.sum())
+
+    replication_ids = np.repeat(np.arange(replications), per_replication)
+    times = (np.repeat(np.tile(np.arange(hours), replications), counts.ravel()) + rng.random(total)) * 3600
+    order = np.lexsort((times, replication_ids))
+    offsets = np.concatenate(([0], np.cumsum(per_replication)[:-1]))
+
+    arrivals = np.full((replications, int(per_replication.max(initial=0))), np.inf)
+    arrivals[replication_ids, np.arange(total) - offsets[replication_ids]] = times[order]
+    return arrivals
+
+
+def simulate_waits(arrivals: np.ndarray, services: np.ndarray, slot_counts: Sequence[int]) -> np.ndarray:
+    """
+    File FCFS à c places (récurrence de Kiefer-Wolfowitz), vectorisée sur toutes les
+    combinaisons (nombre de places x trajectoire) : à chaque arrivée, une seule
+    opération NumPy par étape fait avancer toutes les simulations à la fois.
+
+    `arrivals` et `services` : (replications, n) ; retourne les attentes
+    (len(slot_counts), replications, n), NaN pour les arrivées de complément.
+    """
+    replications, jobs = arrivals.shape
+    slot_counts = np.asarray(slot_counts, dtype=np.int64)
+    candidates = slot_counts.size
+    width = int(slot_counts.max())
+
+    # Instants de libération de chaque place, triés par ligne (+inf : place inexistante)
+    free_at = np.where(
+        np.arange(width)[None, :] < np.repeat(slot_counts, replications)[:, None], 0.0, np.inf
+    )
+    next_free = free_at[:, 0]
+    arrivals_by_job = np.ascontiguousarray(np.tile(arrivals, (candidates, 1)).T)
+    services_by_job = np.ascontiguousarray(np.tile(services, (candidates, 1)).T)
+    waits = np.empty_like(arrivals_by_job)
+
+    with np.errstate(invalid="ignore"):
+        for job in range(jobs):
+            arrival = arrivals_by_job[job]
+            start = np.maximum(next_free, arrival, out=waits[job])
+            np.add(start, services_by_job[job], out=next_free)
+            free_at.sort(axis=1)
+            start -= arrival
+    return waits.T.reshape(candidates, replications, jobs)
+
+
+class CapacityPlannerService:
+    """
+    Planification de capacité : ajuste la charge sur l'historique des transcriptions
+    (mis en cache quelques minutes) puis simule un horizon de trafic pour chaque
+    nombre de workers candidat.
+    """
+
+    def __init__(
+        self,
+        api_client: Optional[VocalyxAPIClient],
+        max_transcriptions: int = 2000,
+        replications: int = 5,
+        cache_ttl: float = 300.0
+    ):
+        self.api_client = api_client
+        self.max_transcriptions = max_transcriptions
+        self.replications = max(1, replications)
+        self._workloads = TTLCache(ttl_seconds=cache_ttl, max_entries=16)
+
+    def load_transcriptions(self, token: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """Transcriptions les plus récentes (au plus `max_transcriptions`)"""
+        transcriptions: List[Dict[str, Any]] = []
+        page = 1
+        while len(transcriptions) < self.max_transcriptions:
+            batch = self.api_client.get_user_transcriptions(jwt_token=token, page=page, limit=page_size)
+            transcriptions.extend(batch)
+            if len(batch) < page_size:
+                break
+            page += 1
+        return transcriptions[:self.max_transcriptions]
+
+    def workload(self, token: str, pool: str = "transcription") -> WorkloadModel:
+        key = (token, pool)
+        model = self._workloads.get(key)
+        if model is None:
+            model = fit_workload(self.load_transcriptions(token), pool)
+            self._workloads.put(key, model)
+        return model
+
+    def plan(
+        self,
+        model: WorkloadModel,
+        worker_counts: Optional[Sequence[int]] = None,
+        concurrency: int = 1,
+        days: float = 30,
+        traffic_scale: float = 1.0,
+        target_p95: float = 60.0,
+        current_workers: Optional[int] = None,
+        replications: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Simule `days` jours de trafic pour chaque nombre de workers candidat"""
+        started = time.perf_counter()
+        concurrency = max(1, concurrency)
+        replications = replications or self.replications
+        offered_load = model.offered_load(traffic_scale)
+        peak_load = model.offered_load(traffic_scale, peak=True)
+        if not worker_counts:
+            # Autour du minimum stable (charge offerte / places par worker)
+            base = max(1, math.ceil(offered_load / concurrency))
+            worker_counts = range(base, base + 6)
+        worker_counts = sorted({int(count) for count in worker_counts if int(count) > 0})
+        if not worker_counts:
+            raise ValueError("At least one positive worker count is required")
+
+        rng = np.random.default_rng(seed)
+        arrivals = generate_arrivals(model.hourly_rates * traffic_scale, int(days * 24), replications, rng)
+        services = np.where(np.isinf(arrivals), 0.0, model.sample_service_times(rng, arrivals.shape))
+        jobs = int(np.isfinite(arrivals).sum())
+
+        candidates = []
+        if jobs:
+            waits = simulate_waits(arrivals, services, [count * concurrency for count in worker_counts])
+            valid = np.isfinite(arrivals)
+            for count, candidate_waits in zip(worker_counts, waits):
+                values = candidate_waits[valid]
+                p50, p95 = np.percentile(values, [50, 95])
+                utilization = offered_load / (count * concurrency)
+                candidates.append({
+                    "workers": count,
+                    "slots": count * concurrency,
+                    "utilization": round(utilization, 3),
+                    "peak_utilization": round(peak_load / (count * concurrency), 3),
+                    "stable": utilization < 1,
+                    "wait_p50": round(float(p50), 1),
+                    "wait_p95": round(float(p95), 1),
+                    "wait_mean": round(float(values.mean()), 1),
+                    "waiting_share": round(float((values > 0).mean()), 3)
+                })
+
+        recommended = next(
+            (c["workers"] for c in candidates if c["stable"] and c["wait_p95"] <= target_p95), None
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"📐 Capacity plan: {jobs} jobs x {len(worker_counts)} candidates simulated in {elapsed_ms:.0f} ms")
+        return {
+            "workload": model.summary(),
+            "simulation": {
+                "days": days,
+                "replications": replications,
+                "traffic_scale": traffic_scale,
+                "concurrency": concurrency,
+                "jobs": jobs,
+                "offered_load": round(offered_load, 2),
+                "peak_load": round(peak_load, 2),
+                "elapsed_ms": round(elapsed_ms, 1)
+            },
+            "current_workers": current_workers,
+            "target_p95": target_p95,
+            "recommended_workers": recommended,
+            "candidates": candidates
+        }
+
+
+def _format_plan(plan: Dict[str, Any]) -> str:
+    workload = plan["workload"]
+    simulation = plan["simulation"]
+    service = workload["service_time"] or {}
+    lines = [
+        f"Charge ({workload['pool']}) : {workload['samples']} échantillons sur {workload['window_days']} j, "
+        f"{workload['arrivals_per_day']} arrivées/j (pic {workload['peak_hourly_rate']}/h), "
+        f"service moyen {service.get('mean', '-')} s (p95 {service.get('p95', '-')} s)",
+        f"Simulation : {simulation['jobs']} tâches, {simulation['days']} j x {simulation['replications']} trajectoires, "
+        f"charge offerte {simulation['offered_load']} erlangs (pointe {simulation['peak_load']}), {simulation['elapsed_ms']} ms",
+        "",
+        f"{'workers':>8} {'places':>7} {'util.':>6} {'pointe':>7} {'p50 (s)':>9} {'p95 (s)':>9} {'attente':>8}"
+    ]
+    for candidate in plan["candidates"]:
+        marker = " <=" if candidate["workers"] == plan["recommended_workers"] else ""
+        lines.append(
+            f"{candidate['workers']:>8} {candidate['slots']:>7} {candidate['utilization']:>6.0%} {candidate['peak_utilization']:>7.0%} "
+            f"{candidate['wait_p50']:>9.1f} {candidate['wait_p95']:>9.1f} {candidate['waiting_share']:>8.0%}{marker}"
+        )
+    recommended = plan["recommended_workers"]
+    lines.append("")
+    lines.append(
+        f"Recommandation (p95 <= {plan['target_p95']:.0f} s) : {recommended} worker(s)"
+        if recommended else f"Aucun candidat ne tient p95 <= {plan['target_p95']:.0f} s"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulation de capacité des workers Vocalyx")
+    parser.add_argument("--input", help="Export JSON des transcriptions (défaut : chargement depuis l'API avec VOCALYX_TOKEN)")
+    parser.add_argument("--pool", choices=sorted(POOLS), default="transcription")
+    parser.add_argument("--workers", help="Nombres de workers candidats, ex. 1,2,3,4 (défaut : autour du minimum stable)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Tâches simultanées par worker")
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--scale", type=float, default=1.0, help="Facteur de croissance du trafic")
+    parser.add_argument("--target-p95", type=float, default=60.0, help="Attente p95 visée (secondes)")
+    parser.add_argument("--replications", type=int, default=5)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="Sortie JSON")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as handle:
+            transcriptions = json.load(handle)
+        planner = CapacityPlannerService(None, replications=args.replications)
+    else:
+        token = os.environ.get("VOCALYX_TOKEN")
+        if not token:
+            parser.error("--input or VOCALYX_TOKEN is required")
+        from config import Config
+        planner = CapacityPlannerService(VocalyxAPIClient(Config()), replications=args.replications)
+        transcriptions = planner.load_transcriptions(token)
+
+    worker_counts = [int(value) for value in args.workers.split(",")] if args.workers else None
+    plan = planner.plan(
+        fit_workload(transcriptions, args.pool),
+        worker_counts=worker_counts,
+        concurrency=args.concurrency,
+        days=args.days,
+        traffic_scale=args.scale,
+        target_p95=args.target_p95,
+        seed=args.seed
+    )
+    print(json.dumps(plan, indent=2, ensure_ascii=False) if args.json else _format_plan(plan))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
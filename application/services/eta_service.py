@@ -0,0 +1,368 @@
+"""
+EtaService - Estimation de l'heure de fin des transcriptions en file ou en cours
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from infrastructure.api.api_client import VocalyxAPIClient
+from infrastructure.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+QUEUED_STATUSES = {"pending", "queued"}
+ACTIVE_STATUSES = QUEUED_STATUSES | {"processing", "transcribed"}
+
+# Estimations par défaut tant qu'aucun historique n'est disponible (secondes)
+DEFAULT_PROCESSING_S = 60.0
+DEFAULT_ENRICHMENT_S = 30.0
+
+# Poids minimal d'un nouvel échantillon : la moyenne suit les évolutions récentes
+MIN_ALPHA = 0.05
+
+# Clé de classe de service : (modèle Whisper, diarisation, enrichissement)
+ServiceKey = Tuple[str, bool, bool]
+
+
+def service_key(transcription: Dict[str, Any]) -> ServiceKey:
+    return (
+        str(transcription.get("whisper_model") or "default"),
+        bool(transcription.get("diarization")),
+        bool(transcription.get("enrichment_requested"))
+    )
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    """Horodatage ISO 8601 (naïf = UTC) -> epoch"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class _RunningMean:
+    """Moyenne glissante : exacte sur les premiers échantillons, puis exponentielle"""
+
+    __slots__ = ("count", "mean")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        alpha = max(1.0 / self.count, MIN_ALPHA)
+        self.mean += alpha * (value - self.mean)
+
+
+@dataclass(frozen=True)
+class ServiceTimeModel:
+    """Temps de service attendu pour une classe de transcriptions (précalculé)"""
+
+    processing_s: float
+    rtf: Optional[float]
+    enrichment_s: float
+    samples: int
+
+    def processing_for(self, duration: Optional[float]) -> float:
+        """Durée de traitement attendue : proportionnelle à l'audio si sa durée est connue"""
+        if duration and self.rtf:
+            return self.rtf * duration
+        return self.processing_s
+
+
+class EtaService:
+    """
+    Apprend les temps de traitement à partir des transcriptions terminées qui
+    transitent par le dashboard, puis estime l'heure de fin des transcriptions
+    actives à partir du statut des workers et de la position dans la file.
+
+    Les modèles par classe (modèle Whisper, diarisation, enrichissement) sont
+    recalculés à chaque apprentissage ; une estimation est une simple lecture
+    de dictionnaire par transcription.
+    """
+
+    def __init__(
+        self,
+        api_client: VocalyxAPIClient,
+        min_samples: int = 20,
+        training_interval: float = 600.0,
+        max_seen: int = 10000,
+        pending_ttl: float = 10.0,
+        pending_limit: int = 500
+    ):
+        self.api_client = api_client
+        self.min_samples = min_samples
+        self.training_interval = training_interval
+        self.max_seen = max_seen
+        self.pending_limit = pending_limit
+        # File d'attente de l'utilisateur (transcriptions en attente), par session
+        self.pending_cache = TTLCache(pending_ttl, max_entries=1024)
+
+        self._processing: Dict[ServiceKey, _RunningMean] = {}
+        self._rtf: Dict[ServiceKey, _RunningMean] = {}
+        self._enrichment: Dict[ServiceKey, _RunningMean] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Modèles précalculés : classe exacte, par modèle Whisper, global
+        self._models: Dict[Any, ServiceTimeModel] = {}
+        self._rebuild()
+
+        self._last_training = 0.0
+        self._training_lock = threading.Lock()
+        self._capacity_source: Optional[float] = None
+        self._capacity = (1, 0.0, 1, 0.0)
+
+    # ------------------------------------------------------------------
+    # Apprentissage
+    # ------------------------------------------------------------------
+
+    @property
+    def samples(self) -> int:
+        return self._models["*"].samples
+
+    def observe(self, transcriptions: Any) -> int:
+        """Intègre les transcriptions terminées jamais vues ; retourne le nombre retenu"""
+        if isinstance(transcriptions, dict):
+            transcriptions = [transcriptions]
+        if not isinstance(transcriptions, list):
+            return 0
+        added = 0
+        with self._lock:
+            for entry in transcriptions:
+                if not isinstance(entry, dict) or entry.get("status") != "done":
+                    continue
+                transcription_id = str(entry.get("id") or "")
+                processing = entry.get("processing_time")
+                if not transcription_id or transcription_id in self._seen or not processing:
+                    continue
+                self._seen[transcription_id] = None
+                if len(self._seen) > self.max_seen:
+                    self._seen.popitem(last=False)
+
+                key = service_key(entry)
+                self._processing.setdefault(key, _RunningMean()).add(float(processing))
+                duration = entry.get("duration")
+                if duration:
+                    self._rtf.setdefault(key, _RunningMean()).add(float(processing) / float(duration))
+                enrichment = entry.get("enrichment_processing_time")
+                if enrichment:
+                    self._enrichment.setdefault(key, _RunningMean()).add(float(enrichment))
+                added += 1
+            if added:
+                self._rebuild()
+        return added
+
+    def _rebuild(self) -> None:
+        """Recalcule les modèles par classe, par modèle Whisper et global"""
+        def merge(keys: Iterable[ServiceKey]) -> ServiceTimeModel:
+            keys = list(keys)
+
+            def pooled(stats: Dict[ServiceKey, _RunningMean]) -> Tuple[Optional[float], int]:
+                count = sum(stats[k].count for k in keys if k in stats)
+                if not count:
+                    return None, 0
+                return sum(stats[k].mean * stats[k].count for k in keys if k in stats) / count, count
+
+            processing, samples = pooled(self._processing)
+            rtf, _ = pooled(self._rtf)
+            enrichment, _ = pooled(self._enrichment)
+            return ServiceTimeModel(
+                processing_s=processing or DEFAULT_PROCESSING_S,
+                rtf=rtf,
+                enrichment_s=enrichment or DEFAULT_ENRICHMENT_S,
+                samples=samples
+            )
+
+        keys = list(self._processing)
+        models: Dict[Any, ServiceTimeModel] = {key: merge([key]) for key in keys}
+        for whisper_model in {key[0] for key in keys}:
+            models[whisper_model] = merge(k for k in keys if k[0] == whisper_model)
+        models["*"] = merge(keys)
+        self._models = models
+
+    def model_for(self, transcription: Dict[str, Any]) -> ServiceTimeModel:
+        """Modèle le plus spécifique disposant d'échantillons (classe, puis modèle Whisper, puis global)"""
+        key = service_key(transcription)
+        models = self._models
+        return models.get(key) or models.get(key[0]) or models["*"]
+
+    def needs_training(self) -> bool:
+        return (
+            not self._training_lock.locked()
+            and self.samples < self.min_samples
+            and time.monotonic() - self._last_training > self.training_interval
+        )
+
+    def train(self, token: str, limit: int = 200) -> None:
+        """Charge des transcriptions terminées de l'utilisateur (tâche de fond)"""
+        if not self._training_lock.acquire(blocking=False):
+            return
+        try:
+            done = self.api_client.get_user_transcriptions(jwt_token=token, limit=limit, status="done")
+            added = self.observe(done)
+            logger.info(f"⏱️ ETA model trained on {added} new transcription(s) ({self.samples} total)")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not train ETA model: {e}")
+        finally:
+            self._last_training = time.monotonic()
+            self._training_lock.release()
+
+    # ------------------------------------------------------------------
+    # Estimation
+    # ------------------------------------------------------------------
+
+    def pending(self, token: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Transcriptions en attente visibles par l'utilisateur (au plus `pending_limit`
+        par statut), mises en cache `pending_ttl` secondes par session. None si l'API
+        ne répond pas : les positions sont alors relatives à la liste estimée.
+        """
+        session = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+        cached = self.pending_cache.get(session)
+        if cached is not None:
+            return cached
+        queued: List[Dict[str, Any]] = []
+        try:
+            for status in sorted(QUEUED_STATUSES):
+                page = self.api_client.get_user_transcriptions(jwt_token=token, limit=self.pending_limit, status=status)
+                if isinstance(page, list):
+                    queued.extend(t for t in page if isinstance(t, dict) and t.get("id"))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load pending transcriptions for ETA: {e}")
+            return None
+        self.pending_cache.put(session, queued)
+        return queued
+
+    def _worker_capacity(self, snapshot: Any = None, workers: Optional[Dict[str, Any]] = None) -> Tuple[int, float, int, float]:
+        """
+        (places transcription, tâches actives, places enrichissement, tâches actives).
+        Calculé une seule fois par instantané du WorkerMonitorService ; `workers`
+        (statut fourni par le client) ne sert qu'en l'absence d'instantané.
+        """
+        source = None
+        if snapshot is not None and snapshot.ok:
+            if snapshot.taken_at == self._capacity_source:
+                return self._capacity
+            source = snapshot.taken_at
+            workers = snapshot.data()
+        if not isinstance(workers, dict):
+            # Dernière capacité connue (valeurs par défaut sans aucun instantané)
+            return self._capacity
+        transcription_workers = int(workers.get("transcription_worker_count") or 0)
+        transcription_active = float(workers.get("transcription_active_tasks") or 0)
+        enrichment_workers = int(workers.get("enrichment_worker_count") or 0)
+        enrichment_active = float(workers.get("enrichment_active_tasks") or 0)
+        capacity = (
+            # Concurrence par worker inconnue : au moins autant de places que de tâches actives
+            max(1, transcription_workers, int(transcription_active)),
+            transcription_active,
+            max(1, enrichment_workers, int(enrichment_active)),
+            enrichment_active
+        )
+        if source is not None:
+            self._capacity_source = source
+            self._capacity = capacity
+        return capacity
+
+    def estimate(
+        self,
+        transcriptions: List[Dict[str, Any]],
+        snapshot: Any = None,
+        workers: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None,
+        pending: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        ETA des transcriptions actives de la liste, à partir de l'instantané du
+        statut des workers (`snapshot`) ou, à défaut, d'un statut fourni (`workers`).
+
+        `queue_position` (0 = prochaine) et l'attente sont calculées sur toute la file
+        de l'utilisateur (`pending`, voir `pending()`) complétée par la liste ; sans
+        `pending`, elles ne portent que sur la liste (une page). Les transcriptions
+        des autres utilisateurs ne comptent que via les tâches actives des workers.
+        """
+        now = now or time.time()
+        t_slots, t_active, e_slots, e_active = self._worker_capacity(snapshot, workers)
+        mean_processing = self._models["*"].processing_s
+        mean_enrichment = self._models["*"].enrichment_s
+        # Travail restant estimé des tâches déjà en cours (à mi-parcours en moyenne)
+        backlog = 0.5 * t_active * mean_processing
+        enrichment_wait = 0.5 * e_active * mean_enrichment / e_slots
+
+        active = [t for t in transcriptions if isinstance(t, dict) and t.get("status") in ACTIVE_STATUSES and t.get("id")]
+        listed = {str(t["id"]) for t in active}
+        # Le statut de la liste prime : une transcription démarrée depuis n'est plus en file
+        others = [
+            t for t in pending or ()
+            if isinstance(t, dict) and t.get("id") and t.get("status") in QUEUED_STATUSES and str(t["id"]) not in listed
+        ]
+        queued = sorted(
+            [t for t in active if t.get("status") in QUEUED_STATUSES] + others,
+            key=lambda t: _parse_time(t.get("created_at")) or now
+        )
+        positions = {str(t["id"]): index for index, t in enumerate(queued)}
+
+        etas: Dict[str, Dict[str, Any]] = {}
+        ahead = 0.0
+        for entry in queued + [t for t in active if t.get("status") not in QUEUED_STATUSES]:
+            transcription_id = str(entry["id"])
+            model = self.model_for(entry)
+            processing = model.processing_for(entry.get("duration"))
+            enrichment = model.enrichment_s + enrichment_wait if entry.get("enrichment_requested") else 0.0
+            status = entry.get("status")
+
+            if status in QUEUED_STATUSES:
+                remaining = (backlog + ahead) / t_slots + processing + enrichment
+                ahead += processing
+                if transcription_id not in listed:
+                    continue
+            elif status == "processing":
+                started = _parse_time(entry.get("processing_start_time"))
+                elapsed = now - started if started else 0.0
+                remaining = max(processing - elapsed, 0.1 * processing) + enrichment
+            else:
+                # Transcrit : seul l'enrichissement reste éventuellement
+                if not entry.get("enrichment_requested") or entry.get("enrichment_status") in ("done", "error"):
+                    continue
+                ended = _parse_time(entry.get("processing_end_time"))
+                elapsed = now - ended if ended else 0.0
+                remaining = max(enrichment - elapsed, 0.1 * model.enrichment_s)
+
+            etas[transcription_id] = {
+                "eta_seconds": round(remaining),
+                "eta_at": datetime.fromtimestamp(now + remaining, tz=timezone.utc).isoformat(),
+                "queue_position": positions.get(transcription_id),
+                "samples": model.samples
+            }
+        return etas
+
+    def annotate(
+        self,
+        transcriptions: Any,
+        snapshot: Any = None,
+        pending: Optional[List[Dict[str, Any]]] = None
+    ) -> Any:
+        """Ajoute eta_seconds / eta_at aux transcriptions actives d'une liste (sur place)"""
+        if not isinstance(transcriptions, list):
+            return transcriptions
+        etas = self.estimate(transcriptions, snapshot=snapshot, pending=pending)
+        for entry in transcriptions:
+            if isinstance(entry, dict):
+                eta = etas.get(str(entry.get("id")))
+                if eta:
+                    entry["eta_seconds"] = eta["eta_seconds"]
+                    entry["eta_at"] = eta["eta_at"]
+        return transcriptions
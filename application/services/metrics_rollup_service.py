@@ -0,0 +1,248 @@
+"""
+MetricsRollupService - Métriques de performance des transcriptions, pré-agrégées par intervalle et par dimensions
+"""
+
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from infrastructure.api.api_client import VocalyxAPIClient
+from infrastructure.cache import TTLCache
+from infrastructure.metrics import Rollup, RollupStore
+
+logger = logging.getLogger(__name__)
+
+# Dimensions des agrégats (toute combinaison peut être filtrée ou regroupée)
+DIMENSIONS = ("project", "whisper_model", "diarization", "enrichment", "worker")
+
+FINAL_STATUSES = {"done", "error"}
+
+QUANTILES = (("p50", 0.5), ("p90", 0.9), ("p95", 0.95), ("p99", 0.99))
+
+# Bornes (secondes) des distributions affichées par la vue Statistiques
+DISTRIBUTION_BOUNDS = (10, 30, 60, 120, 300, 600)
+DISTRIBUTION_LABELS = ("< 10s", "10-30s", "30s-1m", "1-2m", "2-5m", "5-10m", "> 10m")
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    """Horodatage ISO 8601 (naïf = UTC) -> epoch"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def dimensions_of(transcription: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "project": transcription.get("project_name") or "",
+        "whisper_model": transcription.get("whisper_model") or "default",
+        "diarization": "true" if transcription.get("diarization") else "false",
+        "enrichment": "true" if transcription.get("enrichment_requested") else "false",
+        "worker": transcription.get("worker_id") or ""
+    }
+
+
+def values_of(transcription: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    wait = _number(transcription.get("queue_wait_time"))
+    processing = _number(transcription.get("processing_time"))
+    return {
+        "queue_wait_time": wait,
+        "processing_time": processing,
+        "total_time": wait + processing if wait is not None and processing is not None else None,
+        "duration": _number(transcription.get("duration")),
+        "enrichment_processing_time": _number(transcription.get("enrichment_processing_time"))
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+def describe_rollup(rollup: Rollup) -> Dict[str, Any]:
+    """Résumé d'un agrégat au format attendu par la vue Statistiques"""
+    sketches = rollup.metrics
+    summary: Dict[str, Any] = {"total_transcriptions": rollup.count, "errors": rollup.errors}
+    for prefix, metric in (("queue_wait", "queue_wait_time"), ("processing", "processing_time"), ("total", "total_time")):
+        sketch = sketches.get(metric)
+        summary[f"avg_{prefix}_time"] = _round(sketch.mean) if sketch else None
+        summary[f"min_{prefix}_time"] = _round(sketch.min) if sketch and sketch.count else None
+        summary[f"max_{prefix}_time"] = _round(sketch.max) if sketch and sketch.count else None
+    summary["quantiles"] = {
+        metric: {label: _round(sketch.quantile(q)) for label, q in QUANTILES}
+        for metric, sketch in sketches.items() if sketch.count
+    }
+    for metric in ("processing_time", "queue_wait_time"):
+        sketch = sketches.get(metric)
+        summary[f"{metric}_distribution"] = (
+            dict(zip(DISTRIBUTION_LABELS, sketch.histogram(DISTRIBUTION_BOUNDS))) if sketch and sketch.count else {}
+        )
+    return summary
+
+
+class MetricsRollupService:
+    """
+    Agrège les transcriptions terminées qui transitent par le dashboard (listes,
+    détails, rafraîchissements en tâche de fond) dans un RollupStore : compteurs,
+    sommes et sketches de quantiles par minute / heure / jour et par projet,
+    modèle Whisper, diarisation, enrichissement et worker.
+
+    Une requête de métriques fusionne les agrégats de la période et des projets
+    visibles par l'utilisateur ; les transcriptions ne sont jamais relues.
+
+    Dédoublonnage : au-delà de `max_seen` identifiants retenus, les plus anciens
+    (date de fin, puis identifiant) sont oubliés et une ligne de flottaison monte
+    jusqu'à eux ; toute transcription à ou sous cette ligne est ignorée. Une
+    transcription n'est donc jamais comptée deux fois, au prix d'ignorer une
+    transcription jamais vue terminée avant les `max_seen` plus récentes.
+    """
+
+    def __init__(
+        self,
+        api_client: VocalyxAPIClient,
+        retention: Dict[str, float],
+        relative_accuracy: float = 0.01,
+        backfill_max_items: int = 1000,
+        backfill_interval: float = 3600.0,
+        max_seen: int = 100000
+    ):
+        self.api_client = api_client
+        self.store = RollupStore(DIMENSIONS, retention, relative_accuracy)
+        self.backfill_max_items = backfill_max_items
+        self.max_seen = max_seen
+        self._seen: Set[str] = set()
+        self._seen_order: List[Tuple[float, str]] = []
+        self._watermark: Tuple[float, str] = (float("-inf"), "")
+        self._lock = threading.Lock()
+        # Projets visibles par session (None : administrateur, tous les projets)
+        self._access = TTLCache(ttl_seconds=60, max_entries=1024)
+        # Sessions déjà complétées par l'historique récent
+        self._backfilled = TTLCache(ttl_seconds=backfill_interval, max_entries=1024)
+
+    # ------------------------------------------------------------------
+    # Alimentation
+    # ------------------------------------------------------------------
+
+    def observe(self, transcriptions: Any) -> int:
+        """Agrège les transcriptions terminées jamais vues ; retourne le nombre retenu"""
+        if isinstance(transcriptions, dict):
+            transcriptions = [transcriptions]
+        if not isinstance(transcriptions, list):
+            return 0
+        added = 0
+        now = time.time()
+        for entry in transcriptions:
+            if not isinstance(entry, dict) or entry.get("status") not in FINAL_STATUSES:
+                continue
+            transcription_id = str(entry.get("id") or "")
+            timestamp = _parse_time(entry.get("created_at"))
+            if not transcription_id or timestamp is None:
+                continue
+            key = (_parse_time(entry.get("processing_end_time")) or timestamp, transcription_id)
+            with self._lock:
+                if transcription_id in self._seen or key <= self._watermark:
+                    continue
+                self._seen.add(transcription_id)
+                heapq.heappush(self._seen_order, key)
+                while len(self._seen) > self.max_seen:
+                    oldest = heapq.heappop(self._seen_order)
+                    self._seen.discard(oldest[1])
+                    self._watermark = max(self._watermark, oldest)
+            if self.store.add(timestamp, dimensions_of(entry), values_of(entry), entry.get("status") == "error", now=now):
+                added += 1
+        return added
+
+    def needs_backfill(self, token: str) -> bool:
+        return self._backfilled.get(token) is None
+
+    def backfill(self, token: str, page_size: int = 100) -> None:
+        """Agrège l'historique récent de l'utilisateur (tâche de fond, au plus une fois par intervalle)"""
+        if self._backfilled.get(token) is not None:
+            return
+        self._backfilled.put(token, True)
+        started = time.perf_counter()
+        added = fetched = 0
+        page = 1
+        try:
+            while fetched < self.backfill_max_items:
+                batch = self.api_client.get_user_transcriptions(jwt_token=token, page=page, limit=page_size)
+                added += self.observe(batch)
+                fetched += len(batch)
+                if len(batch) < page_size:
+                    break
+                page += 1
+            logger.info(
+                f"📊 Metrics rollups backfilled with {added} transcription(s) "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not backfill metrics rollups: {e}")
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def visible_projects(self, token: str) -> Optional[frozenset]:
+        """Projets dont l'utilisateur peut voir les métriques (None : tous)"""
+        access = self._access.get(token)
+        if access is None:
+            if self.api_client.get_user_profile(token).get("is_admin"):
+                access = (None,)
+            else:
+                projects = self.api_client.get_user_projects(token)
+                access = (frozenset(
+                    name for name in (p.get("name") if isinstance(p, dict) else p for p in projects) if name
+                ),)
+            self._access.put(token, access)
+        return access[0]
+
+    def summary(
+        self,
+        token: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Métriques de la période filtrée (et détail par valeur de `group_by`)"""
+        where: Dict[str, Any] = {key: value for key, value in (filters or {}).items() if value is not None}
+        visible = self.visible_projects(token)
+        if visible is not None:
+            requested = where.get("project")
+            where["project"] = visible if requested is None else (visible & {str(requested)})
+
+        total = self.store.query(start=start, end=end, where=where).get("*") or Rollup(self.store.relative_accuracy)
+        payload = describe_rollup(total)
+        if group_by:
+            groups: List[Dict[str, Any]] = []
+            for key, rollup in self.store.query(start=start, end=end, where=where, group_by=group_by).items():
+                processing = rollup.metrics.get("processing_time")
+                wait = rollup.metrics.get("queue_wait_time")
+                groups.append({
+                    "key": key,
+                    "count": rollup.count,
+                    "errors": rollup.errors,
+                    "avg_processing_time": _round(processing.mean) if processing else None,
+                    "processing_p50": _round(processing.quantile(0.5)) if processing else None,
+                    "processing_p95": _round(processing.quantile(0.95)) if processing else None,
+                    "queue_wait_p50": _round(wait.quantile(0.5)) if wait else None,
+                    "queue_wait_p95": _round(wait.quantile(0.95)) if wait else None
+                })
+            payload["group_by"] = group_by
+            payload["groups"] = sorted(groups, key=lambda group: group["count"], reverse=True)
+        payload["rollup_buckets"] = self.store.granularity_counts()
+        return payload
@@ -0,0 +1,244 @@
+"""
+SearchIndexService - Index de préfixes en mémoire pour l'autocomplétion de la recherche
+"""
+
+import logging
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from infrastructure.api.api_client import VocalyxAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Champs possibles du nom de fichier d'origine selon la version de l'API
+FILENAME_FIELDS = ("original_filename", "filename", "file_name", "file_path")
+
+# Ordre d'affichage des types de suggestions
+KIND_ORDER = {"project": 0, "title": 1, "file": 2}
+
+# Entrée de l'index : (terme normalisé, type, libellé, id de transcription, projet)
+IndexEntry = Tuple[str, str, str, str, str]
+
+
+def normalize(text: str) -> str:
+    """Minuscules sans accents ni espaces superflus"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+def _suffix_terms(label: str) -> List[str]:
+    """Termes indexés pour un libellé : le libellé complet et chaque suffixe commençant à un mot"""
+    words = normalize(label).replace("_", " ").replace("-", " ").replace(".", " ").split()
+    full = normalize(label)
+    terms = {full} if full else set()
+    for index in range(1, len(words)):
+        terms.add(" ".join(words[index:]))
+    return sorted(terms)
+
+
+class UserSearchIndex:
+    """
+    Index de préfixes des libellés visibles par un utilisateur.
+    Les entrées sont conservées dans une liste triée : une recherche par préfixe
+    est une dichotomie suivie d'un parcours des seules entrées correspondantes.
+    Chaque document (transcription ou projet) peut être réindexé individuellement.
+    """
+
+    def __init__(self):
+        self._entries: List[IndexEntry] = []
+        self._documents: Dict[str, List[IndexEntry]] = {}
+        self._lock = threading.Lock()
+        self.refreshed_at = 0.0
+        self.refreshing = False
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _replace(self, doc_id: str, entries: List[IndexEntry]) -> None:
+        for entry in self._documents.pop(doc_id, []):
+            index = bisect_left(self._entries, entry)
+            if index < len(self._entries) and self._entries[index] == entry:
+                del self._entries[index]
+        if entries:
+            for entry in entries:
+                insort(self._entries, entry)
+            self._documents[doc_id] = entries
+
+    def upsert_transcription(self, transcription: Dict[str, Any]) -> None:
+        """(Ré)indexe le nom de fichier et le titre d'enrichissement d'une transcription"""
+        transcription_id = str(transcription.get("id") or "")
+        if not transcription_id:
+            return
+        project = transcription.get("project_name") or ""
+        labels = []
+        filename = next((transcription[f] for f in FILENAME_FIELDS if transcription.get(f)), None)
+        if filename:
+            labels.append(("file", str(filename).replace("\\", "/").rsplit("/", 1)[-1]))
+        title = (transcription.get("enrichment_data") or {}).get("title")
+        if title:
+            labels.append(("title", str(title)))
+
+        entries = [
+            (term, kind, label, transcription_id, project)
+            for kind, label in labels
+            for term in _suffix_terms(label)
+        ]
+        with self._lock:
+            # Une liste sans enrichissement ne doit pas effacer un titre déjà connu
+            if not title and "enrichment_data" not in transcription:
+                entries += [e for e in self._documents.get(f"t:{transcription_id}", []) if e[1] == "title"]
+            self._replace(f"t:{transcription_id}", entries)
+            if project:
+                self._replace(f"p:{project}", [(term, "project", project, "", project) for term in _suffix_terms(project)])
+
+    def upsert_project(self, project_name: str) -> None:
+        if not project_name:
+            return
+        with self._lock:
+            self._replace(f"p:{project_name}", [
+                (term, "project", project_name, "", project_name) for term in _suffix_terms(project_name)
+            ])
+
+    def remove_transcription(self, transcription_id: str) -> None:
+        with self._lock:
+            self._replace(f"t:{transcription_id}", [])
+
+    def suggest(self, query: str, limit: int = 8) -> List[Dict[str, str]]:
+        """Suggestions dont un mot commence par la requête (libellé complet prioritaire)"""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        seen = set()
+        matches = []
+        with self._lock:
+            index = bisect_left(self._entries, (prefix,))
+            # Parcours borné : quelques candidats de plus que demandé suffisent au classement
+            while index < len(self._entries) and len(matches) < limit * 4:
+                term, kind, label, transcription_id, project = self._entries[index]
+                if not term.startswith(prefix):
+                    break
+                index += 1
+                key = (kind, label, transcription_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                matches.append((not normalize(label).startswith(prefix), KIND_ORDER[kind], len(label), key, project))
+
+        matches.sort(key=lambda match: match[:3])
+        suggestions = []
+        for _, _, _, (kind, label, transcription_id), project in matches[:limit]:
+            suggestion = {"type": kind, "label": label, "project_name": project}
+            if transcription_id:
+                suggestion["transcription_id"] = transcription_id
+            suggestions.append(suggestion)
+        return suggestions
+
+
+class SearchIndexService:
+    """
+    Index de recherche par session (jeton), alimenté par les réponses de l'API qui
+    transitent par le dashboard (listes, détails, projets, uploads). Les suggestions
+    sont servies depuis la mémoire uniquement ; un index périmé est rafraîchi en
+    arrière-plan après la réponse.
+    """
+
+    def __init__(
+        self,
+        api_client: VocalyxAPIClient,
+        refresh_seconds: int = 60,
+        max_items: int = 500,
+        max_sessions: int = 256,
+        observers: Sequence[Callable[[List[Dict[str, Any]]], Any]] = ()
+    ):
+        self.api_client = api_client
+        # Appelés avec chaque lot rechargé (temps de traitement, métriques agrégées)
+        self.observers = tuple(observers)
+        self.refresh_seconds = refresh_seconds
+        self.max_items = max_items
+        self.max_sessions = max_sessions
+        self._indexes: "OrderedDict[str, UserSearchIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _index(self, token: str) -> UserSearchIndex:
+        with self._lock:
+            index = self._indexes.get(token)
+            if index is None:
+                index = UserSearchIndex()
+                self._indexes[token] = index
+                while len(self._indexes) > self.max_sessions:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(token)
+            return index
+
+    def index_transcriptions(self, token: str, transcriptions: Any) -> None:
+        if not isinstance(transcriptions, list):
+            return
+        index = self._index(token)
+        for transcription in transcriptions:
+            if isinstance(transcription, dict):
+                index.upsert_transcription(transcription)
+
+    def index_transcription(self, token: str, transcription: Dict[str, Any]) -> None:
+        if isinstance(transcription, dict):
+            self._index(token).upsert_transcription(transcription)
+
+    def index_projects(self, token: str, projects: Any) -> None:
+        if not isinstance(projects, list):
+            return
+        index = self._index(token)
+        for project in projects:
+            name = project.get("name") if isinstance(project, dict) else project
+            if isinstance(name, str):
+                index.upsert_project(name)
+
+    def remove_transcription(self, token: str, transcription_id: str) -> None:
+        self._index(token).remove_transcription(transcription_id)
+
+    def suggest(self, token: str, query: str, limit: int = 8) -> List[Dict[str, str]]:
+        """Suggestions pour la session (mémoire uniquement, aucun appel à l'API)"""
+        return self._index(token).suggest(query, limit)
+
+    def needs_refresh(self, token: str) -> bool:
+        index = self._index(token)
+        return not index.refreshing and time.monotonic() - index.refreshed_at > self.refresh_seconds
+
+    def refresh(self, token: str, page_size: int = 100) -> None:
+        """
+        Recharge les transcriptions récentes et les projets de l'utilisateur dans l'index.
+        Appelé en tâche de fond (BackgroundTasks), jamais pendant une suggestion.
+        """
+        index = self._index(token)
+        if index.refreshing:
+            return
+        index.refreshing = True
+        started = time.perf_counter()
+        try:
+            self.index_projects(token, self.api_client.get_user_projects(token))
+            fetched = 0
+            page = 1
+            while fetched < self.max_items:
+                # Taille de page constante : l'API pagine par décalage (page - 1) x limit
+                page_items = self.api_client.get_user_transcriptions(jwt_token=token, page=page, limit=page_size)
+                batch = page_items[:self.max_items - fetched]
+                self.index_transcriptions(token, batch)
+                for observer in self.observers:
+                    observer(batch)
+                fetched += len(batch)
+                if len(page_items) < page_size:
+                    break
+                page += 1
+            logger.debug(
+                f"🔎 Index de recherche rafraîchi : {len(index)} documents "
+                f"en {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not refresh search index: {e}")
+        finally:
+            index.refreshed_at = time.monotonic()
+            index.refreshing = False
@@ -0,0 +1,175 @@
+"""
+SegmentService - Accès fenêtré aux segments des transcriptions volumineuses
+"""
+
+import hashlib
+import json
+import logging
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Dict, Any, Tuple
+
+from infrastructure.api.api_client import VocalyxAPIClient
+from infrastructure.cache import ByteBoundedLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Seules les transcriptions dans un état terminal sont mises en cache :
+# leurs segments ne bougent plus.
+CACHEABLE_STATUSES = {"done", "error"}
+
+
+class ParsedTranscript:
+    """
+    Transcription découpée pour un accès par fenêtre.
+    Les bornes des segments sont stockées dans des tableaux compacts (array 'd')
+    afin de permettre des recherches temporelles par dichotomie.
+    """
+
+    __slots__ = ("transcription_id", "status", "starts", "ends", "texts", "speakers", "metadata", "nbytes")
+
+    def __init__(self, transcription_id: str, status: Optional[str], segments: List[Dict[str, Any]], metadata: Dict[str, Any]):
+        self.transcription_id = transcription_id
+        self.status = status
+
+        # Les segments Whisper sont normalement ordonnés, on trie par sécurité
+        ordered = segments
+        if any(segments[i].get("start", 0) > segments[i + 1].get("start", 0) for i in range(len(segments) - 1)):
+            ordered = sorted(segments, key=lambda seg: seg.get("start", 0))
+
+        self.starts = array("d", (float(seg.get("start") or 0.0) for seg in ordered))
+        self.ends = array("d", (float(seg.get("end") or 0.0) for seg in ordered))
+        self.texts = [seg.get("text") or "" for seg in ordered]
+        speakers = [seg.get("speaker") for seg in ordered]
+        self.speakers = speakers if any(s is not None for s in speakers) else None
+        self.metadata = metadata
+        self.nbytes = self._estimate_size()
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "ParsedTranscript":
+        """Construit la structure à partir de la réponse de l'API"""
+        segments = payload.get("segments") or []
+        metadata = {key: value for key, value in payload.items() if key != "segments"}
+        metadata.setdefault("segments_count", len(segments))
+        return cls(str(payload.get("id", "")), payload.get("status"), segments, metadata)
+
+    def _estimate_size(self) -> int:
+        """Estime l'empreinte mémoire (octets) de la transcription analysée"""
+        size = self.starts.itemsize * len(self.starts) + self.ends.itemsize * len(self.ends)
+        size += sum(sys.getsizeof(text) for text in self.texts)
+        if self.speakers:
+            size += sum(sys.getsizeof(s) for s in self.speakers if s is not None)
+        size += len(json.dumps(self.metadata, default=str))
+        return size
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def index_at(self, t: float) -> int:
+        """Index du premier segment qui se termine après l'instant t"""
+        return bisect_right(self.ends, t)
+
+    def time_range(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """Bornes [lo, hi) des segments qui recouvrent l'intervalle [start, end)"""
+        lo = self.index_at(start) if start is not None else 0
+        hi = bisect_left(self.starts, end) if end is not None else len(self)
+        return lo, max(lo, hi)
+
+    def segment(self, index: int) -> Dict[str, Any]:
+        """Reconstitue un segment sous forme de dict"""
+        seg = {
+            "index": index,
+            "start": self.starts[index],
+            "end": self.ends[index],
+            "text": self.texts[index]
+        }
+        if self.speakers and self.speakers[index] is not None:
+            seg["speaker"] = self.speakers[index]
+        return seg
+
+
+class SegmentService:
+    """
+    Service de lecture fenêtrée des segments, adossé à un cache LRU borné en
+    octets. Une transcription n'est analysée et conservée qu'une fois, quelle que
+    soit la session ; l'entrée garde les sessions à qui l'API l'a déjà servie. Une
+    autre session la redemande à l'API (contrôle d'accès) avant de la partager.
+    """
+
+    def __init__(self, api_client: VocalyxAPIClient, max_bytes: int):
+        self.api_client = api_client
+        # transcription_id -> (ParsedTranscript, empreintes des jetons autorisés)
+        self.cache = ByteBoundedLRUCache(max_bytes)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _session(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+    def get_transcript(self, token: str, transcription_id: str) -> ParsedTranscript:
+        """Récupère la transcription analysée (depuis le cache si la session y a accès)"""
+        session = self._session(token)
+        entry = self.cache.get(transcription_id)
+        if entry is not None:
+            parsed, sessions = entry
+            with self._lock:
+                if session in sessions:
+                    return parsed
+
+        payload = self.api_client.get_user_transcription(token, transcription_id)
+        if entry is not None:
+            # Accès confirmé par l'API : la copie déjà analysée est partagée
+            with self._lock:
+                sessions.add(session)
+            return parsed
+        parsed = ParsedTranscript.from_payload(payload)
+        if parsed.status in CACHEABLE_STATUSES:
+            if not self.cache.put(transcription_id, (parsed, {session}), parsed.nbytes):
+                logger.warning(
+                    f"Transcription {transcription_id} trop volumineuse pour le cache "
+                    f"({parsed.nbytes} octets > {self.cache.max_bytes})"
+                )
+        return parsed
+
+    def invalidate(self, transcription_id: str) -> None:
+        """Retire une transcription du cache pour toutes les sessions (suppression)"""
+        self.cache.pop(transcription_id)
+
+    def get_metadata(self, token: str, transcription_id: str) -> Dict[str, Any]:
+        """Retourne la transcription sans ses segments"""
+        return dict(self.get_transcript(token, transcription_id).metadata)
+
+    def get_window(
+        self,
+        token: str,
+        transcription_id: str,
+        offset: int = 0,
+        limit: int = 200,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Retourne une fenêtre de segments.
+        `offset`/`limit` s'appliquent à l'intérieur de l'intervalle temporel [start, end)
+        lorsqu'il est fourni, sinon à la liste complète.
+        """
+        parsed = self.get_transcript(token, transcription_id)
+        lo, hi = parsed.time_range(start, end)
+        first = min(lo + max(0, offset), hi)
+        last = min(first + max(0, limit), hi)
+
+        return {
+            "transcription_id": transcription_id,
+            "status": parsed.status,
+            "total": len(parsed),
+            "range_total": hi - lo,
+            "range_start_index": lo,
+            "offset": first - lo,
+            "limit": limit,
+            "returned": last - first,
+            "has_more": last < hi,
+            "duration": parsed.ends[-1] if len(parsed) else 0.0,
+            "segments": [parsed.segment(i) for i in range(first, last)]
+        }
@@ -0,0 +1,176 @@
+"""
+WorkerMonitorService - Sondage périodique du statut des workers, instantané partagé et historique
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from infrastructure.api.api_client import VocalyxAPIClient
+from infrastructure.cache import MetricRingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Métriques agrégées conservées dans l'historique
+HISTORY_FIELDS = (
+    "worker_count",
+    "transcription_worker_count",
+    "enrichment_worker_count",
+    "active_tasks",
+    "transcription_active_tasks",
+    "enrichment_active_tasks"
+)
+
+
+@dataclass(frozen=True)
+class WorkerSnapshot:
+    """Statut des workers à un instant donné, déjà sérialisé pour être servi tel quel"""
+
+    taken_at: float
+    body: bytes
+    ok: bool
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.taken_at)
+
+    def data(self) -> Dict[str, Any]:
+        return json.loads(self.body)
+
+
+class WorkerMonitorService:
+    """
+    Une seule tâche de fond interroge l'API à intervalle fixe et publie un
+    instantané immuable : les lectures de /api/workers/status ne coûtent aucun
+    appel à l'API.
+
+    L'endpoint des workers exige un JWT administrateur : la tâche utilise le jeton
+    du dernier administrateur ayant consulté le statut, et se met en veille lorsque
+    plus personne ne l'a consulté depuis `idle_timeout` secondes (ou si le jeton
+    est refusé).
+    """
+
+    def __init__(
+        self,
+        api_client: VocalyxAPIClient,
+        interval: float = 5.0,
+        history_size: int = 720,
+        idle_timeout: float = 300.0
+    ):
+        self.api_client = api_client
+        self.interval = max(1.0, float(interval))
+        self.idle_timeout = idle_timeout
+        self.history = MetricRingBuffer(HISTORY_FIELDS, history_size)
+        self.snapshot: Optional[WorkerSnapshot] = None
+        self.last_error: Optional[str] = None
+
+        self._token: Optional[str] = None
+        self._last_viewed = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._poll_lock = asyncio.Lock()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="worker-monitor")
+            logger.info(f"🛰️ Worker monitor started (interval {self.interval:.0f}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def touch(self, token: str) -> None:
+        """Enregistre une consultation (jeton admin vérifié) et réveille la tâche si besoin"""
+        self._token = token
+        self._last_viewed = time.monotonic()
+        self._wakeup.set()
+
+    def _active(self) -> bool:
+        return self._token is not None and time.monotonic() - self._last_viewed < self.idle_timeout
+
+    async def _run(self) -> None:
+        while True:
+            if not self._active():
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            started = time.monotonic()
+            await self.poll()
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    # ------------------------------------------------------------------
+    # Sondage
+    # ------------------------------------------------------------------
+
+    async def poll(self) -> Optional[WorkerSnapshot]:
+        """
+        Interroge l'API (hors boucle) et publie un nouvel instantané. Un seul
+        sondage à la fois : les appels concurrents attendent celui en cours.
+        """
+        async with self._poll_lock:
+            if self._poll_task is None or self._poll_task.done():
+                self._poll_task = asyncio.create_task(self._poll(), name="worker-monitor-poll")
+            task = self._poll_task
+        # L'annulation d'un appelant n'interrompt pas le sondage partagé
+        return await asyncio.shield(task)
+
+    async def _poll(self) -> Optional[WorkerSnapshot]:
+        token = self._token
+        if token is None:
+            return self.snapshot
+        try:
+            status = await asyncio.to_thread(self.api_client.get_workers_status, token)
+        except Exception as e:
+            logger.warning(f"⚠️ Worker status poll failed: {e}")
+            self.last_error = str(e)
+            return self.snapshot
+        self.last_error = None
+        return self.publish(status, token)
+
+    def publish(self, status: Dict[str, Any], token: Optional[str] = None) -> WorkerSnapshot:
+        """
+        Publie un statut : instantané partagé + échantillon d'historique si valide.
+        `status_code` (code HTTP de l'API en cas d'échec) n'est pas publié : 401/403
+        signalent un jeton refusé.
+        """
+        status_code = status.get("status_code")
+        status = {key: value for key, value in status.items() if key != "status_code"}
+        ok = not status.get("error")
+        if not ok and token is not None and token == self._token and status_code in (401, 403):
+            # Jeton expiré ou révoqué : en veille jusqu'à la prochaine consultation
+            logger.info("🔑 Worker monitor token rejected, pausing until next admin request")
+            self._token = None
+        if not ok and self.snapshot is not None and self.snapshot.ok:
+            # Conserver le dernier statut valide plutôt qu'un statut vide
+            return self.snapshot
+
+        now = time.time()
+        snapshot = WorkerSnapshot(taken_at=now, body=json.dumps(status).encode("utf-8"), ok=ok)
+        self.snapshot = snapshot
+        if ok:
+            self.history.append(now, {field: status.get(field) for field in HISTORY_FIELDS})
+        return snapshot
+
+    def is_fresh(self) -> bool:
+        return self.snapshot is not None and self.snapshot.age < 2 * self.interval
+
+    def history_payload(self, points: int = 60, window: Optional[float] = None) -> Dict[str, Any]:
+        """Historique sous-échantillonné (au plus `points` valeurs par métrique)"""
+        since = time.time() - window if window else None
+        payload = self.history.downsample(points, since=since)
+        payload["interval"] = self.interval
+        payload["capacity"] = self.history.capacity
+        return payload
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+benchmarks/capacity_simulation.py
+Durée de la simulation de capacité (un mois de trafic, objectif < 1 s)
+
+Usage : python benchmarks/capacity_simulation.py [--per-day 2000] [--days 30] [--workers 1,2,3,4,6,8]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.services.capacity_planner_service import (  # noqa: E402
+    HOURS_PER_WEEK,
+    CapacityPlannerService,
+    WorkloadModel
+)
+
+
+def synthetic_workload(per_day: float, rng: np.random.Generator) -> WorkloadModel:
+    """Trafic de bureau : 80 % des arrivées en semaine entre 8 h et 19 h"""
+    office = np.zeros(HOURS_PER_WEEK, dtype=bool)
+    for day in range(5):
+        office[day * 24 + 8:day * 24 + 19] = True
+    rates = np.where(office, 0.8 * per_day * 7 / office.sum(), 0.2 * per_day * 7 / (~office).sum())
+    services = rng.lognormal(np.log(45), 0.7, 5000)
+    return WorkloadModel("transcription", rates, services, np.empty(0), 28.0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--per-day", type=float, default=2000)
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--workers", default="1,2,3,4,6,8")
+    parser.add_argument("--replications", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    model = synthetic_workload(args.per_day, np.random.default_rng(args.seed))
+    planner = CapacityPlannerService(None, replications=args.replications)
+    worker_counts = [int(value) for value in args.workers.split(",")]
+
+    started = time.perf_counter()
+    plan = planner.plan(model, worker_counts=worker_counts, days=args.days, seed=args.seed)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{plan['simulation']['jobs']} tâches x {len(worker_counts)} candidats x "
+        f"{args.replications} trajectoire(s) : {elapsed * 1000:.0f} ms"
+    )
+    for candidate in plan["candidates"]:
+        print(f"  {candidate['workers']:>3} workers  p50 {candidate['wait_p50']:>9.1f} s  p95 {candidate['wait_p95']:>9.1f} s")
+    return 0 if elapsed < 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
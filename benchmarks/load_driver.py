@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+"""
+benchmarks/load_driver.py
+Test de charge du dashboard contre le faux vocalyx-api : RPS, p50/p95/p99 et pic de RSS par route et pour les uploads
+
+Usage : python benchmarks/load_driver.py [--concurrency 16] [--duration 10] [--latency-ms 20] [--upload-kb 512]
+        [--scenarios recent,detail,...] [--output benchmarks/results] [--compare benchmarks/results/<précédent>.json]
+        [--faults "GET /api/user/transcriptions* latency_ms=300 error_rate=0.1"]
+
+Le faux API (benchmarks/stub_api.py) et le dashboard (uvicorn app:app) sont lancés dans
+des processus séparés ; le RSS est relevé dans /proc (Linux). Les résultats sont écrits
+en JSON (commit, paramètres, mesures) pour être comparés d'un commit à l'autre.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+WORDS = ("reunion", "equipe", "client", "appel", "projet", "budget", "support", "point", "comite", "planning")
+
+# Scénario : nom -> fabrique (méthode, chemin, options httpx) à partir du contexte (identifiants connus)
+Request = Tuple[str, str, Dict[str, Any]]
+SCENARIOS: Dict[str, Callable[[Dict[str, Any], random.Random], Request]] = {
+    "dashboard": lambda ctx, rng: ("GET", "/dashboard", {}),
+    "recent": lambda ctx, rng: ("GET", "/api/transcriptions/recent", {"params": {"page": rng.randint(1, 5), "limit": 25}}),
+    "recent_filtered": lambda ctx, rng: ("GET", "/api/transcriptions/recent", {
+        "params": {"page": 1, "limit": 25, "status": "done", "search": rng.choice(WORDS)}
+    }),
+    "count": lambda ctx, rng: ("GET", "/api/transcriptions/count", {}),
+    "detail": lambda ctx, rng: ("GET", f"/api/transcriptions/{rng.choice(ctx['ids'])}", {}),
+    "segments": lambda ctx, rng: ("GET", f"/api/transcriptions/{rng.choice(ctx['ids'])}/segments", {
+        "params": {"offset": 0, "limit": 100}
+    }),
+    "suggest": lambda ctx, rng: ("GET", "/api/search/suggest", {"params": {"q": rng.choice(WORDS)[:rng.randint(2, 5)]}}),
+    "metrics": lambda ctx, rng: ("GET", "/api/transcriptions/metrics", {"params": {"group_by": "project"}}),
+    "user_projects": lambda ctx, rng: ("GET", "/api/user/projects", {}),
+    "workers": lambda ctx, rng: ("GET", "/api/workers/status", {}),
+    "upload": lambda ctx, rng: ("POST", "/api/upload", {
+        "files": {"file": (f"bench_{rng.randint(0, 10**6)}.wav", ctx["upload_payload"], "audio/wav")},
+        "data": {"project_name": "ISICOMTECH", "api_key": "stub-key-isicomtech", "whisper_model": "small"}
+    })
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def read_rss(pid: int) -> Optional[int]:
+    """RSS courant (octets) d'un processus, None hors Linux"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def git_revision() -> Dict[str, Any]:
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "--short", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} : le processus s'est arrêté (code {process.returncode})")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} : pas de réponse après {timeout:.0f} s")
+
+
+def start_processes(
+    args: argparse.Namespace,
+    workdir: str,
+    stub_options: Sequence[str] = ()
+) -> Tuple[List[subprocess.Popen], subprocess.Popen, str]:
+    """
+    Lance le(s) faux API (même jeu de données) puis le dashboard configuré pour
+    les utiliser ; avec --slow-backend-ms, la dernière instance est plus lente.
+    """
+    backends = max(1, getattr(args, "backends", 1))
+    stubs, api_urls = [], []
+    for index in range(backends):
+        api_port = free_port()
+        slow = backends > 1 and index == backends - 1
+        latency = args.latency_ms + (getattr(args, "slow_backend_ms", 0.0) if slow else 0.0)
+        stub = subprocess.Popen([
+            sys.executable, str(ROOT / "benchmarks" / "stub_api.py"), "--port", str(api_port),
+            "--latency-ms", str(latency), "--jitter-ms", str(args.jitter_ms),
+            "--transcriptions", str(args.transcriptions), "--segments", str(args.segments), *stub_options
+        ], cwd=ROOT)
+        stubs.append(stub)
+        wait_ready(f"http://127.0.0.1:{api_port}/health", stub)
+        api_urls.append(f"http://127.0.0.1:{api_port}")
+    dashboard_port = free_port()
+    env = {
+        **os.environ,
+        "VOCALYX_API_URL": ",".join(api_urls),
+        "LOG_LEVEL": args.log_level,
+        "LOG_COLORED": "false",
+        "LOG_FILE_PATH": str(Path(workdir) / "vocalyx-frontend.log")
+    }
+    if getattr(args, "faults", None):
+        env["VOCALYX_FAULTS"] = args.faults
+    dashboard = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app:app", "--host", "127.0.0.1", "--port", str(dashboard_port),
+        "--log-level", "warning", "--no-access-log"
+    ], cwd=ROOT, env=env)
+    base_url = f"http://127.0.0.1:{dashboard_port}"
+    wait_ready(f"{base_url}/health", dashboard)
+    return stubs, dashboard, base_url
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    context: Dict[str, Any],
+    concurrency: int,
+    duration: float,
+    pid: Optional[int],
+    seed: int
+) -> Dict[str, Any]:
+    """Boucle fermée : `concurrency` utilisateurs enchaînent les requêtes pendant `duration` secondes"""
+    factory = SCENARIOS[name]
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    peak_rss = read_rss(pid) if pid else None
+    deadline = time.perf_counter() + duration
+
+    async def user(index: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            method, path, options = factory(context, rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **options)
+                await response.aread()
+                key = str(response.status_code)
+            except httpx.HTTPError as e:
+                key = type(e).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[key] = statuses.get(key, 0) + 1
+            if not key.startswith(("2", "3")):
+                errors += 1
+
+    async def sample_rss() -> None:
+        nonlocal peak_rss
+        while time.perf_counter() < deadline:
+            rss = read_rss(pid)
+            if rss is not None:
+                peak_rss = max(peak_rss or 0, rss)
+            await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    tasks = [user(index) for index in range(concurrency)]
+    if pid:
+        tasks.append(sample_rss())
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def percentile(q: float) -> Optional[float]:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3) if ordered else None
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ordered), 3) if ordered else None,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1], 3) if ordered else None,
+        "peak_rss_bytes": peak_rss
+    }
+
+
+async def drive(base_url: str, args: argparse.Namespace, pid: Optional[int]) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        # Préparation répétée au besoin : elle peut subir les pannes injectées (--faults)
+        for attempt in range(10):
+            try:
+                login = await client.post("/auth/login", data={"username": "admin", "password": "admin"})
+                login.raise_for_status()
+                recent = await client.get("/api/transcriptions/recent", params={"page": 1, "limit": 100, "status": "done"})
+                recent.raise_for_status()
+                break
+            except httpx.HTTPError:
+                if attempt == 9:
+                    raise
+        context = {
+            "ids": [entry["id"] for entry in recent.json()] or ["missing"],
+            "upload_payload": os.urandom(args.upload_kb * 1024)
+        }
+        results = {}
+        for name in args.scenarios:
+            # Échauffement (connexions, caches) non mesuré
+            await run_scenario(client, name, context, args.concurrency, min(1.0, args.duration / 5), None, args.seed)
+            results[name] = await run_scenario(client, name, context, args.concurrency, args.duration, pid, args.seed)
+            result = results[name]
+            rss = f"{result['peak_rss_bytes'] / 2**20:7.1f} Mo" if result["peak_rss_bytes"] else "    n/a"
+            print(
+                f"  {name:<16} {result['rps']:>8.1f} req/s   p50 {result['p50_ms']:>8.2f}   "
+                f"p95 {result['p95_ms']:>8.2f}   p99 {result['p99_ms']:>8.2f} ms   RSS {rss}   "
+                f"erreurs {result['errors']}"
+            )
+        if getattr(args, "backends", 1) > 1:
+            backends = (await client.get("/health")).json().get("backends", {})
+            for url, state in backends.items():
+                print(
+                    f"  instance {url:<24} {state['requests']:>7} appels   EWMA {state['ewma_latency_ms']:>7.1f} ms   "
+                    f"{state['state']}"
+                )
+        return results
+
+
+def compare(results: Dict[str, Any], baseline_path: str) -> None:
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    print(f"\nComparaison avec {baseline_path} (commit {baseline.get('git', {}).get('commit')}) :")
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+
+        def delta(key: str) -> str:
+            if not previous.get(key) or result.get(key) is None:
+                return "   n/a"
+            return f"{(result[key] - previous[key]) / previous[key] * 100:+6.1f} %"
+
+        print(f"  {name:<16} RPS {delta('rps')}   p95 {delta('p95_ms')}   p99 {delta('p99_ms')}   RSS {delta('peak_rss_bytes')}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Durée mesurée par scénario (secondes)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Parmi : {', '.join(SCENARIOS)}")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latence moyenne du faux API")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--transcriptions", type=int, default=500)
+    parser.add_argument("--segments", type=int, default=200)
+    parser.add_argument("--upload-kb", type=int, default=512, help="Taille des fichiers envoyés par le scénario upload")
+    parser.add_argument("--log-level", default="WARNING", help="Niveau de log du dashboard pendant la mesure")
+    parser.add_argument("--backends", type=int, default=1, help="Nombre d'instances du faux API (répartition de charge)")
+    parser.add_argument("--slow-backend-ms", type=float, default=0.0,
+                        help="Latence ajoutée à la dernière instance (avec --backends > 1)")
+    parser.add_argument("--faults", help="Pannes injectées dans les appels du dashboard à l'API (syntaxe de [FAULTS] rules)")
+    parser.add_argument("--target", help="URL d'un dashboard déjà lancé (sinon faux API + dashboard démarrés ici)")
+    parser.add_argument("--pid", type=int, help="PID du dashboard ciblé par --target (mesure du RSS)")
+    parser.add_argument("--output", default=str(ROOT / "benchmarks" / "results"), help="Répertoire ou fichier JSON")
+    parser.add_argument("--compare", help="Résultats JSON précédents à comparer")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Scénarios inconnus : {', '.join(unknown)}")
+
+    processes: List[subprocess.Popen] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            if args.target:
+                base_url, pid = args.target.rstrip("/"), args.pid
+            else:
+                stubs, dashboard, base_url = start_processes(args, workdir)
+                processes = [dashboard, *stubs]
+                pid = dashboard.pid
+            print(
+                f"{base_url} : {len(args.scenarios)} scénario(s) x {args.duration:g} s, "
+                f"{args.concurrency} utilisateurs simultanés, faux API {args.latency_ms:g} ± {args.jitter_ms:g} ms"
+            )
+            results = asyncio.run(drive(base_url, args, pid))
+        finally:
+            for process in processes:
+                process.terminate()
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+    revision = git_revision()
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": revision,
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "parameters": {
+            key: getattr(args, key) for key in
+            ("concurrency", "duration", "scenarios", "latency_ms", "jitter_ms", "transcriptions", "segments", "upload_kb",
+             "log_level", "faults", "backends", "slow_backend_ms")
+        },
+        "results": results
+    }
+    output = Path(args.output)
+    if output.suffix != ".json":
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = output / f"load-{revision['commit'] or 'nogit'}{'-dirty' if revision['dirty'] else ''}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"Résultats : {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    # Avec des pannes injectées, les erreurs font partie de la mesure
+    return 0 if args.faults or all(result["errors"] == 0 for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+benchmarks/logging_latency.py
+Latence des requêtes avec logs DEBUG : handlers synchrones vs file + thread d'écriture
+
+Usage : python benchmarks/logging_latency.py [--requests 2000] [--logs-per-request 20] [--disk-stall-ms 0]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import logging_config  # noqa: E402
+from logging_config import LOG_DATE_FORMAT, LOG_FORMAT, JsonFormatter, setup_logging  # noqa: E402
+
+
+class StallingFileHandler(logging.FileHandler):
+    """Fichier de log dont une écriture sur 100 reste bloquée (disque saturé, volume réseau)"""
+
+    stall_seconds = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._writes = 0
+
+    def emit(self, record):
+        self._writes += 1
+        if self.stall_seconds and self._writes % 100 == 0:
+            time.sleep(self.stall_seconds)
+        super().emit(record)
+
+
+def build_app(logs_per_request: int) -> FastAPI:
+    app = FastAPI()
+    logger = logging.getLogger("routes")
+
+    @app.get("/api/transcriptions/{transcription_id}")
+    async def transcription(transcription_id: str):
+        for step in range(logs_per_request):
+            logger.debug(f"🔍 Transcription {transcription_id} - étape {step} ({len(transcription_id)} octets)")
+        return {"id": transcription_id, "status": "done"}
+
+    return app
+
+
+def configure_sync(log_file: str, json_format: bool) -> None:
+    """Pipeline historique : handlers appelés sur le thread de la requête"""
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    handler = StallingFileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(formatter)
+    logging.basicConfig(level=logging.DEBUG, handlers=[handler], force=True)
+
+
+def configure_queue(log_file: str, json_format: bool) -> None:
+    setup_logging("DEBUG", log_file=None, json_format=json_format)
+    handler = StallingFileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    # Remplacer la console par le fichier mesuré (le thread d'écriture reste celui de setup_logging)
+    logging_config._listener.handlers = (handler,)
+
+
+async def measure(app: FastAPI, requests: int) -> list:
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for number in range(requests):
+            started = time.perf_counter()
+            response = await client.get(f"/api/transcriptions/{number:08d}")
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(
+        f"  {label:<22} p50 {statistics.median(ordered):6.3f} ms   p99 {p99:7.3f} ms   "
+        f"max {ordered[-1]:7.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--logs-per-request", type=int, default=20)
+    parser.add_argument("--disk-stall-ms", type=float, default=0.0,
+                        help="Blocage simulé d'une écriture sur 100 (0 : disque local)")
+    parser.add_argument("--json", action="store_true", help="Formatter JSON")
+    args = parser.parse_args()
+    StallingFileHandler.stall_seconds = args.disk_stall_ms / 1000
+
+    app = build_app(args.logs_per_request)
+    print(
+        f"{args.requests} requêtes x {args.logs_per_request} logs DEBUG "
+        f"({'JSON' if args.json else 'texte'}, blocage disque {args.disk_stall_ms:g} ms / 100 écritures)"
+    )
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for label, configure in (("synchrone", configure_sync), ("file + thread dédié", configure_queue)):
+            configure(str(Path(directory) / f"{label[:4]}.log"), args.json)
+            results[label] = asyncio.run(measure(app, args.requests))
+            logging_config.shutdown_logging()
+            report(label, results[label])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
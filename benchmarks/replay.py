@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+"""
+benchmarks/replay.py
+Rejeu d'un enregistrement du trafic ([RECORDING]) contre le dashboard et le faux vocalyx-api, à 1x ou accéléré
+
+Usage : python benchmarks/replay.py logs/vocalyx-frontend-traffic.jsonl.gz [--speed 1] [--max-requests 0]
+        [--output benchmarks/results] [--compare benchmarks/results/<précédent>.json]
+
+Les requêtes sont renvoyées en boucle ouverte aux instants enregistrés (divisés par --speed),
+un client authentifié par session. La latence est mesurée depuis l'instant prévu : l'attente
+derrière --max-in-flight requêtes en cours est comptée (pas d'omission coordonnée). Les valeurs pseudonymisées sont remplacées par des
+valeurs du jeu de données du faux API ; celui-ci reproduit, endpoint par endpoint, les
+latences et erreurs de vocalyx-api observées pendant l'enregistrement. Le rapport compare
+les latences rejouées à celles enregistrées.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.load_driver import ROOT, compare, git_revision, read_rss, start_processes  # noqa: E402
+from benchmarks.stub_api import PROJECTS, WORDS, StubDataset  # noqa: E402
+from infrastructure.tracing import parse_pseudonym, read_recording  # noqa: E402
+
+DETAIL_ENDPOINT = "GET /api/user/transcriptions/{transcription_id}"
+# Surcoût multipart (en-têtes des champs) déduit de la taille enregistrée d'un upload
+MULTIPART_OVERHEAD = 600
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(values)
+
+    def at(q: float) -> Optional[float]:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3) if ordered else None
+
+    return {"p50_ms": at(0.50), "p95_ms": at(0.95), "p99_ms": at(0.99)}
+
+
+def upstream_profile(entries: List[Dict[str, Any]]) -> Tuple[Dict[str, List[List[Any]]], Optional[int]]:
+    """Échantillons [ms, statut] par endpoint de l'API et taille médiane (octets) d'une transcription complète"""
+    profile: Dict[str, List[List[Any]]] = defaultdict(list)
+    detail_sizes = []
+    for entry in entries:
+        for method, endpoint, status, duration_ms, size in entry.get("u", ()):
+            key = f"{method} {endpoint}"
+            profile[key].append([duration_ms, status])
+            if key == DETAIL_ENDPOINT and status == 200 and size:
+                detail_sizes.append(size)
+    return dict(profile), int(statistics.median(detail_sizes)) if detail_sizes else None
+
+
+def segments_for(detail_bytes: int) -> int:
+    """Segments par transcription du faux API pour approcher la taille enregistrée des détails"""
+    probe = StubDataset(transcriptions=20, segments=100)
+    sizes = [len(json.dumps(probe.detail(key))) for key, entry in probe.transcriptions.items() if entry["status"] == "done"]
+    per_segment = statistics.median(sizes) / 100
+    return max(1, round(detail_bytes / per_segment))
+
+
+class Rewriter:
+    """Remplace les pseudonymes par des valeurs du jeu de données du faux API et fabrique les corps de requête"""
+
+    def __init__(self, dataset: StubDataset):
+        self.dataset = dataset
+        self.ids = sorted(dataset.transcriptions)
+        self.active = [entry for entry in dataset.transcriptions.values() if entry["status"] in ("pending", "processing")]
+        self.counter = 0
+
+    def value(self, name: str, value: str) -> str:
+        pseudonym = parse_pseudonym(value)
+        if pseudonym is None:
+            return value
+        digest, length = pseudonym
+        index = int(digest, 16)
+        if name == "transcription_id":
+            return self.ids[index % len(self.ids)]
+        if name in ("project", "project_name"):
+            return PROJECTS[index % len(PROJECTS)]
+        if name == "user_id":
+            return "1"
+        if name == "worker":
+            return f"transcription-worker-{index % 3 + 1}@stub"
+        # Texte libre (recherche) : mot du jeu de données de la longueur enregistrée
+        word = WORDS[index % len(WORDS)]
+        return (word * (length // len(word) + 1))[:max(1, length)]
+
+    def body(self, route: str, kind_size: Optional[List[Any]]) -> Optional[Dict[str, Any]]:
+        """Options httpx (data, files, json) de la requête ; None si le corps ne peut pas être reconstitué"""
+        self.counter += 1
+        size = kind_size[1] if kind_size else 0
+        if route == "POST /auth/login":
+            return {"data": {"username": "admin", "password": "admin"}}
+        if route == "POST /api/upload":
+            return {
+                "files": {"file": (f"replay_{self.counter}.wav", os.urandom(max(0, size - MULTIPART_OVERHEAD)), "audio/wav")},
+                "data": {"project_name": PROJECTS[0], "api_key": f"stub-key-{PROJECTS[0].lower()}"}
+            }
+        if route == "POST /api/projects":
+            return {"data": {"project_name": f"REPLAY{self.counter}", "admin_key": "stub-admin-key"}}
+        if route == "POST /api/admin/users":
+            return {"data": {"username": f"replay{self.counter}", "password": "replay", "is_admin": "false"}}
+        if route in ("POST /api/admin/users/assign-project", "POST /api/admin/users/remove-project"):
+            return {"json": {"user_id": "1", "project_id": "1"}}
+        if route == "POST /api/transcriptions/eta":
+            return {"json": {"transcriptions": self.active[:50]}}
+        return {} if not kind_size else None
+
+
+async def replay(base_url: str, entries: List[Dict[str, Any]], rewriter: Rewriter, speed: float,
+                 pid: Optional[int], max_in_flight: int = 128) -> Dict[str, Any]:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    recorded: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[str, int]] = defaultdict(dict)
+    errors: Dict[str, int] = defaultdict(int)
+    skipped: Dict[str, int] = defaultdict(int)
+    lag_ms: List[float] = []
+    peak_rss = read_rss(pid) if pid else None
+    clients: Dict[Optional[str], httpx.AsyncClient] = {}
+    logins: Dict[Optional[str], asyncio.Task] = {}
+    finished = asyncio.Event()
+    # Au-delà, le pool de connexions httpx se dégrade (parcours de la file d'attente à chaque requête)
+    in_flight = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+
+    async def client_for(session: Optional[str]) -> httpx.AsyncClient:
+        if session not in clients:
+            client = httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits)
+            clients[session] = client
+            if session is not None:
+                logins[session] = asyncio.create_task(
+                    client.post("/auth/login", data={"username": "admin", "password": "admin"})
+                )
+        if session in logins:
+            # Les requêtes d'une session attendent sa connexion (une seule par session)
+            await logins[session]
+        return clients[session]
+
+    async def send(entry: Dict[str, Any], options: Dict[str, Any], path: str, due: float) -> None:
+        route = f"{entry['m']} {entry['r']}"
+        client = await client_for(entry.get("s"))
+        params = [(name, rewriter.value(name, value)) for name, value in entry.get("q", ())]
+        async with in_flight:
+            try:
+                response = await client.request(entry["m"], path, params=params, **options)
+                await response.aread()
+                key = str(response.status_code)
+                if response.status_code >= 500 or (response.status_code >= 400) != (entry["st"] >= 400):
+                    errors[route] += 1
+            except httpx.HTTPError as e:
+                key = type(e).__name__
+                errors[route] += 1
+        latencies[route].append((time.perf_counter() - due) * 1000)
+        recorded[route].append(entry["d"])
+        statuses[route][key] = statuses[route].get(key, 0) + 1
+
+    async def sample_rss() -> None:
+        nonlocal peak_rss
+        while not finished.is_set():
+            rss = read_rss(pid)
+            if rss is not None:
+                peak_rss = max(peak_rss or 0, rss)
+            await asyncio.sleep(0.05)
+
+    sampler = asyncio.create_task(sample_rss()) if pid else None
+    tasks = []
+    origin = entries[0]["t"] if entries else 0
+    started = time.perf_counter()
+    for entry in entries:
+        route = f"{entry['m']} {entry['r']}"
+        options = rewriter.body(route, entry.get("b"))
+        if options is None or entry["r"] == "unmatched":
+            skipped[route] += 1
+            continue
+        path = entry["r"].format(**{name: rewriter.value(name, value) for name, value in entry.get("pp", {}).items()})
+        due = started + (entry["t"] - origin) / 1000 / speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            lag_ms.append(-delay * 1000)
+        tasks.append(asyncio.create_task(send(entry, options, path, due)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    finished.set()
+    if sampler is not None:
+        await sampler
+    for client in clients.values():
+        await client.aclose()
+
+    results = {}
+    for route in sorted(latencies, key=lambda name: -len(latencies[name])):
+        replayed = percentiles(latencies[route])
+        results[route] = {
+            "requests": len(latencies[route]),
+            "errors": errors[route],
+            "statuses": statuses[route],
+            "rps": round(len(latencies[route]) / elapsed, 2),
+            **replayed,
+            "recorded": percentiles(recorded[route]),
+            "peak_rss_bytes": peak_rss
+        }
+    return {
+        "results": results,
+        "skipped": dict(skipped),
+        "duration_s": round(elapsed, 2),
+        "max_schedule_lag_ms": round(max(lag_ms), 1) if lag_ms else 0.0,
+        "peak_rss_bytes": peak_rss
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("recording", help="Enregistrement (.jsonl.gz) produit avec [RECORDING] enabled = true")
+    parser.add_argument("--speed", type=float, default=1.0, help="Facteur d'accélération (2 : deux fois plus vite)")
+    parser.add_argument("--max-requests", type=int, default=0, help="Nombre maximal de requêtes rejouées (0 : toutes)")
+    parser.add_argument("--max-in-flight", type=int, default=128, help="Requêtes simultanées maximales du rejeu")
+    parser.add_argument("--transcriptions", type=int, default=500, help="Taille du jeu de données du faux API")
+    parser.add_argument("--log-level", default="WARNING", help="Niveau de log du dashboard pendant le rejeu")
+    parser.add_argument("--target", help="URL d'un dashboard déjà lancé (sinon faux API + dashboard démarrés ici)")
+    parser.add_argument("--pid", type=int, help="PID du dashboard ciblé par --target (mesure du RSS)")
+    parser.add_argument("--output", default=str(ROOT / "benchmarks" / "results"), help="Répertoire ou fichier JSON")
+    parser.add_argument("--compare", help="Résultats JSON précédents à comparer")
+    args = parser.parse_args()
+
+    header, stream = read_recording(args.recording)
+    entries = sorted(stream, key=lambda entry: entry["t"])
+    if args.max_requests:
+        entries = entries[:args.max_requests]
+    if not entries:
+        print(f"{args.recording} : aucune requête enregistrée")
+        return 1
+    profile, detail_bytes = upstream_profile(entries)
+    args.segments = segments_for(detail_bytes) if detail_bytes else 200
+    # Valeurs ignorées par le faux API quand le profil couvre l'endpoint
+    args.latency_ms, args.jitter_ms = 20.0, 5.0
+
+    span_s = (entries[-1]["t"] - entries[0]["t"]) / 1000
+    print(
+        f"{args.recording} ({header.get('started_at')}) : {len(entries)} requêtes sur {span_s:.0f} s, "
+        f"rejeu x{args.speed:g} (~{span_s / args.speed:.0f} s), {len(profile)} endpoints de l'API profilés, "
+        f"{args.segments} segments par transcription"
+    )
+
+    processes = []
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            if args.target:
+                base_url, pid = args.target.rstrip("/"), args.pid
+            else:
+                profile_path = Path(workdir) / "upstream-profile.json"
+                profile_path.write_text(json.dumps(profile), encoding="utf-8")
+                stubs, dashboard, base_url = start_processes(args, workdir, ("--profile", str(profile_path)))
+                processes = [dashboard, *stubs]
+                pid = dashboard.pid
+            rewriter = Rewriter(StubDataset(args.transcriptions, segments=0))
+            report = asyncio.run(replay(base_url, entries, rewriter, args.speed, pid, args.max_in_flight))
+        finally:
+            for process in processes:
+                process.terminate()
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+    for route, result in report["results"].items():
+        recorded = result["recorded"]
+        print(
+            f"  {route:<58} {result['requests']:>6}   p50 {result['p50_ms']:>8.1f} ({recorded['p50_ms']:>8.1f})   "
+            f"p95 {result['p95_ms']:>8.1f} ({recorded['p95_ms']:>8.1f}) ms   erreurs {result['errors']}"
+        )
+    print("  (entre parenthèses : latences enregistrées)")
+    if report["skipped"]:
+        print(f"  Non rejouées (corps non reconstituable) : {report['skipped']}")
+    if report["max_schedule_lag_ms"] > 100:
+        print(f"⚠️ Retard maximal sur le calendrier : {report['max_schedule_lag_ms']:.0f} ms (réduire --speed)")
+
+    revision = git_revision()
+    document = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": revision,
+        "recording": {"path": args.recording, "started_at": header.get("started_at"), "requests": len(entries)},
+        "parameters": {"speed": args.speed, "transcriptions": args.transcriptions, "segments": args.segments},
+        **report
+    }
+    output = Path(args.output)
+    if output.suffix != ".json":
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = output / f"replay-{revision['commit'] or 'nogit'}{'-dirty' if revision['dirty'] else ''}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"Résultats : {output}")
+
+    if args.compare:
+        compare(report["results"], args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
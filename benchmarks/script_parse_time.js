@@ -0,0 +1,118 @@
+#!/usr/bin/env node
+// benchmarks/script_parse_time.js
+// Mesure du temps de parse/compilation du JavaScript du dashboard (V8 via node:vm)
+//
+// Compare :
+//   - "avant"  : toutes les vues chargées d'emblée (scripts de dashboard_base.html + views/*.js)
+//   - "après"  : chemin de démarrage seul (scripts de dashboard_base.html), vues chargées à la demande
+//
+// Usage : node benchmarks/script_parse_time.js [--iterations 200] [--eager] [--json]
+//   --eager : désactive le parse paresseux de V8 (compile aussi le corps des fonctions)
+
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+const v8 = require("v8");
+
+const ROOT = path.resolve(__dirname, "..");
+const TEMPLATES = path.join(ROOT, "templates");
+const args = process.argv.slice(2);
+
+function argValue(name, fallback) {
+    const index = args.indexOf(name);
+    return index !== -1 && args[index + 1] ? args[index + 1] : fallback;
+}
+
+const ITERATIONS = parseInt(argValue("--iterations", "200"), 10);
+if (args.includes("--eager")) v8.setFlagsFromString("--no-lazy");
+
+/**
+ * Scripts locaux chargés au démarrage, dans l'ordre de dashboard_base.html
+ */
+function startupScripts() {
+    const html = fs.readFileSync(path.join(TEMPLATES, "dashboard_base.html"), "utf8");
+    const scripts = [];
+    // src="/static/js/x.js" ou src="{{ static_url('js/x.js') }}"
+    const re = /<script[^>]+src="(?:\/static\/|\{\{ static_url\(')([^"']+\.js)/g;
+    let match;
+    while ((match = re.exec(html)) !== null) {
+        scripts.push(path.join(TEMPLATES, "static", match[1]));
+    }
+    return scripts;
+}
+
+function viewModules() {
+    const dir = path.join(TEMPLATES, "static", "js", "views");
+    return fs.readdirSync(dir)
+        .filter(name => name.endsWith(".js"))
+        .sort()
+        .map(name => path.join(dir, name));
+}
+
+/**
+ * Source compilable par vm.Script : les modules ES perdent leurs lignes import/export
+ * (vm.SourceTextModule exige --experimental-vm-modules ; le coût de parse est équivalent)
+ */
+function loadSource(file, isModule) {
+    let source = fs.readFileSync(file, "utf8");
+    if (isModule) {
+        source = source
+            .replace(/^import .*$/gm, "")
+            .replace(/^export /gm, "");
+    }
+    return source;
+}
+
+function compileOnce(sources, tag) {
+    const start = process.hrtime.bigint();
+    sources.forEach(({ file, source }) => {
+        // Suffixe unique pour contourner le cache de compilation de V8
+        new vm.Script(`${source}\n// ${tag}-${Math.random()}`, { filename: file });
+    });
+    return Number(process.hrtime.bigint() - start) / 1e6;
+}
+
+function summarize(samples) {
+    samples.sort((a, b) => a - b);
+    return {
+        median_ms: samples[Math.floor(samples.length / 2)],
+        p95_ms: samples[Math.min(samples.length - 1, Math.floor(samples.length * 0.95))],
+        min_ms: samples[0]
+    };
+}
+
+function prepare(label, files) {
+    const sources = files.map(({ file, isModule }) => ({ file, source: loadSource(file, isModule) }));
+    const bytes = sources.reduce((total, { source }) => total + Buffer.byteLength(source), 0);
+    return { label, files: files.length, bytes, sources, samples: [] };
+}
+
+const startup = startupScripts().map(file => ({ file, isModule: false }));
+const views = viewModules().map(file => ({ file, isModule: true }));
+
+const sets = [
+    prepare("avant (tout au démarrage)", [...startup, ...views]),
+    prepare("après (démarrage seul)", startup)
+];
+
+// Échauffement, puis mesures alternées pour neutraliser la dérive (JIT, GC, fréquence CPU)
+sets.forEach(set => { for (let i = 0; i < 5; i++) compileOnce(set.sources, `w${i}`); });
+for (let i = 0; i < ITERATIONS; i++) {
+    sets.forEach(set => set.samples.push(compileOnce(set.sources, i)));
+}
+const results = sets.map(({ label, files, bytes, samples }) => ({ label, files, bytes, ...summarize(samples) }));
+
+if (args.includes("--json")) {
+    console.log(JSON.stringify({ iterations: ITERATIONS, eager: args.includes("--eager"), results }, null, 2));
+} else {
+    console.log(`Itérations: ${ITERATIONS}${args.includes("--eager") ? " (parse non paresseux)" : ""}`);
+    results.forEach(r => {
+        console.log(
+            `${r.label.padEnd(28)} ${String(r.files).padStart(2)} fichiers ` +
+            `${(r.bytes / 1024).toFixed(1).padStart(7)} Ko  ` +
+            `médiane ${r.median_ms.toFixed(2)} ms  p95 ${r.p95_ms.toFixed(2)} ms  min ${r.min_ms.toFixed(2)} ms`
+        );
+    });
+    const [before, after] = results;
+    console.log(`Gain médian: ${(100 * (1 - after.median_ms / before.median_ms)).toFixed(1)} %`);
+}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+benchmarks/search_suggest.py
+Latence de l'autocomplétion (index de préfixes en mémoire, objectif < 10 ms)
+
+Usage : python benchmarks/search_suggest.py [--documents 5000] [--queries 2000]
+"""
+
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.services.search_index_service import UserSearchIndex  # noqa: E402
+
+WORDS = [
+    "réunion", "équipe", "client", "appel", "compte", "rendu", "projet", "budget",
+    "entretien", "formation", "support", "commercial", "point", "hebdo", "comité",
+    "direction", "recrutement", "incident", "livraison", "planning"
+]
+
+
+def random_label(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_index(documents: int, rng: random.Random) -> UserSearchIndex:
+    index = UserSearchIndex()
+    projects = [f"PROJET_{name.upper()}" for name in rng.sample(WORDS, 8)]
+    for number in range(documents):
+        index.upsert_transcription({
+            "id": f"{number:08d}-{''.join(rng.choices(string.hexdigits.lower(), k=8))}",
+            "project_name": rng.choice(projects),
+            "filename": f"{random_label(rng, 3).replace(' ', '_')}_{number}.wav",
+            "enrichment_data": {"title": random_label(rng, 5).capitalize()}
+        })
+    return index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    index = build_index(args.documents, rng)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    queries = [rng.choice(WORDS)[:rng.randint(1, 6)] for _ in range(args.queries)]
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        index.suggest(query, 8)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+
+    print(f"Index : {args.documents} transcriptions, {len(index._entries)} termes, construit en {build_ms:.0f} ms")
+    print(
+        f"Suggestions ({args.queries} requêtes) : médiane {statistics.median(samples):.3f} ms  "
+        f"p99 {samples[int(len(samples) * 0.99) - 1]:.3f} ms  max {samples[-1]:.3f} ms"
+    )
+    return 0 if samples[int(len(samples) * 0.99) - 1] < 10 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+"""
+benchmarks/stub_api.py
+Faux vocalyx-api pour les tests de charge : endpoints appelés par VocalyxAPIClient, latence et tailles configurables
+
+Usage : python benchmarks/stub_api.py [--port 8000] [--latency-ms 20] [--jitter-ms 5] [--transcriptions 500] [--segments 200]
+        [--profile profil.json] [--uds /tmp/vocalyx-api.sock]
+
+Avec --profile (généré par benchmarks/replay.py à partir d'un enregistrement du trafic), la latence
+et les erreurs de chaque endpoint sont tirées parmi celles observées en production.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+from starlette.routing import Match
+
+MODELS = ("tiny", "base", "small", "medium", "large-v3")
+PROJECTS = ("ISICOMTECH", "SUPPORT", "COMMERCIAL", "RH", "DIRECTION")
+WORDS = (
+    "réunion", "équipe", "client", "appel", "compte", "rendu", "projet", "budget", "entretien",
+    "formation", "support", "commercial", "point", "hebdo", "comité", "direction", "planning"
+)
+
+
+class StubDataset:
+    """Jeu de données déterministe (graine) : projets, utilisateurs, transcriptions et segments"""
+
+    def __init__(self, transcriptions: int = 500, segments: int = 200, words_per_segment: int = 12, seed: int = 42):
+        rng = random.Random(seed)
+        self.segments_per_transcription = segments
+        self.words_per_segment = words_per_segment
+        self.projects = [{"id": str(index + 1), "name": name, "api_key": f"stub-key-{name.lower()}"}
+                         for index, name in enumerate(PROJECTS)]
+        self.users = [{"id": "1", "username": "admin", "is_admin": True, "projects": list(PROJECTS)}]
+        now = datetime.now(timezone.utc)
+        self.transcriptions: Dict[str, Dict[str, Any]] = {}
+        for number in range(transcriptions):
+            created = now - timedelta(minutes=number * 7 + rng.randint(0, 6))
+            status = "done" if number > 10 else rng.choice(("pending", "processing", "done", "error"))
+            processing = round(rng.lognormvariate(3.8, 0.6), 2)
+            transcription_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            self.transcriptions[transcription_id] = {
+                "id": transcription_id,
+                "status": status,
+                "project_name": rng.choice(PROJECTS),
+                "filename": f"{'_'.join(rng.choices(WORDS, k=3))}_{number}.wav",
+                "created_at": created.isoformat(),
+                "processing_start_time": (created + timedelta(seconds=5)).isoformat(),
+                "processing_end_time": (created + timedelta(seconds=5 + processing)).isoformat() if status == "done" else None,
+                "queue_wait_time": round(rng.uniform(0.5, 30), 2),
+                "processing_time": processing if status == "done" else None,
+                "duration": round(processing * rng.uniform(2, 8), 2),
+                "whisper_model": rng.choice(MODELS),
+                "diarization": rng.random() < 0.3,
+                "enrichment_requested": rng.random() < 0.2,
+                "worker_id": f"transcription-worker-{rng.randint(1, 3)}@stub",
+                "language": "fr",
+                "segments_count": segments
+            }
+
+    def detail(self, transcription_id: str) -> Dict[str, Any]:
+        """Transcription complète : segments générés à la demande (taille réglable, contenu stable)"""
+        entry = self.transcriptions[transcription_id]
+        rng = random.Random(transcription_id)
+        segments: List[Dict[str, Any]] = []
+        start = 0.0
+        for _ in range(self.segments_per_transcription if entry["status"] == "done" else 0):
+            end = start + rng.uniform(1.5, 8.0)
+            segments.append({
+                "start": round(start, 2),
+                "end": round(end, 2),
+                "text": " ".join(rng.choices(WORDS, k=self.words_per_segment)),
+                "speaker": f"SPEAKER_{rng.randint(0, 2):02d}"
+            })
+            start = end
+        return {**entry, "segments": segments, "text": " ".join(segment["text"] for segment in segments)}
+
+    def filtered(self, status: Optional[str], project: Optional[str], search: Optional[str]) -> List[Dict[str, Any]]:
+        entries = list(self.transcriptions.values())
+        if status:
+            entries = [entry for entry in entries if entry["status"] == status]
+        if project:
+            entries = [entry for entry in entries if entry["project_name"] == project]
+        if search:
+            needle = search.lower()
+            entries = [entry for entry in entries if needle in entry["filename"].lower()]
+        return entries
+
+    def workers(self) -> Dict[str, Any]:
+        processing = [entry for entry in self.transcriptions.values() if entry["status"] == "processing"]
+        names = [f"transcription-worker-{index}@stub" for index in (1, 2, 3)] + ["enrichment-worker-1@stub"]
+        stats = {
+            name: {
+                "pool": {"max-concurrency": 2},
+                "total": {"transcribe_audio_task": 100 + index * 17},
+                "health": {"cpu_percent": 12.5 * (index + 1), "memory_percent": 35.0,
+                           "memory_rss_bytes": 1_500_000_000, "uptime_seconds": 86400},
+                "db_stats": {"total_audio_processed_s": 36000.0 * (index + 1)}
+            }
+            for index, name in enumerate(names)
+        }
+        active = {name: [] for name in names}
+        for index, entry in enumerate(processing):
+            active[names[index % 3]].append({"id": entry["id"], "name": "transcribe_audio_task"})
+        return {
+            "worker_count": len(names),
+            "transcription_worker_count": 3,
+            "enrichment_worker_count": 1,
+            "active_tasks": len(processing),
+            "transcription_active_tasks": len(processing),
+            "enrichment_active_tasks": 0,
+            "stats": stats,
+            "workers": active,
+            "registered_tasks": {name: ["transcribe_audio_task"] for name in names}
+        }
+
+
+def create_stub_app(
+    latency_ms: float = 20.0,
+    jitter_ms: float = 5.0,
+    transcriptions: int = 500,
+    segments: int = 200,
+    ws_interval: float = 2.0,
+    seed: int = 42,
+    profile: Optional[Dict[str, List[List[Any]]]] = None
+) -> FastAPI:
+    """
+    Application FastAPI imitant vocalyx-api (latence ajoutée à chaque réponse HTTP).
+    `profile` associe à "MÉTHODE /gabarit" des échantillons [ms, statut] observés :
+    la latence et le statut (erreur simulée) d'une requête y sont tirés au hasard.
+    """
+    app = FastAPI(title="vocalyx-api (stub)")
+    data = StubDataset(transcriptions, segments, seed=seed)
+    app.state.dataset = data
+    latency_rng = random.Random(seed)
+
+    def template_of(request: Request) -> Optional[str]:
+        for route in app.router.routes:
+            if route.matches(request.scope)[0] == Match.FULL:
+                return f"{request.method} {route.path}"
+        return None
+
+    @app.middleware("http")
+    async def simulated_latency(request: Request, call_next):
+        samples = profile.get(template_of(request)) if profile else None
+        if samples:
+            delay_ms, status = latency_rng.choice(samples)
+            await asyncio.sleep(delay_ms / 1000)
+            if not isinstance(status, int):
+                # Échec réseau observé (timeout, connexion) : passerelle en erreur
+                status = 504 if status == "timeout" else 502
+            if status >= 400:
+                return JSONResponse({"detail": f"Simulated upstream error ({status})"}, status_code=status)
+            return await call_next(request)
+        delay = max(0.0, latency_rng.gauss(latency_ms, jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        return await call_next(request)
+
+    def user_for(request: Request) -> Dict[str, Any]:
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        return data.users[0]
+
+    def page_of(entries: List[Dict[str, Any]], page: int, limit: int) -> List[Dict[str, Any]]:
+        entries = sorted(entries, key=lambda entry: entry["created_at"], reverse=True)
+        return entries[(page - 1) * limit:page * limit]
+
+    # --- Authentification et utilisateur courant ---
+
+    @app.post("/api/auth/token")
+    async def token(username: str = Form(...), password: str = Form(...)):
+        return {"access_token": f"stub-token-{username}", "token_type": "bearer"}
+
+    @app.get("/api/user/me")
+    async def me(request: Request):
+        user = user_for(request)
+        return {key: user[key] for key in ("id", "username", "is_admin")}
+
+    @app.get("/api/user/projects")
+    async def user_projects(request: Request):
+        user_for(request)
+        return [{"id": project["id"], "name": project["name"]} for project in data.projects]
+
+    @app.get("/api/admin/admin-api-key")
+    async def admin_api_key(request: Request):
+        user_for(request)
+        return {"api_key": "stub-admin-key"}
+
+    # --- Projets (clé admin) ---
+
+    @app.get("/api/projects")
+    async def list_projects():
+        return data.projects
+
+    @app.post("/api/projects", status_code=201)
+    async def create_project(body: Dict[str, Any]):
+        project = {"id": str(len(data.projects) + 1), "name": body.get("name"), "api_key": f"stub-key-{uuid.uuid4().hex[:8]}"}
+        data.projects.append(project)
+        return project
+
+    @app.get("/api/projects/{project_name}")
+    async def project_details(project_name: str):
+        for project in data.projects:
+            if project["name"] == project_name:
+                return project
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # --- Transcriptions ---
+
+    @app.post("/api/transcriptions", status_code=201)
+    async def create_transcription(
+        file: UploadFile = File(...),
+        project_name: str = Form(...),
+        whisper_model: str = Form("large-v3")
+    ):
+        size = len(await file.read())
+        transcription_id = str(uuid.uuid4())
+        data.transcriptions[transcription_id] = {
+            "id": transcription_id,
+            "status": "pending",
+            "project_name": project_name,
+            "filename": file.filename,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "whisper_model": whisper_model,
+            "file_size": size
+        }
+        return {"id": transcription_id, "status": "pending"}
+
+    @app.get("/api/user/transcriptions")
+    async def user_transcriptions(
+        request: Request, page: int = 1, limit: int = 25,
+        status: Optional[str] = None, project: Optional[str] = None, search: Optional[str] = None
+    ):
+        user_for(request)
+        return page_of(data.filtered(status, project, search), page, limit)
+
+    @app.get("/api/user/transcriptions/count")
+    async def count_transcriptions(
+        request: Request, status: Optional[str] = None, project: Optional[str] = None, search: Optional[str] = None
+    ):
+        user_for(request)
+        total = len(data.filtered(status, project, search))
+        return {"total": total, "total_filtered": total}
+
+    @app.get("/api/user/transcriptions/{transcription_id}")
+    async def transcription_detail(request: Request, transcription_id: str):
+        user_for(request)
+        if transcription_id not in data.transcriptions:
+            raise HTTPException(status_code=404, detail="Transcription not found")
+        return data.detail(transcription_id)
+
+    @app.delete("/api/user/transcriptions/{transcription_id}")
+    async def delete_transcription(request: Request, transcription_id: str):
+        user_for(request)
+        if data.transcriptions.pop(transcription_id, None) is None:
+            raise HTTPException(status_code=404, detail="Transcription not found")
+        return {"status": "deleted", "id": transcription_id}
+
+    # --- Administration des utilisateurs ---
+
+    @app.get("/api/admin/users")
+    async def list_users(request: Request):
+        user_for(request)
+        return data.users
+
+    @app.post("/api/admin/users")
+    async def create_user(request: Request, body: Dict[str, Any]):
+        user_for(request)
+        user = {"id": str(len(data.users) + 1), "username": body.get("username"),
+                "is_admin": bool(body.get("is_admin")), "projects": []}
+        data.users.append(user)
+        return user
+
+    @app.post("/api/admin/users/assign-project")
+    @app.post("/api/admin/users/remove-project")
+    async def user_project(request: Request, body: Dict[str, Any]):
+        user_for(request)
+        return {"status": "ok", **body}
+
+    @app.delete("/api/admin/users/{user_id}")
+    async def delete_user(request: Request, user_id: str):
+        user_for(request)
+        data.users = [user for user in data.users if user["id"] != user_id] or data.users
+        return {"status": "deleted", "id": user_id}
+
+    # --- Workers, santé ---
+
+    @app.get("/api/admin/workers")
+    async def workers(request: Request):
+        user_for(request)
+        return data.workers()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "service": "vocalyx-api-stub"}
+
+    # --- Mises à jour temps réel (connexion directe du navigateur) ---
+
+    @app.websocket("/api/ws/updates")
+    async def updates(websocket: WebSocket):
+        await websocket.accept()
+        filters = {"page": 1, "limit": 25, "status": None, "project": None, "search": None}
+
+        def state() -> Dict[str, Any]:
+            entries = data.filtered(filters.get("status"), filters.get("project"), filters.get("search"))
+            return {
+                "transcriptions": page_of(entries, int(filters.get("page") or 1), int(filters.get("limit") or 25)),
+                "total_filtered_count": len(entries),
+                "worker_stats": data.workers()
+            }
+
+        async def push_updates():
+            while True:
+                await asyncio.sleep(ws_interval)
+                await websocket.send_json({"type": "worker_stats", "data": data.workers()})
+                entry = random.choice(list(data.transcriptions.values()))
+                await websocket.send_json({"type": "transcription_updated", "data": {"transcription": entry}})
+
+        await websocket.send_json({"type": "initial_dashboard_state", "data": state()})
+        pusher = asyncio.create_task(push_updates())
+        try:
+            while True:
+                message = await websocket.receive_json()
+                if message.get("type") == "get_dashboard_state":
+                    filters.update(message.get("payload") or {})
+                    await websocket.send_json({"type": "dashboard_state_update", "data": state()})
+        except WebSocketDisconnect:
+            pass
+        finally:
+            pusher.cancel()
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--uds", help="Écouter sur un socket Unix plutôt qu'en TCP")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latence moyenne ajoutée à chaque réponse")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Écart type de la latence")
+    parser.add_argument("--transcriptions", type=int, default=500, help="Taille du jeu de données")
+    parser.add_argument("--segments", type=int, default=200, help="Segments par transcription terminée (taille des détails)")
+    parser.add_argument("--ws-interval", type=float, default=2.0, help="Intervalle (s) des événements WebSocket")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--profile", help="Latences et statuts observés par endpoint (JSON produit par benchmarks/replay.py)")
+    args = parser.parse_args()
+
+    profile = None
+    if args.profile:
+        with open(args.profile, encoding="utf-8") as handle:
+            profile = json.load(handle)
+    app = create_stub_app(
+        args.latency_ms, args.jitter_ms, args.transcriptions, args.segments, args.ws_interval, args.seed, profile
+    )
+    if args.uds:
+        uvicorn.run(app, uds=args.uds, log_level="warning")
+    else:
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+benchmarks/transport_latency.py
+Latence des appels à vocalyx-api selon le transport : TCP (IP, nom d'hôte, cache DNS) vs socket Unix
+
+Usage : python benchmarks/transport_latency.py [--requests 2000] [--output benchmarks/results/transport.json]
+
+Deux faux API (benchmarks/stub_api.py) sur le même hôte, l'un en TCP, l'autre sur un socket Unix ;
+les clients sont construits par TransportFactory comme ceux du dashboard. Chaque transport est
+mesuré avec une connexion keep-alive réutilisée et avec une nouvelle connexion par appel
+(« Connection: close », coût d'établissement et, pour un nom d'hôte, de résolution DNS).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.load_driver import ROOT, free_port, git_revision, wait_ready  # noqa: E402
+from infrastructure.api.transport import DnsCache, TransportFactory  # noqa: E402
+
+
+def start_stub(*options: str) -> subprocess.Popen:
+    return subprocess.Popen([
+        sys.executable, str(ROOT / "benchmarks" / "stub_api.py"), "--latency-ms", "0", "--jitter-ms", "0",
+        "--transcriptions", "10", *options
+    ], cwd=ROOT)
+
+
+def wait_uds_ready(path: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{path} : le processus s'est arrêté (code {process.returncode})")
+        try:
+            with httpx.Client(transport=httpx.HTTPTransport(uds=path)) as client:
+                if client.get("http://vocalyx-api/health", timeout=1.0).status_code < 500:
+                    return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{path} : pas de réponse après {timeout:.0f} s")
+
+
+def measure(factory: TransportFactory, url: str, requests: int, keepalive: bool) -> List[float]:
+    headers = {} if keepalive else {"Connection": "close"}
+    latencies = []
+    with httpx.Client(timeout=5.0, **factory.client_options(1)) as client:
+        client.get(url, headers=headers)
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = client.get(url, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1], 3),
+        "max_ms": round(ordered[-1], 3)
+    }
+
+
+def report(label: str, summary: Dict[str, float]) -> None:
+    print(
+        f"  {label:<34} p50 {summary['p50_ms']:6.3f} ms   p95 {summary['p95_ms']:6.3f} ms   "
+        f"p99 {summary['p99_ms']:7.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--requests", type=int, default=2000, help="Appels séquentiels par mesure")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        port, socket_path = free_port(), str(Path(directory) / "vocalyx-api.sock")
+        processes = [start_stub("--port", str(port)), start_stub("--uds", socket_path)]
+        try:
+            wait_ready(f"http://127.0.0.1:{port}/health", processes[0])
+            wait_uds_ready(socket_path, processes[1])
+            transports = {
+                "tcp 127.0.0.1": (TransportFactory(), f"http://127.0.0.1:{port}/health"),
+                "tcp localhost": (TransportFactory(), f"http://localhost:{port}/health"),
+                "tcp localhost + cache DNS": (
+                    TransportFactory(dns_cache=DnsCache(ttl_seconds=60)), f"http://localhost:{port}/health"
+                ),
+                "socket Unix": (
+                    TransportFactory(uds=socket_path, uds_origin="http://vocalyx-api"), "http://vocalyx-api/health"
+                )
+            }
+            print(f"{args.requests} appels séquentiels à /health par mesure (faux API sans latence ajoutée)")
+            for mode, keepalive in (("keep-alive", True), ("connexion par appel", False)):
+                print(f"{mode} :")
+                for label, (factory, url) in transports.items():
+                    summary = summarize(measure(factory, url, args.requests, keepalive))
+                    results[f"{label} / {mode}"] = summary
+                    report(label, summary)
+        finally:
+            for process in processes:
+                process.terminate()
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps({
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+            "parameters": {"requests": args.requests},
+            "results": results
+        }, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Résultats : {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,32 @@ class Config:
             'ws_port': '8000',
         }
         
+        config['LOAD_BALANCING'] = {
+            'ewma_decay_seconds': '10',
+            'failure_threshold': '5',
+            'ejection_seconds': '30',
+            'max_ejection_seconds': '300',
+            'probe_interval_seconds': '10'
+        }
+        
+        config['TRANSPORT'] = {
+            'uds': '',
+            'prewarm_connections': '4',
+            'keepalive_expiry_seconds': '5',
+            'dns_cache_ttl_seconds': '60'
+        }
+        
+        config['UPSTREAM_BUDGETS'] = {
+            'connect_timeout': '5',
+            'read_timeout': '10',
+            'read_max_connections': '64',
+            'mutation_max_connections': '16',
+            'upload_timeout': '300',
+            'upload_max_connections': '4',
+            'health_timeout': '5',
+            'health_max_connections': '2'
+        }
+        
         config['SECURITY'] = {
             'admin_project_name': 'ISICOMTECH'
         }
@@ -44,11 +70,96 @@ class Config:
             'flower_url': 'http://localhost:5555/flower/'
         }
         
+        config['CACHE'] = {
+            'transcript_max_bytes': str(64 * 1024 * 1024),
+            'stale_enabled': 'true',
+            'stale_max_bytes': str(16 * 1024 * 1024),
+            'stale_max_age_seconds': '86400'
+        }
+        
+        config['FRONTEND'] = {
+            'critical_css_enabled': 'true',
+            'critical_css_budget_bytes': str(14 * 1024),
+            'prefetch_max_concurrent_per_session': '2'
+        }
+        
+        config['WORKERS'] = {
+            'poll_interval_seconds': '5',
+            'history_size': '720',
+            'idle_timeout_seconds': '300',
+            'admin_check_ttl_seconds': '30'
+        }
+        
+        config['SEARCH'] = {
+            'index_refresh_seconds': '60',
+            'index_max_items': '500'
+        }
+        
+        config['ETA'] = {
+            'min_samples': '20',
+            'training_interval_seconds': '600'
+        }
+        
+        config['METRICS'] = {
+            'minute_retention_minutes': '120',
+            'hour_retention_hours': '168',
+            'day_retention_days': '365',
+            'relative_accuracy': '0.01',
+            'backfill_max_items': '1000',
+            'prometheus_enabled': 'true'
+        }
+        
+        config['CAPACITY'] = {
+            'max_transcriptions': '2000',
+            'replications': '5',
+            'cache_ttl_seconds': '300'
+        }
+        
+        config['TRACING'] = {
+            'enabled': 'true',
+            'server_timing': 'true',
+            'export_enabled': 'false',
+            'export_path': 'logs/vocalyx-frontend-traces.jsonl',
+            'export_sample_ratio': '1.0',
+            'export_max_bytes': '52428800'
+        }
+        
+        config['RECORDING'] = {
+            'enabled': 'false',
+            'path': 'logs/vocalyx-frontend-traffic.jsonl.gz',
+            'sample_ratio': '1.0',
+            'max_requests': '1000000'
+        }
+        
+        config['FAULTS'] = {
+            'enabled': 'false',
+            'rules': '',
+            'admin_endpoint_enabled': 'false'
+        }
+        
+        config['RESILIENCE'] = {
+            'breaker_enabled': 'true',
+            'breaker_failure_threshold': '5',
+            'breaker_reset_timeout_seconds': '30',
+            'retry_max_attempts': '3',
+            'retry_base_delay_ms': '100',
+            'retry_max_delay_ms': '1000',
+            'retry_deadline_ms': '30000',
+            'hedge_endpoints': 'GET /api/user/transcriptions, GET /api/user/me',
+            'hedge_delay_ms': '250',
+            'hedge_max_in_flight': '16'
+        }
+        
         config['LOGGING'] = {
             'level': 'INFO',
             'file_enabled': 'true',
             'file_path': 'logs/vocalyx-frontend.log',
-            'colored': 'true'
+            'colored': 'true',
+            'json_format': 'false',
+            'file_max_bytes': '10485760',
+            'file_backup_count': '5',
+            'file_compress': 'true',
+            'rate_limits': 'routes=30/10, application=30/10, infrastructure=30/10'
         }
         
         with open(self.config_file, 'w') as f:
@@ -60,11 +171,14 @@ class Config:
         """Charge les paramètres dans des attributs"""
         
         # API
-        self.api_url = os.environ.get(
+        api_url_setting = os.environ.get(
             'VOCALYX_API_URL', 
             self.config.get('API', 'url')
         )
-        self.api_timeout = self.config.getint('API', 'timeout', fallback=30)
+        # Plusieurs instances de l'API : URL séparées par des virgules (la première sert de référence)
+        self.api_urls = [url.strip().rstrip('/') for url in api_url_setting.split(',') if url.strip()]
+        self.api_url = self.api_urls[0] if self.api_urls else api_url_setting
+        self.api_timeout = self.config.getfloat('API', 'timeout', fallback=30.0)
         # Port WebSocket (uniquement le port, l'hôte vient de window.location.hostname côté frontend)
         ws_port_str = os.environ.get(
             'VOCALYX_WS_PORT',
@@ -76,6 +190,35 @@ class Config:
             logging.warning(f"⚠️ Invalid WS port '{ws_port_str}' in config, using 8000 as fallback")
             self.ws_port = 8000
         
+        # TRANSPORT
+        # VOCALYX_API_UDS : socket Unix de l'instance locale (déploiement sur le même hôte)
+        self.api_uds = os.environ.get('VOCALYX_API_UDS', self.config.get('TRANSPORT', 'uds', fallback='')).strip()
+        self.prewarm_connections = self.config.getint('TRANSPORT', 'prewarm_connections', fallback=4)
+        self.keepalive_expiry_seconds = self.config.getfloat('TRANSPORT', 'keepalive_expiry_seconds', fallback=5.0)
+        self.dns_cache_ttl_seconds = self.config.getfloat('TRANSPORT', 'dns_cache_ttl_seconds', fallback=60.0)
+        
+        # LOAD_BALANCING
+        self.lb_ewma_decay_seconds = self.config.getfloat('LOAD_BALANCING', 'ewma_decay_seconds', fallback=10.0)
+        self.lb_failure_threshold = self.config.getint('LOAD_BALANCING', 'failure_threshold', fallback=5)
+        self.lb_ejection_seconds = self.config.getfloat('LOAD_BALANCING', 'ejection_seconds', fallback=30.0)
+        self.lb_max_ejection_seconds = self.config.getfloat('LOAD_BALANCING', 'max_ejection_seconds', fallback=300.0)
+        self.lb_probe_interval_seconds = self.config.getfloat('LOAD_BALANCING', 'probe_interval_seconds', fallback=10.0)
+        
+        # UPSTREAM_BUDGETS (délai des modifications par défaut : [API] timeout)
+        self.upstream_connect_timeout_seconds = self.config.getfloat('UPSTREAM_BUDGETS', 'connect_timeout', fallback=5.0)
+        self.upstream_read_timeout_seconds = self.config.getfloat('UPSTREAM_BUDGETS', 'read_timeout', fallback=10.0)
+        self.upstream_read_max_connections = self.config.getint('UPSTREAM_BUDGETS', 'read_max_connections', fallback=64)
+        self.upstream_mutation_timeout_seconds = self.config.getfloat(
+            'UPSTREAM_BUDGETS', 'mutation_timeout', fallback=self.api_timeout
+        )
+        self.upstream_mutation_max_connections = self.config.getint(
+            'UPSTREAM_BUDGETS', 'mutation_max_connections', fallback=16
+        )
+        self.upstream_upload_timeout_seconds = self.config.getfloat('UPSTREAM_BUDGETS', 'upload_timeout', fallback=300.0)
+        self.upstream_upload_max_connections = self.config.getint('UPSTREAM_BUDGETS', 'upload_max_connections', fallback=4)
+        self.upstream_health_timeout_seconds = self.config.getfloat('UPSTREAM_BUDGETS', 'health_timeout', fallback=5.0)
+        self.upstream_health_max_connections = self.config.getint('UPSTREAM_BUDGETS', 'health_max_connections', fallback=2)
+        
         # SECURITY
         self.admin_project_name = os.environ.get(
             'ADMIN_PROJECT_NAME', 
@@ -91,6 +234,89 @@ class Config:
             self.config.get('EXTERNAL', 'flower_url', fallback='http://localhost:5555/flower/')
         )
         
+        # CACHE
+        self.transcript_cache_max_bytes = self.config.getint(
+            'CACHE', 'transcript_max_bytes', fallback=64 * 1024 * 1024
+        )
+        self.stale_cache_enabled = self.config.getboolean('CACHE', 'stale_enabled', fallback=True)
+        self.stale_cache_max_bytes = self.config.getint('CACHE', 'stale_max_bytes', fallback=16 * 1024 * 1024)
+        self.stale_cache_max_age_seconds = self.config.getfloat('CACHE', 'stale_max_age_seconds', fallback=86400.0)
+        
+        # FRONTEND
+        self.critical_css_enabled = self.config.getboolean('FRONTEND', 'critical_css_enabled', fallback=True)
+        self.critical_css_budget_bytes = self.config.getint(
+            'FRONTEND', 'critical_css_budget_bytes', fallback=14 * 1024
+        )
+        self.prefetch_max_concurrent_per_session = self.config.getint(
+            'FRONTEND', 'prefetch_max_concurrent_per_session', fallback=2
+        )
+        
+        # WORKERS
+        self.workers_poll_interval_seconds = self.config.getfloat('WORKERS', 'poll_interval_seconds', fallback=5.0)
+        self.workers_history_size = self.config.getint('WORKERS', 'history_size', fallback=720)
+        self.workers_idle_timeout_seconds = self.config.getfloat('WORKERS', 'idle_timeout_seconds', fallback=300.0)
+        self.admin_check_ttl_seconds = self.config.getfloat('WORKERS', 'admin_check_ttl_seconds', fallback=30.0)
+        
+        # SEARCH
+        self.search_index_refresh_seconds = self.config.getint('SEARCH', 'index_refresh_seconds', fallback=60)
+        self.search_index_max_items = self.config.getint('SEARCH', 'index_max_items', fallback=500)
+        
+        # ETA
+        self.eta_min_samples = self.config.getint('ETA', 'min_samples', fallback=20)
+        self.eta_training_interval_seconds = self.config.getfloat('ETA', 'training_interval_seconds', fallback=600.0)
+        
+        # METRICS
+        self.metrics_minute_retention_minutes = self.config.getint('METRICS', 'minute_retention_minutes', fallback=120)
+        self.metrics_hour_retention_hours = self.config.getint('METRICS', 'hour_retention_hours', fallback=168)
+        self.metrics_day_retention_days = self.config.getint('METRICS', 'day_retention_days', fallback=365)
+        self.metrics_relative_accuracy = self.config.getfloat('METRICS', 'relative_accuracy', fallback=0.01)
+        self.metrics_backfill_max_items = self.config.getint('METRICS', 'backfill_max_items', fallback=1000)
+        self.metrics_prometheus_enabled = self.config.getboolean('METRICS', 'prometheus_enabled', fallback=True)
+        
+        # CAPACITY
+        self.capacity_max_transcriptions = self.config.getint('CAPACITY', 'max_transcriptions', fallback=2000)
+        self.capacity_replications = self.config.getint('CAPACITY', 'replications', fallback=5)
+        self.capacity_cache_ttl_seconds = self.config.getfloat('CAPACITY', 'cache_ttl_seconds', fallback=300.0)
+        
+        # TRACING
+        self.tracing_enabled = self.config.getboolean('TRACING', 'enabled', fallback=True)
+        self.tracing_server_timing = self.config.getboolean('TRACING', 'server_timing', fallback=True)
+        self.tracing_export_enabled = self.config.getboolean('TRACING', 'export_enabled', fallback=False)
+        self.tracing_export_path = self.config.get(
+            'TRACING', 'export_path', fallback='logs/vocalyx-frontend-traces.jsonl'
+        )
+        self.tracing_export_sample_ratio = self.config.getfloat('TRACING', 'export_sample_ratio', fallback=1.0)
+        self.tracing_export_max_bytes = self.config.getint('TRACING', 'export_max_bytes', fallback=52428800)
+        
+        # RECORDING
+        self.recording_enabled = self.config.getboolean('RECORDING', 'enabled', fallback=False)
+        self.recording_path = self.config.get('RECORDING', 'path', fallback='logs/vocalyx-frontend-traffic.jsonl.gz')
+        self.recording_sample_ratio = self.config.getfloat('RECORDING', 'sample_ratio', fallback=1.0)
+        self.recording_max_requests = self.config.getint('RECORDING', 'max_requests', fallback=1000000)
+        
+        # FAULTS
+        # VOCALYX_FAULTS (règles) active l'injection sans modifier config.ini (tests de charge)
+        faults_env = os.environ.get('VOCALYX_FAULTS')
+        self.faults_enabled = bool(faults_env) or self.config.getboolean('FAULTS', 'enabled', fallback=False)
+        self.faults_rules = faults_env or self.config.get('FAULTS', 'rules', fallback='')
+        self.faults_admin_endpoint_enabled = self.config.getboolean('FAULTS', 'admin_endpoint_enabled', fallback=False)
+        
+        # RESILIENCE
+        self.breaker_enabled = self.config.getboolean('RESILIENCE', 'breaker_enabled', fallback=True)
+        self.breaker_failure_threshold = self.config.getint('RESILIENCE', 'breaker_failure_threshold', fallback=5)
+        self.breaker_reset_timeout_seconds = self.config.getfloat(
+            'RESILIENCE', 'breaker_reset_timeout_seconds', fallback=30.0
+        )
+        self.retry_max_attempts = self.config.getint('RESILIENCE', 'retry_max_attempts', fallback=3)
+        self.retry_base_delay_ms = self.config.getfloat('RESILIENCE', 'retry_base_delay_ms', fallback=100.0)
+        self.retry_max_delay_ms = self.config.getfloat('RESILIENCE', 'retry_max_delay_ms', fallback=1000.0)
+        self.retry_deadline_ms = self.config.getfloat('RESILIENCE', 'retry_deadline_ms', fallback=30000.0)
+        self.hedge_endpoints = self.config.get(
+            'RESILIENCE', 'hedge_endpoints', fallback='GET /api/user/transcriptions, GET /api/user/me'
+        )
+        self.hedge_delay_ms = self.config.getfloat('RESILIENCE', 'hedge_delay_ms', fallback=250.0)
+        self.hedge_max_in_flight = self.config.getint('RESILIENCE', 'hedge_max_in_flight', fallback=16)
+        
         # LOGGING
         self.log_level = os.environ.get(
             'LOG_LEVEL', 
@@ -107,6 +333,18 @@ class Config:
             self.config.get('LOGGING', 'colored', fallback='true')
         )
         self.log_colored = log_colored_str.lower() in ['true', '1', 't']
+        
+        log_json_str = os.environ.get(
+            'LOG_JSON',
+            self.config.get('LOGGING', 'json_format', fallback='false')
+        )
+        self.log_json = log_json_str.lower() in ['true', '1', 't']
+        self.log_file_max_bytes = self.config.getint('LOGGING', 'file_max_bytes', fallback=10485760)
+        self.log_file_backup_count = self.config.getint('LOGGING', 'file_backup_count', fallback=5)
+        self.log_file_compress = self.config.getboolean('LOGGING', 'file_compress', fallback=True)
+        self.log_rate_limits = self.config.get(
+            'LOGGING', 'rate_limits', fallback='routes=30/10, application=30/10, infrastructure=30/10'
+        )
     
     def reload(self):
         """Recharge la configuration depuis le fichier"""
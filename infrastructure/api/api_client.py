@@ -2,13 +2,77 @@
 VocalyxAPIClient - Client HTTP refactorisé pour communiquer avec vocalyx-api
 """
 
+import asyncio
 import logging
+import time
+from contextlib import contextmanager
 from typing import List, Optional, Dict, Any
 import httpx
 from config import Config
+from infrastructure.api.budgets import (
+    CLASS_HEALTH,
+    CLASS_READ,
+    ENDPOINT_CLASSES,
+    ClientPools,
+    EndpointBudget,
+    endpoint_class
+)
+from infrastructure.api.fault_injector import FaultInjector, parse_fault_rules
+from infrastructure.api.load_balancer import Backend, LoadBalancer
+from infrastructure.api.resilience import (
+    CircuitBreakerRegistry,
+    Hedger,
+    ResilientCaller,
+    RetryPolicy,
+    is_failure,
+    parse_hedge_endpoints
+)
+from infrastructure.api.transport import DnsCache, TransportFactory
+from infrastructure.metrics import Counter, Gauge, Histogram, pool_stats
+from infrastructure.tracing import REQUEST_ID_HEADER, SPAN_KIND_CLIENT, current_trace
 
 logger = logging.getLogger(__name__)
 
+# Métriques des appels à vocalyx-api (étiquetées par gabarit d'endpoint, jamais par identifiant)
+UPSTREAM_LATENCY = Histogram(
+    "vocalyx_frontend_upstream_request_duration_seconds",
+    "Latence des appels à vocalyx-api",
+    ("method", "endpoint")
+)
+UPSTREAM_REQUESTS = Counter(
+    "vocalyx_frontend_upstream_requests_total",
+    "Appels à vocalyx-api par code de statut",
+    ("method", "endpoint", "status")
+)
+UPSTREAM_ERRORS = Counter(
+    "vocalyx_frontend_upstream_errors_total",
+    "Erreurs des appels à vocalyx-api (timeout, connect, status_4xx, status_5xx, transport)",
+    ("method", "endpoint", "kind")
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "vocalyx_frontend_upstream_requests_in_flight",
+    "Appels à vocalyx-api en cours",
+    ("endpoint",)
+)
+UPLOAD_BYTES_IN_FLIGHT = Gauge(
+    "vocalyx_frontend_upload_bytes_in_flight",
+    "Octets de fichiers audio en cours d'envoi à vocalyx-api"
+)
+UPLOAD_BYTES = Counter(
+    "vocalyx_frontend_upload_bytes_total",
+    "Octets de fichiers audio envoyés à vocalyx-api"
+)
+
+
+def _error_kind(error: httpx.HTTPError) -> str:
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.ConnectError):
+        return "connect"
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"status_{error.response.status_code // 100}xx"
+    return "transport"
+
 
 class VocalyxAPIClient:
     """
@@ -17,16 +81,77 @@ class VocalyxAPIClient:
     """
     
     def __init__(self, config: Config):
-        self.base_url = config.api_url.rstrip('/')
-        self.timeout = httpx.Timeout(30.0, connect=5.0)
+        # Instances de vocalyx-api (une ou plusieurs, choisie à chaque appel)
+        self.balancer = LoadBalancer(
+            config.api_urls,
+            decay_seconds=config.lb_ewma_decay_seconds,
+            failure_threshold=config.lb_failure_threshold,
+            ejection_seconds=config.lb_ejection_seconds,
+            max_ejection_seconds=config.lb_max_ejection_seconds
+        )
+        self.base_url = self.balancer.primary.url
+        
+        # Socket Unix pour l'instance locale (première URL), cache DNS pour les instances en TCP
+        self.dns_cache = DnsCache(config.dns_cache_ttl_seconds) if config.dns_cache_ttl_seconds > 0 else None
+        transports = TransportFactory(
+            uds=config.api_uds,
+            uds_origin=self.base_url,
+            dns_cache=self.dns_cache,
+            keepalive_expiry=config.keepalive_expiry_seconds
+        )
+        if transports.uds:
+            logger.info(f"🔌 Appels à {self.base_url} par le socket Unix {transports.uds}")
         
-        # Client synchrone pour les routes FastAPI
-        self.client = httpx.Client(timeout=self.timeout)
+        # Clients synchrones (routes FastAPI) et asynchrones par classe d'endpoint
+        # (lectures, modifications, envois, santé) : délais et pool de connexions propres
+        self.pools = ClientPools(self._budgets(config), transports)
         
-        # Client asynchrone pour les opérations async
-        self.async_client = httpx.AsyncClient(timeout=self.timeout)
+        # Pannes simulées (tests de résilience) : désactivées hors configuration explicite
+        self.faults = FaultInjector(parse_fault_rules(config.faults_rules), enabled=config.faults_enabled)
+        if self.faults.enabled:
+            logger.warning(f"⚠️ Injection de pannes active sur les appels à l'API ({len(self.faults.rules)} règle(s))")
         
-        logger.info(f"API Client initialized: {self.base_url}")
+        # Disjoncteurs par endpoint, reprises des GET, requêtes couvertes pour les lectures sensibles à la latence
+        self.breakers = CircuitBreakerRegistry(
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout_seconds,
+            enabled=config.breaker_enabled
+        )
+        self.hedger = Hedger(
+            parse_hedge_endpoints(config.hedge_endpoints),
+            delay=config.hedge_delay_ms / 1000,
+            max_in_flight=config.hedge_max_in_flight
+        )
+        self.resilience = ResilientCaller(
+            self.breakers,
+            RetryPolicy(
+                max_attempts=config.retry_max_attempts,
+                base_delay=config.retry_base_delay_ms / 1000,
+                max_delay=config.retry_max_delay_ms / 1000,
+                deadline=config.retry_deadline_ms / 1000
+            ),
+            self.hedger
+        )
+        
+        logger.info(f"API Client initialized: {', '.join(backend.url for backend in self.balancer.backends)}")
+    
+    @staticmethod
+    def _budgets(config: Config) -> Dict[str, EndpointBudget]:
+        return {
+            name: EndpointBudget(
+                timeout=getattr(config, f"upstream_{name}_timeout_seconds"),
+                connect_timeout=config.upstream_connect_timeout_seconds,
+                max_connections=getattr(config, f"upstream_{name}_max_connections")
+            )
+            for name in ENDPOINT_CLASSES
+        }
+    
+    def configure_budgets(self, config: Config) -> List[str]:
+        """Applique à chaud les budgets de la configuration (rechargement) ; retourne les classes modifiées"""
+        changed = self.pools.configure(self._budgets(config))
+        if changed:
+            logger.info(f"⏱️ Budgets des appels à l'API mis à jour : {', '.join(changed)}")
+        return changed
     
     def _get_headers(self, jwt_token: str = None) -> Dict[str, str]:
         """Génère les headers d'authentification"""
@@ -35,6 +160,145 @@ class VocalyxAPIClient:
             headers["Authorization"] = f"Bearer {jwt_token}"
         return headers
     
+    @contextmanager
+    def _instrument(self, method: str, endpoint: str):
+        """
+        Mesure un appel à l'API (latence, statut, erreurs, appels en cours) et,
+        dans une requête tracée, l'enregistre comme span ; fournit les en-têtes
+        de corrélation (X-Request-ID, traceparent) à transmettre à l'API.
+        """
+        outcome = {"status": "error", "headers": {}}
+        trace = current_trace()
+        span = None
+        if trace is not None:
+            span = trace.start_span(f"{method} {endpoint}", kind=SPAN_KIND_CLIENT)
+            outcome["headers"] = {REQUEST_ID_HEADER: trace.request_id, "traceparent": trace.traceparent(span)}
+        UPSTREAM_IN_FLIGHT.inc((endpoint,))
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except httpx.HTTPError as e:
+            kind = _error_kind(e)
+            UPSTREAM_ERRORS.inc((method, endpoint, kind))
+            if span is not None:
+                span.error = True
+                span.attributes["error.type"] = kind
+            raise
+        finally:
+            UPSTREAM_IN_FLIGHT.dec((endpoint,))
+            UPSTREAM_LATENCY.observe(time.perf_counter() - started, (method, endpoint))
+            UPSTREAM_REQUESTS.inc((method, endpoint, outcome["status"]))
+            if span is not None:
+                span.attributes.update({
+                    "http.method": method,
+                    "http.route": endpoint,
+                    "server.address": outcome.get("backend", self.base_url)
+                })
+                if outcome["status"].isdigit():
+                    span.attributes["http.status_code"] = int(outcome["status"])
+                if "bytes" in outcome:
+                    span.attributes["http.response.body.size"] = outcome["bytes"]
+                if "fault" in outcome:
+                    span.attributes["vocalyx.injected_fault"] = outcome["fault"]
+                if "class" in outcome:
+                    span.attributes["vocalyx.endpoint_class"] = outcome["class"]
+                span.end()
+    
+    @contextmanager
+    def _backend(self, method: str, endpoint: str):
+        """
+        Instance de vocalyx-api d'un envoi, hors instances dont le disjoncteur de
+        l'endpoint est ouvert (CircuitOpenError, sans envoi ni mesure, s'il n'en
+        reste aucune) ; latence et échec éventuel rapportés à la répartition et
+        au disjoncteur de l'instance
+        """
+        backend = self.balancer.acquire(avoid=lambda candidate: self.breakers.blocked(candidate.url, method, endpoint))
+        started = None
+        try:
+            with self.resilience.guard(backend.url, method, endpoint):
+                started = time.perf_counter()
+                yield backend
+        except Exception as e:
+            latency = None if started is None else time.perf_counter() - started
+            self.balancer.release(backend, latency, failed=is_failure(e))
+            raise
+        except BaseException:
+            self.balancer.release(backend, None, failed=False)
+            raise
+        else:
+            self.balancer.release(backend, time.perf_counter() - started, failed=False)
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        jwt_token: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Appel synchrone à l'API. `endpoint` est le gabarit du chemin
+        (ex. /api/user/transcriptions/{transcription_id}) utilisé comme étiquette
+        des métriques et des disjoncteurs ; lève httpx.HTTPStatusError sur un
+        statut 4xx/5xx, CircuitOpenError si le disjoncteur de l'endpoint est ouvert.
+        Le client (délais, pool) est celui de la classe de l'appel ; l'instance
+        de l'API est choisie à chaque envoi (tentatives et copies comprises).
+        """
+        path = endpoint.format(**path_params) if path_params else endpoint
+        budget_class = endpoint_class(method, endpoint, upload="files" in kwargs)
+        
+        def send() -> httpx.Response:
+            with self._backend(method, endpoint) as backend, self._instrument(method, endpoint) as outcome:
+                url = backend.url + path
+                outcome["backend"] = backend.url
+                outcome["class"] = budget_class
+                if self.faults.enabled:
+                    self.faults.inject(method, endpoint, url, outcome)
+                response = self.pools.client(budget_class).request(
+                    method, url,
+                    headers={**outcome["headers"], **self._get_headers(jwt_token), **(headers or {})},
+                    **kwargs
+                )
+                outcome["status"] = str(response.status_code)
+                outcome["bytes"] = len(response.content)
+                response.raise_for_status()
+                return response
+        
+        return self.resilience.call(method, endpoint, send, timeout=self.pools.budgets[budget_class].timeout)
+    
+    async def _arequest(
+        self,
+        method: str,
+        endpoint: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        jwt_token: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """[Async] Équivalent de _request sur le client asynchrone"""
+        path = endpoint.format(**path_params) if path_params else endpoint
+        budget_class = endpoint_class(method, endpoint, upload="files" in kwargs)
+        
+        async def send() -> httpx.Response:
+            with self._backend(method, endpoint) as backend, self._instrument(method, endpoint) as outcome:
+                url = backend.url + path
+                outcome["backend"] = backend.url
+                outcome["class"] = budget_class
+                if self.faults.enabled:
+                    await self.faults.ainject(method, endpoint, url, outcome)
+                response = await self.pools.async_client(budget_class).request(
+                    method, url,
+                    headers={**outcome["headers"], **self._get_headers(jwt_token), **(headers or {})},
+                    **kwargs
+                )
+                outcome["status"] = str(response.status_code)
+                outcome["bytes"] = len(response.content)
+                response.raise_for_status()
+                return response
+        
+        return await self.resilience.acall(method, endpoint, send, timeout=self.pools.budgets[budget_class].timeout)
+    
     # ========================================================================
     # AUTHENTIFICATION
     # ========================================================================
@@ -43,11 +307,7 @@ class VocalyxAPIClient:
         """[Async] Appelle l'API backend pour obtenir un token JWT"""
         try:
             data = {"username": username, "password": password}
-            response = await self.async_client.post(
-                f"{self.base_url}/api/auth/token",
-                data=data
-            )
-            response.raise_for_status()
+            response = await self._arequest("POST", "/api/auth/token", data=data)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error logging into API: {e}")
@@ -66,12 +326,7 @@ class VocalyxAPIClient:
     def get_user_profile(self, jwt_token: str) -> Dict[str, Any]:
         """Récupère les informations du profil utilisateur (synchrone - compatibilité)"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/user/me",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/user/me", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user profile: {e}")
@@ -80,12 +335,7 @@ class VocalyxAPIClient:
     def get_user_projects(self, jwt_token: str) -> List[Dict[str, Any]]:
         """Récupère la liste des projets (synchrone - compatibilité)"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/user/projects",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/user/projects", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user projects: {e}")
@@ -95,12 +345,7 @@ class VocalyxAPIClient:
     async def get_user_profile_async(self, jwt_token: str) -> Dict[str, Any]:
         """[Async] Récupère les informations du profil utilisateur courant"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = await self.async_client.get(
-                f"{self.base_url}/api/user/me",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = await self._arequest("GET", "/api/user/me", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user profile: {e}")
@@ -109,12 +354,7 @@ class VocalyxAPIClient:
     async def get_user_projects_async(self, jwt_token: str) -> List[Dict[str, Any]]:
         """[Async] Récupère la liste des projets accessibles pour l'utilisateur courant"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = await self.async_client.get(
-                f"{self.base_url}/api/user/projects",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = await self._arequest("GET", "/api/user/projects", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user projects: {e}")
@@ -123,12 +363,7 @@ class VocalyxAPIClient:
     async def get_admin_api_key_async(self, jwt_token: str) -> Dict[str, Any]:
         """[Async] Appelle l'API backend pour obtenir la clé API admin en utilisant un JWT"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = await self.async_client.get(
-                f"{self.base_url}/api/admin/admin-api-key",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = await self._arequest("GET", "/api/admin/admin-api-key", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting admin API key: {e}")
@@ -141,12 +376,11 @@ class VocalyxAPIClient:
     def create_project(self, project_name: str, admin_key: str) -> Dict[str, Any]:
         """Crée un nouveau projet (nécessite clé admin)"""
         try:
-            response = self.client.post(
-                f"{self.base_url}/api/projects",
+            response = self._request(
+                "POST", "/api/projects",
                 json={"name": project_name},
                 headers={"X-API-Key": admin_key}
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error creating project: {e}")
@@ -155,11 +389,7 @@ class VocalyxAPIClient:
     def list_projects(self, admin_key: str) -> List[Dict[str, Any]]:
         """Liste tous les projets (nécessite clé admin)"""
         try:
-            response = self.client.get(
-                f"{self.base_url}/api/projects",
-                headers={"X-API-Key": admin_key}
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/projects", headers={"X-API-Key": admin_key})
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error listing projects: {e}")
@@ -168,11 +398,11 @@ class VocalyxAPIClient:
     def get_project_details(self, project_name: str, admin_key: str) -> Dict[str, Any]:
         """Récupère les détails d'un projet avec sa clé API"""
         try:
-            response = self.client.get(
-                f"{self.base_url}/api/projects/{project_name}",
+            response = self._request(
+                "GET", "/api/projects/{project_name}",
+                path_params={"project_name": project_name},
                 headers={"X-API-Key": admin_key}
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting project details: {e}")
@@ -197,9 +427,6 @@ class VocalyxAPIClient:
     ) -> Dict[str, Any]:
         """Crée une nouvelle transcription"""
         try:
-            # Log pour déboguer le pre prompt
-            logger.info(f"📝 API Client - initial_prompt reçu: {repr(initial_prompt)} (type: {type(initial_prompt).__name__})")
-            
             files = {"file": (filename, file_content)}
             data = {
                 "project_name": project_name,
@@ -216,19 +443,21 @@ class VocalyxAPIClient:
             # Ajouter initial_prompt seulement s'il n'est pas vide
             if initial_prompt and initial_prompt.strip():
                 data["initial_prompt"] = initial_prompt.strip()
-                logger.info(f"✅ API Client - initial_prompt ajouté au data: {repr(data['initial_prompt'][:50])}...")
-            else:
-                logger.info(f"⚠️ API Client - initial_prompt vide ou None, non ajouté au data")
+                logger.debug(f"📝 API Client - initial_prompt transmis ({len(data['initial_prompt'])} caractère(s))")
             
             headers = {"X-API-Key": api_key}
             
-            response = await self.async_client.post(
-                f"{self.base_url}/api/transcriptions",
-                files=files,
-                data=data,
-                headers=headers
-            )
-            response.raise_for_status()
+            UPLOAD_BYTES_IN_FLIGHT.inc(amount=len(file_content))
+            try:
+                response = await self._arequest(
+                    "POST", "/api/transcriptions",
+                    files=files,
+                    data=data,
+                    headers=headers
+                )
+            finally:
+                UPLOAD_BYTES_IN_FLIGHT.dec(amount=len(file_content))
+            UPLOAD_BYTES.inc(amount=len(file_content))
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error creating transcription: {e}")
@@ -253,13 +482,7 @@ class VocalyxAPIClient:
             if search:
                 params["search"] = search
 
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/user/transcriptions",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/user/transcriptions", jwt_token=jwt_token, params=params)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user transcriptions: {e}")
@@ -282,13 +505,7 @@ class VocalyxAPIClient:
             if search:
                 params["search"] = search
 
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/user/transcriptions/count",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/user/transcriptions/count", jwt_token=jwt_token, params=params)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error counting user transcriptions: {e}")
@@ -297,12 +514,11 @@ class VocalyxAPIClient:
     def get_user_transcription(self, jwt_token: str, transcription_id: str) -> Dict[str, Any]:
         """Récupère une transcription à laquelle l'utilisateur peut accéder"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/user/transcriptions/{transcription_id}",
-                headers=headers
+            response = self._request(
+                "GET", "/api/user/transcriptions/{transcription_id}",
+                path_params={"transcription_id": transcription_id},
+                jwt_token=jwt_token
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting user transcription: {e}")
@@ -311,12 +527,11 @@ class VocalyxAPIClient:
     def delete_transcription(self, transcription_id: str, jwt_token: str) -> Dict[str, Any]:
         """Supprime une transcription (nécessite un JWT token)"""
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.delete(
-                f"{self.base_url}/api/user/transcriptions/{transcription_id}",
-                headers=headers
+            response = self._request(
+                "DELETE", "/api/user/transcriptions/{transcription_id}",
+                path_params={"transcription_id": transcription_id},
+                jwt_token=jwt_token
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error deleting transcription: {e}")
@@ -329,12 +544,7 @@ class VocalyxAPIClient:
     def list_users(self, admin_token: str) -> List[Dict[str, Any]]:
         """[Admin] Liste tous les utilisateurs"""
         try:
-            headers = self._get_headers(internal=False, jwt_token=admin_token)
-            response = self.client.get(
-                f"{self.base_url}/api/admin/users",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/admin/users", jwt_token=admin_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error listing users: {e}")
@@ -343,14 +553,8 @@ class VocalyxAPIClient:
     def create_user(self, admin_token: str, username: str, password: str, is_admin: bool) -> Dict[str, Any]:
         """[Admin] Crée un nouvel utilisateur"""
         try:
-            headers = self._get_headers(internal=False, jwt_token=admin_token)
             data = {"username": username, "password": password, "is_admin": is_admin}
-            response = self.client.post(
-                f"{self.base_url}/api/admin/users",
-                json=data,
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("POST", "/api/admin/users", jwt_token=admin_token, json=data)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error creating user: {e}")
@@ -359,14 +563,8 @@ class VocalyxAPIClient:
     def assign_project_to_user(self, admin_token: str, user_id: str, project_id: str) -> Dict[str, Any]:
         """[Admin] Associe un projet à un utilisateur"""
         try:
-            headers = self._get_headers(internal=False, jwt_token=admin_token)
             data = {"user_id": user_id, "project_id": project_id}
-            response = self.client.post(
-                f"{self.base_url}/api/admin/users/assign-project",
-                json=data,
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("POST", "/api/admin/users/assign-project", jwt_token=admin_token, json=data)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error assigning project: {e}")
@@ -375,14 +573,8 @@ class VocalyxAPIClient:
     def remove_project_from_user(self, admin_token: str, user_id: str, project_id: str) -> Dict[str, Any]:
         """[Admin] Dissocie un projet d'un utilisateur"""
         try:
-            headers = self._get_headers(internal=False, jwt_token=admin_token)
             data = {"user_id": user_id, "project_id": project_id}
-            response = self.client.post(
-                f"{self.base_url}/api/admin/users/remove-project",
-                json=data,
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("POST", "/api/admin/users/remove-project", jwt_token=admin_token, json=data)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error removing project: {e}")
@@ -391,12 +583,11 @@ class VocalyxAPIClient:
     def delete_user(self, admin_token: str, user_id: str) -> Dict[str, Any]:
         """[Admin] Supprime un utilisateur"""
         try:
-            headers = self._get_headers(internal=False, jwt_token=admin_token)
-            response = self.client.delete(
-                f"{self.base_url}/api/admin/users/{user_id}",
-                headers=headers
+            response = self._request(
+                "DELETE", "/api/admin/users/{user_id}",
+                path_params={"user_id": user_id},
+                jwt_token=admin_token
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error deleting user: {e}")
@@ -407,18 +598,18 @@ class VocalyxAPIClient:
     # ========================================================================
     
     def get_workers_status(self, jwt_token: str) -> Dict[str, Any]:
-        """Récupère le statut des workers Celery (nécessite un JWT token admin)"""
+        """
+        Récupère le statut des workers Celery (nécessite un JWT token admin).
+        En cas d'échec, statut vide avec `error` et, si l'API a répondu, son
+        code HTTP dans `status_code`.
+        """
         try:
-            headers = self._get_headers(jwt_token=jwt_token)
-            response = self.client.get(
-                f"{self.base_url}/api/admin/workers",
-                headers=headers
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/api/admin/workers", jwt_token=jwt_token)
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error getting workers status: {e}")
             return {
+                "status_code": e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None,
                 "worker_count": 0,
                 "transcription_worker_count": 0,
                 "enrichment_worker_count": 0,
@@ -431,25 +622,72 @@ class VocalyxAPIClient:
     def health_check(self) -> Dict[str, Any]:
         """Vérifie la santé de l'API"""
         try:
-            response = self.client.get(
-                f"{self.base_url}/health",
-                timeout=httpx.Timeout(5.0)
-            )
-            response.raise_for_status()
+            response = self._request("GET", "/health")
+            return response.json()
+        except httpx.HTTPError as e:
+            logger.error(f"Health check failed: {e}")
+            return {"status": "unhealthy", "error": str(e)}
+    
+    async def health_check_async(self) -> Dict[str, Any]:
+        """[Async] Vérifie la santé de l'API"""
+        try:
+            response = await self._arequest("GET", "/health")
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Health check failed: {e}")
             return {"status": "unhealthy", "error": str(e)}
     
+    async def warm_up(self, connections: int) -> None:
+        """
+        [Async] Vérifie l'API puis ouvre `connections` connexions keep-alive par
+        instance dans les pools de lecture (synchrone et asynchrone) : les
+        premières requêtes du dashboard n'attendent pas l'établissement des
+        connexions. Lancé en tâche de fond au démarrage.
+        """
+        health = await self.health_check_async()
+        if health.get("status") == "healthy":
+            logger.info("✅ API connection successful")
+        else:
+            logger.error(f"❌ API connection failed: {health.get('error')}")
+            return
+        if connections <= 0:
+            return
+        sync_client, async_client = self.pools.client(CLASS_READ), self.pools.async_client(CLASS_READ)
+        calls = []
+        for backend in self.balancer.backends:
+            url = f"{backend.url}/health"
+            calls += [async_client.get(url) for _ in range(connections)]
+            calls += [asyncio.to_thread(sync_client.get, url) for _ in range(connections)]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        opened = sum(
+            pool_stats(client).get("idle", 0)
+            for name, client in self.pools.clients().items() if name.split(":")[1] == CLASS_READ
+        )
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        logger.info(f"🔥 Connexions à l'API préchauffées : {opened} inactive(s) prête(s), {failed} échec(s)")
+    
+    async def probe_backend(self, url: str) -> bool:
+        """[Async] Sonde /health d'une instance précise (répartition de charge, hors disjoncteurs)"""
+        try:
+            response = await self.pools.async_client(CLASS_HEALTH).get(f"{url}/health")
+            return response.status_code < 500
+        except httpx.HTTPError:
+            return False
+    
+    def sticky_backend(self, key: str) -> Backend:
+        """Instance stable pour une session (connexions longues, ex. WebSocket)"""
+        return self.balancer.sticky(key)
+    
     # ========================================================================
     # CLEANUP
     # ========================================================================
     
     def close(self):
         """Ferme les clients HTTP"""
-        self.client.close()
+        self.hedger.shutdown()
+        self.pools.close()
     
     async def aclose(self):
         """Ferme les clients HTTP (async)"""
-        await self.async_client.aclose()
+        await self.pools.aclose()
 
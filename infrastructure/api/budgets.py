@@ -0,0 +1,143 @@
+"""
+Budgets des appels à vocalyx-api par classe d'endpoint (délais, pool de connexions dédié)
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+import httpx
+
+from infrastructure.api.transport import TransportFactory
+
+CLASS_READ = "read"
+CLASS_MUTATION = "mutation"
+CLASS_UPLOAD = "upload"
+CLASS_HEALTH = "health"
+ENDPOINT_CLASSES = (CLASS_READ, CLASS_MUTATION, CLASS_UPLOAD, CLASS_HEALTH)
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def endpoint_class(method: str, endpoint: str, upload: bool = False) -> str:
+    """Classe d'un appel : sonde de santé, envoi de fichier, lecture interactive ou modification"""
+    if endpoint == "/health":
+        return CLASS_HEALTH
+    if upload:
+        return CLASS_UPLOAD
+    return CLASS_READ if method in _READ_METHODS else CLASS_MUTATION
+
+
+@dataclass(frozen=True)
+class EndpointBudget:
+    """
+    `timeout` borne chaque opération réseau d'un appel (écriture, lecture, attente
+    d'une connexion libre du pool) ; `connect_timeout` borne l'établissement de la
+    connexion. `max_connections` est la taille du pool de la classe, donc le
+    nombre d'appels simultanés au-delà duquel les suivants attendent.
+    """
+
+    timeout: float
+    connect_timeout: float
+    max_connections: int
+
+    def __post_init__(self):
+        if self.timeout <= 0 or self.connect_timeout <= 0:
+            raise ValueError("Timeouts must be > 0")
+        if self.max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+
+    def httpx_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout, connect=min(self.connect_timeout, self.timeout))
+
+
+class ClientPools:
+    """
+    Un client httpx synchrone et un asynchrone par classe d'endpoint : chaque
+    classe a son propre pool de connexions, une vague d'envois de fichiers ne
+    peut donc pas occuper les connexions des lectures du dashboard.
+
+    `configure` applique de nouveaux budgets à chaud : un délai modifié est pris
+    en compte par les appels suivants ; une taille de pool modifiée remplace les
+    clients de la classe (les anciens terminent leurs appels en cours et sont
+    fermés à l'arrêt). Les transports (TCP, socket Unix, cache DNS) viennent de
+    `transports`.
+    """
+
+    def __init__(self, budgets: Mapping[str, EndpointBudget], transports: Optional[TransportFactory] = None):
+        self.transports = transports or TransportFactory()
+        self._lock = threading.Lock()
+        self.budgets: Dict[str, EndpointBudget] = {}
+        self._clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        # Transports montés (socket Unix) des clients courants, par nom "sync:<classe>" / "async:<classe>"
+        self._mounts: Dict[str, Dict[str, Any]] = {}
+        self._retired: List[Any] = []
+        self.configure(budgets)
+
+    def configure(self, budgets: Mapping[str, EndpointBudget]) -> List[str]:
+        """Applique les budgets ; retourne les classes modifiées"""
+        missing = set(ENDPOINT_CLASSES) - set(budgets)
+        if missing:
+            raise ValueError(f"Missing endpoint budgets: {', '.join(sorted(missing))}")
+        changed = []
+        with self._lock:
+            for name in ENDPOINT_CLASSES:
+                budget, previous = budgets[name], self.budgets.get(name)
+                if budget == previous:
+                    continue
+                changed.append(name)
+                if previous is not None and budget.max_connections == previous.max_connections:
+                    self._clients[name].timeout = budget.httpx_timeout()
+                    self._async_clients[name].timeout = budget.httpx_timeout()
+                else:
+                    if previous is not None:
+                        self._retired += [self._clients[name], self._async_clients[name]]
+                    options = self.transports.client_options(budget.max_connections)
+                    async_options = self.transports.async_client_options(budget.max_connections)
+                    self._clients[name] = httpx.Client(timeout=budget.httpx_timeout(), **options)
+                    self._async_clients[name] = httpx.AsyncClient(timeout=budget.httpx_timeout(), **async_options)
+                    self._mounts[f"sync:{name}"] = options["mounts"]
+                    self._mounts[f"async:{name}"] = async_options["mounts"]
+                self.budgets[name] = budget
+        return changed
+
+    def client(self, name: str) -> httpx.Client:
+        return self._clients[name]
+
+    def async_client(self, name: str) -> httpx.AsyncClient:
+        return self._async_clients[name]
+
+    def clients(self) -> Dict[str, Any]:
+        """
+        Clients courants par nom "sync:<classe>" / "async:<classe>" et transports
+        montés ("sync:<classe>:uds") pour les métriques des pools
+        """
+        clients: Dict[str, Any] = {}
+        with self._lock:
+            for kind, pool in (("sync", self._clients), ("async", self._async_clients)):
+                for name, client in pool.items():
+                    clients[f"{kind}:{name}"] = client
+                    for transport in self._mounts.get(f"{kind}:{name}", {}).values():
+                        clients[f"{kind}:{name}:uds"] = transport
+        return clients
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "timeout_seconds": budget.timeout,
+                "connect_timeout_seconds": budget.connect_timeout,
+                "max_connections": budget.max_connections
+            }
+            for name, budget in self.budgets.items()
+        }
+
+    def close(self) -> None:
+        for client in list(self._clients.values()) + [c for c in self._retired if isinstance(c, httpx.Client)]:
+            client.close()
+
+    async def aclose(self) -> None:
+        for client in list(self._async_clients.values()) + [
+            c for c in self._retired if isinstance(c, httpx.AsyncClient)
+        ]:
+            await client.aclose()
@@ -0,0 +1,195 @@
+"""
+FaultInjector - Pannes simulées des appels à vocalyx-api (latence, erreurs, coupures) pour les tests de résilience
+"""
+
+import asyncio
+import fnmatch
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from infrastructure.api.resilience import on_event_loop
+from infrastructure.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+FAULTS_INJECTED = Counter(
+    "vocalyx_frontend_upstream_faults_injected_total",
+    "Pannes injectées dans les appels à vocalyx-api (latency, status, reset, timeout)",
+    ("method", "endpoint", "kind")
+)
+
+_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+_RATES = ("error_rate", "reset_rate", "timeout_rate")
+
+
+@dataclass(frozen=True)
+class FaultRule:
+    """
+    Pannes appliquées aux appels dont le gabarit d'endpoint correspond à `pattern`
+    (motif fnmatch, ex. /api/user/transcriptions*) et, si précisée, à la méthode.
+    Chaque appel subit la latence ajoutée puis, au plus, une des pannes tirées
+    selon les taux : coupure de connexion, timeout ou statut d'erreur.
+    """
+
+    pattern: str = "*"
+    method: Optional[str] = None
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    reset_rate: float = 0.0
+    timeout_rate: float = 0.0
+
+    def __post_init__(self):
+        if self.method is not None and self.method.upper() not in _METHODS:
+            raise ValueError(f"Unknown HTTP method: {self.method}")
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency_ms and jitter_ms must be >= 0")
+        if any(not 0.0 <= getattr(self, rate) <= 1.0 for rate in _RATES):
+            raise ValueError("Rates must be between 0 and 1")
+        if sum(getattr(self, rate) for rate in _RATES) > 1.0:
+            raise ValueError("error_rate + reset_rate + timeout_rate must not exceed 1")
+        if not 400 <= self.error_status <= 599:
+            raise ValueError("error_status must be a 4xx or 5xx status")
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "FaultRule":
+        unknown = set(values) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown fault rule fields: {', '.join(sorted(unknown))}")
+        fields = dict(values)
+        for name in ("latency_ms", "jitter_ms") + _RATES:
+            if name in fields:
+                fields[name] = float(fields[name])
+        if "error_status" in fields:
+            fields["error_status"] = int(fields["error_status"])
+        if fields.get("method"):
+            fields["method"] = str(fields["method"]).upper()
+        return cls(**fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def matches(self, method: str, endpoint: str) -> bool:
+        return (self.method is None or self.method == method) and fnmatch.fnmatchcase(endpoint, self.pattern)
+
+
+def parse_fault_rules(value: str) -> List[FaultRule]:
+    """
+    "GET /api/user/transcriptions* latency_ms=200 error_rate=0.1; /api/admin/workers reset_rate=0.2"
+    -> règles (méthode facultative, motif, puis paramètres nom=valeur ; règles séparées par ";")
+    """
+    rules = []
+    for entry in (value or "").split(";"):
+        tokens = entry.split()
+        if not tokens:
+            continue
+        fields: Dict[str, Any] = {}
+        if tokens[0].upper() in _METHODS:
+            fields["method"] = tokens.pop(0)
+        if tokens and "=" not in tokens[0]:
+            fields["pattern"] = tokens.pop(0)
+        for token in tokens:
+            name, separator, setting = token.partition("=")
+            if not separator:
+                raise ValueError(f"Invalid fault setting '{token}' (expected name=value)")
+            fields[name] = setting
+        rules.append(FaultRule.from_dict(fields))
+    return rules
+
+
+class FaultInjector:
+    """
+    Appliqué par VocalyxAPIClient avant chaque appel (à l'intérieur de la mesure :
+    métriques, spans et logs voient les pannes comme de vraies erreurs). La première
+    règle correspondante s'applique. Les règles sont remplacées en bloc par
+    `configure` (configuration au démarrage ou endpoint d'administration).
+    """
+
+    def __init__(self, rules: Iterable[FaultRule] = (), enabled: bool = False, seed: Optional[int] = None):
+        self._rules: Tuple[FaultRule, ...] = tuple(rules)
+        self.enabled = enabled and bool(self._rules)
+        self._rng = random.Random(seed)
+
+    @property
+    def rules(self) -> Tuple[FaultRule, ...]:
+        return self._rules
+
+    def configure(self, rules: Iterable[FaultRule], enabled: bool = True) -> None:
+        self._rules = tuple(rules)
+        self.enabled = enabled and bool(self._rules)
+        if self.enabled:
+            logger.warning(f"⚠️ Injection de pannes active sur les appels à l'API ({len(self._rules)} règle(s))")
+        else:
+            logger.info("🧯 Injection de pannes désactivée")
+
+    def state(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "rules": [rule.to_dict() for rule in self._rules]}
+
+    def _draw(self, method: str, endpoint: str) -> Optional[Tuple[float, Optional[str], int]]:
+        """(délai en secondes, panne éventuelle, statut) pour un appel, None sans règle applicable"""
+        for rule in self._rules:
+            if rule.matches(method, endpoint):
+                break
+        else:
+            return None
+        delay = max(0.0, self._rng.gauss(rule.latency_ms, rule.jitter_ms) if rule.jitter_ms else rule.latency_ms) / 1000
+        draw = self._rng.random()
+        if draw < rule.reset_rate:
+            kind = "reset"
+        elif draw < rule.reset_rate + rule.timeout_rate:
+            kind = "timeout"
+        elif draw < rule.reset_rate + rule.timeout_rate + rule.error_rate:
+            kind = "status"
+        else:
+            kind = None
+        return delay, kind, rule.error_status
+
+    def _fail(self, method: str, endpoint: str, url: str, kind: Optional[str], status: int,
+              delay: float, outcome: Dict[str, Any]) -> None:
+        if kind is None:
+            if delay:
+                FAULTS_INJECTED.inc((method, endpoint, "latency"))
+            return
+        FAULTS_INJECTED.inc((method, endpoint, kind))
+        outcome["fault"] = kind
+        request = httpx.Request(method, url)
+        if kind == "reset":
+            raise httpx.RemoteProtocolError("Server disconnected without sending a response (injected)", request=request)
+        if kind == "timeout":
+            raise httpx.ReadTimeout("Read timed out (injected)", request=request)
+        outcome["status"] = str(status)
+        response = httpx.Response(status, request=request, json={"detail": "Injected upstream fault"})
+        raise httpx.HTTPStatusError(f"Injected upstream error {status} for url '{url}'", request=request, response=response)
+
+    def inject(self, method: str, endpoint: str, url: str, outcome: Dict[str, Any]) -> None:
+        """
+        Applique les pannes d'un appel synchrone (attente bloquante, comme un appel
+        httpx lent). Appelé depuis la boucle asyncio, la latence n'est pas injectée :
+        seules les pannes le sont.
+        """
+        drawn = self._draw(method, endpoint)
+        if drawn is None:
+            return
+        delay, kind, status = drawn
+        if delay and on_event_loop():
+            logger.debug(f"Injected latency skipped for {method} {endpoint}: synchronous call on the event loop")
+            delay = 0.0
+        if delay:
+            time.sleep(delay)
+        self._fail(method, endpoint, url, kind, status, delay, outcome)
+
+    async def ainject(self, method: str, endpoint: str, url: str, outcome: Dict[str, Any]) -> None:
+        """[Async] Équivalent de inject pour le client asynchrone"""
+        drawn = self._draw(method, endpoint)
+        if drawn is None:
+            return
+        delay, kind, status = drawn
+        if delay:
+            await asyncio.sleep(delay)
+        self._fail(method, endpoint, url, kind, status, delay, outcome)
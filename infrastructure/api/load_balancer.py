@@ -0,0 +1,217 @@
+"""
+LoadBalancer - Répartition des appels entre plusieurs instances de vocalyx-api (deux choix aléatoires sur la latence EWMA)
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from infrastructure.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+EJECTIONS = Counter(
+    "vocalyx_frontend_upstream_backend_ejections_total",
+    "Instances de vocalyx-api écartées (erreurs consécutives ou sonde en échec)",
+    ("backend",)
+)
+
+
+class Backend:
+    """
+    Une instance de vocalyx-api : latence EWMA « à pic » (une réponse plus lente
+    que la moyenne la remplace aussitôt, la moyenne ne redescend qu'avec le
+    temps), appels en cours, échecs consécutifs et éviction éventuelle. Sans
+    appel, le coût décroît : une instance lente finit par être réessayée.
+    """
+
+    def __init__(self, url: str, initial_latency: float):
+        self.url = url
+        self.ewma = initial_latency
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.updated_at = time.monotonic()
+
+    def ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+    def cost(self, decay: float, now: float) -> float:
+        idle = math.exp(-max(0.0, now - self.updated_at) / decay) if decay > 0 else 1.0
+        return self.ewma * idle * (self.in_flight + 1)
+
+    def observe(self, latency: float, decay: float, now: float) -> None:
+        if latency > self.ewma:
+            self.ewma = latency
+        else:
+            weight = math.exp(-max(0.0, now - self.updated_at) / decay) if decay > 0 else 0.0
+            self.ewma = self.ewma * weight + latency * (1.0 - weight)
+        self.updated_at = now
+
+
+class LoadBalancer:
+    """
+    Choisit l'instance de chaque appel par « deux choix aléatoires » : deux
+    instances disponibles sont tirées, la moins chargée (latence EWMA x appels en
+    cours + 1) est retenue. Une instance est écartée après `failure_threshold`
+    échecs consécutifs (connexion, timeout, 5xx) pour une durée qui double à
+    chaque éviction jusqu'à `max_ejection_seconds`, sans jamais écarter la
+    dernière instance disponible. Une sonde périodique de /health réintègre les
+    instances rétablies (un échec de sonde compte comme un échec d'appel).
+    Partagé entre la boucle asyncio et le pool de threads des routes synchrones
+    (verrou).
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        decay_seconds: float = 10.0,
+        failure_threshold: int = 5,
+        ejection_seconds: float = 30.0,
+        max_ejection_seconds: float = 300.0,
+        failure_penalty: float = 1.0,
+        initial_latency: float = 0.05,
+        seed: Optional[int] = None
+    ):
+        self.backends = [Backend(url, initial_latency) for url in urls]
+        if not self.backends:
+            raise ValueError("At least one API URL is required")
+        self.decay_seconds = decay_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.ejection_seconds = ejection_seconds
+        self.max_ejection_seconds = max(ejection_seconds, max_ejection_seconds)
+        self.failure_penalty = failure_penalty
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def primary(self) -> Backend:
+        return self.backends[0]
+
+    def _available(self, now: float) -> List[Backend]:
+        available = [backend for backend in self.backends if not backend.ejected(now)]
+        # Toutes écartées : mieux vaut tenter la première à revenir que refuser l'appel
+        return available or [min(self.backends, key=lambda backend: backend.ejected_until)]
+
+    def acquire(self, avoid: Optional[Callable[[Backend], bool]] = None) -> Backend:
+        """
+        Instance d'un appel (à rendre avec `release`) ; les instances pour
+        lesquelles `avoid` est vrai (disjoncteur de l'endpoint ouvert) ne sont
+        retenues que s'il n'en reste aucune autre.
+        """
+        with self._lock:
+            if len(self.backends) == 1:
+                backend = self.backends[0]
+            else:
+                now = time.monotonic()
+                available = self._available(now)
+                if avoid is not None:
+                    available = [backend for backend in available if not avoid(backend)] or available
+                if len(available) == 1:
+                    backend = available[0]
+                else:
+                    first, second = self._rng.sample(available, 2)
+                    cheaper = first.cost(self.decay_seconds, now) <= second.cost(self.decay_seconds, now)
+                    backend = first if cheaper else second
+            backend.in_flight += 1
+            backend.requests += 1
+            return backend
+
+    def release(self, backend: Backend, latency: Optional[float], failed: bool) -> None:
+        """Fin d'un appel ; `latency` None pour un appel abandonné (copie couverte annulée)"""
+        with self._lock:
+            backend.in_flight = max(0, backend.in_flight - 1)
+            now = time.monotonic()
+            if latency is None:
+                return
+            backend.observe(max(latency, self.failure_penalty) if failed else latency, self.decay_seconds, now)
+            if failed:
+                self._record_failure(backend, now)
+            else:
+                backend.failures = 0
+                backend.ejections = 0
+
+    def _record_failure(self, backend: Backend, now: float) -> None:
+        backend.failures += 1
+        if backend.failures < self.failure_threshold or backend.ejected(now) or len(self.backends) == 1:
+            return
+        if not any(other is not backend and not other.ejected(now) for other in self.backends):
+            return
+        duration = min(self.max_ejection_seconds, self.ejection_seconds * 2 ** backend.ejections)
+        backend.ejections += 1
+        backend.ejected_until = now + duration
+        EJECTIONS.inc((backend.url,))
+        logger.warning(f"🚫 Instance {backend.url} écartée pendant {duration:.0f} s ({backend.failures} échec(s))")
+
+    def sticky(self, key: str) -> Backend:
+        """
+        Instance stable pour une clé (session) tant qu'elle reste disponible
+        (hachage de rendez-vous : écarter une instance ne déplace que ses sessions)
+        """
+        with self._lock:
+            available = self._available(time.monotonic())
+        return max(available, key=lambda backend: hashlib.sha256(f"{backend.url}|{key}".encode("utf-8")).digest())
+
+    # ------------------------------------------------------------------
+    # Sondes actives
+    # ------------------------------------------------------------------
+
+    def start(self, probe: Callable[[str], Awaitable[bool]], interval: float) -> None:
+        """Sonde chaque instance toutes les `interval` secondes (inutile avec une seule instance)"""
+        if self._task is None and interval > 0 and len(self.backends) > 1:
+            self._task = asyncio.create_task(self._run(probe, interval), name="api-backend-probes")
+            logger.info(f"⚖️ Répartition entre {len(self.backends)} instances de l'API (sonde toutes les {interval:.0f}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, probe: Callable[[str], Awaitable[bool]], interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            results = await asyncio.gather(*(probe(backend.url) for backend in self.backends), return_exceptions=True)
+            for backend, healthy in zip(self.backends, results):
+                self.record_probe(backend, healthy is True)
+
+    def record_probe(self, backend: Backend, healthy: bool) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if healthy:
+                if backend.ejected(now):
+                    logger.info(f"✅ Instance {backend.url} réintégrée (sonde /health)")
+                backend.ejected_until = 0.0
+                backend.failures = 0
+            else:
+                self._record_failure(backend, now)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                backend.url: {
+                    "state": "ejected" if backend.ejected(now) else "available",
+                    "ewma_latency_ms": round(backend.ewma * 1000, 1),
+                    "in_flight": backend.in_flight,
+                    "requests": backend.requests,
+                    "consecutive_failures": backend.failures,
+                    "ejected_for_seconds": round(max(0.0, backend.ejected_until - now), 1)
+                }
+                for backend in self.backends
+            }
+
+    def ejected_urls(self) -> List[str]:
+        now = time.monotonic()
+        return [backend.url for backend in self.backends if backend.ejected(now)]
@@ -0,0 +1,418 @@
+"""
+Résilience des appels à vocalyx-api : disjoncteurs par instance et endpoint, reprises avec délai aléatoire, requêtes couvertes (hedging)
+"""
+
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import httpx
+
+from infrastructure.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half_open"
+STATE_OPEN = "open"
+# Valeur exposée par vocalyx_frontend_upstream_circuit_state
+STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+# Réponses d'une API momentanément indisponible (passerelle, surcharge) : nouvelle tentative possible
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+SHORT_CIRCUITED = Counter(
+    "vocalyx_frontend_upstream_short_circuited_total",
+    "Appels à vocalyx-api refusés sans envoi (disjoncteur ouvert)",
+    ("method", "endpoint")
+)
+RETRIES = Counter(
+    "vocalyx_frontend_upstream_retries_total",
+    "Nouvelles tentatives d'appels idempotents à vocalyx-api",
+    ("method", "endpoint")
+)
+HEDGES = Counter(
+    "vocalyx_frontend_upstream_hedged_requests_total",
+    "Requêtes couvertes envoyées (won : la copie a répondu la première)",
+    ("method", "endpoint", "outcome")
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Appel refusé localement : le disjoncteur de l'endpoint est ouvert"""
+
+    def __init__(self, endpoint: str, retry_after: float, request: Optional[httpx.Request] = None):
+        super().__init__(f"Circuit open for {endpoint} (retry in {retry_after:.0f}s)", request=request)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def is_failure(error: Exception) -> bool:
+    """Erreur imputable à la disponibilité de l'API (les refus 4xx sont des réponses normales)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError) and not isinstance(error, CircuitOpenError)
+
+
+def on_event_loop() -> bool:
+    """Vrai sur le thread d'une boucle asyncio (une attente bloquante y figerait toutes les requêtes)"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUSES
+    return isinstance(error, httpx.TransportError) and not isinstance(error, CircuitOpenError)
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur d'un endpoint d'une instance : ouvert après `failure_threshold` échecs consécutifs,
+    il refuse les appels pendant `reset_timeout` secondes, puis laisse passer un
+    appel d'essai (semi-ouvert) qui le referme en cas de succès. Partagé entre la
+    boucle asyncio et le pool de threads des routes synchrones (verrou).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN and self.retry_after() > 0:
+                return False
+            # Délai écoulé : un seul appel d'essai à la fois
+            if self._probing:
+                return False
+            self.state = STATE_HALF_OPEN
+            self._probing = True
+            return True
+
+    def blocked(self) -> bool:
+        """Refuserait un appel maintenant (lecture seule : n'engage pas d'appel d'essai)"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return False
+            if self.state == STATE_OPEN and self.retry_after() > 0:
+                return True
+            return self._probing
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            self.state = STATE_CLOSED
+
+    def record_failure(self) -> bool:
+        """Enregistre un échec ; True si le disjoncteur vient de s'ouvrir"""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != STATE_OPEN
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+                self.trips += opened
+                return opened
+            return False
+
+    def release(self) -> None:
+        """Appel d'essai terminé sans verdict (refus 4xx, annulation) : un autre essai est permis"""
+        with self._lock:
+            self._probing = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        payload = {"state": self.state, "consecutive_failures": self.failures, "trips": self.trips}
+        if self.state != STATE_CLOSED:
+            payload["retry_in_seconds"] = round(self.retry_after(), 1)
+        return payload
+
+
+class CircuitBreakerRegistry:
+    """
+    Disjoncteurs créés à la demande, un par (instance, méthode, gabarit
+    d'endpoint) : une instance défaillante n'ouvre pas l'endpoint sur les autres.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, enabled: bool = True):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.enabled = enabled
+        self._breakers: Dict[Tuple[str, str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, backend: str, method: str, endpoint: str) -> Optional[CircuitBreaker]:
+        if not self.enabled:
+            return None
+        key = (backend, method, endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(self.failure_threshold, self.reset_timeout))
+        return breaker
+
+    def blocked(self, backend: str, method: str, endpoint: str) -> bool:
+        """Le disjoncteur de l'endpoint sur cette instance refuserait l'appel (choix de l'instance)"""
+        breaker = self._breakers.get((backend, method, endpoint)) if self.enabled else None
+        return breaker is not None and breaker.blocked()
+
+    def items(self) -> Iterable[Tuple[Tuple[str, str, str], CircuitBreaker]]:
+        return list(self._breakers.items())
+
+    def open_endpoints(self) -> list:
+        return [
+            f"{method} {backend}{endpoint}"
+            for (backend, method, endpoint), breaker in self.items() if breaker.state != STATE_CLOSED
+        ]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            f"{method} {backend}{endpoint}": breaker.snapshot()
+            for (backend, method, endpoint), breaker in sorted(self.items())
+        }
+
+
+class RetryPolicy:
+    """
+    Reprises des appels idempotents (GET) : délai aléatoire uniforme dans
+    [0, min(max, base x 2^n)] (full jitter). `deadline` borne la durée totale
+    d'un appel, tentatives, attentes et copies comprises.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 1.0, deadline: float = 30.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def attempts(self, method: str) -> int:
+        return self.max_attempts if method in ("GET", "HEAD") else 1
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class Hedger:
+    """
+    Requêtes couvertes : sans réponse après `delay` secondes, une copie de la
+    requête est envoyée et la première réponse réussie est retenue. Réservé aux
+    lectures listées dans `endpoints` ; `max_in_flight` borne les requêtes
+    confiées au pool de threads (appels synchrones) et les copies simultanées,
+    pour ne pas doubler la charge d'une API déjà saturée.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = (), delay: float = 0.2, max_in_flight: int = 16):
+        self.endpoints = frozenset(endpoints)
+        self.delay = delay
+        self.max_in_flight = max(1, max_in_flight)
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, endpoint: str) -> bool:
+        return f"{method} {endpoint}" in self.endpoints
+
+    def _submit(self, call: Callable[[], httpx.Response]) -> Optional[Future]:
+        if not self._slots.acquire(blocking=False):
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="api-hedge")
+        # Contexte copié : les spans de la trace de la requête sont conservés
+        future = self._executor.submit(contextvars.copy_context().run, call)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def call(self, method: str, endpoint: str, call: Callable[[], httpx.Response]) -> httpx.Response:
+        """Appel synchrone couvert (les deux requêtes s'exécutent dans le pool de threads)"""
+        primary = self._submit(call)
+        if primary is None:
+            return call()
+        done, _ = wait([primary], timeout=self.delay)
+        if done:
+            return primary.result()
+        hedge = self._submit(call)
+        if hedge is None:
+            return primary.result()
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # La requête perdante se termine en arrière-plan (un appel httpx synchrone ne s'annule pas)
+                    HEDGES.inc((method, endpoint, "won" if future is hedge else "lost"))
+                    return future.result()
+                error = error or future.exception()
+        HEDGES.inc((method, endpoint, "failed"))
+        raise error
+
+    async def acall(self, method: str, endpoint: str, call: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """[Async] Appel couvert : la requête perdante est annulée"""
+        primary = asyncio.ensure_future(call())
+        done, _ = await asyncio.wait({primary}, timeout=self.delay)
+        if done or not self._slots.acquire(blocking=False):
+            return await primary
+        hedge = asyncio.ensure_future(call())
+        hedge.add_done_callback(lambda _: self._slots.release())
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        HEDGES.inc((method, endpoint, "won" if task is hedge else "lost"))
+                        return task.result()
+                    error = error or task.exception()
+            HEDGES.inc((method, endpoint, "failed"))
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def parse_hedge_endpoints(value: str) -> Tuple[str, ...]:
+    """"GET /api/user/transcriptions, GET /api/user/me" -> ("GET /api/user/transcriptions", ...)"""
+    endpoints = []
+    for entry in (value or "").split(","):
+        parts = entry.split()
+        if len(parts) == 1:
+            parts = ["GET", parts[0]]
+        if len(parts) == 2:
+            endpoints.append(f"{parts[0].upper()} {parts[1]}")
+    return tuple(endpoints)
+
+
+class ResilientCaller:
+    """
+    Reprises et couverture autour d'un envoi unitaire (`send`, déjà instrumenté :
+    chaque tentative et chaque copie est mesurée). L'instance étant choisie à
+    chaque envoi, `send` passe par `guard`, le disjoncteur de (instance, endpoint).
+    Un appel synchrone fait depuis la boucle asyncio n'est ni repris ni couvert :
+    l'attente entre deux tentatives et celle des copies bloqueraient la boucle.
+
+    `timeout` (délai d'une tentative, celui de la classe de l'endpoint) sert à
+    respecter l'échéance globale de la RetryPolicy : une tentative n'est reprise,
+    et une copie envoyée, que s'il reste de quoi aller au bout de son délai.
+    """
+
+    def __init__(self, breakers: CircuitBreakerRegistry, retry: RetryPolicy, hedger: Hedger):
+        self.breakers = breakers
+        self.retry = retry
+        self.hedger = hedger
+
+    @contextmanager
+    def guard(self, backend: str, method: str, endpoint: str) -> Iterator[None]:
+        """Disjoncteur d'un envoi vers une instance : CircuitOpenError s'il est ouvert, verdict enregistré"""
+        breaker = self.breakers.get(backend, method, endpoint)
+        self._admit(method, endpoint, breaker)
+        try:
+            yield
+        except BaseException as e:
+            self._record(backend, method, endpoint, breaker, e)
+            raise
+        self._record(backend, method, endpoint, breaker, None)
+
+    def _admit(self, method: str, endpoint: str, breaker: Optional[CircuitBreaker]) -> None:
+        if breaker is not None and not breaker.allow():
+            SHORT_CIRCUITED.inc((method, endpoint))
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+
+    @staticmethod
+    def _record(backend: str, method: str, endpoint: str, breaker: Optional[CircuitBreaker],
+                error: Optional[BaseException]) -> None:
+        if breaker is None:
+            return
+        if error is None:
+            breaker.record_success()
+        elif isinstance(error, Exception) and is_failure(error):
+            if breaker.record_failure():
+                logger.warning(
+                    f"⚡ Disjoncteur ouvert pour {method} {backend}{endpoint} "
+                    f"({breaker.failures} échec(s), nouvel essai dans {breaker.reset_timeout:.0f} s)"
+                )
+        elif isinstance(error, httpx.HTTPStatusError):
+            # Refus 4xx : l'API a répondu
+            breaker.record_success()
+        else:
+            breaker.release()
+
+    def _plan(self, deadline: float, timeout: Optional[float], hedgeable: bool, pause: float = 0.0) -> Optional[bool]:
+        """
+        Prochaine tentative après `pause` secondes : None si elle ne tiendrait pas
+        avant l'échéance, sinon si elle peut être couverte (copie envoyée après
+        le délai de couverture, donc terminée au plus tard d'autant plus tard).
+        """
+        remaining = deadline - time.monotonic() - pause
+        needed = timeout or 0.0
+        if remaining <= 0 or remaining < needed:
+            return None
+        return hedgeable and remaining >= needed + self.hedger.delay
+
+    def call(self, method: str, endpoint: str, send: Callable[[], httpx.Response],
+             timeout: Optional[float] = None) -> httpx.Response:
+        blocking = not on_event_loop()
+        attempts = self.retry.attempts(method) if blocking else 1
+        deadline = time.monotonic() + self.retry.deadline
+        hedged = self._plan(deadline, timeout, blocking and self.hedger.applies(method, endpoint))
+        attempt = 0
+        while True:
+            try:
+                return self.hedger.call(method, endpoint, send) if hedged else send()
+            except Exception as e:
+                if attempt + 1 < attempts and is_retryable(e):
+                    pause = self.retry.delay(attempt)
+                    hedged = self._plan(deadline, timeout, bool(hedged), pause)
+                    if hedged is not None:
+                        RETRIES.inc((method, endpoint))
+                        time.sleep(pause)
+                        attempt += 1
+                        continue
+                raise
+
+    async def acall(self, method: str, endpoint: str, send: Callable[[], Awaitable[httpx.Response]],
+                    timeout: Optional[float] = None) -> httpx.Response:
+        attempts = self.retry.attempts(method)
+        deadline = time.monotonic() + self.retry.deadline
+        hedged = self._plan(deadline, timeout, self.hedger.applies(method, endpoint))
+        attempt = 0
+        while True:
+            try:
+                return await (self.hedger.acall(method, endpoint, send) if hedged else send())
+            except Exception as e:
+                if attempt + 1 < attempts and is_retryable(e):
+                    pause = self.retry.delay(attempt)
+                    hedged = self._plan(deadline, timeout, bool(hedged), pause)
+                    if hedged is not None:
+                        RETRIES.inc((method, endpoint))
+                        await asyncio.sleep(pause)
+                        attempt += 1
+                        continue
+                raise
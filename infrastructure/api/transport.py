@@ -0,0 +1,306 @@
+"""
+Transports httpx vers vocalyx-api : socket Unix pour l'instance locale, cache DNS pour les instances en TCP
+"""
+
+import ipaddress
+import socket
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import anyio
+import httpcore
+import httpx
+
+from infrastructure.cache import TTLCache
+
+
+# Exceptions httpcore -> httpx (de la plus précise à la plus générale)
+_ERRORS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextmanager
+def _httpx_errors(request: httpx.Request) -> Iterator[None]:
+    try:
+        yield
+    except Exception as e:
+        for core_error, httpx_error in _ERRORS:
+            if isinstance(e, core_error):
+                raise httpx_error(str(e), request=request) from e
+        raise
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class DnsCache:
+    """
+    Adresses résolues par (hôte, port), conservées `ttl_seconds`. Une adresse qui
+    refuse la connexion n'est pas retirée seule : l'entrée entière est oubliée
+    quand aucune adresse ne répond (nouvelle résolution à l'appel suivant).
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self.entries = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    @property
+    def hits(self) -> int:
+        return self.entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self.entries.misses
+
+    @staticmethod
+    def _addresses(infos: List[Tuple[Any, ...]]) -> List[str]:
+        addresses = []
+        for info in infos:
+            address = info[4][0]
+            if address not in addresses:
+                addresses.append(address)
+        return addresses
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        addresses = self.entries.get((host, port))
+        if addresses is None:
+            addresses = self._addresses(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+            self.entries.put((host, port), addresses)
+        return addresses
+
+    async def aresolve(self, host: str, port: int) -> List[str]:
+        addresses = self.entries.get((host, port))
+        if addresses is None:
+            addresses = self._addresses(await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+            self.entries.put((host, port), addresses)
+        return addresses
+
+    def forget(self, host: str, port: int) -> None:
+        self.entries.pop((host, port))
+
+
+class CachingNetworkBackend(httpcore.NetworkBackend):
+    """Backend réseau httpcore résolvant les noms d'hôte par le DnsCache (SNI inchangé : le nom reste transmis à TLS)"""
+
+    def __init__(self, dns_cache: DnsCache, backend: Optional[httpcore.NetworkBackend] = None):
+        self.dns_cache = dns_cache
+        self.backend = backend or httpcore.SyncBackend()
+
+    def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None, local_address: Optional[str] = None,
+                    socket_options: Any = None) -> httpcore.NetworkStream:
+        if _is_ip(host):
+            return self.backend.connect_tcp(host, port, timeout, local_address, socket_options)
+        try:
+            addresses = self.dns_cache.resolve(host, port)
+        except OSError as e:
+            # Échec de résolution (socket.gaierror) : erreur de connexion comme pour le transport httpx
+            raise httpcore.ConnectError(f"Could not resolve {host}: {e}") from e
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return self.backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        self.dns_cache.forget(host, port)
+        raise error or httpcore.ConnectError(f"No address for {host}")
+
+    def connect_unix_socket(self, path: str, timeout: Optional[float] = None,
+                            socket_options: Any = None) -> httpcore.NetworkStream:
+        return self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self.backend.sleep(seconds)
+
+
+class AsyncCachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """[Async] Équivalent de CachingNetworkBackend"""
+
+    def __init__(self, dns_cache: DnsCache, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        self.dns_cache = dns_cache
+        self.backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                          local_address: Optional[str] = None, socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        if _is_ip(host):
+            return await self.backend.connect_tcp(host, port, timeout, local_address, socket_options)
+        try:
+            addresses = await self.dns_cache.aresolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(f"Could not resolve {host}: {e}") from e
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self.backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        self.dns_cache.forget(host, port)
+        raise error or httpcore.ConnectError(f"No address for {host}")
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None,
+                                  socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+
+def _core_request(request: httpx.Request) -> httpcore.Request:
+    return httpcore.Request(
+        method=request.method,
+        url=httpcore.URL(
+            scheme=request.url.raw_scheme,
+            host=request.url.raw_host,
+            port=request.url.port,
+            target=request.url.raw_path
+        ),
+        headers=request.headers.raw,
+        content=request.stream,
+        extensions=request.extensions
+    )
+
+
+def _core_pool_options(limits: httpx.Limits) -> Dict[str, Any]:
+    return {
+        "ssl_context": httpx.create_ssl_context(),
+        "max_connections": limits.max_connections,
+        "max_keepalive_connections": limits.max_keepalive_connections,
+        "keepalive_expiry": limits.keepalive_expiry
+    }
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    def __init__(self, stream: Any, request: httpx.Request):
+        self.stream = stream
+        self.request = request
+
+    def __iter__(self) -> Iterator[bytes]:
+        with _httpx_errors(self.request):
+            for part in self.stream:
+                yield part
+
+    def close(self) -> None:
+        if hasattr(self.stream, "close"):
+            self.stream.close()
+
+
+class _AsyncResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, request: httpx.Request):
+        self.stream = stream
+        self.request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors(self.request):
+            async for part in self.stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self.stream, "aclose"):
+            await self.stream.aclose()
+
+
+class DnsCachingTransport(httpx.BaseTransport):
+    """
+    Transport httpx sur un pool httpcore dont le backend réseau résout les noms
+    d'hôte par le DnsCache (httpx.HTTPTransport ne permet pas de choisir ce backend)
+    """
+
+    def __init__(self, dns_cache: DnsCache, limits: httpx.Limits):
+        self._pool = httpcore.ConnectionPool(network_backend=CachingNetworkBackend(dns_cache), **_core_pool_options(limits))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors(request):
+            response = self._pool.handle_request(_core_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream, request),
+            extensions=response.extensions
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class AsyncDnsCachingTransport(httpx.AsyncBaseTransport):
+    """[Async] Équivalent de DnsCachingTransport"""
+
+    def __init__(self, dns_cache: DnsCache, limits: httpx.Limits):
+        self._pool = httpcore.AsyncConnectionPool(
+            network_backend=AsyncCachingNetworkBackend(dns_cache), **_core_pool_options(limits)
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors(request):
+            response = await self._pool.handle_async_request(_core_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_AsyncResponseStream(response.stream, request),
+            extensions=response.extensions
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class TransportFactory:
+    """
+    Transports des clients httpx de ClientPools : TCP (avec cache DNS si
+    `dns_cache` est fourni) et, si `uds` est configuré, socket Unix monté pour
+    l'origine `uds_origin` (l'instance locale) ; les autres origines restent en TCP.
+    """
+
+    def __init__(self, uds: Optional[str] = None, uds_origin: Optional[str] = None,
+                 dns_cache: Optional[DnsCache] = None, keepalive_expiry: float = 5.0):
+        self.uds = uds or None
+        self.uds_origin = uds_origin
+        self.dns_cache = dns_cache
+        self.keepalive_expiry = keepalive_expiry
+
+    def limits(self, max_connections: int) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def _mounts(self, transport_class: type, limits: httpx.Limits) -> Dict[str, Any]:
+        if self.uds is None or self.uds_origin is None:
+            return {}
+        return {self.uds_origin: transport_class(uds=self.uds, limits=limits)}
+
+    def client_options(self, max_connections: int) -> Dict[str, Any]:
+        """Arguments de httpx.Client (transport par défaut et montage du socket Unix)"""
+        limits = self.limits(max_connections)
+        if self.dns_cache is not None:
+            transport: httpx.BaseTransport = DnsCachingTransport(self.dns_cache, limits)
+        else:
+            transport = httpx.HTTPTransport(limits=limits)
+        return {"transport": transport, "mounts": self._mounts(httpx.HTTPTransport, limits)}
+
+    def async_client_options(self, max_connections: int) -> Dict[str, Any]:
+        """Arguments de httpx.AsyncClient"""
+        limits = self.limits(max_connections)
+        if self.dns_cache is not None:
+            transport: httpx.AsyncBaseTransport = AsyncDnsCachingTransport(self.dns_cache, limits)
+        else:
+            transport = httpx.AsyncHTTPTransport(limits=limits)
+        return {"transport": transport, "mounts": self._mounts(httpx.AsyncHTTPTransport, limits)}
@@ -0,0 +1,15 @@
+"""
+Caches en mémoire partagés par les services
+"""
+
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+from infrastructure.cache.ring_buffer import MetricRingBuffer
+from infrastructure.cache.stale_cache import StaleResponseCache
+from infrastructure.cache.ttl_cache import TTLCache
+
+__all__ = [
+    "ByteBoundedLRUCache",
+    "MetricRingBuffer",
+    "StaleResponseCache",
+    "TTLCache"
+]
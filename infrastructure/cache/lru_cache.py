@@ -0,0 +1,89 @@
+"""
+ByteBoundedLRUCache - Cache LRU borné par la taille totale (en octets) des entrées
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ByteBoundedLRUCache:
+    """
+    Cache LRU dont la capacité est exprimée en octets et non en nombre d'entrées.
+    Chaque entrée est stockée avec sa taille ; les entrées les moins récemment
+    utilisées sont évincées tant que le total dépasse `max_bytes`.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur associée à la clé (et la marque comme récente)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key: Hashable, value: Any, size: int) -> bool:
+        """
+        Ajoute ou remplace une entrée.
+        Retourne False si l'entrée est plus grosse que le cache entier (non stockée).
+        """
+        size = max(0, int(size))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+            return True
+    
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Retire une entrée du cache"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self.total_bytes -= entry[1]
+            return entry[0]
+    
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def stats(self) -> dict:
+        """Statistiques du cache (pour le monitoring)"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0
+        }
@@ -0,0 +1,68 @@
+"""
+MetricRingBuffer - Historique de métriques de taille fixe, stocké dans des tableaux compacts
+"""
+
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+
+class MetricRingBuffer:
+    """
+    Tampon circulaire d'échantillons horodatés.
+    Une colonne `array('d')` par métrique, préallouée à `capacity` : l'ajout d'un
+    échantillon est en O(1) et n'alloue rien ; les plus anciens sont écrasés.
+    """
+
+    def __init__(self, fields: Sequence[str], capacity: int):
+        self.fields = tuple(fields)
+        self.capacity = max(1, int(capacity))
+        self._timestamps = array("d", [0.0]) * self.capacity
+        self._columns = {field: array("d", [0.0]) * self.capacity for field in self.fields}
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        """Ajoute un échantillon (métrique absente : 0)"""
+        with self._lock:
+            index = self._next
+            self._timestamps[index] = timestamp
+            for field, column in self._columns.items():
+                column[index] = float(values.get(field) or 0.0)
+            self._next = (index + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def _ordered_indexes(self) -> List[int]:
+        start = (self._next - self._size) % self.capacity
+        return [(start + offset) % self.capacity for offset in range(self._size)]
+
+    def downsample(self, points: int, since: Optional[float] = None) -> Dict[str, object]:
+        """
+        Échantillons postérieurs à `since`, réduits à au plus `points` valeurs par
+        moyenne de seaux consécutifs (le maximum de chaque seau est aussi renvoyé).
+        """
+        points = max(1, int(points))
+        with self._lock:
+            indexes = [i for i in self._ordered_indexes() if since is None or self._timestamps[i] >= since]
+            timestamps = [self._timestamps[i] for i in indexes]
+            columns = {field: [column[i] for i in indexes] for field, column in self._columns.items()}
+
+        count = len(timestamps)
+        bucket = max(1, -(-count // points))
+        bounds = [(start, min(start + bucket, count)) for start in range(0, count, bucket)]
+        return {
+            "timestamps": [timestamps[end - 1] for _, end in bounds],
+            "series": {
+                field: [sum(values[start:end]) / (end - start) for start, end in bounds]
+                for field, values in columns.items()
+            },
+            "max": {
+                field: [max(values[start:end]) for start, end in bounds]
+                for field, values in columns.items()
+            },
+            "bucket_size": bucket
+        }
@@ -0,0 +1,75 @@
+"""
+StaleResponseCache - Dernières réponses valides des routes de lecture, servies quand vocalyx-api est indisponible
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from infrastructure.cache.lru_cache import ByteBoundedLRUCache
+
+# Surcoût approximatif d'une entrée (clé, tuple, horodatage) ajouté à la taille du corps
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+class StaleResponseCache:
+    """
+    Corps JSON de la dernière réponse réussie par (session, route, paramètres).
+    La session est une empreinte du jeton : une réponse n'est jamais servie à un
+    autre jeton que celui qui l'a obtenue (les revendications du JWT ne sont pas
+    vérifiées ici et ne peuvent pas servir de clé). Borné en octets (LRU) ; une
+    entrée plus vieille que `max_age_seconds` n'est plus servie.
+    """
+
+    def __init__(self, max_bytes: int, max_age_seconds: float):
+        self.entries = ByteBoundedLRUCache(max_bytes)
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return self.entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self.entries.misses
+
+    @staticmethod
+    def key(token: str, route: str, params: Dict[str, Any]) -> Tuple[str, str, tuple]:
+        session = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+        return session, route, tuple(sorted((name, str(value)) for name, value in params.items() if value is not None))
+
+    def store(self, key: Hashable, body: bytes) -> None:
+        self.entries.put(key, (body, time.time()), len(body) + _ENTRY_OVERHEAD_BYTES)
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[bytes, float]]:
+        """(corps, âge en secondes) de la dernière réponse, None si absente ou trop ancienne"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        body, stored_at = entry
+        age = max(0.0, time.time() - stored_at)
+        if age > self.max_age_seconds:
+            self.entries.pop(key)
+            return None
+        return body, age
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Réserve le rafraîchissement d'une entrée (False s'il est déjà en cours)"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> dict:
+        stats = self.entries.stats()
+        stats["max_age_seconds"] = self.max_age_seconds
+        stats["refreshing"] = len(self._refreshing)
+        return stats
@@ -0,0 +1,32 @@
+"""
+Agrégation de métriques en mémoire (sketches de quantiles, rollups temporels, exposition Prometheus)
+"""
+
+from infrastructure.metrics.collectors import (
+    pool_stats,
+    register_backend_metrics,
+    register_breaker_metrics,
+    register_cache_metrics,
+    register_pool_metrics
+)
+from infrastructure.metrics.prometheus import REGISTRY, CallbackGauge, Counter, Gauge, Histogram, MetricsRegistry
+from infrastructure.metrics.quantile_sketch import QuantileSketch
+from infrastructure.metrics.rollup_store import GRANULARITIES, Rollup, RollupStore
+
+__all__ = [
+    "CallbackGauge",
+    "Counter",
+    "GRANULARITIES",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "QuantileSketch",
+    "REGISTRY",
+    "Rollup",
+    "RollupStore",
+    "pool_stats",
+    "register_backend_metrics",
+    "register_breaker_metrics",
+    "register_cache_metrics",
+    "register_pool_metrics"
+]
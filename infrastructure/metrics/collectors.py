@@ -0,0 +1,115 @@
+"""
+Collecteurs évalués à chaque lecture de /metrics (pools de connexions, caches, disjoncteurs, instances de l'API)
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from infrastructure.metrics.prometheus import REGISTRY, CallbackGauge, MetricsRegistry
+
+
+def pool_stats(client: Any) -> Dict[str, int]:
+    """
+    Occupation du pool de connexions d'un client httpx (httpcore.ConnectionPool)
+    ou d'un transport httpx. Lecture sans verrou des structures internes : valeurs
+    indicatives, jamais bloquantes.
+    """
+    pool = getattr(getattr(client, "_transport", client), "_pool", None)
+    if pool is None:
+        return {}
+    connections = list(getattr(pool, "_connections", ()))
+    requests = list(getattr(pool, "_requests", ()))
+    return {
+        "max": getattr(pool, "_max_connections", None) or 0,
+        "open": sum(1 for connection in connections if not connection.is_closed()),
+        "idle": sum(1 for connection in connections if connection.is_idle()),
+        "active": sum(1 for connection in connections if not connection.is_idle() and not connection.is_closed()),
+        "queued": sum(1 for request in requests if getattr(request, "connection", None) is None)
+    }
+
+
+def register_pool_metrics(
+    clients: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+    registry: MetricsRegistry = REGISTRY
+) -> None:
+    """
+    Jauges d'occupation des pools httpx (clé : nom du client, ex. sync:read).
+    `clients` peut être une fonction, évaluée à chaque lecture (clients remplacés à chaud).
+    """
+
+    def collect(field: str) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for name, client in (clients() if callable(clients) else clients).items():
+            stats = pool_stats(client)
+            if field in stats:
+                yield (name,), stats[field]
+
+    for field, documentation in (
+        ("max", "Taille maximale du pool de connexions vers vocalyx-api"),
+        ("open", "Connexions ouvertes vers vocalyx-api"),
+        ("active", "Connexions vers vocalyx-api portant une requête"),
+        ("idle", "Connexions inactives (keep-alive) vers vocalyx-api"),
+        ("queued", "Requêtes en attente d'une connexion vers vocalyx-api")
+    ):
+        CallbackGauge(
+            f"vocalyx_frontend_upstream_pool_{field}" if field != "queued" else "vocalyx_frontend_upstream_pool_queued_requests",
+            documentation,
+            ("client",),
+            lambda field=field: collect(field),
+            registry=registry
+        )
+
+
+def register_cache_metrics(caches: Dict[str, Any], registry: MetricsRegistry = REGISTRY) -> None:
+    """Succès, échecs et taux de succès des caches exposant `hits` / `misses`"""
+
+    def collect(field: str) -> List[Tuple[Tuple[str, ...], float]]:
+        samples = []
+        for name, cache in caches.items():
+            hits, misses = cache.hits, cache.misses
+            if field == "ratio":
+                value = hits / (hits + misses) if hits + misses else 0.0
+            else:
+                value = hits if field == "hits" else misses
+            samples.append(((name,), value))
+        return samples
+
+    CallbackGauge("vocalyx_frontend_cache_hits_total", "Lectures servies par le cache", ("cache",),
+                  lambda: collect("hits"), registry=registry, type_name="counter")
+    CallbackGauge("vocalyx_frontend_cache_misses_total", "Lectures absentes du cache (ou expirées)", ("cache",),
+                  lambda: collect("misses"), registry=registry, type_name="counter")
+    CallbackGauge("vocalyx_frontend_cache_hit_ratio", "Taux de succès du cache depuis le démarrage", ("cache",),
+                  lambda: collect("ratio"), registry=registry)
+
+
+# Valeurs de vocalyx_frontend_upstream_circuit_state
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def register_breaker_metrics(breakers: Any, registry: MetricsRegistry = REGISTRY) -> None:
+    """État (0 fermé, 1 semi-ouvert, 2 ouvert) et ouvertures des disjoncteurs par instance et endpoint de vocalyx-api"""
+
+    def collect(field: str) -> List[Tuple[Tuple[str, ...], float]]:
+        return [
+            (key, CIRCUIT_STATE_VALUES.get(breaker.state, 0) if field == "state" else breaker.trips)
+            for key, breaker in breakers.items()
+        ]
+
+    CallbackGauge("vocalyx_frontend_upstream_circuit_state", "État du disjoncteur (0 fermé, 1 semi-ouvert, 2 ouvert)",
+                  ("backend", "method", "endpoint"), lambda: collect("state"), registry=registry)
+    CallbackGauge("vocalyx_frontend_upstream_circuit_trips_total", "Ouvertures du disjoncteur",
+                  ("backend", "method", "endpoint"), lambda: collect("trips"), registry=registry, type_name="counter")
+
+
+def register_backend_metrics(balancer: Any, registry: MetricsRegistry = REGISTRY) -> None:
+    """Latence EWMA, appels en cours et disponibilité de chaque instance de vocalyx-api"""
+
+    def collect(field: str) -> List[Tuple[Tuple[str, ...], float]]:
+        return [((url,), state[field]) for url, state in balancer.snapshot().items()]
+
+    CallbackGauge("vocalyx_frontend_upstream_backend_latency_ewma_seconds", "Latence moyenne (EWMA) de l'instance",
+                  ("backend",), lambda: [(labels, value / 1000) for labels, value in collect("ewma_latency_ms")],
+                  registry=registry)
+    CallbackGauge("vocalyx_frontend_upstream_backend_in_flight", "Appels en cours vers l'instance",
+                  ("backend",), lambda: collect("in_flight"), registry=registry)
+    CallbackGauge("vocalyx_frontend_upstream_backend_available", "Instance disponible (1) ou écartée (0)",
+                  ("backend",), lambda: [(labels, float(state == "available")) for labels, state in collect("state")],
+                  registry=registry)
@@ -0,0 +1,218 @@
+"""
+Métriques au format d'exposition Prometheus (compteurs, jauges, histogrammes)
+"""
+
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+# Latences HTTP (secondes)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées par /metrics"""
+
+    def __init__(self):
+        self._metrics: List["_Metric"] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        """Enregistre une métrique (remplace celle de même nom, ex. au redémarrage de l'application)"""
+        with self._lock:
+            self._metrics = [existing for existing in self._metrics if existing.name != metric.name]
+            self._metrics.append(metric)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics = [metric for metric in self._metrics if metric.name != name]
+
+    def render(self) -> str:
+        """Format texte d'exposition Prometheus 0.0.4"""
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.collect():
+                rendered = ",".join(f'{key}="{_escape(str(label))}"' for key, label in labels.items())
+                lines.append(f"{metric.name}{suffix}{{{rendered}}} {_format_value(value)}" if rendered
+                             else f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: MetricsRegistry = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        if registry is not None:
+            registry.register(self)
+
+    def collect(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+
+class _ShardHolder:
+    """Objet local au thread dont la destruction (fin du thread) libère sa partition"""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ShardedMetric(_Metric):
+    """
+    Valeurs partitionnées par thread : chaque thread n'écrit que dans sa propre
+    partition (aucun verrou ni contention à l'écriture) ; la collecte additionne
+    les partitions. Le verrou n'est pris qu'à la création de la partition d'un
+    nouveau thread et à sa fin, où la partition est versée dans un total de base.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._base: dict = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            holder = self._local.holder = _ShardHolder()
+            with self._shards_lock:
+                self._shards.append(shard)
+            weakref.finalize(holder, self._retire, shard)
+            return shard
+
+    def _retire(self, shard: dict) -> None:
+        """Fin du thread propriétaire : verse la partition dans le total de base et l'oublie"""
+        with self._shards_lock:
+            self._shards = [existing for existing in self._shards if existing is not shard]
+            for labels, value in list(shard.items()):
+                self._base[labels] = self._merge(self._base.get(labels), value)
+
+    @staticmethod
+    def _merge(total, value):
+        """Nouvelle valeur cumulée (jamais modifiée sur place : une collecte peut la lire)"""
+        raise NotImplementedError
+
+    def _snapshots(self) -> List[List[tuple]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+            base = list(self._base.items())
+        return [base] + [list(shard.items()) for shard in shards]
+
+    def _labels(self, values: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(_ShardedMetric):
+    type_name = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    @staticmethod
+    def _merge(total, value):
+        return (total or 0) + value
+
+    def totals(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for items in self._snapshots():
+            for labels, value in items:
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def collect(self) -> Iterable[Sample]:
+        for labels, value in sorted(self.totals().items()):
+            yield "", self._labels(labels), value
+
+
+class Gauge(Counter):
+    """Jauge incrémentale (en cours, octets en transit) : somme des variations de chaque thread"""
+
+    type_name = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_ShardedMetric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, registry: MetricsRegistry = REGISTRY):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # Un compteur par seau (+Inf compris), puis la somme
+            state = shard[labels] = [0] * (len(self.buckets) + 2)
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    @staticmethod
+    def _merge(total, value):
+        return [a + b for a, b in zip(total, value)] if total else list(value)
+
+    def collect(self) -> Iterable[Sample]:
+        merged: Dict[LabelValues, List[float]] = {}
+        for items in self._snapshots():
+            for labels, state in items:
+                total = merged.setdefault(labels, [0] * len(state))
+                for index, value in enumerate(list(state)):
+                    total[index] += value
+        for labels, state in sorted(merged.items()):
+            base = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                cumulative += count
+                yield "_bucket", {**base, "le": _format_value(bound)}, cumulative
+            yield "_sum", base, state[-1]
+            yield "_count", base, cumulative
+
+
+class CallbackGauge(_Metric):
+    """
+    Valeur évaluée à la collecte (utilisation d'un pool, taux de succès d'un cache...).
+    `type_name="counter"` expose un compteur tenu ailleurs (ex. TTLCache.hits).
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 callback: Callable[[], Iterable[Tuple[LabelValues, float]]], registry: MetricsRegistry = REGISTRY,
+                 type_name: str = "gauge"):
+        self.callback = callback
+        self.type_name = type_name
+        super().__init__(name, documentation, labelnames, registry)
+
+    def collect(self) -> Iterable[Sample]:
+        for labels, value in self.callback():
+            yield "", dict(zip(self.labelnames, labels)), value
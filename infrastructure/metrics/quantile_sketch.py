@@ -0,0 +1,115 @@
+"""
+QuantileSketch - Sketch de quantiles fusionnable à erreur relative bornée (type DDSketch)
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+class QuantileSketch:
+    """
+    Histogramme à seaux logarithmiques : une valeur x > 0 tombe dans le seau
+    ceil(log_gamma(x)) avec gamma = (1 + a) / (1 - a). Tout quantile est estimé
+    avec une erreur relative d'au plus `relative_accuracy` (a), et deux sketches
+    de même précision se fusionnent en additionnant leurs compteurs.
+
+    Au-delà de `max_bins` seaux, les plus bas sont regroupés (seuls les quantiles
+    les plus faibles perdent alors en précision).
+    """
+
+    __slots__ = ("relative_accuracy", "max_bins", "_gamma", "_log_gamma", "bins", "zero_count", "count", "sum", "min", "max")
+
+    # Valeurs plus petites comptées comme nulles (durées en secondes)
+    MIN_VALUE = 1e-3
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in ]0, 1[")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: int = 1) -> None:
+        value = float(value)
+        if value < 0 or math.isnan(value):
+            return
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value < self.MIN_VALUE:
+            self.zero_count += weight
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + weight
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Ajoute les compteurs d'un autre sketch (même précision) ; retourne self"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return self
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        return self
+
+    def copy(self) -> "QuantileSketch":
+        return QuantileSketch(self.relative_accuracy, self.max_bins).merge(self)
+
+    def _collapse(self) -> None:
+        keys = sorted(self.bins)
+        excess = keys[:len(keys) - self.max_bins + 1]
+        target = keys[len(excess)]
+        self.bins[target] += sum(self.bins.pop(key) for key in excess)
+
+    def _value(self, key: int) -> float:
+        # Milieu du seau (en erreur relative)
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Quantile q (0..1), None si le sketch est vide"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0 if self.min < self.MIN_VALUE else self.min
+        seen = self.zero_count
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return min(max(self._value(key), self.min), self.max)
+        return self.max
+
+    def count_below(self, value: float) -> int:
+        """Nombre (approché) d'échantillons strictement inférieurs à `value`"""
+        if value <= self.MIN_VALUE:
+            return 0
+        limit = math.ceil(math.log(value) / self._log_gamma)
+        return self.zero_count + sum(count for key, count in self.bins.items() if key < limit)
+
+    def histogram(self, bounds: Iterable[float]) -> list:
+        """Effectifs entre bornes croissantes (dernier intervalle ouvert)"""
+        cumulative = [self.count_below(bound) for bound in bounds]
+        counts = [cumulative[0]] + [b - a for a, b in zip(cumulative, cumulative[1:])]
+        counts.append(self.count - cumulative[-1])
+        return counts
@@ -0,0 +1,188 @@
+"""
+RollupStore - Agrégats pré-calculés par intervalle de temps et par dimensions
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from infrastructure.metrics.quantile_sketch import QuantileSketch
+
+# Granularités, de la plus fine à la plus grossière (secondes)
+GRANULARITIES = (("minute", 60), ("hour", 3600), ("day", 86400))
+
+
+class Rollup:
+    """Agrégat d'un intervalle : nombre d'événements, erreurs et un sketch par métrique"""
+
+    __slots__ = ("count", "errors", "metrics", "_relative_accuracy")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.count = 0
+        self.errors = 0
+        self.metrics: Dict[str, QuantileSketch] = {}
+        self._relative_accuracy = relative_accuracy
+
+    def add(self, values: Dict[str, Optional[float]], error: bool = False) -> None:
+        self.count += 1
+        if error:
+            self.errors += 1
+        for name, value in values.items():
+            if value is None:
+                continue
+            sketch = self.metrics.get(name)
+            if sketch is None:
+                sketch = self.metrics[name] = QuantileSketch(self._relative_accuracy)
+            sketch.add(value)
+
+    def merge(self, other: "Rollup") -> "Rollup":
+        self.count += other.count
+        self.errors += other.errors
+        for name, sketch in other.metrics.items():
+            if name in self.metrics:
+                self.metrics[name].merge(sketch)
+            else:
+                self.metrics[name] = sketch.copy()
+        return self
+
+
+class RollupStore:
+    """
+    Un agrégat par (granularité, début d'intervalle, combinaison de dimensions).
+
+    Les événements récents sont agrégés à la minute ; `compact` fusionne les
+    intervalles plus anciens que la rétention d'une granularité dans la suivante
+    (minute -> heure -> jour) et supprime les jours au-delà de leur rétention.
+    Chaque événement n'est compté que dans un seul intervalle : une requête
+    fusionne les agrégats qui recouvrent la période, quelle que soit leur
+    granularité, sans jamais relire les événements.
+    """
+
+    def __init__(
+        self,
+        dimensions: Sequence[str],
+        retention: Dict[str, float],
+        relative_accuracy: float = 0.01,
+        compact_interval: float = 60.0
+    ):
+        self.dimensions = tuple(dimensions)
+        # Rétention (secondes) de chaque granularité avant compaction
+        self.retention = {name: float(retention[name]) for name, _ in GRANULARITIES}
+        self.relative_accuracy = relative_accuracy
+        self.compact_interval = compact_interval
+        self._buckets: Dict[Tuple[str, int], Dict[Tuple[str, ...], Rollup]] = {}
+        self._lock = threading.Lock()
+        self._compacted_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _granularity_for(self, timestamp: float, now: float) -> Tuple[str, int]:
+        """Granularité la plus fine dont la rétention couvre l'âge de l'événement"""
+        age = now - timestamp
+        for name, width in GRANULARITIES[:-1]:
+            if age < self.retention[name]:
+                return name, width
+        return GRANULARITIES[-1]
+
+    def add(
+        self,
+        timestamp: float,
+        dimensions: Dict[str, Any],
+        values: Dict[str, Optional[float]],
+        error: bool = False,
+        now: Optional[float] = None
+    ) -> bool:
+        """Ajoute un événement ; False s'il est plus ancien que la rétention journalière"""
+        now = now or time.time()
+        if now - timestamp >= self.retention["day"]:
+            return False
+        name, width = self._granularity_for(timestamp, now)
+        key = tuple(str(dimensions.get(dimension, "")) for dimension in self.dimensions)
+        with self._lock:
+            bucket = self._buckets.setdefault((name, int(timestamp // width) * width), {})
+            rollup = bucket.get(key)
+            if rollup is None:
+                rollup = bucket[key] = Rollup(self.relative_accuracy)
+            rollup.add(values, error)
+        return True
+
+    def compact(self, now: Optional[float] = None, force: bool = False) -> int:
+        """Fusionne les intervalles expirés dans la granularité supérieure ; retourne le nombre traité"""
+        now = now or time.time()
+        if not force and now - self._compacted_at < self.compact_interval:
+            return 0
+        self._compacted_at = now
+        compacted = 0
+        with self._lock:
+            for (name, width), (coarser, coarser_width) in zip(GRANULARITIES, GRANULARITIES[1:] + ((None, 0),)):
+                expired = [
+                    start for (granularity, start) in self._buckets
+                    if granularity == name and now - (start + width) >= self.retention[name]
+                ]
+                for start in expired:
+                    bucket = self._buckets.pop((name, start))
+                    compacted += 1
+                    if coarser is None:
+                        continue
+                    target = self._buckets.setdefault((coarser, start // coarser_width * coarser_width), {})
+                    for key, rollup in bucket.items():
+                        if key in target:
+                            target[key].merge(rollup)
+                        else:
+                            target[key] = rollup
+        return compacted
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        where: Optional[Dict[str, Any]] = None,
+        group_by: Optional[str] = None
+    ) -> Dict[str, Rollup]:
+        """
+        Fusionne les agrégats recouvrant [start, end[ qui respectent les filtres
+        (`where` : dimension -> valeur ou ensemble de valeurs autorisées, ou
+        prédicat). Un seul groupe "*" sans `group_by`.
+        """
+        self.compact()
+        predicates: List[Tuple[int, Callable[[str], bool]]] = []
+        for dimension, accepted in (where or {}).items():
+            index = self.dimensions.index(dimension)
+            if callable(accepted):
+                predicates.append((index, accepted))
+            elif isinstance(accepted, (set, frozenset, list, tuple)):
+                allowed = {str(value) for value in accepted}
+                predicates.append((index, allowed.__contains__))
+            else:
+                predicates.append((index, str(accepted).__eq__))
+        group_index = self.dimensions.index(group_by) if group_by else None
+        widths = dict(GRANULARITIES)
+
+        groups: Dict[str, Rollup] = {}
+        with self._lock:
+            for (name, bucket_start), bucket in self._buckets.items():
+                if start is not None and bucket_start + widths[name] <= start:
+                    continue
+                if end is not None and bucket_start >= end:
+                    continue
+                for key, rollup in bucket.items():
+                    if not all(accept(key[index]) for index, accept in predicates):
+                        continue
+                    group = key[group_index] if group_index is not None else "*"
+                    if group not in groups:
+                        groups[group] = Rollup(self.relative_accuracy)
+                    groups[group].merge(rollup)
+        return groups
+
+    def values(self, dimension: str) -> List[str]:
+        """Valeurs observées d'une dimension (pour les filtres de l'interface)"""
+        index = self.dimensions.index(dimension)
+        with self._lock:
+            return sorted({key[index] for bucket in self._buckets.values() for key in bucket})
+
+    def granularity_counts(self) -> Dict[str, int]:
+        counts = {name: 0 for name, _ in GRANULARITIES}
+        for name, _ in self._buckets:
+            counts[name] += 1
+        return counts
@@ -0,0 +1,37 @@
+"""
+Traçage des requêtes (identifiants de corrélation, spans, export JSON OTLP, enregistrement du trafic)
+"""
+
+from infrastructure.tracing.context import (
+    REQUEST_ID_HEADER,
+    SPAN_KIND_CLIENT,
+    SPAN_KIND_INTERNAL,
+    SPAN_KIND_SERVER,
+    RequestTrace,
+    Span,
+    current_request_id,
+    current_trace,
+    reset_current_trace,
+    set_current_trace
+)
+from infrastructure.tracing.file_exporter import OtlpJsonFileExporter, trace_to_otlp
+from infrastructure.tracing.traffic_recorder import TrafficRecorder, body_kind, parse_pseudonym, read_recording
+
+__all__ = [
+    "OtlpJsonFileExporter",
+    "REQUEST_ID_HEADER",
+    "RequestTrace",
+    "SPAN_KIND_CLIENT",
+    "SPAN_KIND_INTERNAL",
+    "SPAN_KIND_SERVER",
+    "Span",
+    "TrafficRecorder",
+    "body_kind",
+    "current_request_id",
+    "current_trace",
+    "parse_pseudonym",
+    "read_recording",
+    "reset_current_trace",
+    "set_current_trace",
+    "trace_to_otlp"
+]
@@ -0,0 +1,119 @@
+"""
+Trace de la requête courante (identifiant de corrélation et spans), portée par une ContextVar
+"""
+
+import os
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+# En-tête de corrélation reçu du client et propagé à vocalyx-api
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Identifiant client accepté tel quel (sinon un nouvel identifiant est généré)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+# W3C Trace Context : version-trace_id-parent_id-flags
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+
+def _random_hex(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+class Span:
+    """Intervalle mesuré (horodatages epoch en nanosecondes, attributs OpenTelemetry)"""
+
+    __slots__ = ("name", "kind", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, kind: int = SPAN_KIND_INTERNAL, parent_id: Optional[str] = None,
+                 start_ns: Optional[int] = None):
+        self.name = name
+        self.kind = kind
+        self.span_id = _random_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.error = False
+
+    def end(self, end_ns: Optional[int] = None) -> "Span":
+        self.end_ns = end_ns if end_ns is not None else time.time_ns()
+        return self
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+
+class RequestTrace:
+    """
+    Trace d'une requête du dashboard : span racine (SERVER) et spans enfants
+    (appels à vocalyx-api, sérialisation). Les spans sont ajoutés depuis la
+    boucle asyncio ou le pool de threads des routes synchrones (list.append
+    est atomique : aucun verrou).
+    """
+
+    def __init__(self, name: str, request_id: Optional[str] = None, traceparent: Optional[str] = None):
+        self.request_id = request_id if request_id and _VALID_REQUEST_ID.match(request_id) else _random_hex(8)
+        # Trace entrante (proxy, navigateur instrumenté) prolongée si fournie
+        parent = _TRACEPARENT.match(traceparent.strip().lower()) if traceparent else None
+        self.trace_id = parent.group(1) if parent else _random_hex(16)
+        self.root = Span(name, kind=SPAN_KIND_SERVER, parent_id=parent.group(2) if parent else None)
+        self.spans: List[Span] = []
+        # Fin d'exécution du endpoint (début de la sérialisation de la réponse)
+        self.handler_end_ns: Optional[int] = None
+
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL, start_ns: Optional[int] = None) -> Span:
+        span = Span(name, kind=kind, parent_id=self.root.span_id, start_ns=start_ns)
+        self.spans.append(span)
+        return span
+
+    def traceparent(self, span: Optional[Span] = None) -> str:
+        """En-tête W3C Trace Context pour un appel sortant"""
+        return f"00-{self.trace_id}-{(span or self.root).span_id}-01"
+
+    def busy_ms(self, kind: int, until_ns: Optional[int] = None) -> float:
+        """Temps couvert par les spans terminés d'un type (appels parallèles comptés une fois)"""
+        intervals = sorted(
+            (span.start_ns, span.end_ns) for span in list(self.spans)
+            if span.kind == kind and span.end_ns is not None and (until_ns is None or span.end_ns <= until_ns)
+        )
+        covered = 0
+        current_start = current_end = None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    covered += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            covered += current_end - current_start
+        return covered / 1e6
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("vocalyx_request_trace", default=None)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def set_current_trace(trace: Optional[RequestTrace]):
+    """Active une trace pour le contexte courant ; retourne le jeton de restauration"""
+    return _current_trace.set(trace)
+
+
+def reset_current_trace(token) -> None:
+    _current_trace.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.request_id if trace is not None else None
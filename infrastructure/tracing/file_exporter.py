@@ -0,0 +1,137 @@
+"""
+OtlpJsonFileExporter - Export des traces au format JSON OTLP (une ligne par requête) vers un fichier local
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from infrastructure.tracing.context import RequestTrace, Span
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "vocalyx-frontend"
+
+# Codes de statut OpenTelemetry
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # int64 encodé en chaîne (mapping JSON de protobuf)
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in values.items() if value is not None]
+
+
+def _span_to_otlp(trace_id: str, span: Span) -> Dict[str, Any]:
+    payload = {
+        "traceId": trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns or span.start_ns),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": STATUS_ERROR if span.error else STATUS_UNSET}
+    }
+    if span.parent_id:
+        payload["parentSpanId"] = span.parent_id
+    return payload
+
+
+def trace_to_otlp(trace: RequestTrace) -> Dict[str, Any]:
+    """Document ExportTraceServiceRequest (encodage JSON OTLP) d'une trace"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": SERVICE_NAME})},
+            "scopeSpans": [{
+                "scope": {"name": SERVICE_NAME},
+                "spans": [_span_to_otlp(trace.trace_id, span) for span in [trace.root] + list(trace.spans)]
+            }]
+        }]
+    }
+
+
+class OtlpJsonFileExporter:
+    """
+    Écrit les traces en JSON Lines (format du file exporter du collecteur
+    OpenTelemetry) depuis un thread dédié : la requête ne fait que déposer la
+    trace dans une file bornée (trace abandonnée si la file est pleine).
+    Le fichier est renommé en `.1` au-delà de `max_bytes`.
+    """
+
+    def __init__(self, path: str, sample_ratio: float = 1.0, max_bytes: int = 50 * 1024 * 1024,
+                 max_queue: int = 10000):
+        self.path = path
+        self.sample_ratio = max(0.0, min(1.0, sample_ratio))
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self.exported = 0
+        self._queue: "queue.Queue[Optional[RequestTrace]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="otlp-file-exporter", daemon=True)
+        self._thread.start()
+        logger.info(f"🧭 Export des traces vers {self.path} (échantillonnage {self.sample_ratio:.0%})")
+
+    def export(self, trace: RequestTrace) -> None:
+        if self._thread is None or (self.sample_ratio < 1.0 and random.random() >= self.sample_ratio):
+            return
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Vide la file puis arrête le thread d'écriture"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            if trace is None:
+                return
+            batch = [trace]
+            # Regrouper les traces déjà en attente en une seule écriture
+            while len(batch) < 512:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    self._write(batch)
+                    return
+                batch.append(pending)
+            self._write(batch)
+
+    def _write(self, batch: List[RequestTrace]) -> None:
+        try:
+            lines = "".join(json.dumps(trace_to_otlp(trace), separators=(",", ":")) + "\n" for trace in batch)
+            if self.max_bytes and os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+            self.exported += len(batch)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not export traces: {e}")
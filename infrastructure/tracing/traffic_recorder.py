@@ -0,0 +1,224 @@
+"""
+TrafficRecorder - Enregistrement anonymisé du trafic (forme des requêtes, temps, appels à l'API) pour le rejouer hors production
+
+Format : JSON Lines compressé gzip. La première ligne décrit l'enregistrement
+({"format": "vocalyx-traffic", "version": 1, ...}), puis une ligne par requête :
+
+    t   instant de réception (ms depuis le début de l'enregistrement)
+    s   session (pseudonyme du cookie d'authentification) ou null
+    m   méthode HTTP
+    r   gabarit de la route (/api/transcriptions/{transcription_id})
+    pp  paramètres de chemin (pseudonymisés)
+    q   paramètres de requête [[nom, valeur], ...] (valeurs pseudonymisées hors liste SAFE_QUERY_PARAMS)
+    b   corps de requête [type, octets] (multipart, form, json, other) : le contenu n'est jamais lu
+    st  statut de la réponse
+    d   durée (ms) jusqu'au dernier octet de la réponse
+    u   appels à vocalyx-api [[méthode, gabarit, statut, ms, octets], ...]
+
+Un pseudonyme (~<empreinte>:<longueur>) est un HMAC tronqué calculé avec un sel
+aléatoire propre à l'enregistrement (jamais écrit) : la même valeur donne le même
+pseudonyme au sein d'un fichier, sans pouvoir être retrouvée par dictionnaire.
+"""
+
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECORDING_FORMAT = "vocalyx-traffic"
+RECORDING_VERSION = 1
+
+# Paramètres de requête sans donnée personnelle (pagination, filtres fermés, dates) conservés tels quels
+SAFE_QUERY_PARAMS = frozenset({
+    "page", "limit", "offset", "status", "start", "end", "start_date", "end_date", "whisper_model",
+    "diarization", "enrichment", "group_by", "include_segments", "points", "window", "workers", "pool",
+    "concurrency", "days", "scale", "target_p95"
+})
+_SAFE_VALUE_MAX_LENGTH = 32
+
+
+def body_kind(content_type: Optional[str]) -> str:
+    content_type = (content_type or "").lower()
+    if content_type.startswith("multipart/"):
+        return "multipart"
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        return "form"
+    if "json" in content_type:
+        return "json"
+    return "other"
+
+
+def parse_pseudonym(value: Any) -> Optional[Tuple[str, int]]:
+    """(empreinte, longueur) d'un pseudonyme, None pour une valeur conservée en clair"""
+    if not isinstance(value, str) or not value.startswith("~") or ":" not in value:
+        return None
+    digest, _, length = value[1:].partition(":")
+    return (digest, int(length)) if length.isdigit() else None
+
+
+class TrafficRecorder:
+    """
+    Anonymise et écrit les requêtes depuis un thread dédié : la requête ne fait
+    que déposer une entrée dans une file bornée (entrée abandonnée si la file est
+    pleine). L'échantillonnage se fait par session, pour conserver l'enchaînement
+    des requêtes d'un même utilisateur ; l'enregistrement s'arrête après
+    `max_requests` entrées. Un fichier existant est renommé en `.1` au démarrage.
+    """
+
+    def __init__(self, path: str, sample_ratio: float = 1.0, max_requests: int = 1_000_000,
+                 max_queue: int = 10000):
+        self.path = path
+        self.sample_ratio = max(0.0, min(1.0, sample_ratio))
+        self.max_requests = max_requests
+        self.recorded = 0
+        self.dropped = 0
+        self._salt = os.urandom(32)
+        self._started_ns = time.time_ns()
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self.recorded + self._queue.qsize() < self.max_requests
+
+    def start(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            os.replace(self.path, self.path + ".1")
+        self._started_ns = time.time_ns()
+        header = {
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "sample_ratio": self.sample_ratio
+        }
+        self._thread = threading.Thread(target=self._run, args=(header,), name="traffic-recorder", daemon=True)
+        self._thread.start()
+        logger.info(f"🎙️ Enregistrement du trafic vers {self.path} (échantillonnage {self.sample_ratio:.0%} des sessions)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Vide la file, termine le flux gzip puis arrête le thread d'écriture"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info(f"🎙️ Trafic enregistré : {self.recorded} requêtes ({self.dropped} abandonnées)")
+
+    def pseudonym(self, value: str) -> str:
+        digest = hmac.new(self._salt, value.encode("utf-8"), hashlib.sha256).hexdigest()[:10]
+        return f"~{digest}:{len(value)}"
+
+    def session(self, token: Optional[str]) -> Optional[str]:
+        return self.pseudonym(token)[:11] if token else None
+
+    def sampled(self, session: Optional[str]) -> bool:
+        if self.sample_ratio >= 1.0:
+            return True
+        # Décision stable pour toute la session (les requêtes anonymes sont tirées une à une)
+        key = session[1:] if session else os.urandom(5).hex()
+        return int(key, 16) / 16 ** len(key) < self.sample_ratio
+
+    def record(
+        self,
+        received_ns: int,
+        session: Optional[str],
+        method: str,
+        route: str,
+        path_params: Dict[str, Any],
+        query: List[Tuple[str, str]],
+        body: Optional[Tuple[str, int]],
+        status: int,
+        duration_ms: float,
+        upstream: List[List[Any]]
+    ) -> None:
+        if not self.active:
+            return
+        entry: Dict[str, Any] = {
+            "t": max(0, (received_ns - self._started_ns) // 1_000_000),
+            "s": session,
+            "m": method,
+            "r": route,
+            "st": status,
+            "d": round(duration_ms, 1)
+        }
+        if path_params:
+            entry["pp"] = {name: self.pseudonym(str(value)) for name, value in path_params.items()}
+        if query:
+            entry["q"] = [
+                [name, value if name in SAFE_QUERY_PARAMS and len(value) <= _SAFE_VALUE_MAX_LENGTH else self.pseudonym(value)]
+                for name, value in query
+            ]
+        if body is not None:
+            entry["b"] = list(body)
+        if upstream:
+            entry["u"] = upstream
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self, header: Dict[str, Any]) -> None:
+        try:
+            handle = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+        except OSError as e:
+            logger.error(f"❌ Could not open traffic recording {self.path}: {e}")
+            self._thread = None
+            return
+        with handle:
+            handle.write(json.dumps(header, separators=(",", ":")) + "\n")
+            while True:
+                entry = self._queue.get()
+                batch = [entry] if entry is not None else []
+                while entry is not None and len(batch) < 512:
+                    try:
+                        entry = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if entry is not None:
+                        batch.append(entry)
+                batch = batch[:max(0, self.max_requests - self.recorded)]
+                try:
+                    handle.write("".join(json.dumps(item, separators=(",", ":")) + "\n" for item in batch))
+                    # Bloc gzip complet : le fichier reste lisible pendant l'enregistrement
+                    handle.flush()
+                    self.recorded += len(batch)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not write traffic recording: {e}")
+                if entry is None:
+                    return
+
+
+def read_recording(path: str) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """
+    En-tête et entrées d'un enregistrement. Un fichier tronqué (processus
+    interrompu pendant l'enregistrement) est lu jusqu'au dernier bloc complet.
+    """
+    handle = gzip.open(path, "rt", encoding="utf-8")
+    header = json.loads(handle.readline())
+    if header.get("format") != RECORDING_FORMAT:
+        handle.close()
+        raise ValueError(f"{path} n'est pas un enregistrement {RECORDING_FORMAT}")
+
+    def entries() -> Iterator[Dict[str, Any]]:
+        with handle:
+            try:
+                for line in handle:
+                    if line.endswith("\n"):
+                        yield json.loads(line)
+            except (EOFError, zlib.error):
+                return
+
+    return header, entries()
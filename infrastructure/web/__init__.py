@@ -0,0 +1,3 @@
+"""
+Ressources web servies par le dashboard (CSS critique)
+"""
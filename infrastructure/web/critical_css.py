@@ -0,0 +1,282 @@
+"""
+Extraction du CSS critique du dashboard
+
+Sélectionne, dans dashboard.css, les règles nécessaires au premier rendu de la
+coque du dashboard (sidebar, en-tête, squelette de la grille des transcriptions)
+afin de les insérer en ligne dans dashboard_base.html. La feuille complète est
+ensuite chargée de façon non bloquante.
+
+Utilisation en ligne de commande (build / CI) :
+    python -m infrastructure.web.critical_css --check
+    python -m infrastructure.web.critical_css --output templates/static/css/dashboard.critical.css
+"""
+
+import argparse
+import logging
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Budget par défaut : doit tenir dans la première fenêtre TCP (~14 Ko) avec le HTML
+DEFAULT_BUDGET_BYTES = 14 * 1024
+
+# Vue rendue au premier affichage
+CRITICAL_VIEW = "transcriptions"
+
+# Classes ajoutées par le JavaScript avant le premier rendu utile
+SAFELIST_CLASSES = {"active", "collapsed"}
+
+# Conteneurs masqués au chargement : seules leurs propres classes comptent
+HIDDEN_CONTAINER_CLASSES = {"modal"}
+
+# Pseudo-classes d'interaction : inutiles au premier rendu
+INTERACTIVE_PSEUDO = re.compile(
+    r":(hover|focus|focus-visible|focus-within|active|visited|disabled|checked|placeholder|"
+    r":placeholder|:-webkit-scrollbar[\w-]*|:selection)\b"
+)
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr"
+}
+
+# Nœud CSS : ("rule", sélecteur, déclarations) | ("block", prélude, enfants) | ("raw", prélude, corps)
+CssNode = Tuple[str, str, Union[str, list]]
+
+
+class _ShellTokenCollector(HTMLParser):
+    """Collecte les classes et ids visibles au premier rendu d'un template"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+        self._depth = 0
+        self._skip_depth: Optional[int] = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        is_void = tag in VOID_ELEMENTS
+
+        if self._skip_depth is None:
+            classes = set(_strip_jinja(attrs.get("class") or "").split())
+            self.classes.update(classes)
+            element_id = _strip_jinja(attrs.get("id") or "").strip()
+            if element_id:
+                self.ids.add(element_id)
+
+            hidden = bool(classes & HIDDEN_CONTAINER_CLASSES) or (
+                "view-wrapper" in classes and attrs.get("data-view") != CRITICAL_VIEW
+            )
+            if hidden and not is_void:
+                self._skip_depth = self._depth
+
+        if not is_void:
+            self._depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._depth -= 1
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS:
+            return
+        self._depth -= 1
+        if self._skip_depth is not None and self._depth <= self._skip_depth:
+            self._skip_depth = None
+
+
+def _strip_jinja(value: str) -> str:
+    """Retire les expressions Jinja d'une valeur d'attribut"""
+    return re.sub(r"{[{%].*?[%}]}", " ", value)
+
+
+def collect_shell_tokens(template_paths: List[Path]) -> Tuple[Set[str], Set[str]]:
+    """Classes et ids présents dans la coque visible des templates donnés"""
+    collector = _ShellTokenCollector()
+    for path in template_paths:
+        collector.feed(path.read_text(encoding="utf-8"))
+        collector.close()
+    return collector.classes | SAFELIST_CLASSES, collector.ids
+
+
+def parse_css(css: str) -> List[CssNode]:
+    """Découpe une feuille de style en règles et blocs @ (analyse volontairement minimale)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    nodes, _ = _parse_block(css, 0)
+    return nodes
+
+
+def _parse_block(css: str, pos: int) -> Tuple[List[CssNode], int]:
+    nodes: List[CssNode] = []
+    length = len(css)
+    while pos < length:
+        # Fin du bloc courant
+        while pos < length and css[pos].isspace():
+            pos += 1
+        if pos >= length:
+            break
+        if css[pos] == "}":
+            return nodes, pos + 1
+
+        brace = css.find("{", pos)
+        semi = css.find(";", pos)
+        if brace == -1:
+            break
+        if css[pos] == "@" and semi != -1 and semi < brace:
+            # @import / @charset
+            nodes.append(("raw", css[pos:semi].strip(), ""))
+            pos = semi + 1
+            continue
+
+        prelude = css[pos:brace].strip()
+        if prelude.startswith(("@media", "@supports")):
+            children, pos = _parse_block(css, brace + 1)
+            nodes.append(("block", prelude, children))
+        else:
+            end = _matching_brace(css, brace)
+            body = css[brace + 1:end].strip()
+            kind = "raw" if prelude.startswith("@") else "rule"
+            nodes.append((kind, prelude, body))
+            pos = end + 1
+    return nodes, pos
+
+
+def _matching_brace(css: str, open_pos: int) -> int:
+    depth = 0
+    for index in range(open_pos, len(css)):
+        char = css[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(css)
+
+
+def _selector_matches(selector: str, classes: Set[str], ids: Set[str]) -> bool:
+    """Un sélecteur est critique si toutes ses classes / ids sont présents dans la coque"""
+    if INTERACTIVE_PSEUDO.search(selector):
+        return False
+    # Arguments de :not(), :has()... et sélecteurs d'attribut ignorés pour la correspondance
+    simplified = re.sub(r"\([^)]*\)", "", selector)
+    simplified = re.sub(r"\[[^\]]*\]", "", simplified)
+    needed_classes = set(re.findall(r"\.([\w-]+)", simplified))
+    needed_ids = set(re.findall(r"#([\w-]+)", simplified))
+    return needed_classes <= classes and needed_ids <= ids
+
+
+def _select(nodes: List[CssNode], classes: Set[str], ids: Set[str]) -> List[CssNode]:
+    selected: List[CssNode] = []
+    for kind, prelude, body in nodes:
+        if kind == "rule":
+            matching = [s.strip() for s in prelude.split(",") if _selector_matches(s, classes, ids)]
+            if matching:
+                selected.append(("rule", ", ".join(matching), body))
+        elif kind == "block":
+            children = _select(body, classes, ids)
+            if children:
+                selected.append(("block", prelude, children))
+        elif prelude.startswith(("@import", "@charset", "@font-face")):
+            selected.append((kind, prelude, body))
+    return selected
+
+
+def _used_keyframes(nodes: List[CssNode]) -> Set[str]:
+    names: Set[str] = set()
+    for kind, _, body in nodes:
+        if kind == "rule":
+            for value in re.findall(r"animation(?:-name)?\s*:\s*([^;]+)", body):
+                names.update(re.findall(r"[A-Za-z_][\w-]*", value))
+        elif kind == "block":
+            names |= _used_keyframes(body)
+    return names
+
+
+def _keyframes(nodes: List[CssNode], names: Set[str]) -> List[CssNode]:
+    """Dernière définition de chaque @keyframes référencée (comme le ferait le navigateur)"""
+    found = {}
+    for kind, prelude, body in nodes:
+        if kind == "raw" and prelude.startswith("@keyframes"):
+            name = prelude.split(None, 1)[1].strip() if " " in prelude else ""
+            if name in names:
+                found[name] = (kind, prelude, body)
+    return list(found.values())
+
+
+def _minify(text: str, declarations: bool = False) -> str:
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    if declarations:
+        text = re.sub(r"\s*:\s*", ":", text)
+    return text.replace(";}", "}").rstrip(";").strip()
+
+
+def serialize_css(nodes: List[CssNode]) -> str:
+    """Sérialise (minifié) une liste de nœuds"""
+    parts = []
+    for kind, prelude, body in nodes:
+        if kind == "block":
+            parts.append(f"{_minify(prelude)}{{{serialize_css(body)}}}")
+        elif not body and kind == "raw":
+            parts.append(f"{_minify(prelude)};")
+        else:
+            parts.append(f"{_minify(prelude)}{{{_minify(body, declarations=kind == 'rule')}}}")
+    return "".join(parts)
+
+
+def extract_critical_css(css: str, template_paths: List[Path]) -> str:
+    """Extrait le CSS critique de `css` pour la coque décrite par les templates"""
+    classes, ids = collect_shell_tokens(template_paths)
+    nodes = parse_css(css)
+    selected = _select(nodes, classes, ids)
+    selected += _keyframes(nodes, _used_keyframes(selected))
+    return serialize_css(selected)
+
+
+def build_critical_css(templates_dir: Union[str, Path]) -> str:
+    """CSS critique du dashboard à partir du répertoire des templates"""
+    templates_dir = Path(templates_dir)
+    css = (templates_dir / "static" / "css" / "dashboard.css").read_text(encoding="utf-8")
+    templates = [templates_dir / "dashboard_base.html", templates_dir / "dashboard.html"]
+    return extract_critical_css(css, templates)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extraction du CSS critique du dashboard")
+    parser.add_argument("--templates-dir", default="templates", help="Répertoire des templates")
+    parser.add_argument("--budget", type=int, default=None, help="Budget en octets (défaut : config.ini)")
+    parser.add_argument("--check", action="store_true", help="Échoue si le CSS critique dépasse le budget")
+    parser.add_argument("--output", help="Écrit le CSS critique dans ce fichier")
+    args = parser.parse_args(argv)
+
+    budget = args.budget
+    if budget is None:
+        try:
+            from config import Config
+            budget = Config().critical_css_budget_bytes
+        except Exception:
+            budget = DEFAULT_BUDGET_BYTES
+
+    critical = build_critical_css(args.templates_dir)
+    size = len(critical.encode("utf-8"))
+    full_size = (Path(args.templates_dir) / "static" / "css" / "dashboard.css").stat().st_size
+
+    if args.output:
+        Path(args.output).write_text(critical, encoding="utf-8")
+
+    print(f"CSS critique : {size} octets ({size / full_size:.1%} de dashboard.css, budget {budget} octets)")
+    if args.check and size > budget:
+        print(f"❌ Budget dépassé de {size - budget} octets", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Middleware ASGI de mesure des requêtes HTTP du dashboard (format Prometheus)
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import Counter, Gauge, Histogram
+from infrastructure.web.routing import RouteTemplates
+
+REQUEST_LATENCY = Histogram(
+    "vocalyx_frontend_http_request_duration_seconds",
+    "Durée de traitement des requêtes HTTP du dashboard",
+    ("method", "route")
+)
+REQUESTS = Counter(
+    "vocalyx_frontend_http_requests_total",
+    "Requêtes HTTP du dashboard par code de statut",
+    ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "vocalyx_frontend_http_requests_in_flight",
+    "Requêtes HTTP du dashboard en cours",
+    ("method",)
+)
+
+
+class MetricsMiddleware:
+    """
+    Mesure durée, statut et requêtes en cours, étiquetés par gabarit de route
+    (/api/transcriptions/{transcription_id}) et non par chemin, pour borner le
+    nombre de séries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._route_of = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec((method,))
+            route = self._route_of(scope)
+            REQUEST_LATENCY.observe(time.perf_counter() - started, (method, route))
+            REQUESTS.inc((method, route, status))
@@ -0,0 +1,75 @@
+"""
+Limitation des préchargements par session
+
+Le dashboard précharge les détails des transcriptions survolées ou visibles.
+Ces requêtes sont spéculatives : au-delà de quelques requêtes simultanées par
+session, elles sont refusées immédiatement (429) plutôt que mises en file, afin
+de ne jamais retarder les requêtes explicites ni saturer l'API.
+"""
+
+import hashlib
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+# En-tête posé par le client (api.js) sur les requêtes de préchargement
+PREFETCH_HEADER = "X-Vocalyx-Prefetch"
+
+
+def is_prefetch_request(request: Request) -> bool:
+    """Vrai pour un préchargement (en-tête du dashboard ou Sec-Purpose/Purpose standard)"""
+    if request.headers.get(PREFETCH_HEADER, "").lower() in ("1", "true"):
+        return True
+    purpose = request.headers.get("sec-purpose") or request.headers.get("purpose") or ""
+    return "prefetch" in purpose.lower()
+
+
+class PrefetchLimiter:
+    """
+    Compteur de préchargements en cours par session (clé dérivée du jeton).
+    Utilisé depuis la boucle asyncio uniquement : aucun verrou nécessaire.
+    """
+
+    def __init__(self, max_concurrent_per_session: int = 2):
+        self.max_concurrent_per_session = max(0, max_concurrent_per_session)
+        self._in_flight: Dict[str, int] = {}
+        self.rejected = 0
+
+    @staticmethod
+    def session_key(token: str) -> str:
+        """Clé de session : empreinte du jeton (le jeton lui-même n'est pas conservé)"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+    def try_acquire(self, token: str) -> bool:
+        """Réserve un emplacement pour la session ; False si la limite est atteinte"""
+        key = self.session_key(token)
+        current = self._in_flight.get(key, 0)
+        if current >= self.max_concurrent_per_session:
+            self.rejected += 1
+            logger.debug(f"⏳ Préchargement refusé pour la session {key} ({current} en cours)")
+            return False
+        self._in_flight[key] = current + 1
+        return True
+
+    def release(self, token: str) -> None:
+        """Libère l'emplacement réservé par try_acquire"""
+        key = self.session_key(token)
+        current = self._in_flight.get(key, 0) - 1
+        if current > 0:
+            self._in_flight[key] = current
+        else:
+            self._in_flight.pop(key, None)
+
+    @contextmanager
+    def slot(self, token: str) -> Iterator[bool]:
+        """Contexte réservant un emplacement ; fournit False si la limite est atteinte"""
+        acquired = self.try_acquire(token)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release(token)
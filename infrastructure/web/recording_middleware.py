@@ -0,0 +1,118 @@
+"""
+Enregistrement du trafic HTTP (forme anonymisée des requêtes et appels à vocalyx-api) pour le rejouer
+"""
+
+import time
+from http.cookies import SimpleCookie
+from typing import Iterable, List, Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.tracing import (
+    SPAN_KIND_CLIENT,
+    RequestTrace,
+    TrafficRecorder,
+    body_kind,
+    current_trace,
+    reset_current_trace,
+    set_current_trace
+)
+from infrastructure.web.routing import RouteTemplates
+
+
+def _session_token(headers: dict, cookie_name: str) -> Optional[str]:
+    cookie_header = headers.get("cookie")
+    if cookie_header:
+        cookie = SimpleCookie()
+        try:
+            cookie.load(cookie_header)
+        except Exception:
+            cookie = {}
+        if cookie_name in cookie:
+            return cookie[cookie_name].value
+    authorization = headers.get("authorization", "")
+    return authorization[7:] if authorization.startswith("Bearer ") else None
+
+
+class TrafficRecordingMiddleware:
+    """
+    Transmet chaque requête HTTP au TrafficRecorder une fois la réponse envoyée :
+    gabarit de route, paramètres, taille du corps, statut, durée et appels à
+    l'API (spans CLIENT de la trace courante ; une trace est ouverte ici si le
+    traçage est désactivé). Placé à l'intérieur de TracingMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, recorder: TrafficRecorder, cookie_name: str,
+                 exclude_prefixes: Iterable[str] = ("/static/",)):
+        self.app = app
+        self.recorder = recorder
+        self.cookie_name = cookie_name
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self._route_of = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.recorder.active
+            or scope["path"].startswith(self.exclude_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict((key.decode("latin-1"), value.decode("latin-1")) for key, value in scope["headers"])
+        session = self.recorder.session(_session_token(headers, self.cookie_name))
+        if not self.recorder.sampled(session):
+            await self.app(scope, receive, send)
+            return
+
+        received_ns = time.time_ns()
+        started = time.perf_counter()
+        trace = current_trace()
+        token = None
+        if trace is None:
+            trace = RequestTrace(scope["method"])
+            token = set_current_trace(trace)
+        body_bytes = 0
+        status = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                body_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            if token is not None:
+                reset_current_trace(token)
+            upstream: List[list] = [
+                [
+                    span.attributes.get("http.method"),
+                    span.attributes.get("http.route"),
+                    span.attributes.get("http.status_code") or span.attributes.get("error.type", "error"),
+                    round(span.duration_ms, 1),
+                    span.attributes.get("http.response.body.size", 0)
+                ]
+                for span in list(trace.spans) if span.kind == SPAN_KIND_CLIENT
+            ]
+            self.recorder.record(
+                received_ns,
+                session,
+                scope["method"],
+                self._route_of(scope),
+                scope.get("path_params") or {},
+                parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True),
+                (body_kind(headers.get("content-type")), body_bytes) if body_bytes else None,
+                status,
+                (time.perf_counter() - started) * 1000,
+                upstream
+            )
@@ -0,0 +1,33 @@
+"""
+Gabarit de la route qui a traité une requête (étiquette bornée pour métriques et traces)
+"""
+
+from typing import Any, Dict, Optional
+
+from starlette.types import Scope
+
+# Requêtes sans route correspondante (404) : une seule valeur, quel que soit le chemin
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteTemplates:
+    """
+    Le routeur Starlette inscrit l'endpoint résolu dans le scope : après l'appel,
+    le gabarit (/api/transcriptions/{transcription_id}) est retrouvé par simple
+    lecture de dictionnaire, sans re-parcourir les routes.
+    """
+
+    def __init__(self):
+        self._routes: Optional[Dict[Any, str]] = None
+
+    def __call__(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if self._routes is None:
+            # Les routes sont toutes déclarées au premier appel (construction paresseuse)
+            self._routes = {
+                getattr(route, "endpoint", None) or getattr(route, "app", None): route.path
+                for route in getattr(scope.get("app"), "routes", ())
+            }
+        return self._routes.get(endpoint, UNMATCHED_ROUTE)
@@ -0,0 +1,82 @@
+"""
+Versionnement des ressources statiques
+
+Calcule une empreinte (SHA-256 tronqué) de chaque fichier de templates/static afin
+de servir des URL versionnées (`/static/js/main.js?v=<hash>`). Ces URL peuvent être
+mises en cache indéfiniment par le navigateur et précachées par le service worker :
+tout changement de contenu change l'URL.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, MutableMapping, Any, Union
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+
+logger = logging.getLogger(__name__)
+
+# Extensions précachées par le service worker
+PRECACHE_EXTENSIONS = {".js", ".css"}
+
+# Ressources versionnées servies avec un cache navigateur long
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticAssetManifest:
+    """Empreintes des fichiers statiques et construction des URL versionnées"""
+
+    def __init__(self, static_dir: Union[str, Path], url_prefix: str = "/static"):
+        self.static_dir = Path(static_dir)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.hashes: Dict[str, str] = {}
+        self.version = ""
+        self.refresh()
+
+    def refresh(self) -> None:
+        """(Re)calcule les empreintes de tous les fichiers"""
+        hashes = {}
+        for path in sorted(self.static_dir.rglob("*")):
+            if path.is_file():
+                relative = path.relative_to(self.static_dir).as_posix()
+                hashes[relative] = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+        self.hashes = hashes
+        # Version globale : change dès qu'une ressource change (nom du cache du service worker)
+        combined = hashlib.sha256("".join(f"{k}:{v}" for k, v in hashes.items()).encode())
+        self.version = combined.hexdigest()[:12]
+        logger.info(f"📦 {len(hashes)} ressources statiques indexées (version {self.version})")
+
+    def url(self, path: str) -> str:
+        """URL versionnée d'une ressource (chemin relatif à templates/static)"""
+        path = path.lstrip("/")
+        digest = self.hashes.get(path)
+        if digest is None:
+            logger.warning(f"⚠️ Ressource statique inconnue: {path}")
+            return f"{self.url_prefix}/{path}"
+        return f"{self.url_prefix}/{path}?v={digest}"
+
+    def precache_urls(self) -> List[str]:
+        """
+        URL à précacher : versionnées pour les ressources référencées par les templates,
+        brutes pour les ressources chargées dynamiquement (modules des vues, worker),
+        dont l'URL doit rester stable (identité des modules ES).
+        """
+        urls = []
+        for path in self.hashes:
+            if Path(path).suffix not in PRECACHE_EXTENSIONS:
+                continue
+            urls.append(self.url(path))
+            if path.startswith("js/views/") or path == "js/ws-worker.js":
+                urls.append(f"{self.url_prefix}/{path}")
+        return urls
+
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles qui marque immuables les réponses des URL versionnées (?v=)"""
+
+    async def get_response(self, path: str, scope: MutableMapping[str, Any]) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and b"v=" in scope.get("query_string", b""):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
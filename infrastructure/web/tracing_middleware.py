@@ -0,0 +1,153 @@
+"""
+Traçage des requêtes : identifiant de corrélation, spans et en-tête Server-Timing
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.tracing import (
+    REQUEST_ID_HEADER,
+    SPAN_KIND_CLIENT,
+    SPAN_KIND_INTERNAL,
+    OtlpJsonFileExporter,
+    RequestTrace,
+    current_trace,
+    reset_current_trace,
+    set_current_trace
+)
+from infrastructure.web.routing import RouteTemplates
+
+
+def _mark_handler_end() -> None:
+    trace = current_trace()
+    if trace is not None:
+        trace.handler_end_ns = time.time_ns()
+
+
+class TracedJSONResponse(JSONResponse):
+    """
+    JSONResponse dont l'encodage est mesuré par un span « serialize » : les routes
+    construisent leur réponse dans le endpoint, avant que TracedAPIRoute ne note
+    la fin du traitement.
+    """
+
+    def render(self, content: Any) -> bytes:
+        trace = current_trace()
+        if trace is None:
+            return super().render(content)
+        span = trace.start_span("serialize")
+        try:
+            return super().render(content)
+        finally:
+            span.end()
+
+
+class TracedAPIRoute(APIRoute):
+    """
+    Route FastAPI qui note la fin d'exécution du endpoint : le temps restant
+    jusqu'à l'envoi des en-têtes (validation du modèle de réponse, encodage
+    JSON) est compté comme sérialisation, de même que l'encodage des
+    TracedJSONResponse construites par le endpoint.
+    """
+
+    def get_route_handler(self):
+        call = self.dependant.call
+        if asyncio.iscoroutinefunction(call):
+            @functools.wraps(call)
+            async def traced_call(*args, **kwargs):
+                try:
+                    return await call(*args, **kwargs)
+                finally:
+                    _mark_handler_end()
+        else:
+            @functools.wraps(call)
+            def traced_call(*args, **kwargs):
+                try:
+                    return call(*args, **kwargs)
+                finally:
+                    _mark_handler_end()
+        self.dependant.call = traced_call
+        return super().get_route_handler()
+
+
+def server_timing(trace: RequestTrace, now_ns: int) -> str:
+    """Répartition frontend / vocalyx-api / sérialisation (millisecondes) pour l'en-tête Server-Timing"""
+    total = (now_ns - trace.root.start_ns) / 1e6
+    upstream = trace.busy_ms(SPAN_KIND_CLIENT, until_ns=now_ns)
+    serialize = trace.busy_ms(SPAN_KIND_INTERNAL, until_ns=now_ns)
+    frontend = max(0.0, total - upstream - serialize)
+    calls = sum(1 for span in trace.spans if span.kind == SPAN_KIND_CLIENT)
+    return (
+        f'app;desc="Frontend";dur={frontend:.1f}, '
+        f'upstream;desc="vocalyx-api ({calls})";dur={upstream:.1f}, '
+        f'serialize;desc="Serialization";dur={serialize:.1f}, '
+        f'total;dur={total:.1f}'
+    )
+
+
+class TracingMiddleware:
+    """
+    Ouvre une trace par requête HTTP (identifiant X-Request-ID repris du client
+    ou généré, traceparent W3C entrant prolongé) accessible via une ContextVar :
+    VocalyxAPIClient y enregistre un span par appel et propage l'identifiant à
+    vocalyx-api. La réponse porte X-Request-ID et Server-Timing ; la trace
+    complète est confiée à l'exportateur (fichier JSON OTLP) si configuré.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True, exporter: Optional[OtlpJsonFileExporter] = None):
+        self.app = app
+        self.server_timing = server_timing
+        self.exporter = exporter
+        self._route_of = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict((key.decode("latin-1"), value.decode("latin-1")) for key, value in scope["headers"])
+        trace = RequestTrace(
+            scope["method"],
+            request_id=headers.get(REQUEST_ID_HEADER.lower()),
+            traceparent=headers.get("traceparent")
+        )
+        token = set_current_trace(trace)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                now_ns = time.time_ns()
+                if trace.handler_end_ns is not None:
+                    trace.start_span("serialize", start_ns=trace.handler_end_ns).end(now_ns)
+                response_headers = MutableHeaders(scope=message)
+                response_headers[REQUEST_ID_HEADER] = trace.request_id
+                if self.server_timing:
+                    response_headers.append("Server-Timing", server_timing(trace, now_ns))
+                trace.root.attributes["http.status_code"] = message["status"]
+                trace.root.error = message["status"] >= 500
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            trace.root.error = True
+            raise
+        finally:
+            reset_current_trace(token)
+            trace.root.end()
+            route = self._route_of(scope)
+            trace.root.name = f"{scope['method']} {route}"
+            trace.root.attributes.update({
+                "http.method": scope["method"],
+                "http.route": route,
+                "http.target": scope.get("path"),
+                "vocalyx.request_id": trace.request_id
+            })
+            if self.exporter is not None:
+                self.exporter.export(trace)
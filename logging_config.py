@@ -5,26 +5,259 @@ Configuration centralisée du logging pour Vocalyx.
 Uniformise le format des logs pour tous les composants.
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from infrastructure.tracing import current_request_id
 
 # Format uniforme pour tous les logs
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Loggers configurés explicitement (handlers dédiés, sans propagation)
+CONFIGURED_LOGGERS = ["uvicorn", "uvicorn.access", "uvicorn.error", "faster_whisper", "vocalyx", "watchfiles"]
+
+# Enregistrements en attente d'écriture ; au-delà, les messages sont abandonnés (jamais bloquants)
+QUEUE_SIZE = 10000
+
+# Écouteur actif (thread d'écriture), remplacé à chaque reconfiguration
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Une ligne JSON par enregistrement (collecte par Loki, Elasticsearch...)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            payload["request_id"] = request_id
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            payload["suppressed"] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limite les messages fréquents : au plus `count` enregistrements par
+    fenêtre de `seconds` et par ligne de code émettrice, pour les loggers
+    dont le nom commence par un préfixe configuré. Les niveaux WARNING et
+    au-delà ne sont jamais limités ; le premier message d'une nouvelle
+    fenêtre indique combien ont été supprimés.
+
+    Exécuté sur le thread appelant : une lecture de dictionnaire par message.
+    """
+
+    def __init__(self, rules: Dict[str, Tuple[int, float]]):
+        super().__init__()
+        # Préfixes les plus longs d'abord (règle la plus spécifique)
+        self.rules = sorted(rules.items(), key=lambda rule: len(rule[0]), reverse=True)
+        self._resolved: Dict[str, Optional[Tuple[int, float]]] = {}
+        # (fichier, ligne) -> [début de fenêtre, émis, supprimés]
+        self._windows: Dict[Tuple[str, int], List[float]] = {}
 
-def setup_logging(log_level: str = "INFO", log_file: str = None):
+    def _rule_for(self, name: str) -> Optional[Tuple[int, float]]:
+        if name not in self._resolved:
+            self._resolved[name] = next(
+                (limit for prefix, limit in self.rules if name == prefix or name.startswith(prefix + ".")), None
+            )
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rule = self._rule_for(record.name)
+        if rule is None:
+            return True
+        count, seconds = rule
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= seconds:
+            suppressed = int(window[2]) if window is not None else 0
+            self._windows[key] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+                record.msg = f"{record.getMessage()} [+{suppressed} similar message(s) suppressed]"
+                record.args = None
+            return True
+        if window[1] < count:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Dépose les enregistrements dans une file lue par un thread dédié : le
+    thread appelant (boucle asyncio, pool de threads) ne fait jamais d'E/S.
+    Le message est calculé et l'identifiant de requête capturé ici, avant
+    que l'enregistrement ne quitte son contexte d'origine.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_size: int = QUEUE_SIZE):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = current_request_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # SimpleQueue (C, sans verrou Python) : borne vérifiée de façon approximative
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+def _compress_rotated(source: str, dest: str) -> None:
+    """Rotation : le fichier plein est compressé en gzip (exécuté sur le thread d'écriture)"""
+    with open(source, "rb") as plain, gzip.open(dest, "wb") as compressed:
+        shutil.copyfileobj(plain, compressed)
+    os.remove(source)
+
+
+def _file_handler(log_file: str, max_bytes: int, backup_count: int, compress: bool) -> logging.Handler:
+    # Créer le répertoire si nécessaire
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    if not max_bytes:
+        return logging.FileHandler(log_file, encoding="utf-8")
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    if compress:
+        handler.namer = lambda name: name + ".gz"
+        handler.rotator = _compress_rotated
+    return handler
+
+
+def parse_rate_limits(value: str) -> Dict[str, Tuple[int, float]]:
+    """"routes=30/10, infrastructure.api=50/10" -> {logger: (messages, secondes)}"""
+    rules = {}
+    for entry in (value or "").split(","):
+        if "=" not in entry:
+            continue
+        name, limit = entry.split("=", 1)
+        count, _, seconds = limit.partition("/")
+        rules[name.strip()] = (int(count), float(seconds or 1))
+    return rules
+
+
+def _install_pipeline(
+    handlers: List[logging.Handler],
+    numeric_level: int,
+    rate_limits: Optional[Dict[str, Tuple[int, float]]] = None
+) -> NonBlockingQueueHandler:
+    """Relie tous les loggers à une file unique dont les handlers réels s'exécutent sur un thread dédié"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    if rate_limits:
+        queue_handler.addFilter(RateLimitFilter(rate_limits))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Configuration globale
+    logging.basicConfig(
+        level=numeric_level,
+        format=LOG_FORMAT,
+        datefmt=LOG_DATE_FORMAT,
+        handlers=[queue_handler],
+        force=True  # Override les configurations existantes
+    )
+    
+    # Configurer les loggers spécifiques
+    for logger_name in CONFIGURED_LOGGERS:
+        log = logging.getLogger(logger_name)
+        log.setLevel(numeric_level)
+        # Supprimer les handlers existants pour éviter les doublons
+        log.handlers.clear()
+        log.addHandler(queue_handler)
+        # Ne pas propager aux parents pour éviter les doublons
+        log.propagate = False
+    
+    # ❗️ MODIFICATION: Mettre watchfiles à WARNING
+    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+    return queue_handler
+
+
+def shutdown_logging() -> None:
+    """Écrit les enregistrements en attente puis arrête le thread d'écriture"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_file: str = None,
+    json_format: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    compress: bool = True,
+    rate_limits: Optional[Dict[str, Tuple[int, float]]] = None
+):
     """
     Configure le logging pour toute l'application.
     
+    Les loggers écrivent dans une file ; console et fichier sont alimentés par
+    un thread dédié (QueueListener), hors de la boucle asyncio.
+    
     Args:
         log_level: Niveau de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Chemin optionnel vers un fichier de log
+        json_format: Une ligne JSON par message au lieu du format texte
+        max_bytes: Taille du fichier avant rotation (0 : pas de rotation)
+        backup_count: Nombre de fichiers de rotation conservés
+        compress: Compresser (gzip) les fichiers de rotation
+        rate_limits: Limites par préfixe de logger {nom: (messages, secondes)}
     """
     
     # Convertir le niveau de log
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
     
     # Configuration de base
     handlers = []
@@ -32,56 +265,17 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
     # Handler pour stdout
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(
-        logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-    )
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     
     # Handler optionnel pour fichier
     if log_file:
-        # Créer le répertoire si nécessaire
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _file_handler(log_file, max_bytes, backup_count, compress)
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(
-            logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-        )
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
-    # Configuration globale
-    logging.basicConfig(
-        level=numeric_level,
-        format=LOG_FORMAT,
-        datefmt=LOG_DATE_FORMAT,
-        handlers=handlers,
-        force=True  # Override les configurations existantes
-    )
-    
-    # Configurer les loggers spécifiques
-    loggers_to_configure = [
-        "uvicorn",
-        "uvicorn.access",
-        "uvicorn.error",
-        "faster_whisper",
-        "vocalyx",
-        "watchfiles" # ❗️ AJOUT (pour le setup normal)
-    ]
-    
-    for logger_name in loggers_to_configure:
-        log = logging.getLogger(logger_name)
-        log.setLevel(numeric_level)
-        # Supprimer les handlers existants pour éviter les doublons
-        log.handlers.clear()
-        # Ajouter nos handlers
-        for handler in handlers:
-            log.addHandler(handler)
-        # Ne pas propager aux parents pour éviter les doublons
-        log.propagate = False
-    
-    # ❗️ MODIFICATION: Mettre watchfiles à WARNING
-    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+    _install_pipeline(handlers, numeric_level, rate_limits)
     
     # Logger initial
     logger = logging.getLogger("vocalyx")
@@ -157,6 +351,8 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
     
     def format(self, record):
+        # Copie : le même enregistrement est ensuite écrit sans couleurs dans le fichier
+        record = logging.makeLogRecord(record.__dict__)
         # Ajouter la couleur au niveau de log
         levelname = record.levelname
         if levelname in self.COLORS:
@@ -165,10 +361,18 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
-def setup_colored_logging(log_level: str = "INFO", log_file: str = None):
+def setup_colored_logging(
+    log_level: str = "INFO",
+    log_file: str = None,
+    json_format: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    compress: bool = True,
+    rate_limits: Optional[Dict[str, Tuple[int, float]]] = None
+):
     """
     Configure le logging avec couleurs pour le terminal.
-    Identique à setup_logging mais avec couleurs.
+    Identique à setup_logging mais avec couleurs (le fichier suit `json_format`).
     """
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
@@ -184,36 +388,14 @@ def setup_colored_logging(log_level: str = "INFO", log_file: str = None):
     
     # Handler fichier sans couleurs
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _file_handler(log_file, max_bytes, backup_count, compress)
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(
-            logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+            JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
         )
         handlers.append(file_handler)
     
-    logging.basicConfig(
-        level=numeric_level,
-        format=LOG_FORMAT,
-        datefmt=LOG_DATE_FORMAT,
-        handlers=handlers,
-        force=True
-    )
-    
-    # Configurer les loggers spécifiques
-    for logger_name in ["uvicorn", "uvicorn.access", "uvicorn.error", 
-                        "faster_whisper", "vocalyx", "watchfiles"]: # ❗️ AJOUT
-        log = logging.getLogger(logger_name)
-        log.setLevel(numeric_level)
-        log.handlers.clear()
-        for handler in handlers:
-            log.addHandler(handler)
-        log.propagate = False
-        
-    # ❗️ MODIFICATION: Mettre watchfiles à WARNING
-    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+    _install_pipeline(handlers, numeric_level, rate_limits)
     
     logger = logging.getLogger("vocalyx")
     logger.info("✅ Logging coloré configuré")
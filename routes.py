@@ -4,12 +4,26 @@ Routes du Dashboard (corrigé pour import circulaire)
 """
 
 import logging
-from fastapi import APIRouter, Request, Form, UploadFile, File, HTTPException, Query, Body, Depends
-from typing import Optional
-from fastapi.responses import JSONResponse
+import httpx
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Request, Form, UploadFile, File, HTTPException, Query, Body, Depends, BackgroundTasks
+from typing import Any, Callable, Dict, Optional
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 from api_client import VocalyxAPIClient
 from config import Config
+from application.services.segment_service import SegmentService
+from application.services.search_index_service import SearchIndexService
+from application.services.eta_service import QUEUED_STATUSES, EtaService
+from application.services.metrics_rollup_service import DIMENSIONS, MetricsRollupService
+from application.services.capacity_planner_service import CapacityPlannerService
+from application.services.worker_monitor_service import WorkerMonitorService
+from infrastructure.api.fault_injector import FaultInjector, FaultRule, parse_fault_rules
+from infrastructure.api.resilience import CircuitOpenError, is_failure
+from infrastructure.cache import StaleResponseCache, TTLCache
+from infrastructure.web.prefetch_limiter import PrefetchLimiter, is_prefetch_request
+from infrastructure.web.tracing_middleware import TracedAPIRoute, TracedJSONResponse
 
 # --- MODIFICATION: Importer depuis auth_deps.py ---
 from auth_deps import get_current_token
@@ -17,17 +31,123 @@ from auth_deps import get_current_token
 
 logger = logging.getLogger(__name__)
 
-dashboard_router = APIRouter()
+dashboard_router = APIRouter(route_class=TracedAPIRoute)
 config = Config()
 
+# Profils récemment vérifiés : évite un appel à l'API à chaque requête admin
+admin_profile_cache = TTLCache(ttl_seconds=config.admin_check_ttl_seconds, max_entries=1024)
 
-def ensure_admin_access(api_client: VocalyxAPIClient, token: str):
-    """Vérifie que l'utilisateur courant est administrateur."""
-    profile = api_client.get_user_profile(token)
+
+async def ensure_admin_access(api_client: VocalyxAPIClient, token: str):
+    """Vérifie que l'utilisateur courant est administrateur (profil mis en cache quelques secondes)."""
+    profile = admin_profile_cache.get(token)
+    if profile is None:
+        profile = await api_client.get_user_profile_async(token)
+        admin_profile_cache.put(token, profile)
     if not profile.get("is_admin"):
         raise HTTPException(status_code=403, detail="Admin access required")
     return profile
 
+
+def observe_transcriptions(request: Request, transcriptions):
+    """Transmet les transcriptions proxifiées aux modèles appris (ETA, métriques agrégées)"""
+    request.app.state.eta_service.observe(transcriptions)
+    request.app.state.metrics_rollups.observe(transcriptions)
+
+
+def parse_date_bound(value: Optional[str], end: bool = False) -> Optional[float]:
+    """Date (AAAA-MM-JJ, incluse) ou horodatage ISO 8601 -> epoch"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid date: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed.timestamp()
+
+
+def upstream_http_exception(error: Exception, default_status: int = 500) -> HTTPException:
+    """
+    Réponse d'erreur d'une route : 503 si le disjoncteur de l'endpoint est ouvert,
+    504 si vocalyx-api n'a pas répondu à temps, 502 si elle est injoignable, a coupé
+    la connexion ou répond en 5xx, statut de l'API conservé pour ses refus (401, 403,
+    404, 422...), `default_status` pour les autres erreurs.
+    """
+    if isinstance(error, HTTPException):
+        return error
+    if isinstance(error, CircuitOpenError):
+        return HTTPException(
+            status_code=503,
+            detail="vocalyx-api temporarily unavailable",
+            headers={"Retry-After": str(max(1, round(error.retry_after)))}
+        )
+    if isinstance(error, httpx.TimeoutException):
+        return HTTPException(status_code=504, detail="vocalyx-api did not respond in time")
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status >= 500:
+            return HTTPException(status_code=502, detail=f"vocalyx-api error ({status})")
+        try:
+            detail = error.response.json().get("detail") or str(error)
+        except Exception:
+            detail = str(error)
+        return HTTPException(status_code=status, detail=detail)
+    if isinstance(error, httpx.TransportError):
+        return HTTPException(status_code=502, detail="vocalyx-api unreachable")
+    return HTTPException(status_code=default_status, detail=str(error))
+
+
+def refresh_last_known_good(stale_cache: StaleResponseCache, key: tuple, load: Callable[[], Any]):
+    """Rafraîchit en tâche de fond une réponse servie périmée (un seul rafraîchissement par clé)"""
+    if not stale_cache.begin_refresh(key):
+        return
+    try:
+        stale_cache.store(key, TracedJSONResponse(content=load()).body)
+    except Exception as e:
+        logger.debug(f"Stale response refresh failed: {e}")
+    finally:
+        stale_cache.end_refresh(key)
+
+
+async def serve_last_known_good(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    token: str,
+    route: str,
+    params: Dict[str, Any],
+    load: Callable[[], Any]
+) -> Response:
+    """
+    Réponse JSON de `load()` (exécuté hors de la boucle), conservée comme dernière réponse valide de la session.
+    Si vocalyx-api est indisponible (disjoncteur ouvert, timeout, connexion, 5xx),
+    la dernière réponse valide est servie avec `X-Vocalyx-Stale` et `Age`, et
+    rafraîchie en tâche de fond ; sans copie, l'erreur est propagée.
+    """
+    stale_cache: Optional[StaleResponseCache] = request.app.state.stale_cache
+    if stale_cache is None:
+        return TracedJSONResponse(content=await run_in_threadpool(load))
+    key = stale_cache.key(token, route, params)
+    try:
+        response = TracedJSONResponse(content=await run_in_threadpool(load))
+    except Exception as e:
+        cached = stale_cache.lookup(key) if isinstance(e, CircuitOpenError) or is_failure(e) else None
+        if cached is None:
+            raise
+        body, age = cached
+        logger.warning(f"⚠️ Serving stale {route} ({age:.0f}s old): {e}")
+        background_tasks.add_task(refresh_last_known_good, stale_cache, key, load)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"X-Vocalyx-Stale": "1", "Age": str(int(age))}
+        )
+    stale_cache.store(key, response.body)
+    return response
+
 # ============================================================================
 # PAGES HTML
 # ============================================================================
@@ -46,12 +166,12 @@ async def list_projects(
     api_client: VocalyxAPIClient = request.app.state.api_client
     
     try:
-        ensure_admin_access(api_client, token)
-        projects = api_client.list_projects(admin_key)
-        return JSONResponse(content=projects)
+        await ensure_admin_access(api_client, token)
+        projects = await run_in_threadpool(api_client.list_projects, admin_key)
+        return TracedJSONResponse(content=projects)
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.post("/api/projects", tags=["Projects"])
 async def create_project(
@@ -64,12 +184,12 @@ async def create_project(
     api_client: VocalyxAPIClient = request.app.state.api_client
     
     try:
-        ensure_admin_access(api_client, token)
-        project = api_client.create_project(project_name, admin_key)
-        return JSONResponse(content=project, status_code=201)
+        await ensure_admin_access(api_client, token)
+        project = await run_in_threadpool(api_client.create_project, project_name, admin_key)
+        return TracedJSONResponse(content=project, status_code=201)
     except Exception as e:
         logger.error(f"Error creating project: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.get("/api/projects/{project_name}", tags=["Projects"])
 async def get_project_details(
@@ -82,12 +202,12 @@ async def get_project_details(
     api_client: VocalyxAPIClient = request.app.state.api_client
     
     try:
-        ensure_admin_access(api_client, token)
-        project = api_client.get_project_details(project_name, admin_key)
-        return JSONResponse(content=project)
+        await ensure_admin_access(api_client, token)
+        project = await run_in_threadpool(api_client.get_project_details, project_name, admin_key)
+        return TracedJSONResponse(content=project)
     except Exception as e:
         logger.error(f"Error getting project details: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
+        raise upstream_http_exception(e, default_status=404)
 
 @dashboard_router.get("/api/user/projects", tags=["Projects"])
 async def list_user_projects_proxy(
@@ -97,11 +217,12 @@ async def list_user_projects_proxy(
     """Liste les projets accessibles par l'utilisateur courant."""
     api_client: VocalyxAPIClient = request.app.state.api_client
     try:
-        projects = api_client.get_user_projects(token)
-        return JSONResponse(content=projects)
+        projects = await api_client.get_user_projects_async(token)
+        request.app.state.search_index.index_projects(token, projects)
+        return TracedJSONResponse(content=projects)
     except Exception as e:
         logger.error(f"Error getting user projects: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 # ============================================================================
 # TRANSCRIPTIONS
@@ -129,8 +250,8 @@ async def upload_audio(
         file_content = await file.read()
         filename = file.filename or "audio.wav"
         
-        # Log pour déboguer le pre prompt
-        logger.info(f"📝 Frontend upload - initial_prompt reçu: {repr(initial_prompt)} (type: {type(initial_prompt).__name__})")
+        # Le contenu du pre prompt n'est jamais journalisé (données utilisateur) : longueur seule, en DEBUG
+        logger.debug(f"📝 Frontend upload - initial_prompt: {len(initial_prompt or '')} caractère(s)")
         
         # Appeler l'API pour créer la transcription
         result = await api_client.create_transcription(
@@ -145,14 +266,19 @@ async def upload_audio(
             llm_model=llm_model,
             initial_prompt=initial_prompt
         )
-        return JSONResponse(content=result, status_code=201)
+        if isinstance(result, dict) and result.get("id"):
+            request.app.state.search_index.index_transcription(
+                token, {"filename": filename, "project_name": project_name, **result}
+            )
+        return TracedJSONResponse(content=result, status_code=201)
     except Exception as e:
         logger.error(f"Error uploading audio: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.get("/api/transcriptions/recent", tags=["Transcriptions"])
 async def get_recent_transcriptions(
     request: Request,
+    background_tasks: BackgroundTasks,
     page: int = 1,
     limit: int = 25,
     status: str = None,
@@ -160,10 +286,10 @@ async def get_recent_transcriptions(
     search: str = None,
     token: str = Depends(get_current_token)  # ✅ AJOUT
 ):
-    """Récupère les transcriptions récentes (proxy vers l'API)"""
+    """Récupère les transcriptions récentes (proxy vers l'API, dernière réponse connue si l'API est indisponible)"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     
-    try:
+    def load():
         transcriptions = api_client.get_user_transcriptions(
             jwt_token=token,
             page=page,
@@ -172,49 +298,234 @@ async def get_recent_transcriptions(
             project=project,
             search=search
         )
-        return JSONResponse(content=transcriptions)
+        request.app.state.search_index.index_transcriptions(token, transcriptions)
+        observe_transcriptions(request, transcriptions)
+        eta_service: EtaService = request.app.state.eta_service
+        queued = isinstance(transcriptions, list) and any(
+            isinstance(t, dict) and t.get("status") in QUEUED_STATUSES for t in transcriptions
+        )
+        eta_service.annotate(
+            transcriptions,
+            snapshot=request.app.state.worker_monitor.snapshot,
+            pending=eta_service.pending(token) if queued else None
+        )
+        return transcriptions
+    
+    try:
+        return await serve_last_known_good(
+            request, background_tasks, token, "transcriptions/recent",
+            {"page": page, "limit": limit, "status": status, "project": project, "search": search},
+            load
+        )
     except Exception as e:
         logger.error(f"Error getting transcriptions: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.get("/api/transcriptions/count", tags=["Transcriptions"])
 async def count_transcriptions(
     request: Request,
+    background_tasks: BackgroundTasks,
     status: str = None,
     project: str = None,
     search: str = None,
     token: str = Depends(get_current_token)  # ✅ AJOUT
 ):
-    """Compte les transcriptions (proxy vers l'API)"""
+    """Compte les transcriptions (proxy vers l'API, dernière réponse connue si l'API est indisponible)"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     
     try:
-        count = api_client.count_user_transcriptions(
-            jwt_token=token,
-            status=status,
-            project=project,
-            search=search
+        return await serve_last_known_good(
+            request, background_tasks, token, "transcriptions/count",
+            {"status": status, "project": project, "search": search},
+            lambda: api_client.count_user_transcriptions(
+                jwt_token=token,
+                status=status,
+                project=project,
+                search=search
+            )
         )
-        return JSONResponse(content=count)
     except Exception as e:
         logger.error(f"Error counting transcriptions: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
+
+@dashboard_router.post("/api/transcriptions/eta", tags=["Transcriptions"])
+async def estimate_transcriptions_eta(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: dict = Body(...),
+    token: str = Depends(get_current_token)
+):
+    """
+    Estime l'heure de fin des transcriptions actives fournies (liste reçue par
+    WebSocket côté navigateur) : modèles de temps de traitement précalculés et
+    dernier instantané du statut des workers ; le statut `workers` envoyé par le
+    client ne sert qu'en l'absence d'instantané. La file d'attente complète de
+    l'utilisateur n'est chargée (requête bornée, en cache quelques secondes) que si
+    la liste contient des transcriptions en attente.
+    """
+    eta_service: EtaService = request.app.state.eta_service
+    transcriptions = payload.get("transcriptions")
+    if not isinstance(transcriptions, list) or len(transcriptions) > 500:
+        raise HTTPException(status_code=422, detail="'transcriptions' must be a list of at most 500 items")
+
+    workers = payload.get("workers") if isinstance(payload.get("workers"), dict) else None
+    pending = None
+    if any(isinstance(t, dict) and t.get("status") in QUEUED_STATUSES for t in transcriptions):
+        pending = await run_in_threadpool(eta_service.pending, token)
+    etas = eta_service.estimate(
+        transcriptions,
+        snapshot=request.app.state.worker_monitor.snapshot,
+        workers=workers,
+        pending=pending
+    )
+    if eta_service.needs_training():
+        background_tasks.add_task(eta_service.train, token)
+    return TracedJSONResponse(content={"etas": etas, "samples": eta_service.samples})
+
+@dashboard_router.get("/api/transcriptions/metrics", tags=["Transcriptions"])
+async def get_transcription_metrics(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project: Optional[str] = None,
+    whisper_model: Optional[str] = None,
+    diarization: Optional[bool] = None,
+    enrichment: Optional[bool] = None,
+    worker: Optional[str] = None,
+    group_by: Optional[str] = Query(None, pattern=f"^({'|'.join(DIMENSIONS)})$"),
+    token: str = Depends(get_current_token)
+):
+    """
+    Métriques de performance (attente, traitement, quantiles, distributions) calculées
+    par fusion des agrégats pré-calculés de la période, limitées aux projets visibles
+    par l'utilisateur. Détail par dimension avec `group_by`.
+    """
+    metrics_rollups: MetricsRollupService = request.app.state.metrics_rollups
+    start, end = parse_date_bound(start_date), parse_date_bound(end_date, end=True)
+    filters = {
+        "project": project,
+        "whisper_model": whisper_model,
+        "diarization": None if diarization is None else str(diarization).lower(),
+        "enrichment": None if enrichment is None else str(enrichment).lower(),
+        "worker": worker
+    }
+    
+    try:
+        payload = await run_in_threadpool(metrics_rollups.summary, token, start, end, filters, group_by)
+        if metrics_rollups.needs_backfill(token):
+            background_tasks.add_task(metrics_rollups.backfill, token)
+            payload["backfilling"] = True
+        return TracedJSONResponse(content=payload)
+    except Exception as e:
+        logger.error(f"Error getting transcription metrics: {e}")
+        raise upstream_http_exception(e)
 
 @dashboard_router.get("/api/transcriptions/{transcription_id}", tags=["Transcriptions"])
 async def get_transcription(
-    request: Request, 
+    request: Request,
     transcription_id: str,
+    include_segments: bool = True,
     token: str = Depends(get_current_token)  # ✅ AJOUT
 ):
-    """Récupère une transcription par ID (proxy vers l'API)"""
+    """
+    Récupère une transcription par ID (proxy vers l'API).
+    Avec include_segments=false, les segments sont omis : ils se lisent par fenêtre
+    via /api/transcriptions/{id}/segments.
+    Les préchargements (en-tête X-Vocalyx-Prefetch) sont limités par session et
+    refusés en 429 au-delà, sans attente.
+    """
     api_client: VocalyxAPIClient = request.app.state.api_client
-    
+    prefetch_limiter: PrefetchLimiter = request.app.state.prefetch_limiter
+    segment_service: SegmentService = request.app.state.segment_service
+
+    search_index: SearchIndexService = request.app.state.search_index
+
+    def fetch():
+        if not include_segments:
+            transcription = segment_service.get_metadata(token, transcription_id)
+        else:
+            transcription = api_client.get_user_transcription(jwt_token=token, transcription_id=transcription_id)
+        search_index.index_transcription(token, transcription)
+        observe_transcriptions(request, transcription)
+        return transcription
+
+    if not is_prefetch_request(request):
+        try:
+            return TracedJSONResponse(content=await run_in_threadpool(fetch))
+        except Exception as e:
+            logger.error(f"Error getting transcription: {e}")
+            raise upstream_http_exception(e, default_status=404)
+
+    with prefetch_limiter.slot(token) as acquired:
+        if not acquired:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many prefetch requests",
+                headers={"Retry-After": "1"}
+            )
+        try:
+            # Hors de la boucle : les préchargements en cours doivent rester comptés
+            transcription = await run_in_threadpool(fetch)
+            return TracedJSONResponse(content=transcription)
+        except Exception as e:
+            logger.error(f"Error prefetching transcription: {e}")
+            raise upstream_http_exception(e, default_status=404)
+
+@dashboard_router.get("/api/transcriptions/{transcription_id}/segments", tags=["Transcriptions"])
+async def get_transcription_segments(
+    request: Request,
+    transcription_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(200, ge=1, le=1000),
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    token: str = Depends(get_current_token)
+):
+    """
+    Retourne une fenêtre de segments (offset/limit, éventuellement restreinte
+    à l'intervalle temporel [start, end) en secondes) ainsi que les totaux.
+    """
+    segment_service: SegmentService = request.app.state.segment_service
+
     try:
-        transcription = api_client.get_user_transcription(jwt_token=token, transcription_id=transcription_id)
-        return JSONResponse(content=transcription)
+        window = await run_in_threadpool(
+            segment_service.get_window,
+            token,
+            transcription_id,
+            offset=offset,
+            limit=limit,
+            start=start,
+            end=end
+        )
+        return TracedJSONResponse(content=window)
     except Exception as e:
-        logger.error(f"Error getting transcription: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
+        logger.error(f"Error getting transcription segments: {e}")
+        raise upstream_http_exception(e, default_status=404)
+
+# ============================================================================
+# RECHERCHE
+# ============================================================================
+
+@dashboard_router.get("/api/search/suggest", tags=["Search"])
+async def search_suggest(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    q: str = Query("", max_length=100),
+    limit: int = Query(8, ge=1, le=20),
+    token: str = Depends(get_current_token)
+):
+    """
+    Suggestions de recherche (noms de fichiers, projets, titres d'enrichissement)
+    servies depuis l'index en mémoire de la session, sans appel à l'API.
+    Un index périmé est rafraîchi en tâche de fond après la réponse.
+    """
+    search_index: SearchIndexService = request.app.state.search_index
+
+    suggestions = search_index.suggest(token, q, limit)
+    if search_index.needs_refresh(token):
+        background_tasks.add_task(search_index.refresh, token)
+    return TracedJSONResponse(content={"query": q, "suggestions": suggestions})
 
 @dashboard_router.delete("/api/transcriptions/{transcription_id}", tags=["Transcriptions"])
 async def delete_transcription(
@@ -226,12 +537,14 @@ async def delete_transcription(
     api_client: VocalyxAPIClient = request.app.state.api_client
     
     try:
-        ensure_admin_access(api_client, token)
-        result = api_client.delete_transcription(transcription_id, jwt_token=token)
-        return JSONResponse(content=result)
+        await ensure_admin_access(api_client, token)
+        result = await run_in_threadpool(api_client.delete_transcription, transcription_id, jwt_token=token)
+        request.app.state.search_index.remove_transcription(token, transcription_id)
+        request.app.state.segment_service.invalidate(transcription_id)
+        return TracedJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error deleting transcription: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 # ============================================================================
 # WORKERS
@@ -242,16 +555,30 @@ async def get_workers_status(
     request: Request,
     token: str = Depends(get_current_token)  # ✅ AJOUT
 ):
-    """Récupère le statut des workers (proxy vers l'API)"""
+    """
+    Statut des workers : instantané publié par le WorkerMonitorService (aucun appel
+    à l'API tant qu'il est frais), sinon interrogation directe qui le rafraîchit.
+    """
     api_client: VocalyxAPIClient = request.app.state.api_client
+    worker_monitor: WorkerMonitorService = request.app.state.worker_monitor
     
     try:
-        ensure_admin_access(api_client, token)
-        status = api_client.get_workers_status(jwt_token=token)
-        return JSONResponse(content=status)
+        await ensure_admin_access(api_client, token)
+        worker_monitor.touch(token)
+        if not worker_monitor.is_fresh():
+            await worker_monitor.poll()
+        snapshot = worker_monitor.snapshot
+        if snapshot is None:
+            # Aucun statut obtenu depuis le démarrage : erreur de l'API
+            raise RuntimeError(worker_monitor.last_error or "Worker status unavailable")
+        return Response(
+            content=snapshot.body,
+            media_type="application/json",
+            headers={"X-Snapshot-Age": f"{snapshot.age:.1f}"}
+        )
     except Exception as e:
         logger.error(f"Error getting workers status: {e}")
-        return JSONResponse(content={
+        return TracedJSONResponse(content={
             "worker_count": 0,
             "transcription_worker_count": 0,
             "enrichment_worker_count": 0,
@@ -261,6 +588,75 @@ async def get_workers_status(
             "error": str(e)
         })
 
+@dashboard_router.get("/api/workers/history", tags=["Workers"])
+async def get_workers_history(
+    request: Request,
+    points: int = Query(60, ge=2, le=720),
+    window: Optional[int] = Query(None, ge=10, description="Fenêtre en secondes (défaut : tout l'historique)"),
+    token: str = Depends(get_current_token)
+):
+    """Historique sous-échantillonné du nombre de workers et de tâches actives (sparklines)"""
+    api_client: VocalyxAPIClient = request.app.state.api_client
+    worker_monitor: WorkerMonitorService = request.app.state.worker_monitor
+    
+    try:
+        await ensure_admin_access(api_client, token)
+        worker_monitor.touch(token)
+        return TracedJSONResponse(content=worker_monitor.history_payload(points=points, window=window))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting workers history: {e}")
+        raise upstream_http_exception(e)
+
+@dashboard_router.get("/api/workers/capacity-plan", tags=["Workers"])
+async def get_workers_capacity_plan(
+    request: Request,
+    workers: Optional[str] = Query(None, description="Nombres de workers candidats, ex. 1,2,4 (défaut : autour du minimum stable)"),
+    pool: str = Query("transcription", pattern="^(transcription|enrichment)$"),
+    concurrency: int = Query(1, ge=1, le=32, description="Tâches simultanées par worker"),
+    days: int = Query(30, ge=1, le=90),
+    scale: float = Query(1.0, gt=0, le=20, description="Facteur de croissance du trafic"),
+    target_p95: float = Query(60.0, gt=0, description="Attente p95 visée (secondes)"),
+    token: str = Depends(get_current_token)
+):
+    """
+    Simulation de capacité : charge ajustée sur l'historique des transcriptions,
+    attentes p50/p95 prédites pour chaque nombre de workers candidat.
+    """
+    api_client: VocalyxAPIClient = request.app.state.api_client
+    planner: CapacityPlannerService = request.app.state.capacity_planner
+    worker_monitor: WorkerMonitorService = request.app.state.worker_monitor
+    
+    try:
+        worker_counts = [int(value) for value in workers.split(",") if value.strip()] if workers else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="'workers' must be a comma-separated list of integers")
+    if worker_counts and (len(worker_counts) > 12 or max(worker_counts) > 256):
+        raise HTTPException(status_code=422, detail="At most 12 candidates of up to 256 workers")
+    
+    try:
+        await ensure_admin_access(api_client, token)
+        model = await run_in_threadpool(planner.workload, token, pool)
+        snapshot = worker_monitor.snapshot
+        current_workers = snapshot.data().get(f"{pool}_worker_count") if snapshot is not None and snapshot.ok else None
+        plan = await run_in_threadpool(
+            planner.plan,
+            model,
+            worker_counts=worker_counts,
+            concurrency=concurrency,
+            days=days,
+            traffic_scale=scale,
+            target_p95=target_p95,
+            current_workers=current_workers
+        )
+        return TracedJSONResponse(content=plan)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error computing capacity plan: {e}")
+        raise upstream_http_exception(e)
+
 # ============================================================================
 # GESTION DES UTILISATEURS (NOUVEAU)
 # ============================================================================
@@ -268,15 +664,17 @@ async def get_workers_status(
 # importé proprement.
 
 @dashboard_router.get("/api/admin/users", tags=["Admin"], dependencies=[Depends(get_current_token)])
-async def proxy_list_users(request: Request, token: str = Depends(get_current_token)):
-    """[Proxy Admin] Liste tous les utilisateurs"""
+async def proxy_list_users(request: Request, background_tasks: BackgroundTasks, token: str = Depends(get_current_token)):
+    """[Proxy Admin] Liste tous les utilisateurs (dernière réponse connue si l'API est indisponible)"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     try:
-        users = api_client.list_users(admin_token=token)
-        return JSONResponse(content=users)
+        return await serve_last_known_good(
+            request, background_tasks, token, "admin/users", {},
+            lambda: api_client.list_users(admin_token=token)
+        )
     except Exception as e:
         logger.error(f"Error proxying list_users: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.post("/api/admin/users", tags=["Admin"], dependencies=[Depends(get_current_token)])
 async def proxy_create_user(
@@ -289,16 +687,17 @@ async def proxy_create_user(
     """[Proxy Admin] Crée un nouvel utilisateur"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     try:
-        user = api_client.create_user(
+        user = await run_in_threadpool(
+            api_client.create_user,
             admin_token=token,
             username=username,
             password=password,
             is_admin=is_admin
         )
-        return JSONResponse(content=user, status_code=201)
+        return TracedJSONResponse(content=user, status_code=201)
     except Exception as e:
         logger.error(f"Error proxying create_user: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.post("/api/admin/users/assign-project", tags=["Admin"], dependencies=[Depends(get_current_token)])
 async def proxy_assign_project(
@@ -314,15 +713,16 @@ async def proxy_assign_project(
         if not user_id or not project_id:
             raise HTTPException(status_code=400, detail="user_id and project_id requis")
             
-        user = api_client.assign_project_to_user(
+        user = await run_in_threadpool(
+            api_client.assign_project_to_user,
             admin_token=token,
             user_id=user_id,
             project_id=project_id
         )
-        return JSONResponse(content=user)
+        return TracedJSONResponse(content=user)
     except Exception as e:
         logger.error(f"Error proxying assign_project: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.post("/api/admin/users/remove-project", tags=["Admin"], dependencies=[Depends(get_current_token)])
 async def proxy_remove_project(
@@ -338,15 +738,16 @@ async def proxy_remove_project(
         if not user_id or not project_id:
             raise HTTPException(status_code=400, detail="user_id and project_id requis")
 
-        user = api_client.remove_project_from_user(
+        user = await run_in_threadpool(
+            api_client.remove_project_from_user,
             admin_token=token,
             user_id=user_id,
             project_id=project_id
         )
-        return JSONResponse(content=user)
+        return TracedJSONResponse(content=user)
     except Exception as e:
         logger.error(f"Error proxying remove_project: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise upstream_http_exception(e)
 
 @dashboard_router.delete("/api/admin/users/{user_id}", tags=["Admin"], dependencies=[Depends(get_current_token)])
 async def proxy_delete_user(
@@ -357,8 +758,65 @@ async def proxy_delete_user(
     """[Proxy Admin] Supprime un utilisateur"""
     api_client: VocalyxAPIClient = request.app.state.api_client
     try:
-        result = api_client.delete_user(admin_token=token, user_id=user_id)
-        return JSONResponse(content=result)
+        result = await run_in_threadpool(api_client.delete_user, admin_token=token, user_id=user_id)
+        return TracedJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error proxying delete_user: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise upstream_http_exception(e)
+
+# ============================================================================
+# INJECTION DE PANNES (TESTS DE RÉSILIENCE)
+# ============================================================================
+
+async def fault_injector_for_admin(request: Request, token: str) -> FaultInjector:
+    """Injecteur du client API, si l'endpoint est activé ([FAULTS] admin_endpoint_enabled) et l'utilisateur admin"""
+    if not config.faults_admin_endpoint_enabled:
+        raise HTTPException(status_code=404, detail="Fault injection endpoint disabled")
+    api_client: VocalyxAPIClient = request.app.state.api_client
+    await ensure_admin_access(api_client, token)
+    return api_client.faults
+
+@dashboard_router.get("/api/admin/faults", tags=["Admin"])
+async def get_fault_injection(request: Request, token: str = Depends(get_current_token)):
+    """Règles d'injection de pannes appliquées aux appels à l'API"""
+    try:
+        return TracedJSONResponse(content=(await fault_injector_for_admin(request, token)).state())
+    except Exception as e:
+        logger.error(f"Error getting fault injection rules: {e}")
+        raise upstream_http_exception(e)
+
+@dashboard_router.put("/api/admin/faults", tags=["Admin"])
+async def set_fault_injection(request: Request, payload: dict = Body(...), token: str = Depends(get_current_token)):
+    """
+    Remplace les règles d'injection de pannes : {"enabled": true, "rules": [{"pattern":
+    "/api/user/transcriptions*", "latency_ms": 300, "error_rate": 0.1}, ...]} ou
+    "rules" sous la forme texte de config.ini.
+    """
+    try:
+        faults = await fault_injector_for_admin(request, token)
+        rules = payload.get("rules") or []
+        try:
+            if isinstance(rules, str):
+                parsed = parse_fault_rules(rules)
+            elif isinstance(rules, list) and all(isinstance(rule, dict) for rule in rules):
+                parsed = [FaultRule.from_dict(rule) for rule in rules]
+            else:
+                raise ValueError("'rules' must be a list of objects or a rule string")
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        faults.configure(parsed, enabled=bool(payload.get("enabled", True)))
+        return TracedJSONResponse(content=faults.state())
+    except Exception as e:
+        logger.error(f"Error setting fault injection rules: {e}")
+        raise upstream_http_exception(e)
+
+@dashboard_router.delete("/api/admin/faults", tags=["Admin"])
+async def clear_fault_injection(request: Request, token: str = Depends(get_current_token)):
+    """Désactive l'injection de pannes et supprime les règles"""
+    try:
+        faults = await fault_injector_for_admin(request, token)
+        faults.configure((), enabled=False)
+        return TracedJSONResponse(content=faults.state())
+    except Exception as e:
+        logger.error(f"Error clearing fault injection rules: {e}")
+        raise upstream_http_exception(e)
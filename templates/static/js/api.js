@@ -1,6 +1,297 @@
 // templates/static/js/api.js
 // Client JavaScript pour communiquer avec le dashboard (qui proxie vers l'API)
 
+/**
+ * Politique de cache par endpoint (millisecondes) :
+ *  - ttl      : durée pendant laquelle la réponse est servie sans revalidation
+ *  - maxStale : au-delà de ttl et jusqu'à maxStale, la réponse est servie
+ *               immédiatement puis revalidée en arrière-plan (stale-while-revalidate)
+ * Au-delà de maxStale, l'appel attend une nouvelle réponse.
+ */
+const API_CACHE_POLICIES = {
+    "projects:user": { ttl: 60000, maxStale: 10 * 60000 },
+    "workers:status": { ttl: 5000, maxStale: 60000 },
+    "users:list": { ttl: 30000, maxStale: 10 * 60000 },
+    "metrics:transcriptions": { ttl: 30000, maxStale: 5 * 60000 }
+};
+
+/**
+ * Préchargement des détails de transcriptions (survol / visibilité) :
+ *  - maxBytes      : taille maximale du cache LRU des détails (taille JSON approchée, UTF-16)
+ *  - maxConcurrent : préchargements simultanés (aligné sur la limite par session du serveur)
+ *  - maxQueued     : préchargements en attente conservés (les moins prioritaires sont abandonnés)
+ *  - ttl           : validité d'un détail terminé (done / error)
+ *  - ttlActive     : validité d'un détail encore en traitement
+ *  - backoffMs     : pause des préchargements après un refus du serveur (429)
+ */
+const DETAIL_PREFETCH_POLICY = {
+    maxBytes: 2 * 1024 * 1024,
+    maxConcurrent: 2,
+    maxQueued: 8,
+    ttl: 5 * 60000,
+    ttlActive: 5000,
+    backoffMs: 1000
+};
+const PREFETCH_PRIORITY = { low: 0, high: 1 };
+const TERMINAL_TRANSCRIPTION_STATUSES = new Set(["done", "error"]);
+
+/**
+ * Cache LRU (borné en octets) des détails de transcriptions et file de préchargement.
+ * Les préchargements sont servis par priorité (survol avant visibilité, le plus récent
+ * d'abord) et annulables (AbortController) tant qu'aucune ouverture ne les attend.
+ */
+class TranscriptionDetailPrefetcher {
+    constructor(fetchDetail) {
+        // fetchDetail(id, { signal }) -> Promise<détail>
+        this.fetchDetail = fetchDetail;
+        // id -> { data, bytes, expiresAt } (ordre d'insertion = ordre LRU)
+        this.entries = new Map();
+        this.totalBytes = 0;
+        // Préchargements en attente : { id, priority, seq }
+        this.queue = [];
+        this.seq = 0;
+        // id -> { controller, priority, claimed, promise }
+        this.inFlight = new Map();
+        this.pausedUntil = 0;
+        this.resumeTimer = null;
+    }
+    
+    _fresh(id) {
+        const entry = this.entries.get(id);
+        if (!entry) return null;
+        if (entry.expiresAt <= Date.now()) {
+            this.delete(id);
+            return null;
+        }
+        return entry;
+    }
+    
+    /**
+     * Détail en cache (undefined si absent ou expiré) ; l'entrée devient la plus récente
+     */
+    get(id) {
+        const entry = this._fresh(id);
+        if (!entry) return undefined;
+        this.entries.delete(id);
+        this.entries.set(id, entry);
+        return entry.data;
+    }
+    
+    has(id) {
+        return this._fresh(id) !== null;
+    }
+    
+    set(id, data) {
+        const bytes = JSON.stringify(data).length * 2;
+        this.delete(id);
+        if (bytes > DETAIL_PREFETCH_POLICY.maxBytes) return;
+        const ttl = TERMINAL_TRANSCRIPTION_STATUSES.has(data?.status)
+            ? DETAIL_PREFETCH_POLICY.ttl
+            : DETAIL_PREFETCH_POLICY.ttlActive;
+        this.entries.set(id, { data, bytes, expiresAt: Date.now() + ttl });
+        this.totalBytes += bytes;
+        for (const [oldId, old] of this.entries) {
+            if (this.totalBytes <= DETAIL_PREFETCH_POLICY.maxBytes) break;
+            this.entries.delete(oldId);
+            this.totalBytes -= old.bytes;
+        }
+    }
+    
+    delete(id) {
+        const entry = this.entries.get(id);
+        if (entry) {
+            this.totalBytes -= entry.bytes;
+            this.entries.delete(id);
+        }
+    }
+    
+    /**
+     * Supprime le détail en cache si le statut connu par la liste a changé
+     */
+    dropIfStale(id, status) {
+        const entry = this.entries.get(id);
+        if (entry && entry.data?.status !== status) this.delete(id);
+    }
+    
+    /**
+     * Ouverture explicite : détail en cache, sinon préchargement en vol (qui ne sera
+     * plus annulé). Retourne une promesse résolue en null si rien n'est disponible.
+     */
+    claim(id) {
+        const cached = this.get(id);
+        if (cached !== undefined) return Promise.resolve(cached);
+        this._dequeue(id);
+        const pending = this.inFlight.get(id);
+        if (!pending) return Promise.resolve(null);
+        pending.claimed = true;
+        return pending.promise;
+    }
+    
+    prefetch(id, priority = "low") {
+        if (!id || this.has(id)) return;
+        const rank = PREFETCH_PRIORITY[priority] ?? PREFETCH_PRIORITY.low;
+        const pending = this.inFlight.get(id);
+        if (pending) {
+            pending.priority = Math.max(pending.priority, rank);
+            return;
+        }
+        const queued = this.queue.find(item => item.id === id);
+        if (queued) {
+            queued.priority = Math.max(queued.priority, rank);
+            queued.seq = ++this.seq;
+        } else {
+            this.queue.push({ id, priority: rank, seq: ++this.seq });
+        }
+        // Priorité décroissante, puis le plus récent d'abord
+        this.queue.sort((a, b) => (b.priority - a.priority) || (b.seq - a.seq));
+        if (this.queue.length > DETAIL_PREFETCH_POLICY.maxQueued) {
+            this.queue.length = DETAIL_PREFETCH_POLICY.maxQueued;
+        }
+        this._pump();
+    }
+    
+    /**
+     * Abandonne un préchargement de visibilité (élément sorti de l'écran).
+     * Les préchargements de survol et ceux attendus par une ouverture sont conservés.
+     */
+    cancel(id) {
+        this._dequeue(id);
+        const pending = this.inFlight.get(id);
+        if (pending && !pending.claimed && pending.priority === PREFETCH_PRIORITY.low) {
+            pending.controller.abort();
+        }
+    }
+    
+    _dequeue(id) {
+        const index = this.queue.findIndex(item => item.id === id);
+        if (index !== -1) this.queue.splice(index, 1);
+    }
+    
+    _pump() {
+        if (Date.now() < this.pausedUntil) return;
+        while (this.inFlight.size < DETAIL_PREFETCH_POLICY.maxConcurrent && this.queue.length > 0) {
+            const { id, priority } = this.queue.shift();
+            if (!this.has(id) && !this.inFlight.has(id)) this._start(id, priority);
+        }
+    }
+    
+    _start(id, priority) {
+        const controller = new AbortController();
+        const pending = { controller, priority, claimed: false, promise: null };
+        pending.promise = this.fetchDetail(id, { signal: controller.signal })
+            .then(data => {
+                this.set(id, data);
+                return data;
+            })
+            .catch(err => {
+                if (err.status === 429) {
+                    this._pause();
+                } else if (err.name !== "AbortError") {
+                    debugLog(`Préchargement ${id} échoué:`, err.message);
+                }
+                // L'ouverture explicite refera la requête
+                return null;
+            })
+            .finally(() => {
+                this.inFlight.delete(id);
+                this._pump();
+            });
+        this.inFlight.set(id, pending);
+    }
+    
+    _pause() {
+        this.pausedUntil = Date.now() + DETAIL_PREFETCH_POLICY.backoffMs;
+        if (this.resumeTimer) return;
+        this.resumeTimer = setTimeout(() => {
+            this.resumeTimer = null;
+            this._pump();
+        }, DETAIL_PREFETCH_POLICY.backoffMs);
+    }
+}
+
+/**
+ * Pont vers le WebSocket détenu par ws-worker.js.
+ * Expose `readyState` comme un WebSocket et reconstruit, à partir des patches
+ * envoyés par le worker, l'état du dashboard attendu par main.js. Les
+ * transcriptions inchangées conservent leur objet (référence) d'un état à l'autre.
+ */
+class WorkerSocketBridge {
+    constructor(url, { onOpen, onClose, onError, onMessage }) {
+        this.readyState = WebSocket.CONNECTING;
+        this.onOpen = onOpen;
+        this.onClose = onClose;
+        this.onError = onError;
+        this.onMessage = onMessage;
+        this.transcriptions = new Map(); // miroir id -> transcription
+        
+        this.worker = new Worker("/static/js/ws-worker.js");
+        this.worker.onmessage = (event) => this._handleWorkerMessage(event.data);
+        this.worker.onerror = (event) => {
+            console.error("❌ Erreur du worker WebSocket:", event.message);
+            this.onError(event);
+        };
+        this.worker.postMessage({ cmd: "connect", url, debug: isDebugEnabled() });
+    }
+    
+    sendMessage(message) {
+        this.worker.postMessage({ cmd: "send", message });
+    }
+    
+    close() {
+        this.worker.postMessage({ cmd: "close" });
+    }
+    
+    _handleWorkerMessage(data) {
+        switch (data.kind) {
+            case "open":
+                this.readyState = WebSocket.OPEN;
+                this.onOpen();
+                break;
+            case "error":
+                this.onError(data);
+                break;
+            case "closed":
+                this.readyState = WebSocket.CLOSED;
+                this.transcriptions.clear();
+                this.worker.terminate();
+                this.onClose(data);
+                break;
+            case "message": {
+                // Même fusion que le worker, pour que le miroir reste aligné sur son diff
+                const updated = data.message.type === "transcription_updated" ? data.message.data?.transcription : null;
+                if (updated && this.transcriptions.has(String(updated.id))) {
+                    const id = String(updated.id);
+                    this.transcriptions.set(id, { ...this.transcriptions.get(id), ...updated });
+                }
+                this.onMessage(data.message);
+                break;
+            }
+            case "patch":
+                this.onMessage({ type: data.type, data: this._applyPatch(data.patch) });
+                break;
+        }
+    }
+    
+    /**
+     * Applique un patch au miroir et retourne l'état à transmettre à l'UI :
+     * les clés modifiées et la liste complète des transcriptions.
+     */
+    _applyPatch(patch) {
+        if (patch.reset) this.transcriptions.clear();
+        const state = { ...patch.changed };
+        if (patch.order) {
+            patch.upserts.forEach(entry => this.transcriptions.set(String(entry.id), entry));
+            state.transcriptions = patch.order.map(id => this.transcriptions.get(id)).filter(Boolean);
+            // Oublier les transcriptions qui ne sont plus affichées
+            const visible = new Set(patch.order);
+            this.transcriptions.forEach((_, id) => {
+                if (!visible.has(id)) this.transcriptions.delete(id);
+            });
+        }
+        return state;
+    }
+}
+
 /**
  * Client API pour le Dashboard Vocalyx
  * Tous les appels passent par le backend du dashboard
@@ -11,9 +302,146 @@ class VocalyxDashboardAPI {
         // this.wsURL = this.baseURL.replace(/^http/, 'ws'); // Plus utilisé
         this.websocket = null;
         this.pendingMessages = [];
+        // Cache des lectures : clé -> { data, fetchedAt, json, promise, generation, onUpdate }
+        this.cache = new Map();
+        // Dernier avertissement "données en cache" affiché (réponses X-Vocalyx-Stale)
+        this.staleNoticeAt = 0;
+        // Détails de transcriptions préchargés (survol / visibilité)
+        this.transcriptionDetails = new TranscriptionDetailPrefetcher(
+            (id, { signal }) => this._fetchTranscription(id, { includeSegments: false, signal, prefetch: true })
+        );
         console.log("🔧 API Client initialized, baseURL:", this.baseURL);
     }
     
+    // ========================================================================
+    // CACHE (STALE-WHILE-REVALIDATE)
+    // ========================================================================
+    
+    /**
+     * Lecture mise en cache.
+     * - réponse fraîche : servie depuis le cache
+     * - réponse périmée (< maxStale) : servie immédiatement, revalidée en arrière-plan ;
+     *   `onUpdate(data)` est appelé si la revalidation rapporte des données différentes
+     * - absente ou trop ancienne : requête réseau (dédupliquée si déjà en vol)
+     */
+    async _cachedGet(key, fetcher, { onUpdate = null } = {}) {
+        const policy = API_CACHE_POLICIES[key.split("?")[0]] || { ttl: 0, maxStale: 0 };
+        let entry = this.cache.get(key);
+        if (!entry) {
+            entry = { data: undefined, fetchedAt: 0, json: null, promise: null, generation: 0, onUpdate: null };
+            this.cache.set(key, entry);
+        }
+        // Un seul abonné par clé : la vue qui a fait le dernier appel
+        if (onUpdate) entry.onUpdate = onUpdate;
+        
+        const age = Date.now() - entry.fetchedAt;
+        if (entry.fetchedAt && age < policy.ttl) {
+            return entry.data;
+        }
+        if (entry.fetchedAt && age < policy.maxStale) {
+            this._revalidate(key, entry, fetcher).catch(err => {
+                console.warn(`⚠️ Revalidation échouée pour ${key}, données périmées conservées:`, err.message);
+            });
+            return entry.data;
+        }
+        return this._revalidate(key, entry, fetcher);
+    }
+    
+    /**
+     * Lance (ou rejoint) la requête en vol pour une clé et met à jour le cache
+     */
+    _revalidate(key, entry, fetcher) {
+        if (entry.promise) return entry.promise;
+        
+        const hadData = entry.fetchedAt > 0;
+        const generation = entry.generation;
+        entry.promise = fetcher()
+            .then(data => {
+                // Invalidée pendant la requête (mutation) : ne pas mettre en cache une réponse antérieure
+                if (generation !== entry.generation) return data;
+                const json = JSON.stringify(data);
+                const changed = json !== entry.json;
+                entry.data = data;
+                entry.json = json;
+                entry.fetchedAt = Date.now();
+                if (hadData && changed && entry.onUpdate) {
+                    try {
+                        entry.onUpdate(data);
+                    } catch (err) {
+                        console.error(`Erreur onUpdate cache ${key}:`, err);
+                    }
+                }
+                return data;
+            })
+            .finally(() => {
+                if (generation === entry.generation) entry.promise = null;
+            });
+        return entry.promise;
+    }
+    
+    /**
+     * Indique si une réponse (fraîche ou périmée) est disponible pour la clé
+     */
+    isCached(key) {
+        return (this.cache.get(key)?.fetchedAt || 0) > 0;
+    }
+    
+    /**
+     * Alimente le cache avec des données reçues par un autre canal (WebSocket)
+     */
+    primeCache(key, data) {
+        const entry = this.cache.get(key) || { promise: null, generation: 0, onUpdate: null };
+        entry.data = data;
+        entry.json = JSON.stringify(data);
+        entry.fetchedAt = Date.now();
+        // Une requête en vol plus ancienne ne doit pas écraser ces données
+        entry.promise = null;
+        entry.generation++;
+        this.cache.set(key, entry);
+    }
+    
+    /**
+     * Invalide les entrées dont la clé commence par l'un des préfixes donnés.
+     * L'abonné est conservé : le prochain appel refera la requête.
+     */
+    invalidate(...prefixes) {
+        this.cache.forEach((entry, key) => {
+            if (prefixes.some(prefix => key.startsWith(prefix))) {
+                entry.fetchedAt = 0;
+                entry.json = null;
+                entry.promise = null;
+                entry.generation++;
+            }
+        });
+    }
+    
+    /**
+     * Invalide / alimente le cache à partir des événements WebSocket
+     */
+    _applyWebSocketEvent(message) {
+        switch (message?.type) {
+            case "worker_stats":
+                this.primeCache("workers:status", message.data);
+                break;
+            case "initial_dashboard_state":
+            case "dashboard_state_update":
+                if (message.data?.worker_stats) {
+                    this.primeCache("workers:status", message.data.worker_stats);
+                }
+                (message.data?.transcriptions || []).forEach(entry => {
+                    this.transcriptionDetails.dropIfStale(entry.id, entry.status);
+                });
+                break;
+            case "transcription_updated":
+            case "transcription_update_trigger": {
+                this.invalidate("metrics:");
+                const id = message.data?.transcription?.id ?? message.data?.transcription_id ?? message.data?.id;
+                if (id) this.transcriptionDetails.delete(id);
+                break;
+            }
+        }
+    }
+    
     /**
      * Gère les erreurs HTTP
      */
@@ -32,13 +460,19 @@ class VocalyxDashboardAPI {
                 // Pas JSON, garder le texte brut
             }
             
-            throw new Error(errorMessage);
+            const error = new Error(errorMessage);
+            error.status = response.status;
+            throw error;
+        }
+        
+        if (response.headers.get('X-Vocalyx-Stale')) {
+            this._notifyStale(response);
         }
         
         // Gérer les réponses non-JSON (comme pour get-token)
         try {
             const data = await response.json();
-            console.log("✅ Response data:", data);
+            debugLog("✅ Response data:", data);
             return data;
         } catch (e) {
             console.log("✅ Response data (non-JSON):", e);
@@ -46,6 +480,21 @@ class VocalyxDashboardAPI {
         }
     }
     
+    /**
+     * vocalyx-api indisponible : le dashboard a servi la dernière réponse connue
+     * (avertissement affiché au plus toutes les 30 s)
+     */
+    _notifyStale(response) {
+        const age = parseInt(response.headers.get('Age') || '0', 10);
+        console.warn(`⚠️ Stale response (${age}s old):`, response.url);
+        const now = Date.now();
+        if (now - this.staleNoticeAt < 30000 || typeof showToast !== 'function') return;
+        this.staleNoticeAt = now;
+        const minutes = Math.round(age / 60);
+        const since = minutes >= 1 ? `il y a ${minutes} min` : `il y a ${age} s`;
+        showToast(`API momentanément indisponible : dernières données connues (${since})`, "warning");
+    }
+    
     // ========================================================================
     // WEBSOCKET
     // ========================================================================
@@ -61,6 +510,10 @@ class VocalyxDashboardAPI {
     
     _internalSend(message) {
         try {
+            if (this.websocket instanceof WorkerSocketBridge) {
+                this.websocket.sendMessage(message); // sérialisé par le worker
+                return;
+            }
             this.websocket.send(JSON.stringify(message));
         } catch (err) {
             console.error("Failed to send WebSocket message:", err);
@@ -111,9 +564,14 @@ class VocalyxDashboardAPI {
         
         console.log(`🔌 Connexion WebSocket à: ${apiWsUrl}/api/ws/updates`);
         
-        this.websocket = new WebSocket(finalWsUrl);
-
-        this.websocket.onopen = (event) => {
+        const reconnect = () => {
+            console.warn("ℹ️ WebSocket déconnecté. Tentative de reconnexion dans 5s...");
+            this.websocket = null;
+            setTimeout(() => {
+                this.connectWebSocket(onMessageCallback, onErrorCallback, onOpenCallback);
+            }, 5000);
+        };
+        const onOpen = () => {
             console.log("✅ WebSocket connecté !");
             this._flushPendingMessages();
             if (onOpenCallback) {
@@ -124,29 +582,42 @@ class VocalyxDashboardAPI {
                 }
             }
         };
+        const onError = (event) => {
+            console.error("❌ Erreur WebSocket:", event);
+            if (onErrorCallback) onErrorCallback(event);
+        };
+        const dispatch = (message) => {
+            debugLog("📬 Message WebSocket reçu:", message);
+            this._applyWebSocketEvent(message);
+            onMessageCallback(message);
+        };
+        
+        // Décodage et diff dans un Web Worker si disponible, sinon sur le thread principal
+        if (window.Worker) {
+            this.websocket = new WorkerSocketBridge(finalWsUrl, {
+                onOpen,
+                onError,
+                onClose: reconnect,
+                onMessage: dispatch
+            });
+            return;
+        }
+        
+        this.websocket = new WebSocket(finalWsUrl);
+
+        this.websocket.onopen = onOpen;
 
         this.websocket.onmessage = (event) => {
             try {
-                const message = JSON.parse(event.data);
-                console.log("📬 Message WebSocket reçu:", message);
-                onMessageCallback(message);
+                dispatch(JSON.parse(event.data));
             } catch (e) {
                 console.error("Erreur parsing JSON WebSocket:", e);
             }
         };
 
-        this.websocket.onerror = (event) => {
-            console.error("❌ Erreur WebSocket:", event);
-            if (onErrorCallback) onErrorCallback(event);
-        };
+        this.websocket.onerror = onError;
 
-        this.websocket.onclose = (event) => {
-            console.warn("ℹ️ WebSocket déconnecté. Tentative de reconnexion dans 5s...");
-            this.websocket = null;
-            setTimeout(() => {
-                this.connectWebSocket(onMessageCallback, onErrorCallback);
-            }, 5000);
-        };
+        this.websocket.onclose = reconnect;
     }
     // --- FIN MODIFICATION ---
     
@@ -155,12 +626,14 @@ class VocalyxDashboardAPI {
     // PROJETS
     // ========================================================================
     
-    async listUserProjects() {
-        const response = await fetch(`${this.baseURL}/api/user/projects`, {
-            method: 'GET',
-            credentials: 'include'
-        });
-        return this._handleResponse(response);
+    async listUserProjects(options = {}) {
+        return this._cachedGet("projects:user", async () => {
+            const response = await fetch(`${this.baseURL}/api/user/projects`, {
+                method: 'GET',
+                credentials: 'include'
+            });
+            return this._handleResponse(response);
+        }, options);
     }
     
     async listProjects(adminKey) {
@@ -181,7 +654,9 @@ class VocalyxDashboardAPI {
             method: 'POST',
             body: formData
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("projects:", "users:");
+        return result;
     }
     
     async getProjectDetails(projectName, adminKey) {
@@ -230,7 +705,9 @@ class VocalyxDashboardAPI {
             method: 'POST',
             body: formData
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("metrics:");
+        return result;
     }
     
     async getTranscriptions(page = 1, limit = 25, filters = {}) {
@@ -255,8 +732,80 @@ class VocalyxDashboardAPI {
         return this._handleResponse(response);
     }
     
-    async getTranscription(transcriptionId) {
-        const response = await fetch(`${this.baseURL}/api/transcriptions/${transcriptionId}`, {
+    async getTranscription(transcriptionId, options = {}) {
+        const includeSegments = options.includeSegments !== false;
+        if (includeSegments) {
+            return this._fetchTranscription(transcriptionId, { includeSegments });
+        }
+        // Détails sans segments : servis depuis le cache ou le préchargement en vol
+        const prefetched = await this.transcriptionDetails.claim(transcriptionId);
+        if (prefetched) return prefetched;
+        const data = await this._fetchTranscription(transcriptionId, { includeSegments });
+        this.transcriptionDetails.set(transcriptionId, data);
+        return data;
+    }
+    
+    async _fetchTranscription(transcriptionId, { includeSegments = true, signal = undefined, prefetch = false } = {}) {
+        const params = new URLSearchParams();
+        if (!includeSegments) params.append('include_segments', 'false');
+        const query = params.toString() ? `?${params}` : '';
+        
+        const init = { credentials: 'include', signal };
+        if (prefetch) {
+            // Limité par session côté serveur (429 au-delà)
+            init.headers = { 'X-Vocalyx-Prefetch': '1' };
+            init.priority = 'low';
+        }
+        const response = await fetch(`${this.baseURL}/api/transcriptions/${transcriptionId}${query}`, init);
+        return this._handleResponse(response);
+    }
+    
+    /**
+     * Suggestions de recherche (index en mémoire du dashboard, sans appel à l'API)
+     */
+    async searchSuggest(query, { limit = 8, signal = undefined } = {}) {
+        const params = new URLSearchParams({ q: query, limit });
+        const response = await fetch(`${this.baseURL}/api/search/suggest?${params}`, {
+            credentials: 'include',
+            signal
+        });
+        return this._handleResponse(response);
+    }
+    
+    /**
+     * Estime l'heure de fin des transcriptions actives (calcul côté dashboard,
+     * sans appel supplémentaire à l'API)
+     */
+    async estimateTranscriptionEtas(transcriptions, workers = null) {
+        const response = await fetch(`${this.baseURL}/api/transcriptions/eta`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            credentials: 'include',
+            body: JSON.stringify({ transcriptions, workers })
+        });
+        return this._handleResponse(response);
+    }
+    
+    /**
+     * Précharge les détails d'une transcription ("high" : survol, "low" : visibilité)
+     */
+    prefetchTranscription(transcriptionId, { priority = "low" } = {}) {
+        this.transcriptionDetails.prefetch(transcriptionId, priority);
+    }
+    
+    cancelTranscriptionPrefetch(transcriptionId) {
+        this.transcriptionDetails.cancel(transcriptionId);
+    }
+    
+    /**
+     * Récupère une fenêtre de segments (offset/limit ou intervalle temporel start/end)
+     */
+    async getTranscriptionSegments(transcriptionId, { offset = 0, limit = 200, start = null, end = null } = {}) {
+        const params = new URLSearchParams({ offset, limit });
+        if (start != null) params.append('start', start);
+        if (end != null) params.append('end', end);
+        
+        const response = await fetch(`${this.baseURL}/api/transcriptions/${transcriptionId}/segments?${params}`, {
             credentials: 'include'
         });
         return this._handleResponse(response);
@@ -267,7 +816,10 @@ class VocalyxDashboardAPI {
             method: 'DELETE',
             credentials: 'include'
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("metrics:");
+        this.transcriptionDetails.delete(transcriptionId);
+        return result;
     }
     
     async countTranscriptions(filters = {}) {
@@ -293,8 +845,34 @@ class VocalyxDashboardAPI {
     // WORKERS
     // ========================================================================
     
-    async getWorkersStatus() {
-        const response = await fetch(`${this.baseURL}/api/workers/status`, {
+    async getWorkersStatus(options = {}) {
+        return this._cachedGet("workers:status", async () => {
+            const response = await fetch(`${this.baseURL}/api/workers/status`, {
+                credentials: 'include'
+            });
+            return this._handleResponse(response);
+        }, options);
+    }
+    
+    /**
+     * Simulation de capacité : attentes p50/p95 prédites par nombre de workers
+     */
+    async getCapacityPlan({ workers = null, pool = "transcription", concurrency = 1, scale = 1, targetP95 = 60 } = {}) {
+        const params = new URLSearchParams({ pool, concurrency, scale, target_p95: targetP95 });
+        if (workers) params.append('workers', workers);
+        const response = await fetch(`${this.baseURL}/api/workers/capacity-plan?${params}`, {
+            credentials: 'include'
+        });
+        return this._handleResponse(response);
+    }
+    
+    /**
+     * Historique sous-échantillonné du statut des workers (sondé par le dashboard)
+     */
+    async getWorkersHistory({ points = 60, window = null } = {}) {
+        const params = new URLSearchParams({ points });
+        if (window) params.append('window', window);
+        const response = await fetch(`${this.baseURL}/api/workers/history?${params}`, {
             credentials: 'include'
         });
         return this._handleResponse(response);
@@ -304,12 +882,14 @@ class VocalyxDashboardAPI {
     // GESTION DES UTILISATEURS (NOUVEAU)
     // ========================================================================
     
-    async listUsers() {
-        const response = await fetch(`${this.baseURL}/api/admin/users`, {
-            method: 'GET',
-            credentials: 'include' // Ajout pour les appels /admin
-        });
-        return this._handleResponse(response);
+    async listUsers(options = {}) {
+        return this._cachedGet("users:list", async () => {
+            const response = await fetch(`${this.baseURL}/api/admin/users`, {
+                method: 'GET',
+                credentials: 'include' // Ajout pour les appels /admin
+            });
+            return this._handleResponse(response);
+        }, options);
     }
     
     async createUser(username, password, isAdmin) {
@@ -323,7 +903,9 @@ class VocalyxDashboardAPI {
             body: formData,
             credentials: 'include' // Ajout pour les appels /admin
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("users:", "projects:user");
+        return result;
     }
     
     async assignProjectToUser(userId, projectId) {
@@ -335,7 +917,9 @@ class VocalyxDashboardAPI {
             body: JSON.stringify({ user_id: userId, project_id: projectId }),
             credentials: 'include' // Ajout pour les appels /admin
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("users:", "projects:user");
+        return result;
     }
     
     async removeProjectFromUser(userId, projectId) {
@@ -347,7 +931,9 @@ class VocalyxDashboardAPI {
             body: JSON.stringify({ user_id: userId, project_id: projectId }),
             credentials: 'include' // Ajout pour les appels /admin
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("users:", "projects:user");
+        return result;
     }
     
     async deleteUser(userId) {
@@ -355,24 +941,29 @@ class VocalyxDashboardAPI {
             method: 'DELETE',
             credentials: 'include' // Ajout pour les appels /admin
         });
-        return this._handleResponse(response);
+        const result = await this._handleResponse(response);
+        this.invalidate("users:", "projects:user");
+        return result;
     }
 
     // ========================================================================
     // MÉTRIQUES (NOUVEAU)
     // ========================================================================
     
-    async getTranscriptionMetrics(startDate = null, endDate = null, project = null) {
+    async getTranscriptionMetrics(startDate = null, endDate = null, project = null, { groupBy = null, ...options } = {}) {
         const params = new URLSearchParams();
         if (startDate) params.append('start_date', startDate);
         if (endDate) params.append('end_date', endDate);
         if (project) params.append('project', project);
+        if (groupBy) params.append('group_by', groupBy);
         
-        const response = await fetch(`${this.baseURL}/api/transcriptions/metrics?${params}`, {
-            method: 'GET',
-            credentials: 'include'
-        });
-        return this._handleResponse(response);
+        return this._cachedGet(`metrics:transcriptions?${params}`, async () => {
+            const response = await fetch(`${this.baseURL}/api/transcriptions/metrics?${params}`, {
+                method: 'GET',
+                credentials: 'include'
+            });
+            return this._handleResponse(response);
+        }, options);
     }
     
     async getTTLHealth(transcriptionId) {
@@ -5,77 +5,8 @@
 // let currentPage = 1;
 // let currentLimit = 25;
 
-/**
- * Attache les événements de clic sur les lignes pour ouvrir la modale
- */
-function attachRowClickEvents() {
-    document.querySelectorAll("#grid-table-body tr").forEach(row => {
-        row.addEventListener("click", async (e) => {
-            // Ne pas ouvrir la modale si on clique sur le bouton supprimer
-            if (e.target.closest(".btn-delete")) {
-                return;
-            }
-            
-            const id = row.dataset.id;
-            openModal();
-            if (modalBody) {
-                modalBody.innerHTML = `
-                    <div style="text-align:center;padding:2rem;">
-                        <div class="spinner"></div>
-                        <p>Chargement des détails...</p>
-                    </div>
-                `;
-            }
-            
-            try {
-                // ✅ Utilisation de l'API client
-                const data = await api.getTranscription(id);
-                renderTranscriptionModal(data);
-            } catch (err) {
-                if (modalBody) {
-                    modalBody.innerHTML = `
-                        <div style="text-align:center;padding:2rem;color:red;">
-                            <p>❌ Erreur: ${err.message}</p>
-                            <button onclick="closeModal()" class="btn btn-danger">Fermer</button>
-                        </div>
-                    `;
-                }
-            }
-        });
-    });
-}
-
-/**
- * Attache les événements de suppression
- */
-function attachDeleteEvents() {
-    document.querySelectorAll(".btn-delete").forEach(btn => {
-        btn.addEventListener("click", async (e) => {
-            e.stopPropagation(); // Empêche le clic de se propager à la ligne
-            const row = e.target.closest("tr");
-            const id = row.dataset.id;
-            
-            if (!confirm(`Supprimer la transcription ${id.substring(0, 8)}... ?`)) return;
-            
-            try {
-                // ✅ Utilisation de l'API client
-                await api.deleteTranscription(id);
-                showToast(`Transcription supprimée !`, "success");
-                
-                // Animation de suppression
-                row.style.transition = "opacity 0.3s, transform 0.3s";
-                row.style.opacity = "0";
-                row.style.transform = "scale(0.95)";
-                
-                setTimeout(() => {
-                    refreshTranscriptions(currentPage, currentLimit);
-                }, 300);
-            } catch (err) {
-                showToast(`Erreur: ${err.message}`, "error");
-            }
-        });
-    });
-}
+// Les clics sur les lignes et cartes (détails, suppression) sont délégués
+// sur leurs conteneurs dans main.js (attachTranscriptionRowsEvents / attachTranscriptionCardsEvents)
 
 /**
  * Rafraîchit la grille avec les données via WebSocket
@@ -291,6 +291,9 @@ function resetFilters() {
     requestUpdateFromFilters();
 }
 
+// Dernière recherche envoyée (évite de redemander un état identique)
+let lastRequestedSearch = null;
+
 // Fonction centralisée pour envoyer l'état des filtres au WebSocket
 function requestUpdateFromFilters() {
     const statusEl = document.getElementById("status-filter");
@@ -307,6 +310,7 @@ function requestUpdateFromFilters() {
     
     // On demande la page 1 lors d'un changement de filtre
     currentPage = 1;
+    lastRequestedSearch = search;
     
     updateFiltersActiveBadge();
 
@@ -336,12 +340,39 @@ if (projectFilterEl) {
     });
 }
 
+// Choix d'une suggestion : filtre projet, ou ouverture directe de la transcription
+function applySearchSuggestion(suggestion) {
+    const searchEl = document.getElementById("search-input");
+    const projectEl = document.getElementById("project-filter");
+    clearTimeout(window.searchTimeout);
+    
+    if (suggestion.transcription_id) {
+        openTranscriptionDetails(suggestion.transcription_id);
+        return;
+    }
+    const hasOption = projectEl && Array.from(projectEl.options).some(o => o.value === suggestion.project_name);
+    if (hasOption) {
+        projectEl.value = suggestion.project_name;
+        if (searchEl) searchEl.value = "";
+    } else if (searchEl) {
+        searchEl.value = suggestion.label;
+    }
+    requestUpdateFromFilters();
+}
+
 const searchInputEl = document.getElementById("search-input");
 if (searchInputEl) {
-    // Debounce amélioré (500ms) ou sur Enter
+    // Autocomplétion (enregistrée en premier : Entrée sur une suggestion ne lance pas la recherche)
+    new SearchTypeahead(searchInputEl, {
+        fetchSuggestions: (query, options) => api.searchSuggest(query, options),
+        onSelect: applySearchSuggestion
+    });
+    
+    // Debounce amélioré (500ms) ou sur Enter ; rien n'est envoyé si la recherche n'a pas changé
     searchInputEl.addEventListener("input", () => {
         clearTimeout(window.searchTimeout);
         window.searchTimeout = setTimeout(() => {
+            if ((searchInputEl.value || null) === lastRequestedSearch) return;
             requestUpdateFromFilters();
         }, 500);
     });
@@ -12,7 +12,102 @@ window.VOCALYX_PROJECT_MAP = window.VOCALYX_PROJECT_MAP || {};
 
 console.log("🚀 main.js loaded");
 
+// ============================================================================
+// CHARGEMENT À LA DEMANDE DES VUES
+// ============================================================================
+
+// Code des vues secondaires (admin, utilisateurs, métriques), chargé par import()
+// uniquement quand la vue est affichée : le démarrage ne parse que la vue transcriptions.
+const VIEW_MODULES = {
+    projects: "/static/js/views/projects.js",
+    users: "/static/js/views/users.js",
+    workers: "/static/js/views/workers.js",
+    statistics: "/static/js/views/statistics.js"
+};
+const loadedViewModules = {};
+
+/**
+ * Charge (une seule fois) le module ES d'une vue
+ */
+function loadViewModule(name) {
+    if (!loadedViewModules[name]) {
+        loadedViewModules[name] = import(VIEW_MODULES[name]).catch(err => {
+            delete loadedViewModules[name];
+            console.error(`❌ Chargement du module ${name} impossible:`, err);
+            throw err;
+        });
+    }
+    return loadedViewModules[name];
+}
+
+/**
+ * Indique si le module d'une vue a déjà été demandé
+ */
+function isViewModuleLoaded(name) {
+    return !!loadedViewModules[name];
+}
+
+// Dernières stats workers reçues, rendues à l'ouverture de la vue workers
+let lastWorkerStats = null;
+
+/**
+ * Rend la grille de monitoring des workers si la vue a été chargée
+ */
+function renderWorkersView(stats) {
+    lastWorkerStats = stats;
+    if (!isViewModuleLoaded("workers") && currentView !== "workers") return;
+    loadViewModule("workers")
+        .then(module => {
+            module.renderWorkerMonitoringGrid(lastWorkerStats);
+            return refreshWorkerHistory().then(history => history && module.renderWorkerHistory(history));
+        })
+        .catch(() => {});
+}
+
+// Historique des workers (sondé côté serveur), redemandé au plus une fois par intervalle de sondage
+let workerHistory = null;
+let workerHistoryFetchedAt = 0;
+
+async function refreshWorkerHistory() {
+    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) return null;
+    const interval = (workerHistory?.interval || 5) * 1000;
+    if (workerHistory && Date.now() - workerHistoryFetchedAt < interval) return workerHistory;
+    workerHistoryFetchedAt = Date.now();
+    try {
+        workerHistory = await api.getWorkersHistory({ points: 60 });
+    } catch (err) {
+        debugLog("Historique workers indisponible:", err.message);
+    }
+    return workerHistory;
+}
+
+/**
+ * Pré-remplit la sparkline des workers avec l'historique serveur
+ * (sinon elle ne se dessine qu'après plusieurs mises à jour WebSocket)
+ */
+async function seedWorkerSparkline() {
+    const history = await refreshWorkerHistory();
+    if (!history || sparklineData.workers.length >= 2) return;
+    const transcription = history.series?.transcription_worker_count || [];
+    const enrichment = history.series?.enrichment_worker_count || [];
+    sparklineData.workers = transcription
+        .map((count, i) => Math.round(count + (enrichment[i] || 0)))
+        .slice(-SPARKLINE_MAX_POINTS);
+    drawSparkline("workers");
+}
+
+/**
+ * Rend les cartes / le tableau des projets si la vue a été chargée
+ */
+function renderProjectsView(projects) {
+    if (!isViewModuleLoaded("projects") && currentView !== "projects") return;
+    loadViewModule("projects")
+        .then(module => module.renderProjects(projects))
+        .catch(() => {});
+}
+
 // Stockage des valeurs pour les sparklines
+const SPARKLINE_MAX_POINTS = 20;
 let sparklineData = {
     projects: [],
     users: [],
@@ -35,7 +130,7 @@ function updateStatValue(id, value) {
         if (sparklineData[statType]) {
             sparklineData[statType].push(value);
             // Garder seulement les 20 dernières valeurs
-            if (sparklineData[statType].length > 20) {
+            if (sparklineData[statType].length > SPARKLINE_MAX_POINTS) {
                 sparklineData[statType].shift();
             }
             drawSparkline(statType);
@@ -82,13 +177,6 @@ function drawSparkline(type) {
     ctx.stroke();
 }
 
-function formatApiKeyPreview(key) {
-    if (!key) return "—";
-    const trimmed = String(key).trim();
-    if (trimmed.length <= 12) return trimmed;
-    return `${trimmed.slice(0, 6)}…${trimmed.slice(-4)}`;
-}
-
 /**
  * Récupère tous les projets et remplit les listes <select>
  */
@@ -97,7 +185,7 @@ async function populateProjectFilters() {
     const uploadSelect = document.getElementById("upload-project-select");
     const projectsGrid = document.getElementById("projects-grid");
     
-    if (projectsGrid) {
+    if (projectsGrid && !api?.isCached?.("projects:user")) {
         projectsGrid.innerHTML = `<div class="section-empty">Chargement des projets...</div>`;
     }
     
@@ -106,7 +194,8 @@ async function populateProjectFilters() {
         let projects;
 
         if (typeof projectsFetcher === "function") {
-            projects = await projectsFetcher.call(api);
+            // Réponse en cache servie immédiatement ; nouveau rendu si la revalidation diffère
+            projects = await projectsFetcher.call(api, { onUpdate: () => populateProjectFilters() });
         } else {
             console.warn("api.listUserProjects indisponible, fallback fetch direct utilisé.");
             const response = await fetch(`${window.location.origin}/api/user/projects`, {
@@ -153,8 +242,7 @@ async function populateProjectFilters() {
                 uploadSelect.appendChild(emptyOption);
             }
             updateStatValue("stat-projects", 0);
-            renderProjectsBoard([]);
-            renderProjectsTable([]);
+            renderProjectsView([]);
             return;
         }
 
@@ -182,178 +270,16 @@ async function populateProjectFilters() {
         }
 
         updateStatValue("stat-projects", allProjects.length);
-        renderProjectsBoard(allProjects);
-        renderProjectsTable(allProjects);
+        renderProjectsView(allProjects);
 
     } catch (err) {
         console.error("Erreur lors du chargement des projets:", err);
         showToast(`Erreur chargement projets: ${err.message}`, "error");
         updateStatValue("stat-projects", 0);
-        renderProjectsBoard([]);
-        renderProjectsTable([]);
+        renderProjectsView([]);
     }
 }
 
-function renderProjectsBoard(projects) {
-    const grid = document.getElementById("projects-grid");
-    if (!grid) return;
-    
-    if (!Array.isArray(projects) || projects.length === 0) {
-        grid.innerHTML = `<div class="section-empty">Aucun projet actif pour le moment.</div>`;
-        return;
-    }
-    
-    const fragment = document.createDocumentFragment();
-    const defaultProjectName = window.VOCALYX_CONFIG?.DEFAULT_PROJECT_NAME;
-    
-    projects.forEach(project => {
-        const card = document.createElement("article");
-        card.className = "project-card";
-        
-        const createdAt = project.created_at ? formatHumanDate(project.created_at) : "—";
-        const isAdmin = window.VOCALYX_CONFIG?.USER_IS_ADMIN && project.name === defaultProjectName;
-        
-        card.innerHTML = `
-            <div class="project-card-header">
-                <h3>${escapeHtml(project.name || "Sans nom")}</h3>
-                ${isAdmin ? '<span class="badge badge-admin">Admin</span>' : ''}
-            </div>
-            <p class="project-meta">Créé le ${escapeHtml(createdAt)}</p>
-            <div class="project-key">${escapeHtml(formatApiKeyPreview(project.api_key))}</div>
-            <div class="project-card-actions">
-                <button class="btn btn-primary btn-copy-key" data-project="${escapeHtml(project.name)}" title="Copier la clé API">
-                    📋 Copier clé
-                </button>
-                <button class="btn btn-success btn-view-details" data-project="${escapeHtml(project.name)}" title="Voir les détails">
-                    👁️ Détails
-                </button>
-            </div>
-        `;
-        
-        fragment.appendChild(card);
-    });
-    
-    grid.innerHTML = "";
-    grid.appendChild(fragment);
-    
-    // Attacher les événements des boutons
-    attachProjectCardEvents();
-}
-
-function attachProjectCardEvents() {
-    // Copier la clé API
-    document.querySelectorAll(".btn-copy-key").forEach(btn => {
-        btn.addEventListener("click", async (e) => {
-            e.stopPropagation();
-            const projectName = btn.dataset.project;
-            if (!projectName) return;
-            
-            const project = window.VOCALYX_PROJECT_MAP?.[projectName];
-            if (!project?.api_key) {
-                showToast("Clé API non disponible", "error");
-                return;
-            }
-            
-            try {
-                await navigator.clipboard.writeText(project.api_key);
-                showToast(`Clé API de "${projectName}" copiée !`, "success");
-            } catch (err) {
-                showToast("Erreur lors de la copie", "error");
-            }
-        });
-    });
-    
-    // Voir les détails
-    document.querySelectorAll(".btn-view-details").forEach(btn => {
-        btn.addEventListener("click", async (e) => {
-            e.stopPropagation();
-            const projectName = btn.dataset.project;
-            if (!projectName) return;
-            
-            const project = window.VOCALYX_PROJECT_MAP?.[projectName];
-            if (!project) {
-                showToast("Projet non trouvé", "error");
-                return;
-            }
-            
-            openModal();
-            modalBody.innerHTML = `
-                <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:1rem;">
-                    <h2>Détails du Projet</h2>
-                    <button class="btn btn-primary" onclick="closeModal()">← Retour</button>
-                </div>
-                <div style="background:#f9f9f9;padding:1.5rem;border-radius:12px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
-                    <h3>${escapeHtml(project.name || 'Sans nom')}</h3>
-                    <p><strong>Clé API:</strong> <code style="background:#fff;padding:0.3rem 0.6rem;border-radius:4px;display:inline-block;margin-left:0.5rem;">${escapeHtml(project.api_key || 'N/A')}</code></p>
-                    <p><strong>Créé le:</strong> ${escapeHtml(formatHumanDate(project.created_at))}</p>
-                    ${project.description ? `<p><strong>Description:</strong> ${escapeHtml(project.description)}</p>` : ''}
-                </div>
-            `;
-        });
-    });
-}
-
-function attachApiKeyRevealEvents() {
-    document.querySelectorAll(".api-key-reveal").forEach(input => {
-        input.addEventListener("click", (e) => {
-            const target = e.currentTarget;
-            const projectName = target.dataset.project;
-            if (!projectName) return;
-
-            const projectDetails = window.VOCALYX_PROJECT_MAP?.[projectName];
-            if (!projectDetails?.api_key) {
-                target.value = "Clé indisponible";
-                target.type = "text";
-                return;
-            }
-
-            if (target.dataset.loaded === "true") {
-                target.type = target.type === "password" ? "text" : "password";
-                return;
-            }
-
-            target.value = projectDetails.api_key;
-            target.type = "text";
-            target.dataset.loaded = "true";
-        });
-    });
-}
-
-function renderProjectsTable(projects) {
-    const tableBody = document.getElementById("projects-table-body");
-    if (!tableBody) return;
-
-    if (!Array.isArray(projects)) {
-        tableBody.innerHTML = `<tr><td colspan="3" style="text-align:center;color:red;">Erreur de chargement</td></tr>`;
-        return;
-    }
-
-    if (projects.length === 0) {
-        tableBody.innerHTML = `<tr><td colspan="3" style="text-align:center;">Aucun projet créé.</td></tr>`;
-        return;
-    }
-
-    tableBody.innerHTML = "";
-    projects.forEach(p => {
-        const row = document.createElement("tr");
-        row.innerHTML = `
-            <td><strong>${escapeHtml(p.name)}</strong></td>
-            <td>
-                <input type="password"
-                       value="••••••••"
-                       title="Cliquez pour récupérer la clé"
-                       data-project="${escapeHtml(p.name)}"
-                       class="api-key-reveal"
-                       readonly>
-            </td>
-            <td>${escapeHtml(formatHumanDate(p.created_at))}</td>
-        `;
-        tableBody.appendChild(row);
-    });
-
-    attachApiKeyRevealEvents();
-}
-
 /**
  * Formate une durée en secondes en H:M:S
  */
@@ -373,140 +299,6 @@ function formatDuration(seconds) {
     return str.trim();
 }
 
-/**
- * ---------------------------------------------------------------------------
- * ✅ MODIFICATION : Lecture de health.total_audio_processed_s
- * ---------------------------------------------------------------------------
- * Remplit la grille de monitoring des workers
- */
-function renderWorkerMonitoringGrid(stats) {
-    const gridBody = document.getElementById("worker-monitoring-grid");
-    if (!gridBody) return;
-
-    const workerStats = stats.stats || {};
-    const activeWorkers = stats.workers || {};
-    const registeredWorkers = stats.registered_tasks || {};
-
-    gridBody.innerHTML = "";
-
-    const allWorkerNames = new Set(Object.keys(workerStats));
-    Object.keys(registeredWorkers).forEach(name => allWorkerNames.add(name));
-
-    if (allWorkerNames.size === 0) {
-        gridBody.innerHTML = `<tr><td colspan="12" style="text-align:center;">Aucun worker Celery n'est actuellement connecté au broker.</td></tr>`;
-        return;
-    }
-
-    allWorkerNames.forEach(workerName => {
-        const row = document.createElement("tr");
-        const workerData = workerStats[workerName];
-        const activeTasks = activeWorkers[workerName] || [];
-        
-        const health = workerData?.health;
-        const db_stats = workerData?.db_stats;
-        
-        // Déterminer le type de worker (transcription ou enrichissement)
-        const simpleName = workerName.split('@')[0];
-        let workerType = "transcription";
-        let workerTypeLabel = "📝 Transcription";
-        if (simpleName.startsWith('enrichment-worker-') || simpleName.includes('enrichment')) {
-            workerType = "enrichment";
-            workerTypeLabel = "✨ Enrichissement";
-        }
-        
-        let status = "offline";
-        let statusClass = "status-offline";
-        let statusIndicator = "status-error";
-        
-        if (workerData) {
-            if (activeTasks.length > 0) {
-                status = "busy";
-                statusClass = "status-processing";
-                statusIndicator = "status-busy";
-            } else {
-                status = "idle";
-                statusClass = "status-done";
-                statusIndicator = "status-ok";
-            }
-        }
-
-        // Tâches
-        let tasksDone = 0;
-        const totalData = workerData?.total;
-        if (typeof totalData === 'number') {
-            tasksDone = totalData;
-        } else if (typeof totalData === 'object' && totalData !== null) {
-            tasksDone = Object.values(totalData).reduce((sum, count) => sum + (typeof count === 'number' ? count : 0), 0);
-        }
-        
-        // Exploitation des données 'health'
-        const cpuPercent = health?.cpu_percent;
-        const ramPercent = health?.memory_percent;
-        const ramRss = health?.memory_rss_bytes;
-        const uptime = health?.uptime_seconds;
-        
-        // "TPS audio traité"
-        const totalAudio = db_stats?.total_audio_processed_s;
-        
-        console.log(`Worker ${workerName}:`, {
-            health_exists: !!health,
-            db_stats_exists: !!db_stats,
-            totalAudio: totalAudio,
-            db_stats_content: db_stats
-        });
-        
-        const activeTaskCount = activeTasks.length;
-        let chargeBar = "N/A";
-        let maxConcurrency = 0;
-
-        if (workerData && workerData.pool && workerData.pool.hasOwnProperty('max-concurrency')) {
-            maxConcurrency = parseInt(workerData.pool['max-concurrency'], 10);
-        }
-        
-        if (maxConcurrency > 0) {
-            // Calculer le pourcentage
-            const chargePercent = (activeTaskCount / maxConcurrency) * 100;
-            chargeBar = createProgressBar(chargePercent); // Utiliser la fonction utilitaire
-        } else if (workerData) {
-            // Si le worker est en ligne mais n'a pas de max-concurrency, afficher 0%
-            chargeBar = createProgressBar(0);
-        }
-
-        // Déterminer les classes de coloration selon CPU/RAM
-        row.className = statusClass;
-        row.dataset.workerType = workerType;
-        row.innerHTML = `
-            <td class="col-instance">${simpleName}</td>
-            <td class="col-type">
-                <span class="worker-type-badge worker-type-${workerType}">${workerTypeLabel}</span>
-            </td>
-            <td class="col-status"><span class="worker-status-light ${statusIndicator}"></span> ${status}</td>
-            <td class="col-charge-num">${activeTaskCount}</td>
-            <td class="col-charge-bar">${chargeBar}</td>
-            <td class="col-cpu-num"><span class="worker-cpu-icon"></span>${cpuPercent != null ? cpuPercent.toFixed(1) + '%' : 'N/A'}</td>
-            <td class="col-cpu-bar">${createProgressBar(cpuPercent)}</td>
-            <td class="col-ram-num"><span class="worker-ram-icon"></span>${bytesToHuman(ramRss)}</td>
-            <td class="col-ram-bar">${createProgressBar(ramPercent)}</td>
-            <td class="col-uptime">${formatUptime(uptime)}</td>
-            <td class="col-jobs">${tasksDone}</td>
-            <td class="col-audio">${formatDuration(totalAudio)}</td>
-        `;
-        
-        // Ajouter les attributs data pour le CSS
-        if (cpuPercent != null) {
-            if (cpuPercent > 80) row.setAttribute('data-cpu-critical', 'true');
-            else if (cpuPercent > 70) row.setAttribute('data-cpu-high', 'true');
-        }
-        if (ramPercent != null) {
-            if (ramPercent > 80) row.setAttribute('data-ram-critical', 'true');
-            else if (ramPercent > 70) row.setAttribute('data-ram-high', 'true');
-        }
-        
-        gridBody.appendChild(row);
-    });
-}
-
-
 /**
  * Met à jour le header avec les stats workers
  */
@@ -552,78 +344,29 @@ function updateWorkerHeader(stats) {
 }
 
 /**
- * Met à jour une transcription spécifique dans l'UI sans rafraîchir toute la liste
+ * Met à jour une transcription spécifique dans l'UI sans rafraîchir toute la liste.
+ * Seuls les champs modifiés de la ligne (et de la carte mobile) sont patchés.
  */
 function updateTranscriptionInUI(transcription) {
     const container = document.getElementById("grid-table-body");
     if (!container) return;
     
-    const row = container.querySelector(`tr[data-id="${transcription.id}"]`);
-    if (row) {
-        // La transcription est visible, mettre à jour la ligne
-        row.className = `status-${transcription.status || 'unknown'}`;
+    const known = transcriptionsById.get(transcription.id);
+    if (known) {
+        // La transcription est visible : fusionner (les mises à jour WS peuvent être partielles)
+        const entry = { ...known, ...transcription };
+        transcriptionsById.set(entry.id, entry);
+        const index = currentTranscriptions.findIndex(t => t.id === entry.id);
+        if (index !== -1) currentTranscriptions[index] = entry;
         
-        // Mettre à jour le statut
-        const statusCell = row.querySelector('.col-status');
-        if (statusCell) {
-            statusCell.innerHTML = statusToBadge(transcription.status);
-        }
-        
-        // Mettre à jour les autres champs si nécessaire
-        const instanceCell = row.querySelector('.col-instance');
-        if (instanceCell && transcription.worker_id) {
-            instanceCell.textContent = transcription.worker_id;
-        }
-        
-        const langCell = row.querySelector('.col-lang');
-        if (langCell && transcription.language) {
-            langCell.textContent = transcription.language;
-        }
-        
-        const durationCell = row.querySelector('.col-duree');
-        if (durationCell && transcription.duration !== undefined) {
-            durationCell.textContent = transcription.duration ? transcription.duration.toFixed(1) + 's' : '-';
-        }
+        const row = container.querySelector(`tr[data-id="${CSS.escape(entry.id)}"]`);
+        if (row) patchTranscriptionRow(row, entry);
         
-        // ✅ NOUVEAU : Mettre à jour le temps d'attente
-        const waitCell = row.querySelector('.col-wait');
-        if (waitCell) {
-            waitCell.textContent = transcription.queue_wait_time ? formatDuration(transcription.queue_wait_time) : '-';
-        }
-        
-        const processCell = row.querySelector('.col-process');
-        if (processCell) {
-            const transcriptionTime = transcription.processing_time || 0;
-            // Utiliser enrichment_data.timing.total_time si disponible, sinon enrichment_processing_time
-            let enrichmentTime = 0;
-            if (transcription.enrichment_data && transcription.enrichment_data.timing && transcription.enrichment_data.timing.total_time) {
-                enrichmentTime = transcription.enrichment_data.timing.total_time;
-            } else if (transcription.enrichment_processing_time) {
-                enrichmentTime = transcription.enrichment_processing_time;
-            }
-            const totalProcessingTime = transcriptionTime + enrichmentTime;
-            
-            let processingTimeDisplay;
-            if (transcription.enrichment_requested) {
-              if (enrichmentTime > 0) {
-                processingTimeDisplay = `${totalProcessingTime.toFixed(1)}s`;
-              } else {
-                processingTimeDisplay = transcriptionTime ? `${transcriptionTime.toFixed(1)}s` : '-';
-              }
-            } else {
-              processingTimeDisplay = transcriptionTime ? `${transcriptionTime.toFixed(1)}s` : '-';
-            }
-            processCell.textContent = processingTimeDisplay;
-        }
-        
-        // Mettre à jour les colonnes workers
-        const transcribeWorkerCell = row.querySelector('.col-worker-transcribe');
-        if (transcribeWorkerCell) {
-            transcribeWorkerCell.textContent = transcription.worker_id || 'N/A';
-        }
-        const enrichmentWorkerCell = row.querySelector('.col-worker-enrichment');
-        if (enrichmentWorkerCell) {
-            enrichmentWorkerCell.textContent = transcription.enrichment_worker_id || '-';
+        if (transcriptionCardsList) {
+            transcriptionCardsList.refresh();
+        } else {
+            const card = document.querySelector(`#transcriptions-cards .transcription-card[data-id="${CSS.escape(entry.id)}"]`);
+            if (card) fillTranscriptionCard(card, entry);
         }
         
         console.log(`✅ Transcription ${transcription.id} mise à jour dans l'UI`);
@@ -651,6 +394,28 @@ function updateTranscriptionInUI(transcription) {
     }
 }
 
+// Mises à jour WS en attente, regroupées par frame d'animation (dernière version par id)
+const pendingTranscriptionUpdates = new Map();
+let transcriptionUpdatesFrame = null;
+
+/**
+ * Met en file une mise à jour de transcription reçue par WebSocket.
+ * Les rafales de messages sont appliquées en un seul passage au prochain frame.
+ */
+function queueTranscriptionUpdate(transcription) {
+    const previous = pendingTranscriptionUpdates.get(transcription.id);
+    pendingTranscriptionUpdates.set(transcription.id, previous ? { ...previous, ...transcription } : transcription);
+    if (transcriptionUpdatesFrame) return;
+    transcriptionUpdatesFrame = requestAnimationFrame(flushTranscriptionUpdates);
+}
+
+function flushTranscriptionUpdates() {
+    transcriptionUpdatesFrame = null;
+    const updates = Array.from(pendingTranscriptionUpdates.values());
+    pendingTranscriptionUpdates.clear();
+    updates.forEach(updateTranscriptionInUI);
+}
+
 /**
  * Rafraîchit la grille des transcriptions via WebSocket uniquement
  */
@@ -774,173 +539,495 @@ function setContextBanner(options={}) {
   banner.style.display = '';
 }
 
-// Patch renderTranscriptions — badges statut et context-banner couplé au count/filters
+/**
+ * Temps de traitement affiché (transcription + enrichissement si terminé)
+ */
+function formatProcessingTime(entry) {
+  // Toujours inclure le temps d'enrichissement s'il est disponible (même si pas encore terminé)
+  const transcriptionTime = entry.processing_time || 0;
+  // Utiliser enrichment_data.timing.total_time si disponible, sinon enrichment_processing_time
+  let enrichmentTime = 0;
+  if (entry.enrichment_data && entry.enrichment_data.timing && entry.enrichment_data.timing.total_time) {
+    enrichmentTime = entry.enrichment_data.timing.total_time;
+  } else if (entry.enrichment_processing_time) {
+    enrichmentTime = entry.enrichment_processing_time;
+  }
+  // Enrichissement terminé : afficher le temps total, sinon seulement la transcription
+  if (entry.enrichment_requested && enrichmentTime > 0) {
+    return `${(transcriptionTime + enrichmentTime).toFixed(1)}s`;
+  }
+  return entry.processing_time ? `${transcriptionTime.toFixed(1)}s` : '-';
+}
+
+// Transcriptions de la page courante (ordre d'affichage + index par id)
+let currentTranscriptions = [];
+const transcriptionsById = new Map();
+
+/**
+ * Crée une ligne vide de la grille des transcriptions
+ */
+function createTranscriptionRow() {
+  const row = document.createElement("tr");
+  row.innerHTML = `
+      <td class="col-status"><span class="status-badge-slot"></span><small class="eta-hint"></small></td>
+      <td class="col-project"></td>
+      <td class="col-id"></td>
+      <td class="col-worker-transcribe"></td>
+      <td class="col-worker-enrichment"></td>
+      <td class="col-lang"></td>
+      <td class="col-duree dur-group" title="Durée totale de l'audio en secondes"></td>
+      <td class="col-wait dur-group" title="Temps d'attente dans la file Celery (secondes)"></td>
+      <td class="col-process dur-group" title="Temps de traitement réel (sans attente) en secondes"></td>
+      <td class="col-date"></td>
+      <td class="col-actions"><button class="btn-delete btn btn-danger" title="Supprimer la transcription">Supprimer</button></td>`;
+  return row;
+}
+
+/**
+ * Patche sur place les cellules d'une ligne (seules les valeurs modifiées sont écrites)
+ */
+function patchTranscriptionRow(row, entry) {
+  const status = entry.status || 'unknown';
+  if (row.dataset.status !== status) {
+    row.dataset.status = status;
+    row.className = `status-${status}`;
+    row.querySelector('.status-badge-slot').innerHTML = statusToBadge(entry.status);
+  }
+  if (entry.eta_at && !transcriptionEtas.has(entry.id)) {
+    transcriptionEtas.set(entry.id, Date.parse(entry.eta_at));
+  }
+  patchEtaHint(row, entry);
+  setTextIfChanged(row.querySelector('.col-project'), entry.project_name || 'N/A');
+  setTextIfChanged(row.querySelector('.col-id'), entry.id);
+  setTextIfChanged(row.querySelector('.col-worker-transcribe'), entry.worker_id || 'N/A');
+  setTextIfChanged(row.querySelector('.col-worker-enrichment'), entry.enrichment_worker_id || '-');
+  setTextIfChanged(row.querySelector('.col-lang'), entry.language || '...');
+  setTextIfChanged(row.querySelector('.col-duree'), entry.duration ? entry.duration.toFixed(1) + 's' : '-');
+  // ✅ NOUVEAU : Afficher le temps d'attente dans la file
+  setTextIfChanged(row.querySelector('.col-wait'), entry.queue_wait_time ? formatDuration(entry.queue_wait_time) : '-');
+  setTextIfChanged(row.querySelector('.col-process'), formatProcessingTime(entry));
+  const dateCell = row.querySelector('.col-date');
+  const date = formatHumanDate(entry.created_at);
+  setTextIfChanged(dateCell, date);
+  if (dateCell.title !== date) dateCell.title = date;
+}
+
+// Rendu de la grille par réconciliation : les lignes sont indexées par id de transcription
 function renderTranscriptions(transcriptions, countData, filters) {
   const container = document.getElementById("grid-table-body");
   if (!container) return;
-  container.innerHTML = "";
+  attachTranscriptionRowsEvents(container);
+  bindHoverPrefetch(container, "tr[data-id]");
   if (!Array.isArray(transcriptions)) {
+    currentTranscriptions = [];
+    transcriptionsById.clear();
     container.innerHTML = `<tr><td colspan="10" style="text-align:center;padding:2rem;color:red;">Erreur: Les données reçues ne sont pas au bon format</td></tr>`;
     return;
   }
+  currentTranscriptions = transcriptions.slice();
+  transcriptionsById.clear();
+  currentTranscriptions.forEach(entry => transcriptionsById.set(entry.id, entry));
+  
   const totalCount = countData?.total_filtered ?? countData?.total ?? transcriptions.length;
   if (transcriptions.length === 0) {
     container.innerHTML = `<tr><td colspan="10" style="text-align:center;padding:2rem;">Aucune transcription trouvée.</td></tr>`;
     setContextBanner({ extraContext: formatFiltersBanner(0, filters||{}) });
+    renderTranscriptionsCards(transcriptions);
     return;
   }
-  const fragment = document.createDocumentFragment();
-  transcriptions.forEach((entry) => {
-    const row = document.createElement("tr");
-    row.className = `status-${entry.status || 'unknown'}`;
-    row.dataset.id = entry.id;
-    // Calculer le temps de traitement total (transcription + enrichissement)
-    // Toujours inclure le temps d'enrichissement s'il est disponible (même si pas encore terminé)
-    const transcriptionTime = entry.processing_time || 0;
-    // Utiliser enrichment_data.timing.total_time si disponible, sinon enrichment_processing_time
-    let enrichmentTime = 0;
-    if (entry.enrichment_data && entry.enrichment_data.timing && entry.enrichment_data.timing.total_time) {
-        enrichmentTime = entry.enrichment_data.timing.total_time;
-    } else if (entry.enrichment_processing_time) {
-        enrichmentTime = entry.enrichment_processing_time;
-    }
-    const totalProcessingTime = transcriptionTime + enrichmentTime;
-    
-    // Si enrichissement demandé mais pas encore terminé, utiliser le temps de transcription seulement
-    // Si enrichissement terminé, utiliser le temps total
-    let processingTimeDisplay;
-    if (entry.enrichment_requested) {
-      if (enrichmentTime > 0) {
-        // Enrichissement terminé : afficher le temps total
-        processingTimeDisplay = `${totalProcessingTime.toFixed(1)}s`;
-      } else {
-        // Enrichissement en cours ou en attente : afficher seulement transcription pour l'instant
-        processingTimeDisplay = entry.processing_time ? `${transcriptionTime.toFixed(1)}s` : '-';
-      }
-    } else {
-      // Pas d'enrichissement demandé : afficher seulement le temps de transcription
-      processingTimeDisplay = entry.processing_time ? `${transcriptionTime.toFixed(1)}s` : '-';
-    }
-    
-    // ✅ NOUVEAU : Afficher le temps d'attente dans la file
-    const queueWaitTimeDisplay = entry.queue_wait_time ? formatDuration(entry.queue_wait_time) : '-';
-    
-    row.innerHTML = `
-      <td class="col-status">${statusToBadge(entry.status)}</td>
-      <td class="col-project">${escapeHtml(entry.project_name || 'N/A')}</td>
-      <td class="col-id">${escapeHtml(entry.id)}</td>
-      <td class="col-worker-transcribe">${escapeHtml(entry.worker_id || 'N/A')}</td>
-      <td class="col-worker-enrichment">${escapeHtml(entry.enrichment_worker_id || '-')}</td>
-      <td class="col-lang">${escapeHtml(entry.language || '...')}</td>
-      <td class="col-duree dur-group" title="Durée totale de l'audio en secondes">${entry.duration ? entry.duration.toFixed(1) + 's' : '-'}</td>
-      <td class="col-wait dur-group" title="Temps d'attente dans la file Celery (secondes)">${queueWaitTimeDisplay}</td>
-      <td class="col-process dur-group" title="Temps de traitement réel (sans attente) en secondes">${processingTimeDisplay}</td>
-      <td class="col-date" title="${formatHumanDate(entry.created_at)}">${formatHumanDate(entry.created_at)}</td>
-      <td class="col-actions"><button class="btn-delete btn btn-danger" title="Supprimer la transcription">Supprimer</button></td>`;
-    fragment.appendChild(row);
+  reconcileKeyedChildren(container, transcriptions, {
+    create: createTranscriptionRow,
+    patch: patchTranscriptionRow
   });
-  container.appendChild(fragment);
+  observeForPrefetch(container.children);
+  refreshPrefetchOnView();
+  scheduleEtaRefresh(transcriptions);
   setContextBanner({ extraContext: formatFiltersBanner(totalCount, filters||{}) });
-  attachRowClickEvents();
-  attachDeleteEvents();
   
   // Rendre aussi en mode cards pour mobile
   renderTranscriptionsCards(transcriptions);
 }
 
 /**
- * Rend les transcriptions en mode cards pour mobile
+ * Ouvre la modale de détails d'une transcription
  */
+async function openTranscriptionDetails(id) {
+  openModal();
+  if (modalBody) {
+    modalBody.innerHTML = `
+      <div style="text-align:center;padding:2rem;">
+        <div class="spinner"></div>
+        <p>Chargement des détails...</p>
+      </div>
+    `;
+  }
+  try {
+    const data = await api.getTranscription(id, { includeSegments: false });
+    renderTranscriptionModal(data);
+  } catch (err) {
+    if (modalBody) {
+      modalBody.innerHTML = `
+        <div style="text-align:center;padding:2rem;color:red;">
+          <p>❌ Erreur: ${err.message}</p>
+          <button onclick="closeModal()" class="btn btn-danger">Fermer</button>
+        </div>
+      `;
+    }
+  }
+}
+
+/**
+ * Supprime une transcription après confirmation, avec animation de l'élément
+ */
+async function deleteTranscriptionWithConfirm(id, element) {
+  if (!confirm(`Supprimer la transcription ${id.substring(0, 8)}... ?`)) return;
+  
+  try {
+    await api.deleteTranscription(id);
+    showToast(`Transcription supprimée !`, "success");
+    if (element) {
+      element.style.transition = "opacity 0.3s, transform 0.3s";
+      element.style.opacity = "0";
+      element.style.transform = "scale(0.95)";
+    }
+    setTimeout(() => {
+      requestDashboardUpdate(currentPage);
+    }, 300);
+  } catch (err) {
+    showToast(`Erreur: ${err.message}`, "error");
+  }
+}
+
+/**
+ * Délégation des clics sur le corps de la grille (attachée une seule fois,
+ * les lignes réconciliées n'ont pas d'écouteurs propres)
+ */
+function attachTranscriptionRowsEvents(container) {
+  if (container.dataset.eventsBound === "true") return;
+  container.dataset.eventsBound = "true";
+  
+  container.addEventListener("click", (e) => {
+    const row = e.target.closest("tr[data-id]");
+    if (!row || !container.contains(row)) return;
+    
+    if (e.target.closest(".btn-delete")) {
+      e.stopPropagation();
+      deleteTranscriptionWithConfirm(row.dataset.id, row);
+      return;
+    }
+    openTranscriptionDetails(row.dataset.id);
+  });
+}
+
+/**
+ * Rend les transcriptions en mode cards pour mobile.
+ * Au-delà de CARDS_VIRTUALIZATION_THRESHOLD éléments, la liste est virtualisée
+ * (seules les cartes visibles existent dans le DOM, les nœuds sont recyclés).
+ */
+const CARDS_VIRTUALIZATION_THRESHOLD = 50;
+const CARD_ROW_HEIGHT = 176;
+let transcriptionCardsList = null;
+
 function renderTranscriptionsCards(transcriptions) {
   const cardsContainer = document.getElementById("transcriptions-cards");
   if (!cardsContainer) return;
   
-  cardsContainer.innerHTML = "";
+  attachTranscriptionCardsEvents(cardsContainer);
+  bindHoverPrefetch(cardsContainer, ".transcription-card[data-id]");
+  
+  const virtualize = Array.isArray(transcriptions) && transcriptions.length > CARDS_VIRTUALIZATION_THRESHOLD;
+  
+  if (transcriptionCardsList && !virtualize) {
+    transcriptionCardsList.destroy();
+    transcriptionCardsList = null;
+    cardsContainer.classList.remove("virtualized");
+  }
   
   if (!Array.isArray(transcriptions) || transcriptions.length === 0) {
     cardsContainer.innerHTML = `<div style="text-align:center;padding:2rem;color:#666;">Aucune transcription trouvée.</div>`;
     return;
   }
   
-  const fragment = document.createDocumentFragment();
+  if (virtualize) {
+    // Les lignes lisent currentTranscriptions : un simple refresh suffit entre deux rendus
+    if (transcriptionCardsList) {
+      transcriptionCardsList.setItemCount(currentTranscriptions.length);
+      return;
+    }
+    cardsContainer.classList.add("virtualized");
+    transcriptionCardsList = new VirtualList(cardsContainer, {
+      rowHeight: CARD_ROW_HEIGHT,
+      overscan: 4,
+      useWindowScroll: true,
+      itemCount: currentTranscriptions.length,
+      createRow: () => {
+        const row = document.createElement("div");
+        row.className = "transcription-card-row";
+        const card = createTranscriptionCard();
+        row.appendChild(card);
+        observeForPrefetch([card]);
+        return row;
+      },
+      updateRow: (row, index) => {
+        // Carte recyclée : le préchargement suit la transcription affichée
+        fillTranscriptionCard(row.firstElementChild, currentTranscriptions[index]);
+        if (prefetchVisible.has(row.firstElementChild)) schedulePrefetchOnView(row.firstElementChild);
+      }
+    });
+    return;
+  }
   
-  transcriptions.forEach((entry) => {
-    const card = document.createElement("div");
-    card.className = "transcription-card";
-    card.dataset.id = entry.id;
-    
-    card.innerHTML = `
-      <div class="transcription-card-header">
-        <div class="transcription-card-title">${statusToBadge(entry.status)} ${escapeHtml(entry.project_name || 'N/A')}</div>
-      </div>
-      <div class="transcription-card-meta">
-        <span><strong>ID:</strong> ${escapeHtml(entry.id.substring(0, 12))}...</span>
-        <span><strong>Durée:</strong> ${entry.duration ? entry.duration.toFixed(1) + 's' : '-'}</span>
-        <span><strong>Créé:</strong> ${formatHumanDate(entry.created_at)}</span>
-      </div>
-      <div class="transcription-card-actions">
-        <button class="btn btn-primary btn-view-details-card" data-id="${escapeHtml(entry.id)}">Voir détails</button>
-        <button class="btn btn-danger btn-delete-card" data-id="${escapeHtml(entry.id)}">Supprimer</button>
-      </div>
-    `;
-    
-    fragment.appendChild(card);
+  reconcileKeyedChildren(cardsContainer, transcriptions, {
+    create: createTranscriptionCard,
+    patch: fillTranscriptionCard
   });
+  observeForPrefetch(cardsContainer.children);
+}
+
+// ============================================================================
+// PRÉCHARGEMENT DES DÉTAILS (SURVOL / VISIBILITÉ)
+// ============================================================================
+
+// Délai de survol avant préchargement (évite de précharger en traversant la liste)
+const PREFETCH_HOVER_DELAY_MS = 80;
+// Temps de présence à l'écran avant préchargement (pas pendant un défilement rapide)
+const PREFETCH_VIEW_DWELL_MS = 300;
+// Seules les transcriptions terminées sont préchargées à l'affichage
+const PREFETCH_VIEW_STATUSES = new Set(["done"]);
+
+let prefetchObserver = null;
+// Éléments visibles -> minuteur de préchargement en attente
+const prefetchVisible = new Map();
+
+function prefetchAllowed() {
+  return !(navigator.connection && navigator.connection.saveData);
+}
+
+/**
+ * Précharge (priorité haute) les détails de la ligne / carte survolée ou focalisée
+ */
+function bindHoverPrefetch(container, selector) {
+  if (container.dataset.prefetchBound === "true") return;
+  container.dataset.prefetchBound = "true";
   
-  cardsContainer.appendChild(fragment);
+  let hoverTimer = null;
+  let hoveredId = null;
+  const prefetchNow = (id) => {
+    if (id && prefetchAllowed()) api.prefetchTranscription(id, { priority: "high" });
+  };
   
-  // Attacher les événements
-  document.querySelectorAll(".btn-view-details-card").forEach(btn => {
-    btn.addEventListener("click", async (e) => {
-      e.stopPropagation();
-      const id = btn.dataset.id;
-      openModal();
-      if (modalBody) {
-        modalBody.innerHTML = `
-          <div style="text-align:center;padding:2rem;">
-            <div class="spinner"></div>
-            <p>Chargement des détails...</p>
-          </div>
-        `;
-      }
-      try {
-        const data = await api.getTranscription(id);
-        renderTranscriptionModal(data);
-      } catch (err) {
-        if (modalBody) {
-          modalBody.innerHTML = `
-            <div style="text-align:center;padding:2rem;color:red;">
-              <p>❌ Erreur: ${err.message}</p>
-              <button onclick="closeModal()" class="btn btn-danger">Fermer</button>
-            </div>
-          `;
+  container.addEventListener("pointerover", (e) => {
+    const element = e.target.closest(selector);
+    if (!element || element.dataset.id === hoveredId) return;
+    hoveredId = element.dataset.id;
+    clearTimeout(hoverTimer);
+    hoverTimer = setTimeout(() => prefetchNow(hoveredId), PREFETCH_HOVER_DELAY_MS);
+  });
+  container.addEventListener("pointerleave", () => {
+    clearTimeout(hoverTimer);
+    hoveredId = null;
+  });
+  container.addEventListener("focusin", (e) => {
+    const element = e.target.closest(selector);
+    if (element) prefetchNow(element.dataset.id);
+  });
+}
+
+/**
+ * Observe des lignes / cartes : préchargement (priorité basse) après un court temps
+ * de présence à l'écran, annulé lorsqu'elles sortent de l'écran
+ */
+function observeForPrefetch(elements) {
+  if (!("IntersectionObserver" in window) || !prefetchAllowed()) return;
+  if (!prefetchObserver) {
+    prefetchObserver = new IntersectionObserver((entries) => {
+      entries.forEach(({ target, isIntersecting }) => {
+        if (isIntersecting) {
+          prefetchVisible.set(target, null);
+          schedulePrefetchOnView(target);
+          return;
         }
-      }
-    });
+        clearTimeout(prefetchVisible.get(target));
+        prefetchVisible.delete(target);
+        if (target.dataset.prefetchId) {
+          api.cancelTranscriptionPrefetch(target.dataset.prefetchId);
+          delete target.dataset.prefetchId;
+        }
+        // Élément retiré par la réconciliation
+        if (!target.isConnected) prefetchObserver.unobserve(target);
+      });
+    }, { rootMargin: "100px 0px" });
+  }
+  Array.from(elements).forEach(element => prefetchObserver.observe(element));
+}
+
+/**
+ * Lignes restées visibles dont le statut a pu changer (ex. passage à "done")
+ */
+function refreshPrefetchOnView() {
+  prefetchVisible.forEach((timer, element) => {
+    if (timer === null && !element.dataset.prefetchId) schedulePrefetchOnView(element);
   });
+}
+
+function schedulePrefetchOnView(element) {
+  const id = element.dataset.id;
+  if (element.dataset.prefetchId === id) return;
+  if (element.dataset.prefetchId) {
+    api.cancelTranscriptionPrefetch(element.dataset.prefetchId);
+    delete element.dataset.prefetchId;
+  }
+  clearTimeout(prefetchVisible.get(element));
+  prefetchVisible.set(element, setTimeout(() => {
+    prefetchVisible.set(element, null);
+    const entry = transcriptionsById.get(element.dataset.id);
+    if (!entry || !PREFETCH_VIEW_STATUSES.has(entry.status)) return;
+    element.dataset.prefetchId = entry.id;
+    api.prefetchTranscription(entry.id, { priority: "low" });
+  }, PREFETCH_VIEW_DWELL_MS));
+}
+
+// ============================================================================
+// ESTIMATION DE L'HEURE DE FIN (ETA)
+// ============================================================================
+
+const ETA_ACTIVE_STATUSES = new Set(["pending", "queued", "processing", "transcribed"]);
+// Regroupe les mises à jour WebSocket rapprochées en une seule estimation
+const ETA_REFRESH_DEBOUNCE_MS = 1000;
+// Réestimation même sans changement (la file avance, les workers changent)
+const ETA_MAX_AGE_MS = 60000;
+const ETA_HINT_INTERVAL_MS = 15000;
+
+// id de transcription -> heure de fin estimée (ms epoch)
+const transcriptionEtas = new Map();
+let etaRefreshTimer = null;
+let etaSignature = "";
+let etaRefreshedAt = 0;
+let etaHintTimer = null;
+
+function formatEtaHint(etaAt) {
+  const remaining = Math.round((etaAt - Date.now()) / 60000);
+  if (remaining < 1) return "~<1 min";
+  if (remaining < 60) return `~${remaining} min`;
+  return `~${Math.floor(remaining / 60)} h ${String(remaining % 60).padStart(2, "0")}`;
+}
+
+function patchEtaHint(row, entry) {
+  const hint = row.querySelector('.eta-hint');
+  const etaAt = ETA_ACTIVE_STATUSES.has(entry.status) ? transcriptionEtas.get(entry.id) : undefined;
+  setTextIfChanged(hint, etaAt ? formatEtaHint(etaAt) : '');
+  const title = etaAt ? `Fin estimée : ${new Date(etaAt).toLocaleTimeString('fr-FR', { hour: '2-digit', minute: '2-digit' })}` : '';
+  if (hint.title !== title) hint.title = title;
+}
+
+/**
+ * Met à jour les indications "~N min" des lignes affichées
+ */
+function updateEtaHints() {
+  const container = document.getElementById("grid-table-body");
+  if (!container) return;
+  container.querySelectorAll("tr[data-id]").forEach(row => {
+    const entry = transcriptionsById.get(row.dataset.id);
+    if (entry) patchEtaHint(row, entry);
+  });
+}
+
+/**
+ * Planifie une réestimation lorsque l'ensemble des transcriptions actives a changé
+ * (ou que la dernière estimation est trop ancienne)
+ */
+function scheduleEtaRefresh(transcriptions) {
+  const active = transcriptions.filter(entry => ETA_ACTIVE_STATUSES.has(entry.status));
+  if (active.length === 0) {
+    transcriptionEtas.clear();
+    clearInterval(etaHintTimer);
+    etaHintTimer = null;
+    return;
+  }
+  if (!etaHintTimer) etaHintTimer = setInterval(updateEtaHints, ETA_HINT_INTERVAL_MS);
+  
+  const signature = active.map(entry => `${entry.id}:${entry.status}`).join(",");
+  if (signature === etaSignature && Date.now() - etaRefreshedAt < ETA_MAX_AGE_MS) return;
+  etaSignature = signature;
+  clearTimeout(etaRefreshTimer);
+  etaRefreshTimer = setTimeout(() => refreshEtas(active), ETA_REFRESH_DEBOUNCE_MS);
+}
+
+async function refreshEtas(active) {
+  etaRefreshedAt = Date.now();
+  try {
+    const { etas } = await api.estimateTranscriptionEtas(active);
+    transcriptionEtas.clear();
+    Object.entries(etas || {}).forEach(([id, eta]) => transcriptionEtas.set(id, Date.parse(eta.eta_at)));
+    updateEtaHints();
+  } catch (err) {
+    console.warn("⚠️ ETA refresh failed:", err.message);
+  }
+}
+
+/**
+ * Crée le squelette (vide) d'une carte de transcription
+ */
+function createTranscriptionCard() {
+  const card = document.createElement("div");
+  card.className = "transcription-card";
+  card.innerHTML = `
+    <div class="transcription-card-header">
+      <div class="transcription-card-title"></div>
+    </div>
+    <div class="transcription-card-meta">
+      <span><strong>ID:</strong> <span class="card-id"></span></span>
+      <span><strong>Durée:</strong> <span class="card-duration"></span></span>
+      <span><strong>Créé:</strong> <span class="card-created"></span></span>
+    </div>
+    <div class="transcription-card-actions">
+      <button class="btn btn-primary btn-view-details-card">Voir détails</button>
+      <button class="btn btn-danger btn-delete-card">Supprimer</button>
+    </div>
+  `;
+  return card;
+}
+
+/**
+ * Remplit une carte (neuve, recyclée ou existante) avec les données d'une transcription.
+ * Seuls les champs modifiés sont réécrits.
+ */
+function fillTranscriptionCard(card, entry) {
+  if (card.dataset.id !== entry.id) {
+    card.dataset.id = entry.id;
+    card.style.opacity = "";
+    card.style.transform = "";
+    delete card.dataset.title;
+  }
+  const title = `${statusToBadge(entry.status)} ${escapeHtml(entry.project_name || 'N/A')}`;
+  if (card.dataset.title !== title) {
+    card.dataset.title = title;
+    card.querySelector(".transcription-card-title").innerHTML = title;
+  }
+  setTextIfChanged(card.querySelector(".card-id"), `${entry.id.substring(0, 12)}...`);
+  setTextIfChanged(card.querySelector(".card-duration"), entry.duration ? entry.duration.toFixed(1) + 's' : '-');
+  setTextIfChanged(card.querySelector(".card-created"), formatHumanDate(entry.created_at));
+}
+
+/**
+ * Délégation des clics sur le conteneur des cartes (attachée une seule fois :
+ * les cartes recyclées par la liste virtualisée n'ont pas d'écouteurs propres)
+ */
+function attachTranscriptionCardsEvents(cardsContainer) {
+  if (cardsContainer.dataset.eventsBound === "true") return;
+  cardsContainer.dataset.eventsBound = "true";
   
-  document.querySelectorAll(".btn-delete-card").forEach(btn => {
-    btn.addEventListener("click", async (e) => {
+  cardsContainer.addEventListener("click", (e) => {
+    const card = e.target.closest(".transcription-card[data-id]");
+    if (!card) return;
+    
+    if (e.target.closest(".btn-view-details-card")) {
       e.stopPropagation();
-      const id = btn.dataset.id;
-      if (!confirm(`Supprimer la transcription ${id.substring(0, 8)}... ?`)) return;
-      
-      try {
-        await api.deleteTranscription(id);
-        showToast("Transcription supprimée", "success");
-        const card = btn.closest(".transcription-card");
-        if (card) {
-          card.style.transition = "opacity 0.3s, transform 0.3s";
-          card.style.opacity = "0";
-          card.style.transform = "scale(0.95)";
-          setTimeout(() => {
-            requestDashboardUpdate(currentPage);
-          }, 300);
-        }
-      } catch (err) {
-        showToast(`Erreur lors de la suppression: ${err.message}`, "error");
-      }
-    });
+      openTranscriptionDetails(card.dataset.id);
+    } else if (e.target.closest(".btn-delete-card")) {
+      e.stopPropagation();
+      deleteTranscriptionWithConfirm(card.dataset.id, card);
+    }
   });
 }
 
@@ -984,70 +1071,6 @@ function createPageButton(page, text, isActive = false) {
     return btn;
 }
 
-/**
- * Attache les événements de clic sur les lignes
- */
-function attachRowClickEvents() {
-    document.querySelectorAll("#grid-table-body tr").forEach(row => {
-        row.addEventListener("click", async (e) => {
-            if (e.target.closest(".btn-delete")) return;
-            
-            const id = row.dataset.id;
-            openModal();
-            modalBody.innerHTML = `
-                <div style="text-align:center;padding:2rem;">
-                    <div class="spinner"></div>
-                    <p>Chargement des détails...</p>
-                </div>
-            `;
-            
-            try {
-                const data = await api.getTranscription(id);
-                renderTranscriptionModal(data);
-            } catch (err) {
-                if (modalBody) {
-                    modalBody.innerHTML = `
-                        <div style="text-align:center;padding:2rem;color:red;">
-                            <p>❌ Erreur: ${err.message}</p>
-                            <button onclick="closeModal()" class="btn btn-danger">Fermer</button>
-                        </div>
-                    `;
-                }
-            }
-        });
-    });
-}
-
-/**
- * Attache les événements de suppression
- */
-function attachDeleteEvents() {
-    document.querySelectorAll(".btn-delete").forEach(btn => {
-        btn.addEventListener("click", async (e) => {
-            e.stopPropagation();
-            const row = e.target.closest("tr");
-            const id = row.dataset.id;
-            
-            if (!confirm(`Supprimer la transcription ${id.substring(0, 8)}... ?`)) return;
-            
-            try {
-                await api.deleteTranscription(id);
-                showToast(`Transcription supprimée !`, "success");
-                
-                row.style.transition = "opacity 0.3s, transform 0.3s";
-                row.style.opacity = "0";
-                row.style.transform = "scale(0.95)";
-                
-                setTimeout(() => {
-                    refreshTranscriptions(currentPage, currentLimit);
-                }, 300);
-            } catch (err) {
-                showToast(`Erreur: ${err.message}`, "error");
-            }
-        });
-    });
-}
-
 // ============================================================================
 // GESTIONNAIRE WEBSOCKET
 // ============================================================================
@@ -1153,7 +1176,7 @@ function handleWebSocketMessage(msg) {
         console.log("WS <- S: ✅ Transcription mise à jour reçue directement");
         const updatedTranscription = msg.data?.transcription;
         if (updatedTranscription) {
-            updateTranscriptionInUI(updatedTranscription);
+            queueTranscriptionUpdate(updatedTranscription);
         }
         return;
     } else if (msg.type === "transcription_update_trigger") {
@@ -1167,7 +1190,7 @@ function handleWebSocketMessage(msg) {
         console.log("WS <- S: 📊 Données worker_stats (update) reçues");
         const stats = msg.data;
         updateWorkerHeader(stats);
-        renderWorkerMonitoringGrid(stats);
+        renderWorkersView(stats);
         return;
     } else if (msg.type === "error") {
         console.error(`WS <- S: Erreur WebSocket: ${msg.message}`);
@@ -1179,9 +1202,11 @@ function handleWebSocketMessage(msg) {
 
     // Si on a reçu un état complet (initial ou update)
     if (state) {
+        rememberDashboardState(state);
+
         // 1. Mettre à jour les workers (grille et header)
         if (state.worker_stats) {
-            renderWorkerMonitoringGrid(state.worker_stats);
+            renderWorkersView(state.worker_stats);
             updateWorkerHeader(state.worker_stats);
         }
         // 2. Mettre à jour la pagination (basé sur le compte)
@@ -1203,6 +1228,54 @@ function handleWebSocketMessage(msg) {
     }
 }
 
+// ============================================================================
+// ÉTAT LOCAL (INDEXEDDB) ET SERVICE WORKER
+// ============================================================================
+
+// Dernier état connu (les patches du worker WS ne contiennent que les clés modifiées)
+let latestDashboardState = {};
+
+/**
+ * Mémorise l'état reçu et le persiste s'il correspond à la vue par défaut
+ * (page 1, sans filtre), celle affichée au chargement suivant.
+ */
+function rememberDashboardState(state) {
+    latestDashboardState = { ...latestDashboardState, ...state };
+    const hasFilters = ["status-filter", "project-filter", "search-input"]
+        .some(id => document.getElementById(id)?.value);
+    if (currentPage === 1 && !hasFilters) {
+        dashboardStateStore.save(latestDashboardState);
+    }
+}
+
+/**
+ * Affiche immédiatement le dernier état sauvegardé, en attendant l'état du serveur
+ */
+async function renderStoredDashboardState() {
+    if (currentView !== "transcriptions") return;
+    const record = await dashboardStateStore.load();
+    if (!record || initialDataLoaded) return;
+    
+    const state = record.state || {};
+    latestDashboardState = state;
+    if (state.worker_stats) updateWorkerHeader(state.worker_stats);
+    if (state.transcriptions) {
+        renderTranscriptions(state.transcriptions, state.transcription_count, {});
+    }
+    if (state.transcription_count) {
+        updatePagination(1, Math.ceil((state.transcription_count.total_filtered || 0) / currentLimit));
+    }
+    console.log(`⚡ État local affiché (sauvegardé ${formatHumanDate(new Date(record.savedAt).toISOString())}), revalidation en cours...`);
+}
+
+if ("serviceWorker" in navigator) {
+    window.addEventListener("load", () => {
+        navigator.serviceWorker.register("/sw.js").catch(err => {
+            console.warn("⚠️ Service worker non enregistré:", err);
+        });
+    });
+}
+
 // ============================================================================
 // INITIALISATION
 // ============================================================================
@@ -1240,9 +1313,14 @@ async function setActiveView(view) {
     } else if (currentView === "workers") {
         console.log("⚡ Chargement immédiat des stats workers...");
         try {
-            const stats = await api.getWorkersStatus();
+            const stats = await api.getWorkersStatus({
+                onUpdate: (fresh) => {
+                    updateWorkerHeader(fresh);
+                    renderWorkersView(fresh);
+                }
+            });
             updateWorkerHeader(stats);
-            renderWorkerMonitoringGrid(stats);
+            renderWorkersView(stats);
         } catch (err) {
             console.error("Erreur lors du chargement des workers:", err);
         }
@@ -1251,10 +1329,12 @@ async function setActiveView(view) {
             showToast("Accès réservé aux administrateurs. Contactez un administrateur pour gérer les comptes.", "warning");
             return;
         }
+        const { loadUsersList } = await loadViewModule("users");
         await loadUsersList();
     } else if (currentView === "projects") {
         await populateProjectFilters();
     } else if (currentView === "statistics") {
+        const { loadPerformanceMetrics } = await loadViewModule("statistics");
         await loadPerformanceMetrics();
     }
     
@@ -1272,248 +1352,6 @@ async function setActiveView(view) {
     setContextBanner();
 }
 
-function createProjectSelector(user) {
-    const userProjectIds = new Set(user.projects.map(p => p.id));
-    const availableProjects = allProjects.filter(p => !userProjectIds.has(p.id));
-
-    if (availableProjects.length === 0) {
-        return `<small>Tous les projets sont assignés.</small>`;
-    }
-
-    const options = availableProjects.map(p => `<option value="${p.id}">${escapeHtml(p.name)}</option>`).join("");
-    return `
-        <div class="form-group-inline">
-            <select class="project-assign-select" data-user-id="${user.id}">
-                ${options}
-            </select>
-            <button class="btn btn-small btn-success btn-assign-project" data-user-id="${user.id}">Assigner</button>
-        </div>
-    `;
-}
-
-async function loadUsersList() {
-    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
-        return;
-    }
-    const container = document.getElementById("users-list-container");
-    if (!container) return;
-
-    container.innerHTML = "<p>Chargement des utilisateurs...</p>";
-    try {
-        const users = await api.listUsers();
-
-        if (!users.length) {
-            container.innerHTML = "<p>Aucun utilisateur créé.</p>";
-            return;
-        }
-
-        container.innerHTML = "";
-        users.forEach(user => {
-            const card = document.createElement("div");
-            card.className = "user-card";
-
-            const projectsList = user.projects.map(p => `
-                <li>
-                    <span>${escapeHtml(p.name)}</span>
-                    <button class="btn btn-small btn-danger btn-remove-project"
-                            data-user-id="${user.id}"
-                            data-project-id="${p.id}">
-                        Retirer
-                    </button>
-                </li>
-            `).join("");
-
-            card.innerHTML = `
-                <div class="user-header">
-                    <div>
-                        <strong>${escapeHtml(user.username)}</strong>
-                        ${user.is_admin ? '<span class="badge badge-admin">Admin</span>' : ''}
-                    </div>
-                    ${user.username !== 'admin'
-                        ? `<button class="btn btn-danger btn-delete-user" data-user-id="${user.id}">Supprimer</button>`
-                        : ''}
-                </div>
-                <div class="user-projects">
-                    <strong>Projets assignés:</strong>
-                    <ul class="user-projects-list">
-                        ${projectsList || '<li><small>Aucun projet assigné.</small></li>'}
-                    </ul>
-                    ${!user.is_admin ? createProjectSelector(user) : '<small>Les administrateurs ont accès à tous les projets.</small>'}
-                </div>
-            `;
-            container.appendChild(card);
-        });
-
-        attachUserCardEvents();
-    } catch (err) {
-        container.innerHTML = `<p style="color:red;">Erreur: ${err.message}</p>`;
-    }
-}
-
-function attachUserCardEvents() {
-    document.querySelectorAll(".btn-delete-user").forEach(btn => {
-        btn.addEventListener("click", async (event) => {
-            const userId = event.currentTarget.dataset.userId;
-            if (!userId) return;
-
-            if (!confirm("Supprimer cet utilisateur ?")) return;
-            try {
-                await api.deleteUser(userId);
-                showToast("Utilisateur supprimé", "success");
-                await loadUsersList();
-            } catch (err) {
-                showToast(`Erreur: ${err.message}`, "error");
-            }
-        });
-    });
-
-    document.querySelectorAll(".btn-assign-project").forEach(btn => {
-        btn.addEventListener("click", async (event) => {
-            const userId = event.currentTarget.dataset.userId;
-            if (!userId) return;
-            const select = document.querySelector(`.project-assign-select[data-user-id="${userId}"]`);
-            const projectId = select?.value;
-            if (!projectId) return;
-
-            try {
-                await api.assignProjectToUser(userId, projectId);
-                showToast("Projet assigné", "success");
-                await loadUsersList();
-            } catch (err) {
-                showToast(`Erreur: ${err.message}`, "error");
-            }
-        });
-    });
-
-    document.querySelectorAll(".btn-remove-project").forEach(btn => {
-        btn.addEventListener("click", async (event) => {
-            const userId = event.currentTarget.dataset.userId;
-            const projectId = event.currentTarget.dataset.projectId;
-            if (!userId || !projectId) return;
-
-            try {
-                await api.removeProjectFromUser(userId, projectId);
-                showToast("Projet retiré", "success");
-                await loadUsersList();
-            } catch (err) {
-                showToast(`Erreur: ${err.message}`, "error");
-            }
-        });
-    });
-}
-
-async function handleCreateProject() {
-    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
-        showToast("Fonction réservée aux administrateurs.", "warning");
-        return;
-    }
-
-    const input = document.getElementById("new-project-name-input");
-    if (!input) return;
-    const projectName = input.value.trim();
-    const adminKey = window.VOCALYX_CONFIG?.DEFAULT_PROJECT_KEY;
-
-    if (!projectName) {
-        showToast("Le nom du projet est requis", "warning");
-        return;
-    }
-    if (!adminKey) {
-        showToast("Clé admin indisponible", "error");
-        return;
-    }
-
-    try {
-        const newProject = await api.createProject(projectName, adminKey);
-        showToast(`Projet '${newProject.name}' créé`, "success");
-        input.value = "";
-        await populateProjectFilters();
-        await loadUsersList();
-    } catch (err) {
-        showToast(`Erreur: ${err.message}`, "error");
-    }
-}
-
-// Fonction pour calculer la force du mot de passe
-function calculatePasswordStrength(password) {
-    if (!password) return { strength: 'none', score: 0 };
-    
-    let score = 0;
-    if (password.length >= 6) score++;
-    if (password.length >= 8) score++;
-    if (/[a-z]/.test(password) && /[A-Z]/.test(password)) score++;
-    if (/\d/.test(password)) score++;
-    if (/[^a-zA-Z\d]/.test(password)) score++;
-    
-    if (score <= 2) return { strength: 'weak', score };
-    if (score <= 3) return { strength: 'medium', score };
-    return { strength: 'strong', score };
-}
-
-// Fonction pour mettre à jour le password strength meter
-function updatePasswordStrength(password) {
-    const strengthBar = document.getElementById("password-strength-bar");
-    if (!strengthBar) return;
-    
-    const { strength } = calculatePasswordStrength(password);
-    strengthBar.className = `password-strength-bar ${strength}`;
-}
-
-async function handleCreateUser() {
-    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
-        showToast("Fonction réservée aux administrateurs.", "warning");
-        return;
-    }
-    const usernameInput = document.getElementById("new-user-username");
-    const passwordInput = document.getElementById("new-user-password");
-    const isAdminInput = document.getElementById("new-user-is-admin");
-    if (!usernameInput || !passwordInput || !isAdminInput) return;
-
-    const username = usernameInput.value.trim();
-    const password = passwordInput.value.trim();
-    const isAdmin = isAdminInput.checked;
-
-    // Validations visuelles
-    if (!username) {
-        showToast("Nom d'utilisateur requis", "warning");
-        usernameInput.focus();
-        return;
-    }
-    if (username.length < 3) {
-        showToast("Le nom d'utilisateur doit contenir au moins 3 caractères", "warning");
-        usernameInput.focus();
-        return;
-    }
-    if (!password) {
-        showToast("Mot de passe requis", "warning");
-        passwordInput.focus();
-        return;
-    }
-    if (password.length < 6) {
-        showToast("Le mot de passe doit contenir au moins 6 caractères", "warning");
-        passwordInput.focus();
-        return;
-    }
-    
-    const { strength } = calculatePasswordStrength(password);
-    if (strength === 'weak') {
-        if (!confirm("Le mot de passe est faible. Voulez-vous continuer ?")) {
-            return;
-        }
-    }
-
-    try {
-        await api.createUser(username, password, isAdmin);
-        showToast(`Utilisateur créé: ${username}`, "success");
-        usernameInput.value = "";
-        passwordInput.value = "";
-        isAdminInput.checked = false;
-        updatePasswordStrength("");
-        await loadUsersList();
-    } catch (err) {
-        showToast(`Erreur lors de la création: ${err.message}`, "error");
-    }
-}
-
 document.addEventListener('DOMContentLoaded', async () => {
     console.log("✅ DOMContentLoaded fired");
     
@@ -1526,6 +1364,10 @@ document.addEventListener('DOMContentLoaded', async () => {
     viewWrappers = Array.from(document.querySelectorAll(".view-wrapper[data-view]"));
     
     navButtons.forEach(btn => {
+        // Précharger le module de la vue au survol du lien
+        btn.addEventListener("pointerenter", () => {
+            if (VIEW_MODULES[btn.dataset.view]) loadViewModule(btn.dataset.view).catch(() => {});
+        }, { once: true });
         btn.addEventListener("click", async (event) => {
             event.preventDefault();
             const view = btn.dataset.view;
@@ -1545,6 +1387,10 @@ document.addEventListener('DOMContentLoaded', async () => {
         });
     });
     
+    // Rendu immédiat depuis IndexedDB (revalidé par l'état initial du WebSocket)
+    await renderStoredDashboardState();
+    seedWorkerSparkline();
+    
     console.log("🚀 Lancement du chargement des filtres projets...");
     await populateProjectFilters();
     console.log("✅ Filtres projets chargés.");
@@ -1649,18 +1495,33 @@ document.addEventListener('DOMContentLoaded', async () => {
 
     const createProjectBtn = document.getElementById("create-project-btn");
     if (createProjectBtn) {
-        createProjectBtn.addEventListener("click", handleCreateProject);
+        createProjectBtn.addEventListener("click", async () => {
+            const { handleCreateProject } = await loadViewModule("projects");
+            await handleCreateProject();
+        });
+    }
+
+    const capacityPlanBtn = document.getElementById("capacity-plan-btn");
+    if (capacityPlanBtn) {
+        capacityPlanBtn.addEventListener("click", async () => {
+            const { handleCapacityPlan } = await loadViewModule("workers");
+            await handleCapacityPlan();
+        });
     }
 
     const createUserBtn = document.getElementById("create-user-btn");
     if (createUserBtn) {
-        createUserBtn.addEventListener("click", handleCreateUser);
+        createUserBtn.addEventListener("click", async () => {
+            const { handleCreateUser } = await loadViewModule("users");
+            await handleCreateUser();
+        });
     }
     
     // Password strength meter
     const passwordInput = document.getElementById("new-user-password");
     if (passwordInput) {
-        passwordInput.addEventListener("input", (e) => {
+        passwordInput.addEventListener("input", async (e) => {
+            const { updatePasswordStrength } = await loadViewModule("users");
             updatePasswordStrength(e.target.value);
         });
     }
@@ -1710,85 +1571,8 @@ document.addEventListener('DOMContentLoaded', () => {
   const refreshMetricsBtn = document.getElementById('refresh-metrics-btn');
   if (refreshMetricsBtn) {
     refreshMetricsBtn.addEventListener('click', async () => {
+      const { loadPerformanceMetrics } = await loadViewModule("statistics");
       await loadPerformanceMetrics();
     });
   }
 });
-
-/**
- * ✅ NOUVEAU : Charge et affiche les métriques de performance
- */
-async function loadPerformanceMetrics() {
-    const container = document.getElementById('performance-metrics-container');
-    if (!container) return;
-    
-    container.innerHTML = '<p style="text-align: center; color: #64748b;">Chargement des métriques...</p>';
-    
-    try {
-        const metrics = await api.getTranscriptionMetrics();
-        
-        if (!metrics || metrics.total_transcriptions === 0) {
-            container.innerHTML = '<p style="text-align: center; color: #64748b; padding: 2rem;">Aucune métrique disponible pour le moment.</p>';
-            return;
-        }
-        
-        const metricsHtml = `
-            <div class="metrics-summary-grid">
-                <div class="metric-summary-card">
-                    <div class="metric-summary-label">Total transcriptions</div>
-                    <div class="metric-summary-value">${metrics.total_transcriptions}</div>
-                </div>
-                <div class="metric-summary-card">
-                    <div class="metric-summary-label">⏳ Temps d'attente moyen</div>
-                    <div class="metric-summary-value" style="color: #ff9800;">${formatDuration(metrics.avg_queue_wait_time)}</div>
-                    <div class="metric-summary-detail">Min: ${formatDuration(metrics.min_queue_wait_time)} | Max: ${formatDuration(metrics.max_queue_wait_time)}</div>
-                </div>
-                <div class="metric-summary-card">
-                    <div class="metric-summary-label">⚙️ Temps de traitement moyen</div>
-                    <div class="metric-summary-value" style="color: #4a90e2;">${formatDuration(metrics.avg_processing_time)}</div>
-                    <div class="metric-summary-detail">Min: ${formatDuration(metrics.min_processing_time)} | Max: ${formatDuration(metrics.max_processing_time)}</div>
-                </div>
-                <div class="metric-summary-card">
-                    <div class="metric-summary-label">⏱️ Temps total moyen</div>
-                    <div class="metric-summary-value" style="color: #28a745;">${formatDuration(metrics.avg_total_time)}</div>
-                    <div class="metric-summary-detail">Attente + Traitement</div>
-                </div>
-            </div>
-            
-            <div style="margin-top: 2rem;">
-                <h3 style="margin-bottom: 1rem;">Distribution des temps de traitement</h3>
-                <div class="distribution-grid">
-                    ${Object.entries(metrics.processing_time_distribution || {}).map(([range, count]) => `
-                        <div class="distribution-item">
-                            <span class="distribution-range">${range}</span>
-                            <div class="distribution-bar">
-                                <div class="distribution-bar-fill" style="width: ${(count / metrics.total_transcriptions) * 100}%"></div>
-                            </div>
-                            <span class="distribution-count">${count}</span>
-                        </div>
-                    `).join('')}
-                </div>
-            </div>
-            
-            <div style="margin-top: 2rem;">
-                <h3 style="margin-bottom: 1rem;">Distribution des temps d'attente</h3>
-                <div class="distribution-grid">
-                    ${Object.entries(metrics.queue_wait_time_distribution || {}).map(([range, count]) => `
-                        <div class="distribution-item">
-                            <span class="distribution-range">${range}</span>
-                            <div class="distribution-bar">
-                                <div class="distribution-bar-fill" style="width: ${(count / metrics.total_transcriptions) * 100}%; background: #ff9800;"></div>
-                            </div>
-                            <span class="distribution-count">${count}</span>
-                        </div>
-                    `).join('')}
-                </div>
-            </div>
-        `;
-        
-        container.innerHTML = metricsHtml;
-    } catch (err) {
-        console.error('Erreur lors du chargement des métriques:', err);
-        container.innerHTML = `<p style="text-align: center; color: #dc3545; padding: 2rem;">Erreur: ${err.message}</p>`;
-    }
-}
\ No newline at end of file
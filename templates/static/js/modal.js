@@ -33,6 +33,7 @@ function openModal(data = null) {
  */
 function closeModal() {
     if (modal) {
+        closeSegmentsView();
         modal.style.display = "none";
         document.body.style.overflow = "";
         document.removeEventListener("keydown", handleKeyDown);
@@ -67,12 +68,10 @@ window.onclick = (event) => {
 function renderTranscriptionModal(data) {
     currentTranscriptionData = data;
     
-    const segmentsHtml = (data.segments || []).map((seg, idx) => `
-        <div class="segment" data-start="${seg.start}" data-end="${seg.end}" data-index="${idx}" tabindex="0" 
-             title="Durée: ${seg.start}s - ${seg.end}s">
-            <strong>[${seg.start.toFixed(2)}s - ${seg.end.toFixed(2)}s]</strong> ${escapeHtml(seg.text || '')}
-        </div>
-    `).join('');
+    // Les segments ne sont inclus que si la transcription a été chargée complète ;
+    // sinon ils sont récupérés par fenêtres via /segments à l'ouverture de l'onglet.
+    // Dans les deux cas la liste est virtualisée (voir openSegmentsView).
+    const inlineSegments = Array.isArray(data.segments) ? data.segments : null;
     
     const fullText = data.text || 'Aucun texte disponible.';
     const jsonData = JSON.stringify(data, null, 2);
@@ -321,9 +320,8 @@ function renderTranscriptionModal(data) {
             <div class="segments-layout">
                 <div class="segments-panel">
                     <h3>Segments (${data.segments_count || 0})</h3>
-                    <div class="segments-list">
-                        ${segmentsHtml || '<p style="color:#64748b;text-align:center;padding:2rem;">Aucun segment disponible.</p>'}
-                    </div>
+                    <div class="segments-list" id="segments-list"></div>
+                    <small class="segments-progress" id="segments-progress"></small>
                 </div>
                 <div class="text-panel">
                     <div class="text-panel-header">
@@ -456,9 +454,16 @@ function renderTranscriptionModal(data) {
             tab.classList.add("active");
             const content = document.querySelector(`[data-content="${targetTab}"]`);
             if (content) content.classList.add("active");
+            
+            // Premier affichage des segments : créer la liste virtualisée
+            if (targetTab === "segments" && !segmentsView) {
+                openSegmentsView(data, inlineSegments);
+            }
         });
     });
     
+    closeSegmentsView();
+    
     // Ajouter les événements de clic sur les segments avec surlignage
     attachSegmentEvents(data);
     
@@ -476,32 +481,176 @@ function renderTranscriptionModal(data) {
  * Attache les événements de sélection de segments avec surlignage
  */
 function attachSegmentEvents(data) {
-    const segments = document.querySelectorAll(".segment");
+    const list = document.getElementById("segments-list");
+    if (!list) return;
     const fullText = data.text || '';
     
-    segments.forEach(seg => {
-        seg.addEventListener("click", () => {
-            // Désélectionner tous les segments
-            document.querySelectorAll(".segment").forEach(s => {
-                s.classList.remove("selected");
-            });
-            
-            // Sélectionner le segment cliqué
-            seg.classList.add("selected");
-            
-            // Surligner dans le texte complet
-            highlightTextInFullText(seg, fullText);
-        });
+    // Délégation sur la liste : les segments chargés plus tard sont couverts
+    list.addEventListener("click", (e) => {
+        const seg = e.target.closest(".segment");
+        if (!seg) return;
         
-        seg.addEventListener("keydown", (e) => {
-            if (e.key === "Enter" || e.key === " ") {
-                e.preventDefault();
-                seg.click();
-            }
+        // Désélectionner tous les segments
+        list.querySelectorAll(".segment.selected").forEach(s => {
+            s.classList.remove("selected");
         });
+        
+        // Sélectionner le segment cliqué (mémorisé pour les lignes recyclées)
+        seg.classList.add("selected");
+        if (segmentsView) segmentsView.selectedIndex = Number(seg.dataset.index);
+        
+        // Surligner dans le texte complet
+        highlightTextInFullText(seg, fullText);
+    });
+    
+    list.addEventListener("keydown", (e) => {
+        const seg = e.target.closest(".segment");
+        if (seg && (e.key === "Enter" || e.key === " ")) {
+            e.preventDefault();
+            seg.click();
+        }
     });
 }
 
+// ============================================================================
+// SEGMENTS (LISTE VIRTUALISÉE, CHARGEMENT PAR FENÊTRES)
+// ============================================================================
+
+const SEGMENTS_WINDOW_SIZE = 200;
+const SEGMENT_ROW_HEIGHT = 72;
+let segmentsView = null;
+
+/**
+ * Crée la liste virtualisée des segments.
+ * Les segments déjà présents (payload complet) sont utilisés tels quels, sinon ils
+ * sont chargés par fenêtres de SEGMENTS_WINDOW_SIZE au fil du défilement.
+ */
+function openSegmentsView(data, inlineSegments) {
+    const list = document.getElementById("segments-list");
+    if (!list) return;
+    
+    const state = {
+        transcriptionId: data.id,
+        inline: !!inlineSegments,
+        items: inlineSegments ? inlineSegments.map((seg, index) => ({ ...seg, index })) : [],
+        total: inlineSegments ? inlineSegments.length : 0,
+        loadedPages: new Set(),
+        loadingPages: new Set(),
+        selectedIndex: null,
+        list: null
+    };
+    segmentsView = state;
+    
+    state.list = new VirtualList(list, {
+        rowHeight: SEGMENT_ROW_HEIGHT,
+        overscan: 10,
+        itemCount: state.total,
+        createRow: createSegmentRow,
+        updateRow: (node, index) => fillSegmentRow(node, state.items[index], index, state),
+        onRangeChange: (first, last) => ensureSegmentsLoaded(state, first, last)
+    });
+    
+    if (state.inline) {
+        updateSegmentsProgress(state);
+    } else {
+        ensureSegmentsLoaded(state, 0, 1);
+    }
+}
+
+/**
+ * Libère la liste virtualisée de la transcription précédente
+ */
+function closeSegmentsView() {
+    if (segmentsView?.list) segmentsView.list.destroy();
+    segmentsView = null;
+}
+
+function createSegmentRow() {
+    const row = document.createElement("div");
+    row.className = "segment-row";
+    const seg = document.createElement("div");
+    seg.className = "segment";
+    seg.tabIndex = 0;
+    row.appendChild(seg);
+    return row;
+}
+
+function fillSegmentRow(row, seg, index, state) {
+    const el = row.firstElementChild;
+    el.dataset.index = index;
+    if (!seg) {
+        el.classList.add("segment-placeholder");
+        el.classList.remove("selected");
+        el.removeAttribute("data-start");
+        el.removeAttribute("data-end");
+        el.title = "";
+        el.textContent = "Chargement…";
+        return;
+    }
+    const start = Number(seg.start) || 0;
+    const end = Number(seg.end) || 0;
+    el.classList.remove("segment-placeholder");
+    el.classList.toggle("selected", state.selectedIndex === index);
+    el.dataset.start = start;
+    el.dataset.end = end;
+    el.title = `Durée: ${start}s - ${end}s\n${seg.text || ''}`;
+    el.innerHTML = `<strong>[${start.toFixed(2)}s - ${end.toFixed(2)}s]</strong> ${escapeHtml(seg.text || '')}`;
+}
+
+/**
+ * Charge les fenêtres couvrant les index [first, last)
+ */
+function ensureSegmentsLoaded(state, first, last) {
+    if (state.inline) return;
+    const firstPage = Math.floor(first / SEGMENTS_WINDOW_SIZE);
+    const lastPage = Math.floor(Math.max(first, last - 1) / SEGMENTS_WINDOW_SIZE);
+    for (let page = firstPage; page <= lastPage; page++) {
+        if (!state.loadedPages.has(page) && !state.loadingPages.has(page)) {
+            loadSegmentsPage(state, page);
+        }
+    }
+}
+
+async function loadSegmentsPage(state, page) {
+    state.loadingPages.add(page);
+    try {
+        const result = await api.getTranscriptionSegments(state.transcriptionId, {
+            offset: page * SEGMENTS_WINDOW_SIZE,
+            limit: SEGMENTS_WINDOW_SIZE
+        });
+        // La modale a pu changer de transcription pendant la requête
+        if (segmentsView !== state) return;
+        
+        result.segments.forEach(seg => { state.items[seg.index] = seg; });
+        state.loadedPages.add(page);
+        if (state.total !== result.total) {
+            state.total = result.total;
+            state.list.setItemCount(result.total);
+        } else {
+            state.list.refresh();
+        }
+        updateSegmentsProgress(state);
+    } catch (err) {
+        const progress = document.getElementById("segments-progress");
+        if (progress && segmentsView === state) {
+            progress.textContent = `Erreur de chargement des segments: ${err.message}`;
+        }
+    } finally {
+        state.loadingPages.delete(page);
+    }
+}
+
+function updateSegmentsProgress(state) {
+    const progress = document.getElementById("segments-progress");
+    if (!progress) return;
+    if (!state.total) {
+        progress.textContent = "Aucun segment disponible.";
+        return;
+    }
+    const loaded = state.inline ? state.total : Math.min(state.total, state.loadedPages.size * SEGMENTS_WINDOW_SIZE);
+    progress.textContent = `${state.total} segments · ${loaded} chargés`;
+}
+
 /**
  * Surligne le texte du segment dans le texte complet
  */
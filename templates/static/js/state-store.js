@@ -0,0 +1,79 @@
+// templates/static/js/state-store.js
+// Persistance du dernier état du dashboard (IndexedDB) pour un rendu immédiat au rechargement
+
+/**
+ * Stocke le dernier état complet reçu par WebSocket (page 1, sans filtre) afin de
+ * l'afficher dès le chargement suivant, avant que le serveur ne renvoie l'état à jour.
+ * L'état est associé à l'utilisateur courant et ignoré s'il est trop ancien.
+ */
+class DashboardStateStore {
+    constructor({ dbName = "vocalyx-dashboard", storeName = "state", maxAgeMs = 24 * 3600 * 1000 } = {}) {
+        this.dbName = dbName;
+        this.storeName = storeName;
+        this.maxAgeMs = maxAgeMs;
+        this._db = null;
+        this._pending = null;
+        this._timer = null;
+    }
+    
+    _open() {
+        if (!window.indexedDB) return Promise.reject(new Error("IndexedDB indisponible"));
+        if (this._db) return this._db;
+        this._db = new Promise((resolve, reject) => {
+            const request = indexedDB.open(this.dbName, 1);
+            request.onupgradeneeded = () => request.result.createObjectStore(this.storeName);
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+        this._db.catch(() => { this._db = null; });
+        return this._db;
+    }
+    
+    _key() {
+        return `dashboard:${window.VOCALYX_CONFIG?.USERNAME || "anonymous"}`;
+    }
+    
+    /**
+     * Retourne le dernier état sauvegardé pour l'utilisateur courant (ou null)
+     */
+    async load() {
+        try {
+            const db = await this._open();
+            const record = await new Promise((resolve, reject) => {
+                const request = db.transaction(this.storeName, "readonly").objectStore(this.storeName).get(this._key());
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+            if (!record || Date.now() - record.savedAt > this.maxAgeMs) return null;
+            return record;
+        } catch (err) {
+            debugLog("⚠️ Lecture de l'état local impossible:", err);
+            return null;
+        }
+    }
+    
+    /**
+     * Sauvegarde (regroupée) de l'état : au plus une écriture toutes les `delayMs`
+     */
+    save(state, delayMs = 2000) {
+        this._pending = state;
+        if (this._timer) return;
+        this._timer = setTimeout(() => {
+            this._timer = null;
+            const record = { state: this._pending, savedAt: Date.now() };
+            this._pending = null;
+            this._write(record);
+        }, delayMs);
+    }
+    
+    async _write(record) {
+        try {
+            const db = await this._open();
+            db.transaction(this.storeName, "readwrite").objectStore(this.storeName).put(record, this._key());
+        } catch (err) {
+            debugLog("⚠️ Écriture de l'état local impossible:", err);
+        }
+    }
+}
+
+const dashboardStateStore = new DashboardStateStore();
@@ -0,0 +1,151 @@
+// templates/static/js/typeahead.js
+// Autocomplétion de la recherche : suggestions servies par /api/search/suggest
+
+/**
+ * Liste de suggestions attachée à un champ texte.
+ * - les frappes sont regroupées (debounce) et la requête précédente est annulée
+ * - navigation au clavier (↑ / ↓ / Entrée / Échap)
+ * - `onSelect(suggestion)` est appelé au choix d'une suggestion
+ */
+class SearchTypeahead {
+    constructor(input, { fetchSuggestions, onSelect, debounceMs = 120, minLength = 2, limit = 8 }) {
+        this.input = input;
+        this.fetchSuggestions = fetchSuggestions;
+        this.onSelect = onSelect;
+        this.debounceMs = debounceMs;
+        this.minLength = minLength;
+        this.limit = limit;
+
+        this.suggestions = [];
+        this.activeIndex = -1;
+        this.timer = null;
+        this.controller = null;
+        this.lastQuery = null;
+
+        this.list = document.createElement("ul");
+        this.list.className = "search-suggestions";
+        this.list.id = `${input.id || "search"}-suggestions`;
+        this.list.setAttribute("role", "listbox");
+        this.list.hidden = true;
+        input.parentElement.classList.add("has-suggestions");
+        input.insertAdjacentElement("afterend", this.list);
+
+        input.setAttribute("autocomplete", "off");
+        input.setAttribute("role", "combobox");
+        input.setAttribute("aria-autocomplete", "list");
+        input.setAttribute("aria-controls", this.list.id);
+        input.setAttribute("aria-expanded", "false");
+
+        input.addEventListener("input", () => this._schedule());
+        input.addEventListener("keydown", (e) => this._onKeyDown(e));
+        input.addEventListener("blur", () => setTimeout(() => this.close(), 150));
+        // Premier focus : l'index du serveur est (ré)alimenté en arrière-plan
+        input.addEventListener("focus", () => this._warmUp(), { once: true });
+        // mousedown plutôt que click : le choix précède la perte de focus du champ
+        this.list.addEventListener("mousedown", (e) => {
+            const item = e.target.closest("li[data-index]");
+            if (!item) return;
+            e.preventDefault();
+            this._select(parseInt(item.dataset.index, 10));
+        });
+    }
+
+    get isOpen() {
+        return !this.list.hidden;
+    }
+
+    _warmUp() {
+        this.fetchSuggestions("", { limit: 1 }).catch(() => {});
+    }
+
+    _schedule() {
+        clearTimeout(this.timer);
+        const query = this.input.value.trim();
+        if (query.length < this.minLength) {
+            this._abort();
+            this.lastQuery = null;
+            this.close();
+            return;
+        }
+        this.timer = setTimeout(() => this._load(query), this.debounceMs);
+    }
+
+    _abort() {
+        if (this.controller) {
+            this.controller.abort();
+            this.controller = null;
+        }
+    }
+
+    async _load(query) {
+        if (query === this.lastQuery) return;
+        this._abort();
+        const controller = new AbortController();
+        this.controller = controller;
+        try {
+            const result = await this.fetchSuggestions(query, { limit: this.limit, signal: controller.signal });
+            if (controller !== this.controller) return;
+            this.lastQuery = query;
+            this._render(result?.suggestions || []);
+        } catch (err) {
+            if (err.name !== "AbortError") debugLog("Suggestions indisponibles:", err.message);
+        } finally {
+            if (controller === this.controller) this.controller = null;
+        }
+    }
+
+    _render(suggestions) {
+        this.suggestions = suggestions;
+        this.activeIndex = -1;
+        if (suggestions.length === 0) {
+            this.close();
+            return;
+        }
+        const labels = { project: "Projet", title: "Titre", file: "Fichier" };
+        this.list.innerHTML = suggestions.map((suggestion, index) => `
+            <li id="${this.list.id}-${index}" role="option" data-index="${index}" class="search-suggestion">
+                <span class="search-suggestion-type type-${escapeHtml(suggestion.type)}">${labels[suggestion.type] || escapeHtml(suggestion.type)}</span>
+                <span class="search-suggestion-label">${escapeHtml(suggestion.label)}</span>
+                ${suggestion.type !== "project" && suggestion.project_name ? `<small>${escapeHtml(suggestion.project_name)}</small>` : ""}
+            </li>
+        `).join("");
+        this.list.hidden = false;
+        this.input.setAttribute("aria-expanded", "true");
+    }
+
+    _setActive(index) {
+        const items = this.list.querySelectorAll("li[data-index]");
+        if (items.length === 0) return;
+        this.activeIndex = (index + items.length) % items.length;
+        items.forEach((item, i) => item.classList.toggle("active", i === this.activeIndex));
+        this.input.setAttribute("aria-activedescendant", items[this.activeIndex].id);
+    }
+
+    _onKeyDown(e) {
+        if (!this.isOpen) return;
+        if (e.key === "ArrowDown" || e.key === "ArrowUp") {
+            e.preventDefault();
+            this._setActive(this.activeIndex + (e.key === "ArrowDown" ? 1 : -1));
+        } else if (e.key === "Enter" && this.activeIndex >= 0) {
+            // Empêche la recherche plein texte déclenchée par Entrée
+            e.preventDefault();
+            e.stopImmediatePropagation();
+            this._select(this.activeIndex);
+        } else if (e.key === "Escape") {
+            this.close();
+        }
+    }
+
+    _select(index) {
+        const suggestion = this.suggestions[index];
+        this.close();
+        if (suggestion) this.onSelect(suggestion);
+    }
+
+    close() {
+        this.list.hidden = true;
+        this.activeIndex = -1;
+        this.input.setAttribute("aria-expanded", "false");
+        this.input.removeAttribute("aria-activedescendant");
+    }
+}
@@ -1,6 +1,26 @@
 // utils.js
 // Utilitaires généraux
 
+/**
+ * Indique si les logs verbeux sont activés : `DEBUG` dans VOCALYX_CONFIG (LOG_LEVEL=DEBUG
+ * côté serveur), ou surcharge locale via `localStorage.vocalyx_debug = "1"`.
+ */
+function isDebugEnabled() {
+    try {
+        if (window.localStorage?.getItem("vocalyx_debug") === "1") return true;
+    } catch (e) {
+        // localStorage indisponible (navigation privée...)
+    }
+    return !!window.VOCALYX_CONFIG?.DEBUG;
+}
+
+/**
+ * console.log réservé au mode debug (évite de sérialiser de gros objets dans la console)
+ */
+function debugLog(...args) {
+    if (isDebugEnabled()) console.log(...args);
+}
+
 /**
  * Formate une date ISO en format lisible français
  */
@@ -123,4 +143,54 @@ function createProgressBar(percent) {
             </div>
         </div>
     `;
-}
\ No newline at end of file
+}
+/**
+ * Met à jour le texte d'un élément uniquement s'il a changé (évite les écritures DOM inutiles)
+ */
+function setTextIfChanged(el, text) {
+    if (el && el.textContent !== text) {
+        el.textContent = text;
+    }
+}
+
+/**
+ * Réconcilie les enfants d'un conteneur avec une liste d'éléments identifiés par clé.
+ * Les nœuds existants (repérés par data-id) sont réutilisés et patchés sur place,
+ * les nouveaux sont créés, les absents supprimés, et l'ordre est corrigé sans
+ * déplacer les nœuds déjà à leur place.
+ *
+ * Options :
+ *  - key(item)         : clé unique de l'élément (défaut : item.id)
+ *  - create(item)      : crée un nouveau nœud
+ *  - patch(node, item) : met à jour le nœud sur place
+ */
+function reconcileKeyedChildren(container, items, { key = item => item.id, create, patch }) {
+    const existing = new Map();
+    Array.from(container.children).forEach(node => {
+        if (node.dataset && node.dataset.id) {
+            existing.set(node.dataset.id, node);
+        } else {
+            node.remove(); // placeholder ("Aucune transcription", erreur...)
+        }
+    });
+
+    let cursor = container.firstElementChild;
+    items.forEach(item => {
+        const id = String(key(item));
+        let node = existing.get(id);
+        if (node) {
+            existing.delete(id);
+        } else {
+            node = create(item);
+            node.dataset.id = id;
+        }
+        patch(node, item);
+        if (node === cursor) {
+            cursor = cursor.nextElementSibling;
+        } else {
+            container.insertBefore(node, cursor);
+        }
+    });
+
+    existing.forEach(node => node.remove());
+}
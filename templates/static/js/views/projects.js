@@ -0,0 +1,211 @@
+// templates/static/js/views/projects.js
+// Vue Projets (administration) : cartes, tableau, création
+// Module ES chargé à la demande par setActiveView (voir loadViewModule dans main.js).
+// Les utilitaires (api, showToast, escapeHtml...) restent des globaux des scripts classiques.
+import { loadUsersList } from "./users.js";
+
+function formatApiKeyPreview(key) {
+    if (!key) return "—";
+    const trimmed = String(key).trim();
+    if (trimmed.length <= 12) return trimmed;
+    return `${trimmed.slice(0, 6)}…${trimmed.slice(-4)}`;
+}
+
+function renderProjectsBoard(projects) {
+    const grid = document.getElementById("projects-grid");
+    if (!grid) return;
+    
+    if (!Array.isArray(projects) || projects.length === 0) {
+        grid.innerHTML = `<div class="section-empty">Aucun projet actif pour le moment.</div>`;
+        return;
+    }
+    
+    const fragment = document.createDocumentFragment();
+    const defaultProjectName = window.VOCALYX_CONFIG?.DEFAULT_PROJECT_NAME;
+    
+    projects.forEach(project => {
+        const card = document.createElement("article");
+        card.className = "project-card";
+        
+        const createdAt = project.created_at ? formatHumanDate(project.created_at) : "—";
+        const isAdmin = window.VOCALYX_CONFIG?.USER_IS_ADMIN && project.name === defaultProjectName;
+        
+        card.innerHTML = `
+            <div class="project-card-header">
+                <h3>${escapeHtml(project.name || "Sans nom")}</h3>
+                ${isAdmin ? '<span class="badge badge-admin">Admin</span>' : ''}
+            </div>
+            <p class="project-meta">Créé le ${escapeHtml(createdAt)}</p>
+            <div class="project-key">${escapeHtml(formatApiKeyPreview(project.api_key))}</div>
+            <div class="project-card-actions">
+                <button class="btn btn-primary btn-copy-key" data-project="${escapeHtml(project.name)}" title="Copier la clé API">
+                    📋 Copier clé
+                </button>
+                <button class="btn btn-success btn-view-details" data-project="${escapeHtml(project.name)}" title="Voir les détails">
+                    👁️ Détails
+                </button>
+            </div>
+        `;
+        
+        fragment.appendChild(card);
+    });
+    
+    grid.innerHTML = "";
+    grid.appendChild(fragment);
+    
+    // Attacher les événements des boutons
+    attachProjectCardEvents();
+}
+
+function attachProjectCardEvents() {
+    // Copier la clé API
+    document.querySelectorAll(".btn-copy-key").forEach(btn => {
+        btn.addEventListener("click", async (e) => {
+            e.stopPropagation();
+            const projectName = btn.dataset.project;
+            if (!projectName) return;
+            
+            const project = window.VOCALYX_PROJECT_MAP?.[projectName];
+            if (!project?.api_key) {
+                showToast("Clé API non disponible", "error");
+                return;
+            }
+            
+            try {
+                await navigator.clipboard.writeText(project.api_key);
+                showToast(`Clé API de "${projectName}" copiée !`, "success");
+            } catch (err) {
+                showToast("Erreur lors de la copie", "error");
+            }
+        });
+    });
+    
+    // Voir les détails
+    document.querySelectorAll(".btn-view-details").forEach(btn => {
+        btn.addEventListener("click", async (e) => {
+            e.stopPropagation();
+            const projectName = btn.dataset.project;
+            if (!projectName) return;
+            
+            const project = window.VOCALYX_PROJECT_MAP?.[projectName];
+            if (!project) {
+                showToast("Projet non trouvé", "error");
+                return;
+            }
+            
+            openModal();
+            modalBody.innerHTML = `
+                <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:1rem;">
+                    <h2>Détails du Projet</h2>
+                    <button class="btn btn-primary" onclick="closeModal()">← Retour</button>
+                </div>
+                <div style="background:#f9f9f9;padding:1.5rem;border-radius:12px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
+                    <h3>${escapeHtml(project.name || 'Sans nom')}</h3>
+                    <p><strong>Clé API:</strong> <code style="background:#fff;padding:0.3rem 0.6rem;border-radius:4px;display:inline-block;margin-left:0.5rem;">${escapeHtml(project.api_key || 'N/A')}</code></p>
+                    <p><strong>Créé le:</strong> ${escapeHtml(formatHumanDate(project.created_at))}</p>
+                    ${project.description ? `<p><strong>Description:</strong> ${escapeHtml(project.description)}</p>` : ''}
+                </div>
+            `;
+        });
+    });
+}
+
+function attachApiKeyRevealEvents() {
+    document.querySelectorAll(".api-key-reveal").forEach(input => {
+        input.addEventListener("click", (e) => {
+            const target = e.currentTarget;
+            const projectName = target.dataset.project;
+            if (!projectName) return;
+
+            const projectDetails = window.VOCALYX_PROJECT_MAP?.[projectName];
+            if (!projectDetails?.api_key) {
+                target.value = "Clé indisponible";
+                target.type = "text";
+                return;
+            }
+
+            if (target.dataset.loaded === "true") {
+                target.type = target.type === "password" ? "text" : "password";
+                return;
+            }
+
+            target.value = projectDetails.api_key;
+            target.type = "text";
+            target.dataset.loaded = "true";
+        });
+    });
+}
+
+function renderProjectsTable(projects) {
+    const tableBody = document.getElementById("projects-table-body");
+    if (!tableBody) return;
+
+    if (!Array.isArray(projects)) {
+        tableBody.innerHTML = `<tr><td colspan="3" style="text-align:center;color:red;">Erreur de chargement</td></tr>`;
+        return;
+    }
+
+    if (projects.length === 0) {
+        tableBody.innerHTML = `<tr><td colspan="3" style="text-align:center;">Aucun projet créé.</td></tr>`;
+        return;
+    }
+
+    tableBody.innerHTML = "";
+    projects.forEach(p => {
+        const row = document.createElement("tr");
+        row.innerHTML = `
+            <td><strong>${escapeHtml(p.name)}</strong></td>
+            <td>
+                <input type="password"
+                       value="••••••••"
+                       title="Cliquez pour récupérer la clé"
+                       data-project="${escapeHtml(p.name)}"
+                       class="api-key-reveal"
+                       readonly>
+            </td>
+            <td>${escapeHtml(formatHumanDate(p.created_at))}</td>
+        `;
+        tableBody.appendChild(row);
+    });
+
+    attachApiKeyRevealEvents();
+}
+
+/**
+ * Rend les cartes et le tableau des projets
+ */
+export function renderProjects(projects) {
+    renderProjectsBoard(projects);
+    renderProjectsTable(projects);
+}
+
+export async function handleCreateProject() {
+    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
+        showToast("Fonction réservée aux administrateurs.", "warning");
+        return;
+    }
+
+    const input = document.getElementById("new-project-name-input");
+    if (!input) return;
+    const projectName = input.value.trim();
+    const adminKey = window.VOCALYX_CONFIG?.DEFAULT_PROJECT_KEY;
+
+    if (!projectName) {
+        showToast("Le nom du projet est requis", "warning");
+        return;
+    }
+    if (!adminKey) {
+        showToast("Clé admin indisponible", "error");
+        return;
+    }
+
+    try {
+        const newProject = await api.createProject(projectName, adminKey);
+        showToast(`Projet '${newProject.name}' créé`, "success");
+        input.value = "";
+        await populateProjectFilters();
+        await loadUsersList();
+    } catch (err) {
+        showToast(`Erreur: ${err.message}`, "error");
+    }
+}
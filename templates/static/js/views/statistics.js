@@ -0,0 +1,165 @@
+// templates/static/js/views/statistics.js
+// Vue Statistiques : métriques de performance
+// Module ES chargé à la demande par setActiveView (voir loadViewModule dans main.js).
+// Les utilitaires (api, showToast, escapeHtml...) restent des globaux des scripts classiques.
+
+// Dimensions des agrégats de métriques (détail par valeur)
+const METRICS_GROUPS = {
+    whisper_model: "Modèle Whisper",
+    project: "Projet",
+    diarization: "Diarisation",
+    enrichment: "Enrichissement",
+    worker: "Worker"
+};
+let metricsGroupBy = "whisper_model";
+// Nouvel essai pendant l'agrégation initiale de l'historique (côté serveur)
+const METRICS_BACKFILL_RETRY_MS = 3000;
+let metricsBackfillRetry = null;
+
+/**
+ * Quantiles d'une métrique : "p50 · p95 · p99"
+ */
+function formatQuantiles(quantiles) {
+    if (!quantiles) return '';
+    return `p50 ${formatDuration(quantiles.p50)} · p95 ${formatDuration(quantiles.p95)} · p99 ${formatDuration(quantiles.p99)}`;
+}
+
+/**
+ * Tableau de répartition des métriques par valeur de la dimension choisie
+ */
+function renderMetricsBreakdown(metrics) {
+    const options = Object.entries(METRICS_GROUPS).map(([value, label]) =>
+        `<option value="${value}" ${value === metricsGroupBy ? 'selected' : ''}>${label}</option>`
+    ).join('');
+    const rows = (metrics.groups || []).map(group => `
+        <tr>
+            <td>${escapeHtml(group.key || '-')}</td>
+            <td>${group.count}${group.errors ? ` <small style="color:#dc3545;">(${group.errors} err.)</small>` : ''}</td>
+            <td>${formatDuration(group.processing_p50)}</td>
+            <td>${formatDuration(group.processing_p95)}</td>
+            <td>${formatDuration(group.queue_wait_p50)}</td>
+            <td>${formatDuration(group.queue_wait_p95)}</td>
+        </tr>
+    `).join('');
+    return `
+        <div style="margin-top: 2rem;">
+            <div class="metrics-breakdown-header">
+                <h3>Répartition par</h3>
+                <select id="metrics-group-by">${options}</select>
+            </div>
+            <div class="table-wrapper">
+                <table class="grid-table metrics-breakdown-table">
+                    <thead>
+                        <tr>
+                            <th>${METRICS_GROUPS[metricsGroupBy]}</th>
+                            <th>Transcriptions</th>
+                            <th>Traitement p50</th>
+                            <th>Traitement p95</th>
+                            <th>Attente p50</th>
+                            <th>Attente p95</th>
+                        </tr>
+                    </thead>
+                    <tbody>${rows}</tbody>
+                </table>
+            </div>
+        </div>
+    `;
+}
+
+/**
+ * ✅ NOUVEAU : Charge et affiche les métriques de performance
+ */
+export async function loadPerformanceMetrics() {
+    const container = document.getElementById('performance-metrics-container');
+    if (!container) return;
+    
+    if (!api.isCached(`metrics:transcriptions?group_by=${metricsGroupBy}`)) {
+        container.innerHTML = '<p style="text-align: center; color: #64748b;">Chargement des métriques...</p>';
+    }
+    
+    try {
+        const metrics = await api.getTranscriptionMetrics(null, null, null, {
+            groupBy: metricsGroupBy,
+            onUpdate: () => loadPerformanceMetrics()
+        });
+        
+        if (metrics && metrics.backfilling && !metricsBackfillRetry) {
+            metricsBackfillRetry = setTimeout(() => {
+                api.invalidate("metrics:");
+                loadPerformanceMetrics();
+            }, METRICS_BACKFILL_RETRY_MS);
+        }
+        
+        if (!metrics || metrics.total_transcriptions === 0) {
+            container.innerHTML = '<p style="text-align: center; color: #64748b; padding: 2rem;">Aucune métrique disponible pour le moment.</p>';
+            return;
+        }
+        const quantiles = metrics.quantiles || {};
+        
+        const metricsHtml = `
+            <div class="metrics-summary-grid">
+                <div class="metric-summary-card">
+                    <div class="metric-summary-label">Total transcriptions</div>
+                    <div class="metric-summary-value">${metrics.total_transcriptions}</div>
+                </div>
+                <div class="metric-summary-card">
+                    <div class="metric-summary-label">⏳ Temps d'attente moyen</div>
+                    <div class="metric-summary-value" style="color: #ff9800;">${formatDuration(metrics.avg_queue_wait_time)}</div>
+                    <div class="metric-summary-detail">Min: ${formatDuration(metrics.min_queue_wait_time)} | Max: ${formatDuration(metrics.max_queue_wait_time)}</div>
+                    <div class="metric-summary-detail">${formatQuantiles(quantiles.queue_wait_time)}</div>
+                </div>
+                <div class="metric-summary-card">
+                    <div class="metric-summary-label">⚙️ Temps de traitement moyen</div>
+                    <div class="metric-summary-value" style="color: #4a90e2;">${formatDuration(metrics.avg_processing_time)}</div>
+                    <div class="metric-summary-detail">Min: ${formatDuration(metrics.min_processing_time)} | Max: ${formatDuration(metrics.max_processing_time)}</div>
+                    <div class="metric-summary-detail">${formatQuantiles(quantiles.processing_time)}</div>
+                </div>
+                <div class="metric-summary-card">
+                    <div class="metric-summary-label">⏱️ Temps total moyen</div>
+                    <div class="metric-summary-value" style="color: #28a745;">${formatDuration(metrics.avg_total_time)}</div>
+                    <div class="metric-summary-detail">Attente + Traitement</div>
+                    <div class="metric-summary-detail">${formatQuantiles(quantiles.total_time)}</div>
+                </div>
+            </div>
+            
+            <div style="margin-top: 2rem;">
+                <h3 style="margin-bottom: 1rem;">Distribution des temps de traitement</h3>
+                <div class="distribution-grid">
+                    ${Object.entries(metrics.processing_time_distribution || {}).map(([range, count]) => `
+                        <div class="distribution-item">
+                            <span class="distribution-range">${range}</span>
+                            <div class="distribution-bar">
+                                <div class="distribution-bar-fill" style="width: ${(count / metrics.total_transcriptions) * 100}%"></div>
+                            </div>
+                            <span class="distribution-count">${count}</span>
+                        </div>
+                    `).join('')}
+                </div>
+            </div>
+            
+            <div style="margin-top: 2rem;">
+                <h3 style="margin-bottom: 1rem;">Distribution des temps d'attente</h3>
+                <div class="distribution-grid">
+                    ${Object.entries(metrics.queue_wait_time_distribution || {}).map(([range, count]) => `
+                        <div class="distribution-item">
+                            <span class="distribution-range">${range}</span>
+                            <div class="distribution-bar">
+                                <div class="distribution-bar-fill" style="width: ${(count / metrics.total_transcriptions) * 100}%; background: #ff9800;"></div>
+                            </div>
+                            <span class="distribution-count">${count}</span>
+                        </div>
+                    `).join('')}
+                </div>
+            </div>
+        ` + renderMetricsBreakdown(metrics);
+        
+        container.innerHTML = metricsHtml;
+        container.querySelector('#metrics-group-by')?.addEventListener('change', (e) => {
+            metricsGroupBy = e.target.value;
+            loadPerformanceMetrics();
+        });
+    } catch (err) {
+        console.error('Erreur lors du chargement des métriques:', err);
+        container.innerHTML = `<p style="text-align: center; color: #dc3545; padding: 2rem;">Erreur: ${err.message}</p>`;
+    }
+}
@@ -0,0 +1,217 @@
+// templates/static/js/views/users.js
+// Vue Utilisateurs (administration) : liste, assignation de projets, création
+// Module ES chargé à la demande par setActiveView (voir loadViewModule dans main.js).
+// Les utilitaires (api, showToast, escapeHtml...) restent des globaux des scripts classiques.
+
+function createProjectSelector(user) {
+    const userProjectIds = new Set(user.projects.map(p => p.id));
+    const availableProjects = allProjects.filter(p => !userProjectIds.has(p.id));
+
+    if (availableProjects.length === 0) {
+        return `<small>Tous les projets sont assignés.</small>`;
+    }
+
+    const options = availableProjects.map(p => `<option value="${p.id}">${escapeHtml(p.name)}</option>`).join("");
+    return `
+        <div class="form-group-inline">
+            <select class="project-assign-select" data-user-id="${user.id}">
+                ${options}
+            </select>
+            <button class="btn btn-small btn-success btn-assign-project" data-user-id="${user.id}">Assigner</button>
+        </div>
+    `;
+}
+
+export async function loadUsersList() {
+    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
+        return;
+    }
+    const container = document.getElementById("users-list-container");
+    if (!container) return;
+
+    if (!api.isCached("users:list")) {
+        container.innerHTML = "<p>Chargement des utilisateurs...</p>";
+    }
+    try {
+        const users = await api.listUsers({ onUpdate: () => loadUsersList() });
+
+        if (!users.length) {
+            container.innerHTML = "<p>Aucun utilisateur créé.</p>";
+            return;
+        }
+
+        container.innerHTML = "";
+        users.forEach(user => {
+            const card = document.createElement("div");
+            card.className = "user-card";
+
+            const projectsList = user.projects.map(p => `
+                <li>
+                    <span>${escapeHtml(p.name)}</span>
+                    <button class="btn btn-small btn-danger btn-remove-project"
+                            data-user-id="${user.id}"
+                            data-project-id="${p.id}">
+                        Retirer
+                    </button>
+                </li>
+            `).join("");
+
+            card.innerHTML = `
+                <div class="user-header">
+                    <div>
+                        <strong>${escapeHtml(user.username)}</strong>
+                        ${user.is_admin ? '<span class="badge badge-admin">Admin</span>' : ''}
+                    </div>
+                    ${user.username !== 'admin'
+                        ? `<button class="btn btn-danger btn-delete-user" data-user-id="${user.id}">Supprimer</button>`
+                        : ''}
+                </div>
+                <div class="user-projects">
+                    <strong>Projets assignés:</strong>
+                    <ul class="user-projects-list">
+                        ${projectsList || '<li><small>Aucun projet assigné.</small></li>'}
+                    </ul>
+                    ${!user.is_admin ? createProjectSelector(user) : '<small>Les administrateurs ont accès à tous les projets.</small>'}
+                </div>
+            `;
+            container.appendChild(card);
+        });
+
+        attachUserCardEvents();
+    } catch (err) {
+        container.innerHTML = `<p style="color:red;">Erreur: ${err.message}</p>`;
+    }
+}
+
+function attachUserCardEvents() {
+    document.querySelectorAll(".btn-delete-user").forEach(btn => {
+        btn.addEventListener("click", async (event) => {
+            const userId = event.currentTarget.dataset.userId;
+            if (!userId) return;
+
+            if (!confirm("Supprimer cet utilisateur ?")) return;
+            try {
+                await api.deleteUser(userId);
+                showToast("Utilisateur supprimé", "success");
+                await loadUsersList();
+            } catch (err) {
+                showToast(`Erreur: ${err.message}`, "error");
+            }
+        });
+    });
+
+    document.querySelectorAll(".btn-assign-project").forEach(btn => {
+        btn.addEventListener("click", async (event) => {
+            const userId = event.currentTarget.dataset.userId;
+            if (!userId) return;
+            const select = document.querySelector(`.project-assign-select[data-user-id="${userId}"]`);
+            const projectId = select?.value;
+            if (!projectId) return;
+
+            try {
+                await api.assignProjectToUser(userId, projectId);
+                showToast("Projet assigné", "success");
+                await loadUsersList();
+            } catch (err) {
+                showToast(`Erreur: ${err.message}`, "error");
+            }
+        });
+    });
+
+    document.querySelectorAll(".btn-remove-project").forEach(btn => {
+        btn.addEventListener("click", async (event) => {
+            const userId = event.currentTarget.dataset.userId;
+            const projectId = event.currentTarget.dataset.projectId;
+            if (!userId || !projectId) return;
+
+            try {
+                await api.removeProjectFromUser(userId, projectId);
+                showToast("Projet retiré", "success");
+                await loadUsersList();
+            } catch (err) {
+                showToast(`Erreur: ${err.message}`, "error");
+            }
+        });
+    });
+}
+
+// Fonction pour calculer la force du mot de passe
+function calculatePasswordStrength(password) {
+    if (!password) return { strength: 'none', score: 0 };
+    
+    let score = 0;
+    if (password.length >= 6) score++;
+    if (password.length >= 8) score++;
+    if (/[a-z]/.test(password) && /[A-Z]/.test(password)) score++;
+    if (/\d/.test(password)) score++;
+    if (/[^a-zA-Z\d]/.test(password)) score++;
+    
+    if (score <= 2) return { strength: 'weak', score };
+    if (score <= 3) return { strength: 'medium', score };
+    return { strength: 'strong', score };
+}
+
+// Fonction pour mettre à jour le password strength meter
+export function updatePasswordStrength(password) {
+    const strengthBar = document.getElementById("password-strength-bar");
+    if (!strengthBar) return;
+    
+    const { strength } = calculatePasswordStrength(password);
+    strengthBar.className = `password-strength-bar ${strength}`;
+}
+
+export async function handleCreateUser() {
+    if (!window.VOCALYX_CONFIG?.USER_IS_ADMIN) {
+        showToast("Fonction réservée aux administrateurs.", "warning");
+        return;
+    }
+    const usernameInput = document.getElementById("new-user-username");
+    const passwordInput = document.getElementById("new-user-password");
+    const isAdminInput = document.getElementById("new-user-is-admin");
+    if (!usernameInput || !passwordInput || !isAdminInput) return;
+
+    const username = usernameInput.value.trim();
+    const password = passwordInput.value.trim();
+    const isAdmin = isAdminInput.checked;
+
+    // Validations visuelles
+    if (!username) {
+        showToast("Nom d'utilisateur requis", "warning");
+        usernameInput.focus();
+        return;
+    }
+    if (username.length < 3) {
+        showToast("Le nom d'utilisateur doit contenir au moins 3 caractères", "warning");
+        usernameInput.focus();
+        return;
+    }
+    if (!password) {
+        showToast("Mot de passe requis", "warning");
+        passwordInput.focus();
+        return;
+    }
+    if (password.length < 6) {
+        showToast("Le mot de passe doit contenir au moins 6 caractères", "warning");
+        passwordInput.focus();
+        return;
+    }
+    
+    const { strength } = calculatePasswordStrength(password);
+    if (strength === 'weak') {
+        if (!confirm("Le mot de passe est faible. Voulez-vous continuer ?")) {
+            return;
+        }
+    }
+
+    try {
+        await api.createUser(username, password, isAdmin);
+        showToast(`Utilisateur créé: ${username}`, "success");
+        usernameInput.value = "";
+        passwordInput.value = "";
+        isAdminInput.checked = false;
+        updatePasswordStrength("");
+        await loadUsersList();
+    } catch (err) {
+        showToast(`Erreur lors de la création: ${err.message}`, "error");
+    }
+}
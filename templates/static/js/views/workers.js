@@ -0,0 +1,273 @@
+// templates/static/js/views/workers.js
+// Vue Workers : grille de monitoring détaillée
+// Module ES chargé à la demande par setActiveView (voir loadViewModule dans main.js).
+// Les utilitaires (api, showToast, escapeHtml...) restent des globaux des scripts classiques.
+
+/**
+ * ---------------------------------------------------------------------------
+ * ✅ MODIFICATION : Lecture de health.total_audio_processed_s
+ * ---------------------------------------------------------------------------
+ * Remplit la grille de monitoring des workers
+ */
+export function renderWorkerMonitoringGrid(stats) {
+    const gridBody = document.getElementById("worker-monitoring-grid");
+    if (!gridBody) return;
+
+    const workerStats = stats.stats || {};
+    const activeWorkers = stats.workers || {};
+    const registeredWorkers = stats.registered_tasks || {};
+
+    gridBody.innerHTML = "";
+
+    const allWorkerNames = new Set(Object.keys(workerStats));
+    Object.keys(registeredWorkers).forEach(name => allWorkerNames.add(name));
+
+    if (allWorkerNames.size === 0) {
+        gridBody.innerHTML = `<tr><td colspan="12" style="text-align:center;">Aucun worker Celery n'est actuellement connecté au broker.</td></tr>`;
+        return;
+    }
+
+    allWorkerNames.forEach(workerName => {
+        const row = document.createElement("tr");
+        const workerData = workerStats[workerName];
+        const activeTasks = activeWorkers[workerName] || [];
+        
+        const health = workerData?.health;
+        const db_stats = workerData?.db_stats;
+        
+        // Déterminer le type de worker (transcription ou enrichissement)
+        const simpleName = workerName.split('@')[0];
+        let workerType = "transcription";
+        let workerTypeLabel = "📝 Transcription";
+        if (simpleName.startsWith('enrichment-worker-') || simpleName.includes('enrichment')) {
+            workerType = "enrichment";
+            workerTypeLabel = "✨ Enrichissement";
+        }
+        
+        let status = "offline";
+        let statusClass = "status-offline";
+        let statusIndicator = "status-error";
+        
+        if (workerData) {
+            if (activeTasks.length > 0) {
+                status = "busy";
+                statusClass = "status-processing";
+                statusIndicator = "status-busy";
+            } else {
+                status = "idle";
+                statusClass = "status-done";
+                statusIndicator = "status-ok";
+            }
+        }
+
+        // Tâches
+        let tasksDone = 0;
+        const totalData = workerData?.total;
+        if (typeof totalData === 'number') {
+            tasksDone = totalData;
+        } else if (typeof totalData === 'object' && totalData !== null) {
+            tasksDone = Object.values(totalData).reduce((sum, count) => sum + (typeof count === 'number' ? count : 0), 0);
+        }
+        
+        // Exploitation des données 'health'
+        const cpuPercent = health?.cpu_percent;
+        const ramPercent = health?.memory_percent;
+        const ramRss = health?.memory_rss_bytes;
+        const uptime = health?.uptime_seconds;
+        
+        // "TPS audio traité"
+        const totalAudio = db_stats?.total_audio_processed_s;
+        
+        console.log(`Worker ${workerName}:`, {
+            health_exists: !!health,
+            db_stats_exists: !!db_stats,
+            totalAudio: totalAudio,
+            db_stats_content: db_stats
+        });
+        
+        const activeTaskCount = activeTasks.length;
+        let chargeBar = "N/A";
+        let maxConcurrency = 0;
+
+        if (workerData && workerData.pool && workerData.pool.hasOwnProperty('max-concurrency')) {
+            maxConcurrency = parseInt(workerData.pool['max-concurrency'], 10);
+        }
+        
+        if (maxConcurrency > 0) {
+            // Calculer le pourcentage
+            const chargePercent = (activeTaskCount / maxConcurrency) * 100;
+            chargeBar = createProgressBar(chargePercent); // Utiliser la fonction utilitaire
+        } else if (workerData) {
+            // Si le worker est en ligne mais n'a pas de max-concurrency, afficher 0%
+            chargeBar = createProgressBar(0);
+        }
+
+        // Déterminer les classes de coloration selon CPU/RAM
+        row.className = statusClass;
+        row.dataset.workerType = workerType;
+        row.innerHTML = `
+            <td class="col-instance">${simpleName}</td>
+            <td class="col-type">
+                <span class="worker-type-badge worker-type-${workerType}">${workerTypeLabel}</span>
+            </td>
+            <td class="col-status"><span class="worker-status-light ${statusIndicator}"></span> ${status}</td>
+            <td class="col-charge-num">${activeTaskCount}</td>
+            <td class="col-charge-bar">${chargeBar}</td>
+            <td class="col-cpu-num"><span class="worker-cpu-icon"></span>${cpuPercent != null ? cpuPercent.toFixed(1) + '%' : 'N/A'}</td>
+            <td class="col-cpu-bar">${createProgressBar(cpuPercent)}</td>
+            <td class="col-ram-num"><span class="worker-ram-icon"></span>${bytesToHuman(ramRss)}</td>
+            <td class="col-ram-bar">${createProgressBar(ramPercent)}</td>
+            <td class="col-uptime">${formatUptime(uptime)}</td>
+            <td class="col-jobs">${tasksDone}</td>
+            <td class="col-audio">${formatDuration(totalAudio)}</td>
+        `;
+        
+        // Ajouter les attributs data pour le CSS
+        if (cpuPercent != null) {
+            if (cpuPercent > 80) row.setAttribute('data-cpu-critical', 'true');
+            else if (cpuPercent > 70) row.setAttribute('data-cpu-high', 'true');
+        }
+        if (ramPercent != null) {
+            if (ramPercent > 80) row.setAttribute('data-ram-critical', 'true');
+            else if (ramPercent > 70) row.setAttribute('data-ram-high', 'true');
+        }
+        
+        gridBody.appendChild(row);
+    });
+}
+
+/**
+ * Dessine l'historique (sondé côté serveur) des tâches actives et des workers en ligne
+ */
+export function renderWorkerHistory(history) {
+    const canvas = document.getElementById("worker-activity-history");
+    if (!canvas || !history?.series) return;
+
+    const active = history.series.active_tasks || [];
+    const workers = (history.series.transcription_worker_count || [])
+        .map((count, i) => count + ((history.series.enrichment_worker_count || [])[i] || 0));
+    if (active.length < 2) return;
+
+    // Résolution du canvas alignée sur sa taille affichée
+    const width = canvas.clientWidth || canvas.width;
+    const height = canvas.height;
+    if (canvas.width !== width) canvas.width = width;
+
+    const ctx = canvas.getContext("2d");
+    ctx.clearRect(0, 0, width, height);
+    const max = Math.max(1, ...active, ...workers);
+
+    const drawSeries = (values, color) => {
+        ctx.strokeStyle = color;
+        ctx.lineWidth = 2;
+        ctx.beginPath();
+        values.forEach((value, index) => {
+            const x = (index / (values.length - 1)) * width;
+            const y = height - 2 - (value / max) * (height - 4);
+            if (index === 0) ctx.moveTo(x, y);
+            else ctx.lineTo(x, y);
+        });
+        ctx.stroke();
+    };
+    drawSeries(workers, "#28a745");
+    drawSeries(active, "#4a90e2");
+
+    const legend = document.getElementById("worker-activity-legend");
+    if (legend && history.timestamps.length) {
+        const minutes = Math.round((history.timestamps[history.timestamps.length - 1] - history.timestamps[0]) / 60);
+        legend.textContent = `Tâches actives (bleu) / workers en ligne (vert) — ${minutes} min, max ${Math.round(max)}`;
+    }
+}
+
+/**
+ * Lance la simulation de capacité avec les paramètres du formulaire
+ */
+export async function handleCapacityPlan() {
+    const container = document.getElementById("capacity-plan-result");
+    const button = document.getElementById("capacity-plan-btn");
+    if (!container) return;
+
+    const workers = document.getElementById("capacity-workers")?.value.replace(/\s+/g, "") || null;
+    if (workers && !/^\d+(,\d+)*$/.test(workers)) {
+        showToast("Workers candidats : liste d'entiers séparés par des virgules", "error");
+        return;
+    }
+    if (button) button.disabled = true;
+    container.innerHTML = `<div style="text-align:center;padding:1rem;"><div class="spinner"></div></div>`;
+    try {
+        const plan = await api.getCapacityPlan({
+            workers,
+            pool: document.getElementById("capacity-pool")?.value || "transcription",
+            concurrency: document.getElementById("capacity-concurrency")?.value || 1,
+            scale: document.getElementById("capacity-scale")?.value || 1,
+            targetP95: document.getElementById("capacity-target")?.value || 60
+        });
+        renderCapacityPlan(plan);
+    } catch (err) {
+        container.innerHTML = `<p style="color:red;">❌ Erreur: ${escapeHtml(err.message)}</p>`;
+    } finally {
+        if (button) button.disabled = false;
+    }
+}
+
+/**
+ * Affiche le résultat de la simulation (une ligne par nombre de workers candidat)
+ */
+export function renderCapacityPlan(plan) {
+    const container = document.getElementById("capacity-plan-result");
+    if (!container) return;
+
+    const { workload, simulation } = plan;
+    if (!plan.candidates.length) {
+        container.innerHTML = `<p>Pas assez d'historique pour ajuster la charge de ce pool.</p>`;
+        return;
+    }
+    const service = workload.service_time || {};
+    const observed = workload.observed_wait
+        ? ` · attente observée p50 ${formatDuration(workload.observed_wait.p50)} / p95 ${formatDuration(workload.observed_wait.p95)}`
+        : "";
+    const rows = plan.candidates.map(candidate => {
+        const classes = [
+            candidate.workers === plan.recommended_workers ? "capacity-recommended" : "",
+            candidate.workers === plan.current_workers ? "capacity-current" : ""
+        ].join(" ").trim();
+        const tags = [
+            candidate.workers === plan.recommended_workers ? "✅ recommandé" : "",
+            candidate.workers === plan.current_workers ? "actuel" : ""
+        ].filter(Boolean).join(" · ");
+        return `
+            <tr class="${classes}">
+                <td>${candidate.workers} ${tags ? `<small>${tags}</small>` : ""}</td>
+                <td>${candidate.slots}</td>
+                <td>${Math.round(candidate.utilization * 100)}% <small>(pointe ${Math.round(candidate.peak_utilization * 100)}%)</small></td>
+                <td>${formatDuration(candidate.wait_p50)}</td>
+                <td>${formatDuration(candidate.wait_p95)}</td>
+                <td>${Math.round(candidate.waiting_share * 100)}%</td>
+            </tr>`;
+    }).join("");
+
+    container.innerHTML = `
+        <p class="capacity-plan-summary">
+            ${workload.samples} transcriptions sur ${workload.window_days} j · ${workload.arrivals_per_day} arrivées/j
+            (pic ${workload.peak_hourly_rate}/h) · service moyen ${formatDuration(service.mean)}${observed}<br>
+            <small>${simulation.jobs} tâches simulées (${simulation.days} j × ${simulation.replications} trajectoires, trafic × ${simulation.traffic_scale}) en ${Math.round(simulation.elapsed_ms)} ms</small>
+        </p>
+        <div class="table-wrapper">
+            <table class="grid-table capacity-plan-table">
+                <thead>
+                    <tr>
+                        <th>Workers</th>
+                        <th>Places</th>
+                        <th>Utilisation</th>
+                        <th>Attente p50</th>
+                        <th>Attente p95</th>
+                        <th>Tâches en attente</th>
+                    </tr>
+                </thead>
+                <tbody>${rows}</tbody>
+            </table>
+        </div>
+        <p>${plan.recommended_workers
+            ? `Recommandation : <strong>${plan.recommended_workers} worker(s)</strong> pour une attente p95 ≤ ${formatDuration(plan.target_p95)}.`
+            : `Aucun candidat ne tient une attente p95 ≤ ${formatDuration(plan.target_p95)} : essayez davantage de workers.`}</p>`;
+}
@@ -0,0 +1,178 @@
+// templates/static/js/virtual-list.js
+// Rendu virtualisé de longues listes (seules les lignes visibles + overscan sont dans le DOM)
+
+/**
+ * Liste virtualisée à hauteur de ligne fixe.
+ *
+ * Le conteneur reçoit un "spacer" de la hauteur totale de la liste ; seules les
+ * lignes de la fenêtre visible (plus `overscan` lignes de part et d'autre) existent
+ * dans le DOM. Les nœuds sortis de la fenêtre sont recyclés pour les nouveaux index.
+ *
+ * Options :
+ *  - rowHeight      : hauteur d'une ligne en pixels (obligatoire)
+ *  - overscan       : nombre de lignes rendues hors écran de chaque côté
+ *  - itemCount      : nombre total d'éléments
+ *  - createRow()    : crée un nœud de ligne vide
+ *  - updateRow(node, index) : remplit un nœud (recyclé) pour l'index donné
+ *  - onRangeChange(first, last) : appelé quand la fenêtre rendue change
+ *  - useWindowScroll: défiler avec la page plutôt qu'avec le conteneur
+ */
+class VirtualList {
+    constructor(container, options = {}) {
+        this.container = container;
+        this.rowHeight = options.rowHeight;
+        this.overscan = options.overscan ?? 8;
+        this.itemCount = options.itemCount || 0;
+        this.createRow = options.createRow;
+        this.updateRow = options.updateRow;
+        this.onRangeChange = options.onRangeChange || null;
+        this.useWindowScroll = !!options.useWindowScroll;
+
+        this.visibleRows = new Map(); // index -> nœud
+        this.freeRows = [];
+        this.range = { first: 0, last: 0 };
+        this._frame = null;
+
+        this.container.innerHTML = "";
+        this.spacer = document.createElement("div");
+        this.spacer.className = "virtual-list-spacer";
+        this.spacer.style.position = "relative";
+        this.spacer.style.width = "100%";
+        this.container.appendChild(this.spacer);
+
+        this._onScroll = () => this._schedule();
+        this._scrollTarget = this.useWindowScroll ? window : this.container;
+        this._scrollTarget.addEventListener("scroll", this._onScroll, { passive: true });
+        window.addEventListener("resize", this._onScroll);
+
+        this._updateSpacer();
+        this.render();
+    }
+
+    /**
+     * Change le nombre d'éléments et re-rend la fenêtre courante
+     */
+    setItemCount(count) {
+        this.itemCount = count;
+        this._updateSpacer();
+        this.refresh();
+    }
+
+    /**
+     * Re-remplit toutes les lignes visibles (après arrivée de nouvelles données)
+     */
+    refresh() {
+        this.visibleRows.forEach((node, index) => {
+            if (index >= this.itemCount) {
+                this._release(index, node);
+            } else {
+                this.updateRow(node, index);
+            }
+        });
+        this.render();
+    }
+
+    /**
+     * Fait défiler la liste pour rendre visible l'index donné
+     */
+    scrollToIndex(index) {
+        const offset = Math.max(0, index) * this.rowHeight;
+        if (this.useWindowScroll) {
+            const top = this.container.getBoundingClientRect().top + window.scrollY;
+            window.scrollTo({ top: top + offset });
+        } else {
+            this.container.scrollTop = offset;
+        }
+        this.render();
+    }
+
+    /**
+     * Calcule la fenêtre visible et synchronise le DOM
+     */
+    render() {
+        this._frame = null;
+        const { first, last } = this._computeRange();
+
+        // Recycler les lignes sorties de la fenêtre
+        this.visibleRows.forEach((node, index) => {
+            if (index < first || index >= last) {
+                this._release(index, node);
+            }
+        });
+
+        // Rendre les lignes manquantes
+        for (let index = first; index < last; index++) {
+            if (this.visibleRows.has(index)) continue;
+            const node = this.freeRows.pop() || this._createNode();
+            node.style.transform = `translateY(${index * this.rowHeight}px)`;
+            node.dataset.index = index;
+            node.hidden = false;
+            this.updateRow(node, index);
+            this.visibleRows.set(index, node);
+        }
+
+        if (first !== this.range.first || last !== this.range.last) {
+            this.range = { first, last };
+            if (this.onRangeChange) this.onRangeChange(first, last);
+        }
+    }
+
+    /**
+     * Retire les écouteurs et vide le conteneur
+     */
+    destroy() {
+        this._scrollTarget.removeEventListener("scroll", this._onScroll);
+        window.removeEventListener("resize", this._onScroll);
+        if (this._frame) cancelAnimationFrame(this._frame);
+        this.visibleRows.clear();
+        this.freeRows = [];
+        this.container.innerHTML = "";
+    }
+
+    _schedule() {
+        if (this._frame) return;
+        this._frame = requestAnimationFrame(() => this.render());
+    }
+
+    _computeRange() {
+        let scrollTop;
+        let viewportHeight;
+        if (this.useWindowScroll) {
+            const rect = this.container.getBoundingClientRect();
+            scrollTop = Math.max(0, -rect.top);
+            viewportHeight = window.innerHeight;
+        } else {
+            scrollTop = this.container.scrollTop;
+            viewportHeight = this.container.clientHeight || window.innerHeight;
+        }
+        const first = Math.max(0, Math.floor(scrollTop / this.rowHeight) - this.overscan);
+        const last = Math.min(
+            this.itemCount,
+            Math.ceil((scrollTop + viewportHeight) / this.rowHeight) + this.overscan
+        );
+        return { first, last: Math.max(first, last) };
+    }
+
+    _createNode() {
+        const node = this.createRow();
+        node.classList.add("virtual-list-row");
+        node.style.position = "absolute";
+        node.style.top = "0";
+        node.style.left = "0";
+        node.style.right = "0";
+        node.style.height = `${this.rowHeight}px`;
+        node.style.boxSizing = "border-box";
+        this.spacer.appendChild(node);
+        return node;
+    }
+
+    _release(index, node) {
+        node.hidden = true;
+        this.visibleRows.delete(index);
+        this.freeRows.push(node);
+    }
+
+    _updateSpacer() {
+        this.spacer.style.height = `${this.itemCount * this.rowHeight}px`;
+    }
+}
@@ -0,0 +1,149 @@
+// templates/static/js/ws-worker.js
+// Web Worker propriétaire du WebSocket : décodage JSON et diff d'état hors du thread UI
+
+/**
+ * Protocole page -> worker :
+ *  - { cmd: "connect", url, debug } : ouvre la connexion
+ *  - { cmd: "send", message }       : sérialise et envoie un message
+ *  - { cmd: "close" }               : ferme la connexion
+ *
+ * Protocole worker -> page :
+ *  - { kind: "open" } / { kind: "closed", code } / { kind: "error" }
+ *  - { kind: "message", message }   : message transmis tel quel (petits messages)
+ *  - { kind: "patch", type, patch } : état du dashboard sous forme de diff
+ *
+ * Un patch contient :
+ *  - changed : clés de premier niveau (hors transcriptions) dont la valeur a changé
+ *  - order   : ids des transcriptions dans l'ordre d'affichage (si présentes)
+ *  - upserts : transcriptions nouvelles ou modifiées depuis le dernier état
+ *  - reset   : true si la page doit repartir d'un miroir vide
+ */
+
+let socket = null;
+let debug = false;
+
+// Dernier état connu (sérialisations par clé et par transcription)
+let lastKeys = new Map();
+let lastTranscriptions = new Map();
+
+// Clés toujours renvoyées : nécessaires au rendu de la pagination et de la grille
+const ALWAYS_SENT_KEYS = new Set(["transcription_count"]);
+const STATE_MESSAGE_TYPES = new Set(["initial_dashboard_state", "dashboard_state_update"]);
+
+function debugLog(...args) {
+    if (debug) console.log("[ws-worker]", ...args);
+}
+
+function resetState() {
+    lastKeys = new Map();
+    lastTranscriptions = new Map();
+}
+
+/**
+ * Calcule le diff d'un état complet par rapport au dernier état envoyé
+ */
+function diffState(data, reset) {
+    const patch = { changed: {}, reset };
+    if (reset) resetState();
+
+    Object.keys(data || {}).forEach(key => {
+        if (key === "transcriptions") return;
+        const value = data[key];
+        const json = JSON.stringify(value);
+        if (ALWAYS_SENT_KEYS.has(key) || lastKeys.get(key) !== json) {
+            patch.changed[key] = value;
+            lastKeys.set(key, json);
+        }
+    });
+
+    if (Array.isArray(data?.transcriptions)) {
+        const next = new Map();
+        patch.order = [];
+        patch.upserts = [];
+        data.transcriptions.forEach(entry => {
+            const id = String(entry.id);
+            const json = JSON.stringify(entry);
+            patch.order.push(id);
+            next.set(id, json);
+            if (lastTranscriptions.get(id) !== json) {
+                patch.upserts.push(entry);
+            }
+        });
+        lastTranscriptions = next;
+    }
+    return patch;
+}
+
+/**
+ * Traite un message brut reçu du serveur
+ */
+function handleRawMessage(raw) {
+    let message;
+    try {
+        message = JSON.parse(raw);
+    } catch (err) {
+        console.error("[ws-worker] Erreur parsing JSON WebSocket:", err);
+        return;
+    }
+
+    if (STATE_MESSAGE_TYPES.has(message.type)) {
+        const patch = diffState(message.data, message.type === "initial_dashboard_state");
+        debugLog(`${message.type}: ${patch.upserts ? patch.upserts.length : 0} transcription(s) modifiée(s), clés:`, Object.keys(patch.changed));
+        self.postMessage({ kind: "patch", type: message.type, patch });
+        return;
+    }
+
+    if (message.type === "worker_stats") {
+        const json = JSON.stringify(message.data);
+        if (lastKeys.get("worker_stats") === json) {
+            debugLog("worker_stats inchangé, ignoré");
+            return;
+        }
+        lastKeys.set("worker_stats", json);
+    }
+
+    if (message.type === "transcription_updated" && message.data?.transcription) {
+        // Garder le miroir cohérent pour le prochain diff
+        const entry = message.data.transcription;
+        const id = String(entry.id);
+        if (lastTranscriptions.has(id)) {
+            const merged = { ...JSON.parse(lastTranscriptions.get(id)), ...entry };
+            lastTranscriptions.set(id, JSON.stringify(merged));
+        }
+    }
+
+    debugLog("Message reçu:", message);
+    self.postMessage({ kind: "message", message });
+}
+
+function connect(url) {
+    if (socket && socket.readyState <= WebSocket.OPEN) {
+        debugLog("WebSocket déjà ouvert");
+        return;
+    }
+    resetState();
+    socket = new WebSocket(url);
+    socket.onopen = () => self.postMessage({ kind: "open" });
+    socket.onmessage = (event) => handleRawMessage(event.data);
+    socket.onerror = () => self.postMessage({ kind: "error" });
+    socket.onclose = (event) => {
+        socket = null;
+        self.postMessage({ kind: "closed", code: event.code });
+    };
+}
+
+self.onmessage = (event) => {
+    const { cmd } = event.data || {};
+    if (cmd === "connect") {
+        debug = !!event.data.debug;
+        connect(event.data.url);
+    } else if (cmd === "send") {
+        if (socket && socket.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify(event.data.message));
+        } else {
+            debugLog("Envoi ignoré, WebSocket fermé:", event.data.message?.type);
+        }
+    } else if (cmd === "close") {
+        if (socket) socket.close();
+    }
+};
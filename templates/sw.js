@@ -0,0 +1,101 @@
+// templates/sw.js
+// Service worker du dashboard Vocalyx (servi par FastAPI sur /sw.js, portée "/")
+//
+// - Ressources statiques précachées à l'installation, servies en cache-first
+// - Coque HTML du dashboard servie depuis le cache puis revalidée en arrière-plan
+// - API, authentification et WebSocket : toujours le réseau
+
+const VERSION = "{{ version }}";
+const STATIC_CACHE = `vocalyx-static-${VERSION}`;
+const SHELL_CACHE = "vocalyx-shell";
+const PRECACHE_URLS = {{ precache_urls|tojson }};
+const SHELL_URLS = {{ shell_urls|tojson }};
+const STATE_DB_NAME = "vocalyx-dashboard";
+
+self.addEventListener("install", (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(STATIC_CACHE);
+        await cache.addAll(PRECACHE_URLS);
+        // La coque n'est précachée que si la session est valide (sinon redirection vers /login)
+        const shell = await caches.open(SHELL_CACHE);
+        await Promise.all(SHELL_URLS.map(async (url) => {
+            try {
+                const response = await fetch(url, { credentials: "same-origin" });
+                if (isCacheableShell(response)) await shell.put(url, response);
+            } catch (err) {
+                // Hors ligne : la coque sera mise en cache à la prochaine navigation
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith("vocalyx-static-") && name !== STATIC_CACHE)
+            .map(name => caches.delete(name)));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request;
+    if (request.method !== "GET") return;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (url.pathname === "/auth/logout") {
+        // Déconnexion : oublier la coque et l'état du dashboard de cet utilisateur
+        event.waitUntil(clearUserData());
+        return;
+    }
+    if (url.pathname.startsWith("/static/")) {
+        event.respondWith(cacheFirst(request));
+        return;
+    }
+    if (request.mode === "navigate" && SHELL_URLS.includes(url.pathname)) {
+        event.respondWith(staleWhileRevalidate(event, url.pathname));
+    }
+});
+
+function isCacheableShell(response) {
+    return response && response.ok && !response.redirected && response.type === "basic";
+}
+
+async function cacheFirst(request) {
+    const cache = await caches.open(STATIC_CACHE);
+    const cached = await cache.match(request);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+}
+
+async function staleWhileRevalidate(event, key) {
+    const cache = await caches.open(SHELL_CACHE);
+    const cached = await cache.match(key);
+    const network = fetch(event.request).then(async (response) => {
+        if (isCacheableShell(response)) {
+            await cache.put(key, response.clone());
+        } else if (response.redirected || response.type === "opaqueredirect") {
+            // Session expirée : ne plus servir la coque en cache
+            await cache.delete(key);
+        }
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => {}));
+        return cached;
+    }
+    return network;
+}
+
+async function clearUserData() {
+    await caches.delete(SHELL_CACHE);
+    await new Promise((resolve) => {
+        const request = indexedDB.deleteDatabase(STATE_DB_NAME);
+        request.onsuccess = request.onerror = request.onblocked = () => resolve();
+    });
+}
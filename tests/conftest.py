@@ -0,0 +1,48 @@
+"""
+Tests unitaires de vocalyx-frontend : python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from config import Config  # noqa: E402
+from infrastructure.api.api_client import VocalyxAPIClient  # noqa: E402
+from infrastructure.api.budgets import ClientPools  # noqa: E402
+from infrastructure.api.transport import TransportFactory  # noqa: E402
+
+
+class MockTransports(TransportFactory):
+    """Transports des clients remplacés par un httpx.MockTransport (aucun appel réseau)"""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def client_options(self, max_connections):
+        return {"transport": httpx.MockTransport(self.handler), "mounts": {}}
+
+    async_client_options = client_options
+
+
+@pytest.fixture
+def make_api_client(monkeypatch):
+    """VocalyxAPIClient configuré par config.ini.example, réponses de l'API fournies par `handler`"""
+    clients = []
+
+    def make(handler, urls="http://api.test"):
+        monkeypatch.setenv("VOCALYX_API_URL", urls)
+        client = VocalyxAPIClient(Config(str(ROOT / "config.ini.example")))
+        client.pools.close()
+        client.pools = ClientPools(client.pools.budgets, MockTransports(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
@@ -0,0 +1,74 @@
+"""
+EtaService : position dans la file calculée sur toute la file de l'utilisateur, apprentissage unique
+"""
+
+import threading
+
+from application.services.eta_service import EtaService
+
+
+def transcription(transcription_id, minute, status="pending"):
+    return {"id": transcription_id, "status": status, "created_at": f"2026-01-01T10:{minute:02d}:00"}
+
+
+class FakeAPI:
+    def __init__(self, pending=()):
+        self.pending = list(pending)
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_user_transcriptions(self, jwt_token, limit=25, status=None, **params):
+        self.calls += 1
+        if status == "done":
+            self.started.set()
+            self.release.wait(5)
+            return []
+        return [t for t in self.pending if t["status"] == status]
+
+
+def test_queue_position_counts_pending_transcriptions_outside_the_page():
+    # 30 transcriptions en attente ; la page affichée ne contient que les 2 plus récentes
+    older = [transcription(f"t{i}", i) for i in range(28)]
+    page = [transcription("t28", 28), transcription("t29", 29)]
+    service = EtaService(FakeAPI(older + page))
+
+    page_only = service.estimate(page)
+    assert page_only["t28"]["queue_position"] == 0
+
+    etas = service.estimate(page, pending=service.pending("token"))
+    assert set(etas) == {"t28", "t29"}
+    assert etas["t28"]["queue_position"] == 28
+    assert etas["t29"]["queue_position"] == 29
+    assert etas["t28"]["eta_seconds"] > page_only["t28"]["eta_seconds"]
+
+
+def test_listed_status_overrides_the_cached_pending_set():
+    api = FakeAPI([transcription("t0", 0), transcription("t1", 1)])
+    service = EtaService(api)
+    pending = service.pending("token")
+    # t0 a démarré depuis le chargement de la file : elle ne précède plus t1
+    etas = service.estimate([transcription("t0", 0, "processing"), transcription("t1", 1)], pending=pending)
+    assert etas["t1"]["queue_position"] == 0
+    assert etas["t0"]["queue_position"] is None
+    assert service.pending("token") is pending
+    assert api.calls == 2  # une requête par statut en attente, puis le cache
+
+
+def test_concurrent_training_starts_once():
+    api = FakeAPI()
+    service = EtaService(api, training_interval=0)
+    first = threading.Thread(target=service.train, args=("token",))
+    first.start()
+    assert api.started.wait(5)
+    assert not service.needs_training()
+    # Les apprentissages lancés pendant le premier reviennent sans appel à l'API
+    others = [threading.Thread(target=service.train, args=("token",)) for _ in range(8)]
+    for thread in others:
+        thread.start()
+    for thread in others:
+        thread.join()
+    api.release.set()
+    first.join()
+    assert api.calls == 1
+    assert service.needs_training()
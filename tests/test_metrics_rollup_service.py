@@ -0,0 +1,46 @@
+"""
+MetricsRollupService : dédoublonnage des transcriptions à la limite d'éviction des identifiants retenus
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from application.services.metrics_rollup_service import MetricsRollupService
+
+RETENTION = {"minute": 7200, "hour": 7 * 86400, "day": 365 * 86400}
+START = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=1)
+
+
+def transcription(number):
+    created = START + timedelta(minutes=number)
+    return {
+        "id": f"t{number}",
+        "status": "done",
+        "project": "demo",
+        "created_at": created.isoformat(),
+        "processing_end_time": (created + timedelta(seconds=30)).isoformat(),
+        "processing_time": 30.0,
+        "duration": 60.0
+    }
+
+
+def test_evicted_transcriptions_are_never_counted_twice():
+    service = MetricsRollupService(api_client=None, retention=RETENTION, max_seen=3)
+    jobs = [transcription(i) for i in range(5)]
+
+    assert service.observe(jobs) == 5
+    assert len(service._seen) == 3
+    # t0 et t1 ont été oubliés : ils sont sous la ligne de flottaison
+    assert service.observe(jobs) == 0
+    assert service.observe(list(reversed(jobs))) == 0
+
+    # Une transcription plus récente reste comptée, une seule fois
+    assert service.observe(transcription(10)) == 1
+    assert service.observe([transcription(10), transcription(0)]) == 0
+    assert len(service._seen) == 3
+
+
+def test_transcription_finished_before_the_watermark_is_ignored():
+    service = MetricsRollupService(api_client=None, retention=RETENTION, max_seen=2)
+    service.observe([transcription(i) for i in (2, 3, 4)])
+    # Jamais vue, mais terminée avant la plus ancienne oubliée : ignorée plutôt que risquer un doublon
+    assert service.observe(transcription(1)) == 0
@@ -0,0 +1,50 @@
+"""
+Métriques partitionnées par thread : les partitions des threads terminés sont versées dans le total de base
+"""
+
+import gc
+import threading
+
+from infrastructure.metrics.prometheus import Counter, Histogram, MetricsRegistry
+
+
+def run_threads(count, target):
+    for _ in range(count):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+
+def test_counter_shards_of_finished_threads_are_reclaimed():
+    counter = Counter("test_requests_total", "Requêtes", ("route",), registry=MetricsRegistry())
+
+    def work():
+        for _ in range(10):
+            counter.inc(("a",))
+        counter.inc(("b",), 2)
+
+    run_threads(200, work)
+    assert len(counter._shards) == 0
+    assert counter.totals() == {("a",): 2000, ("b",): 400}
+
+    # Les threads vivants gardent leur partition, additionnée au total de base
+    counter.inc(("a",))
+    assert len(counter._shards) == 1
+    assert counter.totals() == {("a",): 2001, ("b",): 400}
+
+
+def test_histogram_shards_of_finished_threads_are_reclaimed():
+    registry = MetricsRegistry()
+    histogram = Histogram("test_latency_seconds", "Latence", buckets=(0.1, 1.0), registry=registry)
+
+    def work():
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+    run_threads(100, work)
+    assert len(histogram._shards) == 0
+    rendered = registry.render()
+    assert 'test_latency_seconds_bucket{le="0.1"} 100' in rendered
+    assert 'test_latency_seconds_bucket{le="+Inf"} 200' in rendered
+    assert "test_latency_seconds_count 200" in rendered
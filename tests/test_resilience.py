@@ -0,0 +1,75 @@
+"""
+ResilientCaller : échéance globale des reprises et des copies
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from infrastructure.api.resilience import CircuitBreakerRegistry, Hedger, ResilientCaller, RetryPolicy
+
+ENDPOINT = "/api/user/transcriptions"
+
+
+def slow_timeout(duration, calls):
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(time.monotonic())
+        time.sleep(duration)
+        raise httpx.ReadTimeout("read timeout", request=httpx.Request("GET", "http://api" + ENDPOINT))
+    return send
+
+
+def caller(deadline, hedge_endpoints=()):
+    return ResilientCaller(
+        CircuitBreakerRegistry(enabled=False),
+        RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, deadline=deadline),
+        Hedger(hedge_endpoints, delay=0.05)
+    )
+
+
+def test_retries_stop_when_an_attempt_no_longer_fits_the_deadline():
+    calls = []
+    started = time.monotonic()
+    with pytest.raises(httpx.ReadTimeout):
+        caller(deadline=0.5).call("GET", ENDPOINT, slow_timeout(0.2, calls), timeout=0.2)
+    # 0,2 s + 0,2 s : il ne reste que 0,1 s, une troisième tentative dépasserait l'échéance
+    assert len(calls) == 2
+    assert time.monotonic() - started < 0.5
+
+
+def test_all_attempts_run_when_the_deadline_allows_them():
+    calls = []
+    with pytest.raises(httpx.ReadTimeout):
+        caller(deadline=5.0).call("GET", ENDPOINT, slow_timeout(0.05, calls), timeout=0.05)
+    assert len(calls) == 3
+
+
+def test_hedged_attempts_count_the_hedge_delay_against_the_deadline():
+    calls = []
+    started = time.monotonic()
+    service = caller(deadline=0.6, hedge_endpoints=(f"GET {ENDPOINT}",))
+    with pytest.raises(httpx.ReadTimeout):
+        service.call("GET", ENDPOINT, slow_timeout(0.2, calls), timeout=0.2)
+    # Deux tentatives couvertes (requête + copie) de 0,25 s ; la troisième ne tiendrait pas
+    assert len(calls) == 4
+    assert time.monotonic() - started < 0.6
+    service.hedger.shutdown()
+
+
+def test_async_retries_respect_the_deadline():
+    calls = []
+
+    async def send():
+        calls.append(time.monotonic())
+        await asyncio.sleep(0.2)
+        raise httpx.ReadTimeout("read timeout", request=httpx.Request("GET", "http://api" + ENDPOINT))
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(caller(deadline=0.5).acall("GET", ENDPOINT, send, timeout=0.2))
+    assert len(calls) == 2
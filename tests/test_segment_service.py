@@ -0,0 +1,62 @@
+"""
+Cache des transcriptions analysées de SegmentService : partage entre sessions, contrôle d'accès, suppression
+"""
+
+import httpx
+import pytest
+
+from application.services.segment_service import SegmentService
+
+
+class FakeAPI:
+    def __init__(self, allowed):
+        self.allowed = allowed
+        self.calls = []
+
+    def get_user_transcription(self, token, transcription_id):
+        self.calls.append((token, transcription_id))
+        if token not in self.allowed:
+            request = httpx.Request("GET", f"http://api/api/user/transcriptions/{transcription_id}")
+            raise httpx.HTTPStatusError("Forbidden", request=request, response=httpx.Response(403, request=request))
+        return {
+            "id": transcription_id,
+            "status": "done",
+            "segments": [{"start": float(i), "end": i + 1.0, "text": f"segment {i}"} for i in range(10)]
+        }
+
+
+def test_transcript_is_parsed_once_and_shared_after_access_check():
+    api = FakeAPI(allowed={"alice", "bob"})
+    service = SegmentService(api, max_bytes=10_000_000)
+
+    first = service.get_transcript("alice", "t1")
+    assert service.get_transcript("alice", "t1") is first
+    # Une autre session passe par l'API (contrôle d'accès) puis partage la même copie
+    assert service.get_transcript("bob", "t1") is first
+    assert service.get_transcript("bob", "t1") is first
+    assert api.calls == [("alice", "t1"), ("bob", "t1")]
+    assert len(service.cache) == 1
+
+
+def test_cached_transcript_is_not_served_to_a_session_without_access():
+    api = FakeAPI(allowed={"alice"})
+    service = SegmentService(api, max_bytes=10_000_000)
+    service.get_transcript("alice", "t1")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        service.get_transcript("mallory", "t1")
+
+
+def test_delete_evicts_the_transcript_for_every_session():
+    api = FakeAPI(allowed={"alice", "bob"})
+    service = SegmentService(api, max_bytes=10_000_000)
+    service.get_transcript("alice", "t1")
+    service.get_transcript("bob", "t1")
+
+    service.invalidate("t1")
+    api.allowed.clear()  # supprimée côté API
+
+    for token in ("alice", "bob"):
+        with pytest.raises(httpx.HTTPStatusError):
+            service.get_window(token, "t1")
+    assert len(service.cache) == 0
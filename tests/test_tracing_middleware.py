@@ -0,0 +1,49 @@
+"""
+Server-Timing : l'encodage des réponses construites dans le endpoint est compté comme sérialisation
+"""
+
+import re
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from infrastructure.web.tracing_middleware import TracedAPIRoute, TracedJSONResponse, TracingMiddleware
+
+PAYLOAD = [{"id": i, "text": f"segment {i} " * 20, "start": i * 1.5, "end": i * 1.5 + 1.2} for i in range(50000)]
+
+
+def timings(response):
+    return {
+        name: float(duration)
+        for name, duration in re.findall(r"(\w+)(?:;desc=\"[^\"]*\")?;dur=([\d.]+)", response.headers["Server-Timing"])
+    }
+
+
+def make_client():
+    router = APIRouter(route_class=TracedAPIRoute)
+
+    @router.get("/built")
+    async def built():
+        return TracedJSONResponse(content=PAYLOAD)
+
+    @router.get("/returned")
+    async def returned():
+        return PAYLOAD
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(TracingMiddleware)
+    return TestClient(app)
+
+
+def test_response_built_in_the_endpoint_is_timed_as_serialization():
+    response = make_client().get("/built")
+    assert response.status_code == 200
+    durations = timings(response)
+    assert durations["serialize"] > 0
+    assert durations["serialize"] <= durations["total"]
+
+
+def test_returned_content_is_still_timed_as_serialization():
+    durations = timings(make_client().get("/returned"))
+    assert durations["serialize"] > 0
@@ -0,0 +1,48 @@
+"""
+Transports à cache DNS : un échec de résolution est une erreur de connexion httpx
+"""
+
+import asyncio
+import socket
+
+import anyio
+import httpx
+import pytest
+
+from infrastructure.api.transport import DnsCache, TransportFactory
+
+
+@pytest.fixture
+def failing_resolver(monkeypatch):
+    calls = []
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        calls.append(host)
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    async def agetaddrinfo(host, port, *args, **kwargs):
+        return getaddrinfo(host, port)
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    monkeypatch.setattr(anyio, "getaddrinfo", agetaddrinfo)
+    return calls
+
+
+def test_failed_lookup_raises_httpx_connect_error(failing_resolver):
+    dns_cache = DnsCache(ttl_seconds=60)
+    with httpx.Client(**TransportFactory(dns_cache=dns_cache).client_options(1)) as client:
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError, match="Could not resolve vocalyx-api.test"):
+                client.get("http://vocalyx-api.test/health")
+    # L'échec n'est pas mis en cache : la résolution est retentée
+    assert failing_resolver == ["vocalyx-api.test", "vocalyx-api.test"]
+
+
+def test_failed_async_lookup_raises_httpx_connect_error(failing_resolver):
+    async def get():
+        dns_cache = DnsCache(ttl_seconds=60)
+        async with httpx.AsyncClient(**TransportFactory(dns_cache=dns_cache).async_client_options(1)) as client:
+            await client.get("http://vocalyx-api.test/health")
+
+    with pytest.raises(httpx.ConnectError, match="Could not resolve vocalyx-api.test"):
+        asyncio.run(get())
@@ -0,0 +1,65 @@
+"""
+WorkerMonitorService : sondage unique partagé, jeton refusé (401/403) et autres erreurs de l'API
+"""
+
+import asyncio
+
+import httpx
+
+from application.services.worker_monitor_service import WorkerMonitorService
+
+
+def workers_api(make_api_client, status_code, calls=None):
+    def handler(request):
+        if calls is not None:
+            calls.append(request.url.path)
+        if status_code != 200:
+            return httpx.Response(status_code, json={"detail": "nope"})
+        return httpx.Response(200, json={"worker_count": 2, "active_tasks": 1})
+    return make_api_client(handler)
+
+
+def test_poll_publishes_worker_status(make_api_client):
+    monitor = WorkerMonitorService(workers_api(make_api_client, 200))
+    monitor.touch("admin-token")
+
+    snapshot = asyncio.run(monitor.poll())
+
+    assert snapshot.ok
+    assert snapshot.data()["worker_count"] == 2
+    assert "status_code" not in snapshot.data()
+
+
+def test_rejected_token_pauses_the_monitor(make_api_client):
+    monitor = WorkerMonitorService(workers_api(make_api_client, 401))
+    monitor.touch("expired-token")
+
+    snapshot = asyncio.run(monitor.poll())
+
+    assert not snapshot.ok
+    assert monitor._token is None
+
+
+def test_non_auth_error_keeps_polling_even_if_the_message_contains_401(make_api_client):
+    monitor = WorkerMonitorService(workers_api(make_api_client, 404))
+    monitor.touch("admin-token")
+    # Le texte de l'erreur n'est pas interprété : seul le code HTTP compte
+    monitor.publish({"error": "upstream 4017 at /api/admin/workers/401"}, "admin-token")
+    snapshot = asyncio.run(monitor.poll())
+
+    assert not snapshot.ok
+    assert monitor._token == "admin-token"
+
+
+def test_concurrent_polls_share_one_upstream_call(make_api_client):
+    calls = []
+    monitor = WorkerMonitorService(workers_api(make_api_client, 200, calls))
+    monitor.touch("admin-token")
+
+    async def burst():
+        return await asyncio.gather(*(monitor.poll() for _ in range(20)))
+
+    snapshots = asyncio.run(burst())
+
+    assert calls == ["/api/admin/workers"]
+    assert len({id(snapshot) for snapshot in snapshots}) == 1